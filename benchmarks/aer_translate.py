@@ -0,0 +1,103 @@
+"""
+Benchmark the translate phase of the Aer backend.
+
+Compares building and translating every rank's circuits one after the
+other in a single process (what the coordinator used to do while all
+other ranks waited) against doing it for each rank in its own worker
+process, as the process rank runner now does.  The worker figure is
+wall-clock time around :func:`translate_parallel`, so it includes
+starting the pool and pickling the programs back.  Composition of the
+global circuit is timed separately since it stays on the coordinator.
+
+Usage::
+
+    python benchmarks/aer_translate.py --ranks 8 --gates 20000
+"""
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from netqmpi.runtime.adapters.aer.aer_layout import AerLayout, splice, translate_rank  # noqa: E402
+from netqmpi.runtime.adapters.aer.aer_process import (  # noqa: E402
+    AerProcessCommunicator, _RecordingExecutor,
+)
+from netqmpi.runtime.adapters.aer.aer_run_config import AerSimulatorConfig  # noqa: E402
+from netqmpi.sdk.environment import Environment  # noqa: E402
+
+
+def build_rank(rank: int, size: int, num_qubits: int, num_gates: int):
+    """Record a random layered circuit for one rank."""
+    config = AerSimulatorConfig()
+    env = Environment(AerProcessCommunicator(rank, size, config, None), _RecordingExecutor(config))
+    circuit = env.create_circuit(num_qubits, num_qubits)
+    rng = random.Random(rank)
+    for _ in range(num_gates):
+        q = rng.randrange(num_qubits)
+        kind = rng.randrange(4)
+        if kind == 0:
+            circuit.h(q)
+        elif kind == 1:
+            circuit.rz(rng.random(), q)
+        elif kind == 2:
+            circuit.cx(q, (q + 1) % num_qubits)
+        else:
+            circuit.qsend([q], (rank + 1) % size)
+    circuit.measure_all()
+    return env.comm.circuits
+
+
+def translate_one(rank: int, size: int, num_qubits: int, num_gates: int, layout: AerLayout):
+    """Worker: build and translate one rank."""
+    return translate_rank(build_rank(rank, size, num_qubits, num_gates), layout)
+
+
+def translate_parallel(size: int, num_qubits: int, num_gates: int, layout: AerLayout):
+    """Build and translate every rank in its own spawned worker process."""
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=size, mp_context=context) as pool:
+        futures = [
+            pool.submit(translate_one, rank, size, num_qubits, num_gates, layout)
+            for rank in range(size)
+        ]
+        return [future.result() for future in futures]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--ranks", type=int, default=8)
+    parser.add_argument("--qubits", type=int, default=2)
+    parser.add_argument("--gates", type=int, default=20000, help="Gates per rank")
+    args = parser.parse_args()
+
+    size = args.ranks
+    layout = AerLayout.plan([[(args.qubits, args.qubits)]] * size)
+
+    start = time.perf_counter()
+    for rank in range(size):
+        translate_one(rank, size, args.qubits, args.gates, layout)
+    serial = time.perf_counter() - start
+
+    start = time.perf_counter()
+    programs = translate_parallel(size, args.qubits, args.gates, layout)
+    parallel = time.perf_counter() - start
+
+    start = time.perf_counter()
+    circuit = layout.compose(splice(programs))
+    compose = time.perf_counter() - start
+
+    print(f"ranks={size} gates/rank={args.gates} global qubits={circuit.num_qubits} cpus={multiprocessing.cpu_count()}")
+    print(f"build+translate, serial          : {serial:8.3f} s")
+    print(f"build+translate, per-rank workers: {parallel:8.3f} s  ({serial / parallel:.1f}x)")
+    print(f"compose (coordinator)            : {compose:8.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,429 @@
+"""
+Benchmark suite for SDK circuit building, dispatch and adapter translation.
+
+Times, for several workloads at increasing op and rank counts:
+
+* ``build``: recording the operations through the :class:`Circuit` API.
+* ``flatten``: walking the recorded :class:`OperationContainer`.
+* ``dispatch``: :meth:`Circuit.translate` with handlers that do nothing,
+  i.e. the cost of the dispatch table itself.
+* ``translate.<backend>``: each adapter's translate step.  The Aer
+  adapter translates against a planned layout.  The NetQASM and CUNQA
+  adapters translate on :class:`BenchCommunicator`; NetQASM translation
+  only builds the closures a run would execute, so nothing is sent to a
+  simulator.  When ``netqasm`` or ``cunqa`` is not installed, its modules
+  are replaced by inert stubs (see :func:`stub_missing`) so that both
+  adapters are always timed; the stubbed packages are listed in the
+  report's ``meta``.  With CUNQA stubbed, the figure leaves out the cost
+  of CUNQA's own circuit object.
+
+Run it from anywhere; the repository root is put on ``sys.path``.
+
+Every metric is the best of ``--repeat`` runs, summed over all ranks.
+Results are written as JSON; with ``--baseline`` the run fails (exit
+status 1) if a metric is slower than the baseline by more than
+``--threshold``.  Typical use::
+
+    python benchmarks/suite.py -o baseline.json          # on the reference commit
+    python benchmarks/suite.py --baseline baseline.json  # on the change
+"""
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import math
+import os
+import platform
+import random
+import sys
+import time
+import types
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from netqmpi.sdk.circuit import Circuit  # noqa: E402
+from netqmpi.sdk.communicator import QMPICommunicator  # noqa: E402
+
+# ---------------------------------------------------------------------------
+# Stubs
+# ---------------------------------------------------------------------------
+
+
+class BenchCommunicator(QMPICommunicator):
+    """Communicator that only carries rank, size and the backend config."""
+
+    def __init__(self, rank: int, size: int, config: Any = None) -> None:
+        super().__init__(rank, size)
+        self._config = config
+
+    def __enter__(self) -> "BenchCommunicator":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        return None
+
+    def route_plan(self, index: int) -> Any:
+        """No routed transfers: the bench topology is a full mesh."""
+        from netqmpi.runtime.adapters.netqasm.netqasm_routing import RoutePlan
+
+        return RoutePlan()
+
+
+class _StubMeta(type):
+    def __getattr__(cls, name: str) -> Any:
+        return cls
+
+
+class _Stub(metaclass=_StubMeta):
+    """Stands in for any class, instance or function of a stubbed package."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+    def __getattr__(self, name: str) -> Callable[..., None]:
+        return lambda *args, **kwargs: None
+
+
+# Modules each adapter imports from its backend package.
+STUBBED_MODULES = {
+    "netqasm": [
+        "netqasm", "netqasm.sdk", "netqasm.sdk.external", "netqasm.sdk.toolbox",
+        "netqasm.sdk.classical_communication", "netqasm.sdk.classical_communication.message",
+        "netqasm.runtime", "netqasm.runtime.app_config", "netqasm.runtime.application",
+        "netqasm.runtime.process_logs", "netqasm.runtime.settings",
+        "netqasm.util", "netqasm.util.yaml",
+    ],
+    "cunqa": ["cunqa", "cunqa.circuit", "cunqa.circuit.core", "cunqa.qpu", "cunqa.qjob"],
+}
+
+
+def stub_missing() -> List[str]:
+    """
+    Install inert stand-ins for the backend packages that are not installed.
+
+    Every attribute of a stub module is :class:`_Stub`, so the adapters
+    import and translate; nothing they call does any work.
+
+    Returns:
+        The names of the stubbed packages.
+    """
+    stubbed = []
+    for package, modules in STUBBED_MODULES.items():
+        if importlib.util.find_spec(package) is not None:
+            continue
+        for name in modules:
+            module = types.ModuleType(name)
+            module.__getattr__ = lambda attr: _Stub
+            sys.modules[name] = module
+        stubbed.append(package)
+    return stubbed
+
+
+def _ignore(self, op) -> None:
+    return None
+
+
+def _translate_children(self, op) -> None:
+    for child in op.flatten():
+        self.translate(child)
+
+
+# Circuit whose handlers do nothing, to time the dispatch alone.
+NullCircuit = type("NullCircuit", (Circuit,), {
+    **{name: _ignore for name in dir(Circuit) if name.startswith("_translate_")},
+    "_translate_operation_container": _translate_children,
+})
+
+# ---------------------------------------------------------------------------
+# Workloads
+# ---------------------------------------------------------------------------
+# Each workload takes (ops, rank, size) and returns (num_qubits, builder),
+# where builder(circuit) records roughly `ops` operations.
+
+
+def random_workload(ops: int, rank: int, size: int) -> Tuple[int, Callable[[Circuit], None]]:
+    """Random one- and two-qubit gates with occasional sends to the next rank."""
+    num_qubits = 8
+
+    def build(circuit: Circuit) -> None:
+        rng = random.Random(rank)
+        for _ in range(ops):
+            q = rng.randrange(num_qubits)
+            kind = rng.randrange(6)
+            if kind == 0:
+                circuit.h(q)
+            elif kind == 1:
+                circuit.rz(rng.random(), q)
+            elif kind == 2:
+                circuit.cx(q, (q + 1) % num_qubits)
+            elif kind == 3:
+                circuit.crz(rng.random(), q, (q + 1) % num_qubits)
+            elif kind == 4:
+                circuit.x(q)
+            else:
+                circuit.qsend([q], (rank + 1) % size)
+        circuit.measure_all()
+
+    return num_qubits, build
+
+
+def qft_workload(ops: int, rank: int, size: int) -> Tuple[int, Callable[[Circuit], None]]:
+    """Textbook QFT sized to about `ops` gates."""
+    num_qubits = max(2, int(math.sqrt(2 * ops)))
+
+    def build(circuit: Circuit) -> None:
+        for i in range(num_qubits):
+            circuit.h(i)
+            for j in range(i + 1, num_qubits):
+                circuit.crz(math.pi / 2 ** (j - i), j, i)
+        for i in range(num_qubits // 2):
+            circuit.swap(i, num_qubits - 1 - i)
+        circuit.measure_all()
+
+    return num_qubits, build
+
+
+def ghz_workload(ops: int, rank: int, size: int) -> Tuple[int, Callable[[Circuit], None]]:
+    """GHZ chain over `ops` qubits, handing the last qubit to the next rank."""
+    num_qubits = max(2, ops)
+
+    def build(circuit: Circuit) -> None:
+        circuit.h(0)
+        for i in range(num_qubits - 1):
+            circuit.cx(i, i + 1)
+        circuit.qsend([num_qubits - 1], (rank + 1) % size)
+        circuit.measure_all()
+
+    return num_qubits, build
+
+
+def ring_workload(ops: int, rank: int, size: int) -> Tuple[int, Callable[[Circuit], None]]:
+    """Teleport a qubit around the ring, `ops / 3` hops."""
+    num_qubits = 2
+
+    def build(circuit: Circuit) -> None:
+        for _ in range(max(1, ops // 3)):
+            circuit.h(0)
+            circuit.qsend([0], (rank + 1) % size)
+            circuit.qrecv([0], (rank - 1) % size)
+        circuit.measure_all()
+
+    return num_qubits, build
+
+
+WORKLOADS = {
+    "random": random_workload,
+    "qft": qft_workload,
+    "ghz": ghz_workload,
+    "ring": ring_workload,
+}
+
+# ---------------------------------------------------------------------------
+# Adapters
+# ---------------------------------------------------------------------------
+
+
+# Each translator factory returns (circuit class, config, translate), where
+# translate(circuits) returns the seconds spent translating, or None if the
+# adapter cannot be imported.
+
+
+def aer_translator() -> Optional[Tuple[type, Any, Callable]]:
+    """Translator of the Aer adapter."""
+    try:
+        from netqmpi.runtime.adapters.aer.aer_circuit import AerCircuitAdapter
+        from netqmpi.runtime.adapters.aer.aer_layout import AerLayout, translate_rank
+        from netqmpi.runtime.adapters.aer.aer_run_config import AerSimulatorConfig
+    except ImportError:
+        return None
+
+    def translate(circuits: List[Circuit]) -> float:
+        layout = AerLayout.plan([[(c.num_qubits, c.num_clbits)] for c in circuits])
+        start = time.perf_counter()
+        for circuit in circuits:
+            translate_rank([circuit], layout)
+        return time.perf_counter() - start
+
+    return AerCircuitAdapter, AerSimulatorConfig(), translate
+
+
+def netqasm_translator() -> Optional[Tuple[type, Any, Callable]]:
+    """Translator of the NetQASM adapter."""
+    try:
+        from netqmpi.runtime.adapters.netqasm.netqasm_circuit import NetQASMCircuitAdapter
+        from netqmpi.runtime.adapters.netqasm.netqasm_executor import NetQASMRunConfig
+    except ImportError:
+        return None
+
+    def translate(circuits: List[Circuit]) -> float:
+        start = time.perf_counter()
+        for circuit in circuits:
+            circuit.translate(circuit.ops)
+        return time.perf_counter() - start
+
+    return NetQASMCircuitAdapter, NetQASMRunConfig(), translate
+
+
+def cunqa_translator() -> Optional[Tuple[type, Any, Callable]]:
+    """Translator of the CUNQA adapter."""
+    try:
+        from netqmpi.runtime.adapters.cunqa.cunqa_circuit import CunqaCircuitAdapter
+    except ImportError:
+        return None
+
+    def translate(circuits: List[Circuit]) -> float:
+        start = time.perf_counter()
+        for circuit in circuits:
+            circuit.translate(circuit.ops)
+        return time.perf_counter() - start
+
+    return CunqaCircuitAdapter, None, translate
+
+
+TRANSLATORS = {
+    "aer": aer_translator,
+    "netqasm": netqasm_translator,
+    "cunqa": cunqa_translator,
+}
+
+# ---------------------------------------------------------------------------
+# Measurement
+# ---------------------------------------------------------------------------
+
+
+def build_circuits(
+    circuit_class: type,
+    workload: Callable,
+    ops: int,
+    size: int,
+    config: Any = None,
+) -> Tuple[List[Circuit], float]:
+    """Record one circuit per rank; return them and the time it took."""
+    plans = [workload(ops, rank, size) for rank in range(size)]
+    circuits = []
+    for rank, (num_qubits, _) in enumerate(plans):
+        comm = BenchCommunicator(rank, size, config)
+        comm.circuits.append(circuit_class(num_qubits, num_qubits, comm))
+        circuits.append(comm.circuits[0])
+    start = time.perf_counter()
+    for circuit, (_, build) in zip(circuits, plans):
+        build(circuit)
+    return circuits, time.perf_counter() - start
+
+
+def run_case(
+    workload: Callable,
+    ops: int,
+    size: int,
+    repeat: int,
+    translators: Dict[str, Tuple[type, Any, Callable]],
+) -> Dict[str, float]:
+    """Measure every metric of one (workload, ops, ranks) case."""
+    best: Dict[str, float] = {}
+
+    def keep(metric: str, seconds: float) -> None:
+        best[metric] = min(seconds, best.get(metric, math.inf))
+
+    for _ in range(repeat):
+        circuits, seconds = build_circuits(NullCircuit, workload, ops, size)
+        keep("build", seconds)
+
+        start = time.perf_counter()
+        for circuit in circuits:
+            for _ in circuit.ops.flatten():
+                pass
+        keep("flatten", time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for circuit in circuits:
+            circuit.translate(circuit.ops)
+        keep("dispatch", time.perf_counter() - start)
+
+        for name, (circuit_class, config, translate) in translators.items():
+            circuits, _ = build_circuits(circuit_class, workload, ops, size, config)
+            keep(f"translate.{name}", translate(circuits))
+    return best
+
+
+def compare(
+    metrics: Dict[str, float],
+    baseline: Dict[str, float],
+    threshold: float,
+    min_seconds: float,
+) -> List[str]:
+    """Return one message per metric that regressed beyond `threshold`."""
+    failures = []
+    for key, seconds in sorted(metrics.items()):
+        reference = baseline.get(key)
+        if reference is None or max(seconds, reference) < min_seconds:
+            continue
+        if seconds > reference * (1 + threshold):
+            failures.append(f"{key}: {seconds * 1e3:.2f} ms vs {reference * 1e3:.2f} ms "
+                            f"(+{(seconds / reference - 1) * 100:.0f}%)")
+    return failures
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--workloads", nargs="+", choices=sorted(WORKLOADS), default=sorted(WORKLOADS))
+    parser.add_argument("--ops", nargs="+", type=int, default=[1000, 10000], help="Ops per rank")
+    parser.add_argument("--ranks", nargs="+", type=int, default=[2, 8])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("-o", "--output", help="Write the results as JSON")
+    parser.add_argument("--baseline", help="Results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="Allowed slowdown against the baseline (default: 0.25 = 25%%)")
+    parser.add_argument("--min-seconds", type=float, default=1e-3,
+                        help="Ignore metrics faster than this in both runs (default: 1 ms)")
+    args = parser.parse_args()
+
+    stubbed = stub_missing()
+    for package in stubbed:
+        print(f"{package} is not installed; translating against stub modules")
+    translators = {}
+    for name, factory in TRANSLATORS.items():
+        translator = factory()
+        if translator is None:
+            print(f"skipping translate.{name}: backend not installed")
+        else:
+            translators[name] = translator
+
+    metrics: Dict[str, float] = {}
+    for workload in args.workloads:
+        for ops in args.ops:
+            for size in args.ranks:
+                case = run_case(WORKLOADS[workload], ops, size, args.repeat, translators)
+                for metric, seconds in case.items():
+                    key = f"{metric}/{workload}/ops={ops}/ranks={size}"
+                    metrics[key] = seconds
+                    print(f"{key:<45} {seconds * 1e3:10.3f} ms")
+
+    report: Dict[str, Any] = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": args.repeat,
+            "stubbed": stubbed,
+        },
+        "metrics": metrics,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["metrics"]
+        failures = compare(metrics, baseline, args.threshold, args.min_seconds)
+        for failure in failures:
+            print(f"REGRESSION {failure}")
+        if failures:
+            return 1
+        print(f"no regressions beyond {args.threshold:.0%} against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,12 +1,24 @@
+import os
 import runpy
 
+from netqmpi.runtime import profiling
+
+# (absolute path, mtime_ns) -> main function, so repeated runs of the same
+# script in one process (e.g. ``netqmpi sweep``) skip re-executing it.
+_MAIN_CACHE = {}
+
 def load_main(path):
     if path is None:
         raise ValueError("script must be provided")
     if not path.endswith(".py"):
         raise ValueError("script must be a .py script")
-    
-    namespace = runpy.run_path(path)
+
+    key = (os.path.abspath(path), os.stat(path).st_mtime_ns)
+    if key in _MAIN_CACHE:
+        return _MAIN_CACHE[key]
+
+    with profiling.phase("load"):
+        namespace = runpy.run_path(path)
 
     if "main" not in namespace:
         raise ValueError(f"{path} does not define a main() function")
@@ -14,4 +26,5 @@ def load_main(path):
     if namespace["main"] is None:
             raise ValueError(f"main function not found in {path}")
 
-    return namespace["main"]
\ No newline at end of file
+    _MAIN_CACHE[key] = namespace["main"]
+    return namespace["main"]
@@ -1,11 +1,19 @@
 """
 Backend adapters for NetQMPI.
 
-This module contains the backend-specific adapters (NetQASM, CUNQA, and Aer) that implement
-the interfaces defined in the SDK.
+This module contains the backend-specific adapters (NetQASM, CUNQA, Aer, NumPy,
+stabilizer, MPS, sharded, sparse and bit-vector) that implement the interfaces
+defined in the SDK.
 
 Available adapter packages:
 - netqmpi.runtime.adapters.netqasm  — NetQASM simulator backend
 - netqmpi.runtime.adapters.cunqa   — CUNQA QPU backend
 - netqmpi.runtime.adapters.aer     — Qiskit AerSimulator backend
+- netqmpi.runtime.adapters.numpy   — NumPy statevector backend (no external simulator)
+- netqmpi.runtime.adapters.stabilizer — stabilizer-tableau backend for Clifford programs
+- netqmpi.runtime.adapters.mps     — matrix-product-state backend for chains of ranks
+- netqmpi.runtime.adapters.sharded — statevector sharded across local worker processes
+- netqmpi.runtime.adapters.sparse  — sparse statevector for states with few non-zero amplitudes
+- netqmpi.runtime.adapters.bitvector — bit-vector backend for reversible classical programs
+- netqmpi.runtime.adapters.monolithic — layer shared by the monolithic-program backends
 """
@@ -3,11 +3,25 @@
 This package exposes the AerSimulator-specific runtime adapter classes
 used by NetQMPI to simulate distributed quantum programs on a single
 monolithic QuantumCircuit.
+
+Classes are loaded on first access, so importing the package is cheap.
 """
-from netqmpi.runtime.adapters.aer.aer_circuit import AerCircuitAdapter
-from netqmpi.runtime.adapters.aer.aer_executor import AerExecutorAdapter
-from netqmpi.runtime.adapters.aer.aer_communicator import AerCommunicator
-from netqmpi.runtime.adapters.aer.aer_run_config import AerSimulatorConfig
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from netqmpi.runtime.adapters.aer.aer_circuit import AerCircuitAdapter
+    from netqmpi.runtime.adapters.aer.aer_executor import AerExecutorAdapter
+    from netqmpi.runtime.adapters.aer.aer_communicator import AerCommunicator
+    from netqmpi.runtime.adapters.aer.aer_run_config import AerSimulatorConfig
+
+# Public name -> submodule defining it.
+_LAZY = {
+    "AerCircuitAdapter": "netqmpi.runtime.adapters.aer.aer_circuit",
+    "AerExecutorAdapter": "netqmpi.runtime.adapters.aer.aer_executor",
+    "AerCommunicator": "netqmpi.runtime.adapters.aer.aer_communicator",
+    "AerSimulatorConfig": "netqmpi.runtime.adapters.aer.aer_run_config",
+}
 
 __all__ = [
     "AerCircuitAdapter",
@@ -15,3 +29,15 @@ __all__ = [
     "AerCommunicator",
     "AerSimulatorConfig",
 ]
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,584 @@
+"""
+Circuit cutting and knitting for the Qiskit AerSimulator adapter.
+
+When the monolithic global circuit built by :class:`AerExecutorAdapter`
+is wider than the simulator can hold, the program is split at its
+inter-rank links.  Every ``qsend`` is lowered by :class:`AerCircuitAdapter`
+into a SWAP between two rank slices, so those SWAPs are exactly the points
+where state crosses from one rank to another and form the natural cut set.
+
+Each cut is a *wire cut* based on the identity-channel decomposition::
+
+    rho = 1/2 * sum_{P in {I, X, Y, Z}} Tr(rho P) P
+
+The upstream fragment measures the cut wire in the eigenbasis of ``P`` and
+the downstream fragment starts from the eigenstates of ``P``.  Fragments
+are simulated independently (in parallel worker processes) for every
+measurement-basis/preparation combination, and the output distribution is
+reconstructed by quasi-probability knitting.  With ``k`` cuts the knitting
+sums ``4**k`` terms and the sampling overhead is ``16**k``; both are
+reported by :class:`CutPlan` before anything is simulated.
+
+Cross-rank gates other than the qsend SWAPs are not cut: they simply merge
+the fragments they touch.
+"""
+from __future__ import annotations
+
+import itertools
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    from qiskit import QuantumCircuit  # type: ignore[import-not-found]
+
+
+# Measurement basis used by the upstream fragment for each Pauli label.
+_MEASURE_BASIS = {"I": "Z", "Z": "Z", "X": "X", "Y": "Y"}
+
+# Eigen-decomposition of each Pauli label as (preparation state, eigenvalue).
+_EIGENSTATES = {
+    "I": (("0", 1), ("1", 1)),
+    "Z": (("0", 1), ("1", -1)),
+    "X": (("+", 1), ("-", -1)),
+    "Y": (("+i", 1), ("-i", -1)),
+}
+
+# Per-cut 1-norm of the decomposition; the sampling overhead is its square.
+_CUT_GAMMA = 4
+
+
+@dataclass
+class WireCut:
+    """
+    A single wire cut at an inter-rank link.
+
+    Attributes:
+        index: Position of the cut in :attr:`CutPlan.cuts`.
+        src_rank: Rank whose state leaves through the link.
+        dest_rank: Rank receiving the state.
+        upstream: Wire segment that ends at the cut.
+        downstream: Wire segment that starts at the cut.
+    """
+
+    index: int
+    src_rank: int
+    dest_rank: int
+    upstream: int
+    downstream: int
+
+
+@dataclass
+class Fragment:
+    """
+    Connected piece of the global circuit left after cutting.
+
+    Attributes:
+        segments: Wire segments forming the fragment qubits.
+        instructions: ``(operation, segment_qargs, global_cargs)`` triples
+            in global program order.
+        clbits: Global classical bits written by the fragment.
+        cut_inputs: Indices of the cuts whose downstream side is here.
+        cut_outputs: Indices of the cuts whose upstream side is here.
+    """
+
+    segments: List[int] = field(default_factory=list)
+    instructions: List[Tuple[Any, Tuple[int, ...], Tuple[int, ...]]] = field(default_factory=list)
+    clbits: List[int] = field(default_factory=list)
+    cut_inputs: List[int] = field(default_factory=list)
+    cut_outputs: List[int] = field(default_factory=list)
+
+    @property
+    def width(self) -> int:
+        """Number of qubits the fragment needs."""
+        return len(self.segments)
+
+    @property
+    def num_variants(self) -> int:
+        """Number of sub-experiments required to characterise the fragment."""
+        if not self.clbits and not self.cut_outputs:
+            return 0
+        return 3 ** len(self.cut_outputs) * 6 ** len(self.cut_inputs)
+
+
+@dataclass
+class CutPlan:
+    """
+    Result of cutting a global circuit at its inter-rank links.
+
+    Attributes:
+        cuts: Wire cuts, one per state-carrying direction of each link.
+        fragments: Fragments to simulate.
+        num_clbits: Width of the global classical register.
+        creg_sizes: Sizes of the global classical registers, in order,
+            used to format result keys like Qiskit counts.
+    """
+
+    cuts: List[WireCut]
+    fragments: List[Fragment]
+    num_clbits: int
+    creg_sizes: List[int]
+
+    @property
+    def num_cuts(self) -> int:
+        """Number of wire cuts."""
+        return len(self.cuts)
+
+    @property
+    def max_fragment_width(self) -> int:
+        """Width of the widest fragment."""
+        return max((f.width for f in self.fragments), default=0)
+
+    @property
+    def num_subexperiments(self) -> int:
+        """Total number of fragment circuits that will be simulated."""
+        return sum(f.num_variants for f in self.fragments)
+
+    @property
+    def sampling_overhead(self) -> int:
+        """
+        Multiplicative shot overhead needed to match the uncut variance.
+
+        Returns:
+            ``gamma ** 2`` where ``gamma = 4 ** num_cuts``.
+        """
+        return (_CUT_GAMMA ** self.num_cuts) ** 2
+
+    def summary(self) -> Dict[str, int]:
+        """
+        Return the plan figures as a plain dictionary.
+
+        Returns:
+            Cut count, fragment count and width, sub-experiment count and
+            sampling overhead.
+        """
+        return {
+            "num_cuts": self.num_cuts,
+            "num_fragments": len(self.fragments),
+            "max_fragment_width": self.max_fragment_width,
+            "num_subexperiments": self.num_subexperiments,
+            "sampling_overhead": self.sampling_overhead,
+        }
+
+
+# ---------------------------------------------------------------------------
+# Planning
+# ---------------------------------------------------------------------------
+
+def plan_cuts(circuit: "QuantumCircuit", rank_of: Callable[[int], int]) -> CutPlan:
+    """
+    Cut a global circuit at every SWAP that crosses two rank slices.
+
+    Each cut SWAP splits both wires into new segments.  A direction whose
+    upstream segment has never been touched carries ``|0>`` and needs no
+    cut, which is the common case for a fresh ``qrecv`` slot.
+
+    Args:
+        circuit: Global circuit produced by the Aer adapter.
+        rank_of: Maps a global qubit index to the rank owning it.
+
+    Returns:
+        The :class:`CutPlan` describing cuts and fragments.
+
+    Raises:
+        ValueError: If two fragments write the same classical bit, which
+            knitting cannot order.
+    """
+    seg_of = list(range(circuit.num_qubits))
+    touched = [False] * circuit.num_qubits
+    parent = list(range(circuit.num_qubits))
+    cuts: List[WireCut] = []
+    instructions: List[Tuple[Any, Tuple[int, ...], Tuple[int, ...]]] = []
+
+    def new_segment() -> int:
+        touched.append(False)
+        parent.append(len(parent))
+        return len(parent) - 1
+
+    def find(s: int) -> int:
+        while parent[s] != s:
+            parent[s] = parent[parent[s]]
+            s = parent[s]
+        return s
+
+    for instruction in circuit.data:
+        operation = instruction.operation
+        qargs = [circuit.find_bit(q).index for q in instruction.qubits]
+        cargs = tuple(circuit.find_bit(c).index for c in instruction.clbits)
+
+        if operation.name == "barrier":
+            continue
+
+        if operation.name == "swap" and rank_of(qargs[0]) != rank_of(qargs[1]):
+            a, b = qargs
+            new_a, new_b = new_segment(), new_segment()
+            for src, dst, new in ((a, b, new_b), (b, a, new_a)):
+                upstream = seg_of[src]
+                if touched[upstream]:
+                    cuts.append(WireCut(len(cuts), rank_of(src), rank_of(dst), upstream, new))
+                    touched[new] = True
+            seg_of[a], seg_of[b] = new_a, new_b
+            continue
+
+        segments = tuple(seg_of[q] for q in qargs)
+        for s in segments:
+            touched[s] = True
+        for s in segments[1:]:
+            parent[find(s)] = find(segments[0])
+        instructions.append((operation, segments, cargs))
+
+    fragments: Dict[int, Fragment] = {}
+
+    def fragment_of(segment: int) -> Fragment:
+        return fragments.setdefault(find(segment), Fragment())
+
+    for s in range(len(parent)):
+        if touched[s]:
+            fragment_of(s).segments.append(s)
+    for operation, segments, cargs in instructions:
+        fragment = fragment_of(segments[0])
+        fragment.instructions.append((operation, segments, cargs))
+        for c in cargs:
+            if c not in fragment.clbits:
+                fragment.clbits.append(c)
+    for cut in cuts:
+        fragment_of(cut.upstream).cut_outputs.append(cut.index)
+        fragment_of(cut.downstream).cut_inputs.append(cut.index)
+
+    writers: Dict[int, Fragment] = {}
+    for fragment in fragments.values():
+        fragment.clbits.sort()
+        for c in fragment.clbits:
+            if writers.setdefault(c, fragment) is not fragment:
+                raise ValueError(
+                    f"Clbit {c} is written on both sides of a cut; circuit cutting "
+                    "needs every clbit to be measured within one fragment."
+                )
+
+    return CutPlan(
+        cuts=cuts,
+        fragments=list(fragments.values()),
+        num_clbits=circuit.num_clbits,
+        creg_sizes=[creg.size for creg in circuit.cregs],
+    )
+
+
+# ---------------------------------------------------------------------------
+# Fragment simulation
+# ---------------------------------------------------------------------------
+
+def _simulate_batch(circuits: Sequence["QuantumCircuit"], shots: int, seed: Optional[int]) -> List[Dict[str, int]]:
+    """
+    Run a batch of fragment circuits on a fresh AerSimulator.
+
+    Module-level so that it can be shipped to worker processes.
+
+    Args:
+        circuits: Fragment circuits to simulate.
+        shots: Shots per circuit.
+        seed: Optional simulator seed.
+
+    Returns:
+        One counts dictionary per circuit.
+    """
+    from qiskit_aer import AerSimulator  # type: ignore[import-not-found]
+
+    run_kwargs: dict = {"shots": shots}
+    if seed is not None:
+        run_kwargs["seed_simulator"] = seed
+    result = AerSimulator().run(list(circuits), **run_kwargs).result()
+    return [result.get_counts(i) for i in range(len(circuits))]
+
+
+class CircuitKnitter:
+    """
+    Simulate the fragments of a :class:`CutPlan` and knit their results.
+
+    Args:
+        plan: Cut plan to execute.
+        shots: Shots per fragment sub-experiment.
+        seed: Optional base seed; each worker batch gets ``seed + index``.
+        workers: Number of worker processes.  ``None`` lets the pool pick
+            one per CPU; ``1`` simulates in-process.
+    """
+
+    def __init__(
+        self,
+        plan: CutPlan,
+        shots: int,
+        seed: Optional[int] = None,
+        workers: Optional[int] = None,
+    ) -> None:
+        self._plan = plan
+        self._shots = shots
+        self._seed = seed
+        self._workers = workers
+
+    def run(self) -> Dict[str, float]:
+        """
+        Simulate every fragment and reconstruct the global distribution.
+
+        Returns:
+            Quasi-probability distribution keyed like Qiskit counts.  Small
+            negative entries are a normal artefact of finite sampling.
+        """
+        variants = [self._fragment_variants(f) for f in self._plan.fragments]
+        counts = self._simulate(variants)
+        tables = [
+            self._fragment_table(fragment, dict(zip(keys, results)))
+            for fragment, keys, results in zip(self._plan.fragments, variants, counts)
+        ]
+        return self._knit(tables)
+
+    # ------------------------------------------------------------------
+    # Sub-experiment construction and execution
+    # ------------------------------------------------------------------
+
+    def _fragment_variants(self, fragment: Fragment) -> List[Tuple[Tuple[str, ...], Tuple[str, ...]]]:
+        """
+        List the ``(measurement bases, preparation states)`` pairs to run.
+
+        Args:
+            fragment: Fragment to characterise.
+
+        Returns:
+            The variant keys, empty when the fragment has no outputs.
+        """
+        if not fragment.num_variants:
+            return []
+        bases = itertools.product("ZXY", repeat=len(fragment.cut_outputs))
+        preps = list(itertools.product(("0", "1", "+", "-", "+i", "-i"), repeat=len(fragment.cut_inputs)))
+        return [(b, p) for b in bases for p in preps]
+
+    def _build_circuit(self, fragment: Fragment, bases: Tuple[str, ...], preps: Tuple[str, ...]) -> "QuantumCircuit":
+        """
+        Build one fragment sub-experiment.
+
+        Classical bits ``[0, len(clbits))`` hold the fragment outputs and
+        the following ones the cut-wire measurements.
+
+        Args:
+            fragment: Fragment to build.
+            bases: Measurement basis per cut output.
+            preps: Preparation state per cut input.
+
+        Returns:
+            The fragment circuit.
+        """
+        from qiskit import QuantumCircuit  # type: ignore[import-not-found]
+
+        local = {s: i for i, s in enumerate(fragment.segments)}
+        cmap = {c: i for i, c in enumerate(fragment.clbits)}
+        qc = QuantumCircuit(fragment.width, len(fragment.clbits) + len(fragment.cut_outputs))
+
+        for cut_index, state in zip(fragment.cut_inputs, preps):
+            q = local[self._plan.cuts[cut_index].downstream]
+            if state in ("1", "-", "-i"):
+                qc.x(q)
+            if state != "0" and state != "1":
+                qc.h(q)
+            if state in ("+i", "-i"):
+                qc.s(q)
+
+        for operation, segments, cargs in fragment.instructions:
+            qc.append(operation, [local[s] for s in segments], [cmap[c] for c in cargs])
+
+        for i, (cut_index, basis) in enumerate(zip(fragment.cut_outputs, bases)):
+            q = local[self._plan.cuts[cut_index].upstream]
+            if basis == "Y":
+                qc.sdg(q)
+            if basis != "Z":
+                qc.h(q)
+            qc.measure(q, len(fragment.clbits) + i)
+        return qc
+
+    def _simulate(self, variants: List[List[Tuple[Tuple[str, ...], Tuple[str, ...]]]]) -> List[List[Dict[str, int]]]:
+        """
+        Simulate every sub-experiment, fanning batches out to workers.
+
+        Args:
+            variants: Variant keys per fragment.
+
+        Returns:
+            Counts per fragment, aligned with ``variants``.
+        """
+        circuits = [
+            self._build_circuit(fragment, bases, preps)
+            for fragment, keys in zip(self._plan.fragments, variants)
+            for bases, preps in keys
+        ]
+        if not circuits:
+            return [[] for _ in variants]
+
+        workers = self._workers or os.cpu_count() or 1
+        if workers == 1:
+            flat = _simulate_batch(circuits, self._shots, self._seed)
+        else:
+            n_batches = min(len(circuits), workers)
+            # Rank threads and Aer's own thread pool make fork() unsafe here.
+            context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=n_batches, mp_context=context) as pool:
+                batches = [circuits[i::n_batches] for i in range(n_batches)]
+                futures = [
+                    pool.submit(
+                        _simulate_batch, batch, self._shots,
+                        None if self._seed is None else self._seed + i,
+                    )
+                    for i, batch in enumerate(batches)
+                ]
+                flat = [None] * len(circuits)
+                for i, future in enumerate(futures):
+                    flat[i::n_batches] = future.result()
+
+        out, pos = [], 0
+        for keys in variants:
+            out.append(flat[pos:pos + len(keys)])
+            pos += len(keys)
+        return out
+
+    # ------------------------------------------------------------------
+    # Knitting
+    # ------------------------------------------------------------------
+
+    def _fragment_table(self, fragment: Fragment, counts: Dict[Tuple[Tuple[str, ...], Tuple[str, ...]], Dict[str, int]]) -> Dict[Tuple[str, ...], Dict[int, float]]:
+        """
+        Contract a fragment's sub-experiments into per-label distributions.
+
+        Args:
+            fragment: Fragment whose results are contracted.
+            counts: Counts per variant key.
+
+        Returns:
+            Map from the Pauli labels of the fragment cuts (outputs first,
+            then inputs) to a distribution over the fragment outputs, with
+            outputs encoded as integers over global clbit positions.
+        """
+        n_out, n_in = len(fragment.cut_outputs), len(fragment.cut_inputs)
+        table: Dict[Tuple[str, ...], Dict[int, float]] = {}
+
+        for labels in itertools.product("IXYZ", repeat=n_out + n_in):
+            out_labels, in_labels = labels[:n_out], labels[n_out:]
+
+            if not fragment.num_variants:
+                # Trace-preserving fragment with no observable output.
+                if all(label == "I" for label in in_labels):
+                    table[labels] = {0: 2.0 ** n_in}
+                continue
+
+            bases = tuple(_MEASURE_BASIS[label] for label in out_labels)
+            dist: Dict[int, float] = {}
+            for choice in itertools.product(*(_EIGENSTATES[label] for label in in_labels)):
+                preps = tuple(state for state, _ in choice)
+                coeff = 1
+                for _, eigenvalue in choice:
+                    coeff *= eigenvalue
+                for key, count in counts[(bases, preps)].items():
+                    bits = key.replace(" ", "")[::-1]
+                    sign = coeff
+                    for i, label in enumerate(out_labels):
+                        if label != "I" and bits[len(fragment.clbits) + i] == "1":
+                            sign = -sign
+                    value = 0
+                    for i, c in enumerate(fragment.clbits):
+                        if bits[i] == "1":
+                            value |= 1 << c
+                    dist[value] = dist.get(value, 0.0) + sign * count / self._shots
+            table[labels] = dist
+        return table
+
+    def _knit(self, tables: List[Dict[Tuple[str, ...], Dict[int, float]]]) -> Dict[str, float]:
+        """
+        Sum the product of fragment tables over every cut labelling.
+
+        Args:
+            tables: Output of :meth:`_fragment_table` per fragment.
+
+        Returns:
+            The reconstructed quasi-probability distribution.
+        """
+        fragments = self._plan.fragments
+        k = self._plan.num_cuts
+        scale = 0.5 ** k
+        total: Dict[int, float] = {}
+
+        for labels in itertools.product("IXYZ", repeat=k):
+            partial: Dict[int, float] = {0: scale}
+            for fragment, table in zip(fragments, tables):
+                key = tuple(labels[c] for c in fragment.cut_outputs) + tuple(labels[c] for c in fragment.cut_inputs)
+                dist = table.get(key)
+                if not dist:
+                    partial = {}
+                    break
+                partial = {
+                    a | b: pa * pb
+                    for a, pa in partial.items()
+                    for b, pb in dist.items()
+                }
+            for value, p in partial.items():
+                total[value] = total.get(value, 0.0) + p
+
+        return {
+            format_key(value, self._plan.creg_sizes): p
+            for value, p in total.items()
+            if abs(p) > 1e-12
+        }
+
+
+# ---------------------------------------------------------------------------
+# Result helpers
+# ---------------------------------------------------------------------------
+
+def format_key(value: int, creg_sizes: Sequence[int]) -> str:
+    """
+    Format a global clbit assignment like a Qiskit counts key.
+
+    Args:
+        value: Integer whose bit ``i`` is global clbit ``i``.
+        creg_sizes: Sizes of the classical registers in declaration order.
+
+    Returns:
+        Space-separated register strings, last register first.
+    """
+    parts, base = [], 0
+    for size in creg_sizes:
+        parts.append(format((value >> base) & ((1 << size) - 1), f"0{size}b") if size else "")
+        base += size
+    return " ".join(p for p in reversed(parts) if p)
+
+
+def quasi_to_counts(quasi: Dict[str, float], shots: int) -> Dict[str, int]:
+    """
+    Scale a quasi-probability distribution to integer counts.
+
+    Negative and vanishing entries are dropped.
+
+    Args:
+        quasi: Knitted quasi-probability distribution.
+        shots: Number of shots to scale to.
+
+    Returns:
+        A counts dictionary compatible with ``Result.get_counts()``.
+    """
+    counts = {key: int(round(p * shots)) for key, p in quasi.items()}
+    return {key: c for key, c in counts.items() if c > 0}
+
+
+def expectation_value(quasi: Dict[str, float], clbits: Sequence[int]) -> float:
+    """
+    Compute ``<Z...Z>`` over a set of global classical bits.
+
+    Args:
+        quasi: Knitted quasi-probability distribution.
+        clbits: Global clbit indices whose parity is observed.
+
+    Returns:
+        The expectation value of the parity observable.
+    """
+    total = 0.0
+    for key, p in quasi.items():
+        bits = key.replace(" ", "")[::-1]
+        parity = sum(bits[c] == "1" for c in clbits) % 2
+        total += -p if parity else p
+    return total
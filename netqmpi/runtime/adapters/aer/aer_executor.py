@@ -7,33 +7,43 @@ NetQMPI applications on Qiskit's AerSimulator backend.
 """
 from __future__ import annotations
 
-import threading
-from typing import Any, List, Tuple
+from functools import partial
+from typing import Any, List
 
-from netqmpi.runtime.executor import Executor
-from netqmpi.sdk.environment import Environment
+from netqmpi.runtime import profiling, tracing
+from netqmpi.runtime.adapters.monolithic.monolithic_executor import MonolithicExecutor
 from netqmpi.runtime.adapters.aer.aer_circuit import AerCircuitAdapter
 from netqmpi.runtime.adapters.aer.aer_communicator import AerCommunicator
+from netqmpi.runtime.adapters.aer.aer_layout import AerLayout, Instruction
 from netqmpi.runtime.adapters.aer.aer_run_config import AerSimulatorConfig
-from netqmpi.helpers import load_main
 
 
-class AerExecutorAdapter(Executor):
+class AerExecutorAdapter(MonolithicExecutor):
     """
     Executor adapter that runs NetQMPI apps on Qiskit's AerSimulator.
 
-    Owns a single global QuantumCircuit that grows with every
-    :meth:`create_circuit` call.  Each call allocates a new contiguous
-    *circuit group* of ``size * num_qubits`` qubits (one slice per rank),
-    so any number of circuits can be created per rank while the SWAP-based
-    qsend offsets remain consistent.
-
-    :meth:`run` launches every rank in a separate thread.
-    :meth:`build_apps` installs a :class:`threading.Barrier` on
-    :class:`AerCommunicator` so that ``__exit__`` can synchronise all
-    threads before and after the simulation.
+    Circuits are only recorded while ranks run.  Once every rank has left
+    its ``with env.comm:`` block, the executor plans a global
+    :class:`~netqmpi.runtime.adapters.aer.aer_layout.AerLayout` from the
+    circuit shapes: circuit ``g`` of every rank lands in *circuit group*
+    ``g``, one slice per rank, so any number of circuits can be created
+    per rank while the SWAP-based qsend offsets remain consistent.  Each
+    rank then translates its own circuits concurrently, and the executor
+    splices the resulting instruction lists into one global QuantumCircuit.
+
+    The thread runner, layout planning and barrier protocol come from
+    :class:`~netqmpi.runtime.adapters.monolithic.monolithic_executor.MonolithicExecutor`.
+
+    With ``rank_runner="process"`` ranks run and translate in worker
+    processes instead and ship their instructions back to this executor
+    (see :mod:`~netqmpi.runtime.adapters.aer.aer_process`).
     """
 
+    config_class = AerSimulatorConfig
+    circuit_class = AerCircuitAdapter
+    communicator_class = AerCommunicator
+    layout_class = AerLayout
+
     def __init__(self, size: int, config: AerSimulatorConfig = None) -> None:
         """
         Initialize the AerSimulator executor adapter.
@@ -43,139 +53,173 @@ class AerExecutorAdapter(Executor):
             config: AerSimulator-specific configuration.  Defaults to
                 :class:`AerSimulatorConfig` with its built-in defaults.
         """
-        _config = config or AerSimulatorConfig()
-        super().__init__(size, _config)
+        super().__init__(size, config)
         # Re-narrow the type so the checker knows we have AerSimulatorConfig.
-        self._config: AerSimulatorConfig = _config
+        self._config: AerSimulatorConfig = self._config
         self._global_circuit = None
-        # Each entry: (num_qubits, num_clbits, qubit_base, clbit_base)
-        self._circuit_groups: List[Tuple[int, int, int, int]] = []
-        self._qubit_count: int = 0
-        self._clbit_count: int = 0
-        # Protects global-circuit mutations when ranks call create_circuit concurrently.
-        self._lock = threading.Lock()
-
-    def create_circuit(
-        self,
-        num_qubits: int,
-        num_clbits: int,
-        comm: AerCommunicator,
-    ) -> AerCircuitAdapter:
-        """
-        Create an AerCircuitAdapter and extend the global circuit if needed.
-
-        Thread-safe: multiple ranks may call this simultaneously.  The
-        first rank to request a given circuit group allocates
-        ``size * num_qubits`` new qubits for that group; subsequent ranks
-        reuse the already-allocated group.
-
-        Args:
-            num_qubits: Number of qubits for this rank's circuit slice.
-            num_clbits: Number of classical bits for this rank's circuit slice.
-            comm: Communicator associated with this rank.
-
-        Returns:
-            An :class:`AerCircuitAdapter` writing into the global circuit at
-            the correct qubit/clbit offset for this rank and circuit group.
-        """
-        with self._lock:
-            if self._global_circuit is None:
-                from qiskit import QuantumCircuit  # type: ignore[import-not-found]
-                self._global_circuit = QuantumCircuit(0, 0)
-
-            # len(comm.circuits) is the index of the circuit being created:
-            # Environment.create_circuit() appends AFTER this method returns.
-            circuit_index = len(comm.circuits)
-
-            if circuit_index >= len(self._circuit_groups):
-                # First rank for this group: allocate slots for all ranks.
-                from qiskit import QuantumRegister, ClassicalRegister  # type: ignore[import-not-found]
-                qr = QuantumRegister(self._size * num_qubits, f'qr{circuit_index}')
-                cr = ClassicalRegister(self._size * num_clbits, f'cr{circuit_index}')
-                self._global_circuit.add_register(qr)
-                self._global_circuit.add_register(cr)
-                self._circuit_groups.append(
-                    (num_qubits, num_clbits, self._qubit_count, self._clbit_count)
-                )
-                self._qubit_count += self._size * num_qubits
-                self._clbit_count += self._size * num_clbits
-
-            _, _, qubit_base, clbit_base = self._circuit_groups[circuit_index]
-            qubit_offset = qubit_base + comm._rank * num_qubits
-            clbit_offset = clbit_base + comm._rank * num_clbits
-
-            return AerCircuitAdapter(
-                num_qubits, num_clbits, comm,
-                self._global_circuit, qubit_offset, clbit_offset, qubit_base,
-            )
+        # AerSimulator instance reused across runs of this executor.
+        self._simulator = None
+        # Long-lived thread that composes and simulates for thread-mode runs.
+        self._coordinator = None
+        # CutPlan of the last run that needed cutting (see max_qubits).
+        self.cut_plan = None
 
     def build_apps(self, file: str, size: int) -> List[Any]:
         """
-        Build one callable wrapper per rank and install the sync barrier.
+        Build one callable wrapper per rank.
 
-        Creates all :class:`AerCommunicator` instances and then installs
-        a :class:`threading.Barrier` on the class so that every rank's
-        ``__exit__`` can synchronise before the simulation runs.
+        With the thread runner, creates all :class:`AerCommunicator`
+        instances and installs the sync barrier (see
+        :meth:`MonolithicExecutor.build_apps`).
 
         Args:
             file: Path to the NetQMPI Python script defining ``main()``.
             size: Number of ranks to instantiate.
 
         Returns:
-            A list of zero-argument callables, one per rank.
+            A list of zero-argument callables, one per rank.  With the
+            process runner, each callable instead takes the worker end of
+            the coordinator pipe and is picklable.
+
+        Raises:
+            ValueError: If ``rank_runner`` is not ``"thread"`` or
+                ``"process"``.
         """
-        main_func = load_main(file)
-        apps = []
-        for rank in range(size):
-            comm = AerCommunicator(rank, size, self._config, self)
-            env = Environment(comm, self)
-            wrapped_main = lambda env=env: main_func(env=env)
-            apps.append(wrapped_main)
-        # Install the barrier after all communicators exist so __exit__ can use it.
-        AerCommunicator._barrier = threading.Barrier(size)
-        return apps
+        if self._config.rank_runner not in ("thread", "process"):
+            raise ValueError(
+                f"Unknown rank_runner {self._config.rank_runner!r}; use 'thread' or 'process'."
+            )
+        self.results = {}
+        if self._config.rank_runner == "process":
+            from netqmpi.runtime.adapters.aer.aer_process import run_rank
+            profiler = profiling.active()
+            profile = profiler.options() if profiler is not None else None
+            trace = tracing.active() is not None
+            return [
+                partial(run_rank, file, rank, size, self._config, profile=profile, trace=trace)
+                for rank in range(size)
+            ]
+
+        return super().build_apps(file, size)
 
     def run(self, apps: List[Any]) -> None:
         """
-        Launch every rank in a separate thread and wait for all to finish.
+        Launch every rank and wait for all to finish.
 
-        Running ranks concurrently is required so that the
-        :class:`threading.Barrier` in ``AerCommunicator.__exit__`` can
-        synchronise them: all N threads must reach the barrier for any of
-        them to proceed past it.
+        Ranks run in threads of this process (see
+        :meth:`MonolithicExecutor.run`) or, with the process runner, in
+        worker processes.
 
         Args:
             apps: List of callables returned by :meth:`build_apps`.
+
+        Raises:
+            RuntimeError: If a rank raised; chained to its exception.
         """
-        threads = [threading.Thread(target=app) for app in apps]
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
+        if self._config.rank_runner == "process":
+            from netqmpi.runtime.adapters.aer.aer_process import run_rank_processes
+            run_rank_processes(self, apps)
+            return
+
+        super().run(apps)
 
     # ------------------------------------------------------------------
-    # Internal helpers called by AerCommunicator.__exit__
+    # Internal helpers called by the rank runners
     # ------------------------------------------------------------------
 
-    def _run_simulation(self) -> None:
+    def _simulate(self, programs: List[List[Instruction]]) -> dict:
         """
-        Submit the global circuit to AerSimulator and broadcast counts.
+        Run :meth:`_run_simulation` on the executor's coordinator thread.
 
-        Called by the designated thread inside ``AerCommunicator.__exit__``
-        after all ranks have finished building their circuits.
+        Rank threads only live for one run.  Building Qiskit circuits from
+        a new short-lived thread on every run of the same process can
+        crash the interpreter, so the thread runner hands composition and
+        simulation to one thread that lives as long as the executor.
+
+        Args:
+            programs: Segments of the global program, in order.
+
+        Returns:
+            The measurement counts.
         """
-        from qiskit_aer import AerSimulator  # type: ignore[import-not-found]
+        if self._coordinator is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self._coordinator = ThreadPoolExecutor(max_workers=1, thread_name_prefix="aer-coordinator")
+        return self._coordinator.submit(self._run_simulation, programs).result()
 
-        run_kwargs: dict = {"shots": self._config.shots}
-        if self._config.seed_simulator is not None:
-            run_kwargs["seed_simulator"] = self._config.seed_simulator
+    def _run_simulation(self, programs: List[List[Instruction]]) -> dict:
+        """
+        Compose the global circuit and submit it to AerSimulator.
 
-        simulator = AerSimulator()
-        job = simulator.run(self._global_circuit, **run_kwargs)
-        counts = job.result().get_counts()
+        Args:
+            programs: Segments of the global program, in order, as
+                returned by :func:`~netqmpi.runtime.adapters.aer.aer_layout.splice`.
+
+        Returns:
+            The counts to broadcast to every rank.
+        """
+        with profiling.phase("submit"):
+            self._global_circuit = self._layout.compose(programs)
+
+            job = None
+            max_qubits = self._config.max_qubits
+            if max_qubits is None or self._global_circuit.num_qubits <= max_qubits:
+                from qiskit_aer import AerSimulator  # type: ignore[import-not-found]
+
+                run_kwargs: dict = {"shots": self._config.shots}
+                if self._config.seed_simulator is not None:
+                    run_kwargs["seed_simulator"] = self._config.seed_simulator
+
+                if self._simulator is None:
+                    self._simulator = AerSimulator()
+                job = self._simulator.run(self._global_circuit, **run_kwargs)
+
+        with profiling.phase("simulate"):
+            if job is None:
+                return self._run_cut_simulation()
+            return job.result().get_counts()
+
+    def _run_cut_simulation(self) -> dict:
+        """
+        Simulate the global circuit by cutting it at its inter-rank links.
+
+        The cut plan, including its sampling overhead, is computed before
+        any fragment runs and kept in :attr:`cut_plan`.
+
+        Returns:
+            Counts reconstructed from the knitted quasi-distribution.
+
+        Raises:
+            ValueError: If a clbit is written on both sides of a cut.
+            RuntimeError: If a fragment is still wider than ``max_qubits``
+                or the sampling overhead exceeds ``max_sampling_overhead``.
+        """
+        from netqmpi.runtime.adapters.aer.aer_cutting import (
+            CircuitKnitter, plan_cuts, quasi_to_counts,
+        )
+
+        plan = plan_cuts(self._global_circuit, self._layout.rank_of_qubit)
+        self.cut_plan = plan
+
+        if plan.max_fragment_width > self._config.max_qubits:
+            raise RuntimeError(
+                f"Cutting at inter-rank links leaves a fragment of "
+                f"{plan.max_fragment_width} qubits (max_qubits={self._config.max_qubits})."
+            )
+        limit = self._config.max_sampling_overhead
+        if limit is not None and plan.sampling_overhead > limit:
+            raise RuntimeError(
+                f"Sampling overhead {plan.sampling_overhead} for {plan.num_cuts} cuts "
+                f"exceeds max_sampling_overhead={limit}."
+            )
 
-        for comm in AerCommunicator.communicators:
-            comm.results = counts
+        knitter = CircuitKnitter(
+            plan,
+            shots=self._config.shots,
+            seed=self._config.seed_simulator,
+            workers=self._config.cutting_workers,
+        )
+        return quasi_to_counts(knitter.run(), self._config.shots)
 
     def _reset(self) -> None:
         """
@@ -184,7 +228,5 @@ class AerExecutorAdapter(Executor):
         Called by the designated thread inside ``AerCommunicator.__exit__``
         after all ranks have received their results.
         """
+        super()._reset()
         self._global_circuit = None
-        self._circuit_groups = []
-        self._qubit_count = 0
-        self._clbit_count = 0
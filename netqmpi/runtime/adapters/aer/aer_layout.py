@@ -0,0 +1,197 @@
+"""
+Global qubit/clbit layout of the monolithic Aer circuit.
+
+Layout planning and per-rank translation are shared with the other
+monolithic backends (see
+:mod:`~netqmpi.runtime.adapters.monolithic.monolithic_layout`).  This
+module adds what is specific to Qiskit: creating the global
+``QuantumCircuit`` and adding the spliced global-index instructions to
+it.
+"""
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Sequence, Tuple
+
+# Instruction, splice and translate_rank are re-exported for the Aer modules.
+from netqmpi.runtime.adapters.monolithic.monolithic_layout import (
+    GlobalLayout, Instruction, splice, translate_rank,
+)
+
+if TYPE_CHECKING:
+    from qiskit import QuantumCircuit  # type: ignore[import-not-found]
+
+
+class AerLayout(GlobalLayout):
+    """
+    Placement of every circuit group in the global QuantumCircuit.
+
+    Registers ``qr<g>``/``cr<g>`` of the global circuit hold the slices
+    of circuit group ``g``.
+    """
+
+    def new_circuit(self) -> "QuantumCircuit":
+        """
+        Create an empty global circuit with one register pair per group.
+
+        Returns:
+            A ``QuantumCircuit`` with registers ``qr<g>`` and ``cr<g>``.
+        """
+        from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister  # type: ignore[import-not-found]
+
+        circuit = QuantumCircuit()
+        for group, (qubit_width, clbit_width) in enumerate(zip(self.qubit_widths, self.clbit_widths)):
+            circuit.add_register(QuantumRegister(self.size * qubit_width, f'qr{group}'))
+            circuit.add_register(ClassicalRegister(self.size * clbit_width, f'cr{group}'))
+        return circuit
+
+    def compose(self, programs: Sequence[Sequence[Instruction]]) -> "QuantumCircuit":
+        """
+        Add the segments of the global program to a new global circuit.
+
+        Where the installed Qiskit passes :func:`_bulk_emission_supported`,
+        bypasses ``QuantumCircuit.append`` and its argument broadcasting:
+        instruction names are mapped to Qiskit operations through a
+        table, bit tuples are resolved once per distinct index tuple, and
+        each segment is added to the circuit data in one ``extend`` call.
+        Otherwise every instruction goes through ``append``.
+
+        Args:
+            programs: Segments of the global program, in order, as
+                returned by :func:`splice`.
+
+        Returns:
+            The global circuit.
+        """
+        circuit = self.new_circuit()
+        if _bulk_emission_supported():
+            _extend(circuit, programs)
+        else:
+            _append(circuit, programs)
+        return circuit
+
+
+# ----------------------------------------------------------------------
+# Emission
+# ----------------------------------------------------------------------
+
+def _extend(circuit: "QuantumCircuit", programs: Sequence[Sequence[Instruction]]) -> None:
+    """
+    Add the program segments to the private circuit data in bulk.
+
+    Args:
+        circuit: Global circuit to add to.
+        programs: Segments of the global program, in order.
+    """
+    from qiskit.circuit import CircuitInstruction  # type: ignore[import-not-found]
+
+    data = circuit._data
+    data.reserve(sum(len(program) for program in programs))
+
+    table = _emission_table()
+    from_standard = CircuitInstruction.from_standard
+    qubits, clbits = circuit.qubits, circuit.clbits
+    qargs_cache: Dict[tuple, tuple] = {}
+    cargs_cache: Dict[tuple, tuple] = {(): ()}
+    operations: Dict[tuple, Any] = {}
+
+    for program in programs:
+        batch = []
+        for name, params, qargs, cargs in program:
+            qbits = qargs_cache.get(qargs)
+            if qbits is None:
+                qbits = qargs_cache[qargs] = tuple(qubits[q] for q in qargs)
+            standard, factory = table[name]
+            if standard is not None:
+                batch.append(from_standard(standard, qbits, params))
+                continue
+            cbits = cargs_cache.get(cargs)
+            if cbits is None:
+                cbits = cargs_cache[cargs] = tuple(clbits[c] for c in cargs)
+            operation = operations.get((name, params))
+            if operation is None:
+                operation = operations[name, params] = factory(*params)
+            batch.append(CircuitInstruction(operation, qbits, cbits))
+        data.extend(batch)
+
+
+def _append(circuit: "QuantumCircuit", programs: Sequence[Sequence[Instruction]]) -> None:
+    """
+    Add the program segments through the public ``QuantumCircuit.append``.
+
+    Args:
+        circuit: Global circuit to add to.
+        programs: Segments of the global program, in order.
+    """
+    table = _emission_table()
+    qubits, clbits = circuit.qubits, circuit.clbits
+    operations: Dict[tuple, Any] = {}
+    for program in programs:
+        for name, params, qargs, cargs in program:
+            operation = operations.get((name, params))
+            if operation is None:
+                operation = operations[name, params] = table[name][1](*params)
+            circuit.append(
+                operation, [qubits[q] for q in qargs], [clbits[c] for c in cargs], copy=False,
+            )
+
+
+@lru_cache(maxsize=None)
+def _bulk_emission_supported() -> bool:
+    """
+    Check that the Qiskit internals used by :func:`_extend` still work.
+
+    ``QuantumCircuit._data``, ``CircuitData.reserve``,
+    ``CircuitInstruction.from_standard`` and ``Gate._standard_gate`` are
+    private, so instead of trusting the version number the probe builds
+    a small circuit both ways and compares them.
+
+    Returns:
+        ``True`` if :func:`_extend` builds the same circuit as
+        :func:`_append`.
+    """
+    from qiskit import QuantumCircuit  # type: ignore[import-not-found]
+
+    program = [
+        ("h", (), (0,), ()), ("crz", (0.5,), (0, 1), ()),
+        ("measure", (), (1,), (0,)), ("reset", (), (1,), ()),
+    ]
+    expected = QuantumCircuit(2, 1)
+    _append(expected, [program])
+    try:
+        circuit = QuantumCircuit(2, 1)
+        _extend(circuit, [program])
+    except (AttributeError, TypeError):
+        return False
+    return circuit == expected
+
+
+@lru_cache(maxsize=None)
+def _emission_table() -> Dict[str, Tuple[Any, Any]]:
+    """
+    Map instruction names emitted by the circuit adapter to Qiskit.
+
+    Returns:
+        ``name -> (standard_gate, factory)``.  ``standard_gate`` is the
+        Rust-side gate id that lets instructions be created without a
+        Python gate object, or ``None`` for non-gate instructions and
+        Qiskit versions without standard gates; ``factory`` builds the
+        operation from the instruction parameters.
+    """
+    from qiskit.circuit import Barrier, Measure, Reset  # type: ignore[import-not-found]
+    from qiskit.circuit import library  # type: ignore[import-not-found]
+
+    gates = {
+        "h": library.HGate, "x": library.XGate, "y": library.YGate, "z": library.ZGate,
+        "s": library.SGate, "sdg": library.SdgGate, "t": library.TGate, "tdg": library.TdgGate,
+        "rx": library.RXGate, "ry": library.RYGate, "rz": library.RZGate,
+        "swap": library.SwapGate, "cx": library.CXGate, "ccx": library.CCXGate,
+        "cz": library.CZGate, "crz": library.CRZGate,
+    }
+    table = {}
+    for name, gate in gates.items():
+        # Every parametrised gate used here takes a single angle.
+        probe = gate(0.0) if name in ("rx", "ry", "rz", "crz") else gate()
+        table[name] = (getattr(probe, "_standard_gate", None), gate)
+    table.update({"measure": (None, Measure), "reset": (None, Reset), "barrier": (None, Barrier)})
+    return table
@@ -0,0 +1,263 @@
+"""
+Process-based rank runner for the Qiskit AerSimulator adapter.
+
+With ``AerSimulatorConfig.rank_runner = "process"`` every rank runs its
+user ``main()`` in its own worker process instead of a thread, so script
+code and circuit building no longer serialise on the GIL.
+
+Each worker records its operations as usual.  When a rank leaves its
+``with env.comm:`` block, the worker sends its circuit shapes to the
+coordinator over a pipe.  Once every rank has reported, the coordinator
+plans the global layout and sends it back; each worker then translates
+its own circuits into global-index instructions in parallel with the
+others and ships them to the coordinator, which splices and simulates
+the global circuit exactly as the threaded runner does and answers every
+rank.
+"""
+from __future__ import annotations
+
+import multiprocessing
+import traceback
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from netqmpi.sdk.communicator import QMPICommunicator
+from netqmpi.sdk.topology import Topology
+from netqmpi.runtime import profiling, tracing
+from netqmpi.sdk.environment import Environment
+from netqmpi.runtime.adapters.aer.aer_circuit import AerCircuitAdapter
+from netqmpi.runtime.adapters.aer.aer_layout import splice, translate_rank
+from netqmpi.runtime.adapters.aer.aer_run_config import AerSimulatorConfig
+from netqmpi.helpers import load_main
+
+if TYPE_CHECKING:
+    from multiprocessing.connection import Connection
+    from netqmpi.runtime.adapters.aer.aer_executor import AerExecutorAdapter
+
+
+class AerProcessCommunicator(QMPICommunicator):
+    """
+    Worker-side communicator for a rank running in its own process.
+
+    Args:
+        rank: Numeric index of the current rank.
+        size: Total number of ranks.
+        config: AerSimulator-specific configuration.
+        conn: Worker end of the pipe to the coordinator.
+    """
+
+    def __init__(
+        self,
+        rank: int,
+        size: int,
+        config: AerSimulatorConfig,
+        conn: "Connection",
+    ) -> None:
+        """
+        Initialize the communicator.
+
+        Args:
+            rank: Numeric index of the current rank.
+            size: Total number of ranks in the communicator.
+            config: AerSimulator-specific configuration.
+            conn: Worker end of the pipe to the coordinator.
+        """
+        super().__init__(rank, size, Topology.parse(config.topology, size))
+        self._config = config
+        self._conn = conn
+
+    def __enter__(self) -> "AerProcessCommunicator":
+        """
+        Enter the communicator context.
+
+        Returns:
+            The communicator instance.
+        """
+        profiling.begin("build", self.rank)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """
+        Report circuit shapes, translate against the planned layout and
+        ship the instructions to the coordinator, then wait for results.
+
+        Args:
+            exc_type: Exception type, if one was raised.
+            exc_val: Exception instance, if one was raised.
+            exc_tb: Traceback, if one was raised.
+        """
+        profiling.end("build", self.rank)
+        shapes = [(circuit.num_qubits, circuit.num_clbits) for circuit in self.circuits]
+        self._conn.send(("exit", shapes))
+        with tracing.span("wait", "aer", rank=self.rank, what="layout"):
+            layout = self._conn.recv()
+        with profiling.phase("translate", self.rank):
+            program = translate_rank(self.circuits, layout)
+        self._conn.send(("program", program))
+        with tracing.span("wait", "aer", rank=self.rank, what="counts"):
+            self.results = self._conn.recv()
+        return None
+
+
+class _RecordingExecutor:
+    """
+    Minimal circuit factory used inside worker processes.
+
+    Circuits created here record operations and are translated in the
+    worker once the coordinator has sent the global layout.
+    """
+
+    def __init__(self, config: AerSimulatorConfig) -> None:
+        self.config = config
+
+    def create_circuit(self, num_qubits: int, num_clbits: int, comm: AerProcessCommunicator) -> AerCircuitAdapter:
+        return AerCircuitAdapter(num_qubits, num_clbits, comm)
+
+
+def run_rank(
+    file: str,
+    rank: int,
+    size: int,
+    config: AerSimulatorConfig,
+    conn: "Connection",
+    profile: Optional[Dict[str, bool]] = None,
+    trace: bool = False,
+) -> None:
+    """
+    Worker entry point: run one rank of a NetQMPI script.
+
+    Module-level so it can be used with the ``spawn`` start method.
+
+    Args:
+        file: Path to the NetQMPI script defining ``main()``.
+        rank: Rank executed by this worker.
+        size: Total number of ranks.
+        config: AerSimulator-specific configuration.
+        conn: Worker end of the pipe to the coordinator.
+        profile: :meth:`Profiler.options <netqmpi.runtime.profiling.Profiler.options>`
+            of the coordinator's profiler, if one is active.  The
+            worker's measurements are sent back with its outcome.
+        trace: Whether the coordinator is tracing; the worker's spans
+            are sent back with its outcome.
+    """
+    profiler = profiling.Profiler(**profile).start() if profile is not None else None
+    tracer = tracing.Tracer(f"rank_{rank}").start() if trace else None
+    try:
+        main_func = load_main(file)
+        comm = AerProcessCommunicator(rank, size, config, conn)
+        with profiling.phase("main", rank), profiling.rank_profile():
+            value = main_func(env=Environment(comm, _RecordingExecutor(config)))
+    except BaseException:
+        conn.send(("error", traceback.format_exc()))
+    else:
+        outcome = {"results": comm.results, "return": value, "network": comm.network_stats}
+        if profiler is not None:
+            profiler.stop()
+            outcome["profile"] = profiler.export()
+        if tracer is not None:
+            tracer.stop()
+            outcome["trace"] = tracer.export()
+        conn.send(("done", outcome))
+    finally:
+        if profiler is not None:
+            profiler.stop()
+        if tracer is not None:
+            tracer.stop()
+        conn.close()
+
+
+def _receive(conns: List["Connection"]) -> List[Any]:
+    """
+    Receive one message from every rank.
+
+    Args:
+        conns: Coordinator ends of the worker pipes, in rank order.
+
+    Returns:
+        The ``(kind, body)`` messages in rank order.
+
+    Raises:
+        RuntimeError: If a rank reports an error.
+    """
+    messages = []
+    for rank, conn in enumerate(conns):
+        with tracing.span("receive", "aer", peer=rank):
+            messages.append(conn.recv())
+    for rank, (kind, body) in enumerate(messages):
+        if kind == "error":
+            raise RuntimeError(f"rank_{rank} failed in its worker process:\n{body}")
+    return messages
+
+
+def run_rank_processes(executor: "AerExecutorAdapter", apps: List[Any]) -> None:
+    """
+    Start one worker process per rank and serve their simulation rounds.
+
+    Every ``with env.comm:`` exit is one round: the coordinator collects
+    circuit shapes from each rank, sends back the planned layout, collects
+    the translated instructions, lets ``executor`` splice and simulate the
+    global circuit, and sends the counts back to every rank.
+
+    Args:
+        executor: Executor planning, assembling and simulating each round.
+        apps: Worker callables returned by
+            :meth:`AerExecutorAdapter.build_apps`; each takes the worker
+            end of a pipe.
+
+    Raises:
+        RuntimeError: If a rank fails or the ranks disagree on the
+            number of communicator blocks.
+    """
+    start_method = executor.config.start_method
+    if start_method is None and "forkserver" in multiprocessing.get_all_start_methods():
+        # Plain fork is unsafe once AerSimulator has run in this process.
+        start_method = "forkserver"
+    context = multiprocessing.get_context(start_method)
+    conns, procs = [], []
+    for app in apps:
+        parent_conn, child_conn = context.Pipe()
+        proc = context.Process(target=app, args=(child_conn,), daemon=True)
+        proc.start()
+        child_conn.close()
+        conns.append(parent_conn)
+        procs.append(proc)
+
+    try:
+        while True:
+            messages = _receive(conns)
+            kinds = {kind for kind, _ in messages}
+            if kinds == {"done"}:
+                profiler, tracer = profiling.active(), tracing.active()
+                for rank, (_, outcome) in enumerate(messages):
+                    exported = outcome.pop("profile", None)
+                    if profiler is not None and exported is not None:
+                        profiler.absorb(exported)
+                    exported = outcome.pop("trace", None)
+                    if tracer is not None and exported is not None:
+                        tracer.absorb(exported)
+                    executor.results[rank] = outcome
+                break
+            if "done" in kinds:
+                raise RuntimeError(
+                    "Ranks left a different number of `with env.comm:` blocks."
+                )
+
+            layout = executor._plan_layout([body for _, body in messages])
+            for conn in conns:
+                conn.send(layout)
+            programs = [body for _, body in _receive(conns)]
+
+            counts = executor._run_simulation(splice(programs))
+            executor._reset()
+            with profiling.phase("distribute"):
+                for conn in conns:
+                    conn.send(counts)
+
+        for proc in procs:
+            proc.join()
+    finally:
+        # Only reached with live workers when a rank failed mid-protocol.
+        for proc in procs:
+            if proc.is_alive():
+                proc.terminate()
+        for conn in conns:
+            conn.close()
@@ -3,17 +3,21 @@ Backend-specific configuration for Qiskit AerSimulator runs.
 """
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 
-from netqmpi.runtime.run_config import RunConfig
+from netqmpi.runtime.adapters.monolithic.monolithic_run_config import MonolithicRunConfig
 
 
 @dataclass
-class AerSimulatorConfig(RunConfig):
+class AerSimulatorConfig(MonolithicRunConfig):
     """
-    Extension of :class:`~netqmpi.runtime.run_config.RunConfig` with
-    Qiskit AerSimulator-specific fields.
+    Extension of
+    :class:`~netqmpi.runtime.adapters.monolithic.monolithic_run_config.MonolithicRunConfig`
+    with Qiskit AerSimulator-specific fields.
+
+    Field ``metadata["choices"]`` lists the accepted values of string
+    fields; the CLI turns it into ``choices`` for the matching option.
 
     Attributes:
         shots: Number of simulation shots.
@@ -21,13 +25,37 @@ class AerSimulatorConfig(RunConfig):
             ``"swap"`` (default) inserts an unphysical SWAP gate between
             the source and destination qubit slots — produces shallower
             circuits and is easier to debug, but does not model a real
-            quantum-network transfer.
-            ``"teleport"`` implements a physically realistic teleportation
-            circuit using mid-circuit measurement and classical feedforward,
-            which requires AerSimulator dynamic-circuits support.
+            quantum-network transfer.  It is the only mode the Aer
+            backend implements; teleportation is not modelled yet.
         seed_simulator: Optional RNG seed for reproducible simulations.
+        max_qubits: Global circuit width above which the program is cut
+            at its inter-rank links and reconstructed by quasi-probability
+            knitting (see :mod:`~netqmpi.runtime.adapters.aer.aer_cutting`).
+            ``None`` (default) never cuts.
+        cutting_workers: Worker processes used to simulate the fragments.
+            ``None`` uses one per CPU.
+        max_sampling_overhead: Refuse to run a cut program whose estimated
+            sampling overhead exceeds this value.  ``None`` disables the
+            check.
+        rank_runner: How rank ``main()`` functions are executed.
+            ``"thread"`` (default) runs every rank in a thread of the
+            current process; the threads share the GIL, so this only
+            overlaps I/O-bound or GIL-releasing work.  ``"process"``
+            runs every rank in its own worker process so script code and
+            circuit building scale across cores (see :mod:`~netqmpi.runtime.adapters.aer.aer_process`).
+        start_method: :mod:`multiprocessing` start method used by the
+            process runner.  ``None`` uses ``"forkserver"`` where
+            available (forking after AerSimulator has run in the same
+            process can crash it) and the platform default elsewhere.
     """
 
     shots: int = 1024
-    transfer_mode: str = "swap"        # "swap" | "teleport"
+    transfer_mode: str = field(default="swap", metadata={"choices": ("swap",)})
     seed_simulator: Optional[int] = None
+    max_qubits: Optional[int] = None
+    cutting_workers: Optional[int] = None
+    max_sampling_overhead: Optional[float] = None
+    rank_runner: str = field(default="thread", metadata={"choices": ("thread", "process")})
+    start_method: Optional[str] = field(
+        default=None, metadata={"choices": ("fork", "spawn", "forkserver")}
+    )
@@ -0,0 +1,44 @@
+"""Bit-vector runtime adapter for NetQMPI.
+
+This package exposes the runtime adapter classes used by NetQMPI to
+simulate reversible classical programs (X, CX, CCX, SWAP, measurements
+and qsend/qrecv) as one bit per qubit, so distributed arithmetic and
+routing kernels run at thousands of qubits.
+
+Classes are loaded on first access, so importing the package is cheap.
+"""
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from netqmpi.runtime.adapters.bitvector.bitvector_circuit import BitVectorCircuitAdapter
+    from netqmpi.runtime.adapters.bitvector.bitvector_executor import BitVectorExecutorAdapter
+    from netqmpi.runtime.adapters.bitvector.bitvector_communicator import BitVectorCommunicator
+    from netqmpi.runtime.adapters.bitvector.bitvector_run_config import BitVectorConfig
+
+# Public name -> submodule defining it.
+_LAZY = {
+    "BitVectorCircuitAdapter": "netqmpi.runtime.adapters.bitvector.bitvector_circuit",
+    "BitVectorExecutorAdapter": "netqmpi.runtime.adapters.bitvector.bitvector_executor",
+    "BitVectorCommunicator": "netqmpi.runtime.adapters.bitvector.bitvector_communicator",
+    "BitVectorConfig": "netqmpi.runtime.adapters.bitvector.bitvector_run_config",
+}
+
+__all__ = [
+    "BitVectorCircuitAdapter",
+    "BitVectorExecutorAdapter",
+    "BitVectorCommunicator",
+    "BitVectorConfig",
+]
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,20 @@
+"""
+Circuit adapter for the bit-vector backend.
+
+Translation into global-index instructions is shared with the other
+monolithic backends (see
+:class:`~netqmpi.runtime.adapters.monolithic.monolithic_circuit.MonolithicCircuitAdapter`);
+the executor checks that the program of all ranks is classical and runs
+it on bits, or hands it to its fallback backend.
+"""
+from __future__ import annotations
+
+from netqmpi.runtime.adapters.monolithic.monolithic_circuit import MonolithicCircuitAdapter
+
+
+class BitVectorCircuitAdapter(MonolithicCircuitAdapter):
+    """
+    Circuit adapter that translates operations into global-index instructions.
+    """
+
+    _BACKEND = "bit-vector"
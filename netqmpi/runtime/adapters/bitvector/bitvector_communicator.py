@@ -0,0 +1,24 @@
+"""
+Communicator adapter for the bit-vector backend.
+
+Manages the context lifecycle for a single rank through the barrier
+protocol of
+:class:`~netqmpi.runtime.adapters.monolithic.monolithic_communicator.MonolithicCommunicator`.
+"""
+from __future__ import annotations
+
+from netqmpi.runtime.adapters.monolithic.monolithic_communicator import MonolithicCommunicator
+
+
+class BitVectorCommunicator(MonolithicCommunicator):
+    """
+    Bit-vector-backed communicator for a single rank.
+
+    Args:
+        rank: Numeric index of the current rank.
+        size: Total number of ranks.
+        config: Bit-vector configuration.
+        executor: Executor that simulates the global program.
+    """
+
+    _TRACE_CATEGORY = "bitvector"
@@ -0,0 +1,109 @@
+"""
+Executor adapter for the bit-vector backend.
+
+This module provides the :class:`BitVectorExecutorAdapter`
+implementation of the :class:`~netqmpi.runtime.executor.Executor`
+interface.  It simulates reversible classical programs one bit per
+qubit, in time and memory linear in the program, and hands any other
+program to a general monolithic backend.
+"""
+from __future__ import annotations
+
+from itertools import chain
+from typing import List
+
+from netqmpi.runtime import profiling
+from netqmpi.runtime.adapters.bitvector.bitvector_circuit import BitVectorCircuitAdapter
+from netqmpi.runtime.adapters.bitvector.bitvector_communicator import BitVectorCommunicator
+from netqmpi.runtime.adapters.bitvector.bitvector_run_config import BitVectorConfig
+from netqmpi.runtime.adapters.monolithic.monolithic_executor import MonolithicExecutor
+from netqmpi.runtime.adapters.monolithic.monolithic_layout import Instruction
+
+
+class BitVectorExecutorAdapter(MonolithicExecutor):
+    """
+    Executor adapter that runs reversible classical NetQMPI apps on bits.
+
+    Ranks run in threads and are translated against a global layout as
+    described in
+    :class:`~netqmpi.runtime.adapters.monolithic.monolithic_executor.MonolithicExecutor`.
+    If every instruction of every rank is classical (see
+    :func:`~netqmpi.runtime.adapters.bitvector.bitvector_state.is_classical`)
+    the program is simulated by
+    :mod:`~netqmpi.runtime.adapters.bitvector.bitvector_state`; otherwise
+    by an executor of the ``fallback`` backend on the same layout.
+
+    Attributes:
+        delegate: The fallback executor that simulated the last run, or
+            ``None`` if it ran on bits.
+    """
+
+    config_class = BitVectorConfig
+    circuit_class = BitVectorCircuitAdapter
+    communicator_class = BitVectorCommunicator
+
+    def __init__(self, size: int, config: BitVectorConfig = None) -> None:
+        """
+        Initialize the bit-vector executor adapter.
+
+        Args:
+            size: Number of parallel ranks to simulate.
+            config: Bit-vector configuration.  Defaults to
+                :class:`BitVectorConfig` with its built-in defaults.
+        """
+        super().__init__(size, config)
+        # Re-narrow the type so the checker knows we have BitVectorConfig.
+        self._config: BitVectorConfig = self._config
+        self.delegate = None
+
+    def _run_simulation(self, programs: List[List[Instruction]]) -> dict:
+        """
+        Simulate the global program on bits, or with the fallback backend.
+
+        Args:
+            programs: Segments of the global program, in order, as
+                returned by :func:`~netqmpi.runtime.adapters.monolithic.monolithic_layout.splice`.
+
+        Returns:
+            The counts to broadcast to every rank.
+
+        Raises:
+            ValueError: If the program is not classical and ``fallback``
+                is ``None``.
+        """
+        from netqmpi.runtime.adapters.bitvector.bitvector_state import describe, is_classical, simulate
+
+        with profiling.phase("submit"):
+            quantum = next(
+                ((name, params) for name, params, _, _ in chain.from_iterable(programs)
+                 if not is_classical(name, params)),
+                None,
+            )
+        if quantum is None:
+            self.delegate = None
+            with profiling.phase("simulate"):
+                return simulate(programs, self._layout, self._config.shots)
+
+        if self._config.fallback is None:
+            raise ValueError(
+                f"{describe(*quantum)} is not a classical gate; the bit-vector backend "
+                "only simulates X, CX, CCX, SWAP, phase gates, measurements and resets "
+                "(set a fallback backend to simulate other programs)."
+            )
+        self.delegate = self._fallback_executor()
+        return self.delegate._run_simulation(programs)
+
+    def _fallback_executor(self) -> MonolithicExecutor:
+        """Return an executor of the fallback backend sharing this run's layout."""
+        from netqmpi.runtime.registry import get_backend
+
+        executor_class = get_backend(self._config.fallback).load()
+        config = executor_class.config_class(
+            shots=self._config.shots,
+            params=self._config.params,
+            transfer_mode=self._config.transfer_mode,
+            seed=self._config.seed,
+        )
+        executor = executor_class(self.size, config)
+        executor._layout = self._layout
+        return executor
@@ -0,0 +1,35 @@
+"""
+Backend-specific configuration for bit-vector runs.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Optional
+
+from netqmpi.runtime.adapters.monolithic.monolithic_run_config import MonolithicRunConfig
+
+
+@dataclass
+class BitVectorConfig(MonolithicRunConfig):
+    """
+    Extension of
+    :class:`~netqmpi.runtime.adapters.monolithic.monolithic_run_config.MonolithicRunConfig`
+    with bit-vector-specific fields.
+
+    Field ``metadata["choices"]`` lists the accepted values of string
+    fields; the CLI turns it into ``choices`` for the matching option.
+
+    Attributes:
+        shots: Number of simulation shots.
+        seed: Optional RNG seed, passed to the fallback backend.
+        fallback: Backend that simulates programs with a non-classical
+            gate, run with the same ``shots``, ``seed`` and
+            ``transfer_mode``.  ``None`` rejects such programs instead.
+    """
+
+    shots: int = 1024
+    seed: Optional[int] = None
+    fallback: Optional[str] = field(
+        default="sparse",
+        metadata={"choices": ("sparse", "numpy", "stabilizer", "mps", "sharded")},
+    )
@@ -0,0 +1,114 @@
+"""
+Bit-vector simulation of reversible classical NetQMPI programs.
+
+A program whose gates map every basis state to a single basis state, up
+to a phase, never leaves the computational basis: starting from
+``|0...0>`` its state is one bit per qubit throughout.  Such gates are
+the *classical* gates:
+
+* X, Y, CX, CCX and any other (controlled) gate whose matrix has a zero
+  diagonal flip their target when every control is ``1``;
+* Z, S, T, RZ, CZ, CRZ and other diagonal gates only change the global
+  phase and are skipped;
+* SWAP, measurements, resets and barriers act on bits directly.
+
+Oracles, adders and swap-mode qsend/qrecv routing fall into this class.
+The program is run once on a ``bytearray`` of the global qubits, in time
+linear in its length and memory linear in its width, and since every
+shot sees the same basis state, all shots share that one outcome.
+"""
+from __future__ import annotations
+
+from functools import lru_cache
+from itertools import chain
+from typing import Dict, Optional, Sequence
+
+from netqmpi.runtime.adapters.monolithic.monolithic_layout import GlobalLayout, Instruction
+from netqmpi.runtime.adapters.numpy.numpy_statevector import _CONTROLLED, gate_matrix
+
+# Matrix entries closer to zero than this count as zero, so rotations by
+# multiples of pi are classical.
+_TOLERANCE = 1e-12
+
+
+@lru_cache(maxsize=None)
+def flips_target(name: str, params: tuple = ()) -> Optional[bool]:
+    """
+    Return how a gate acts on a basis state.
+
+    Args:
+        name: Lower-case instruction name.
+        params: Instruction parameters.
+
+    Returns:
+        ``True`` if the gate flips its target, ``False`` if it only
+        changes the phase, and ``None`` if it creates a superposition or
+        is unknown.
+    """
+    try:
+        matrix = gate_matrix(_CONTROLLED.get(name, name), params)
+    except ValueError:
+        return None
+    if abs(matrix[0, 1]) < _TOLERANCE and abs(matrix[1, 0]) < _TOLERANCE:
+        return False
+    if abs(matrix[0, 0]) < _TOLERANCE and abs(matrix[1, 1]) < _TOLERANCE:
+        return True
+    return None
+
+
+def is_classical(name: str, params: tuple = ()) -> bool:
+    """
+    Return whether an instruction keeps basis states in the basis.
+
+    Args:
+        name: Lower-case instruction name.
+        params: Instruction parameters.
+
+    Returns:
+        ``True`` for classical gates, SWAP, measurements, resets and barriers.
+    """
+    return name in ("swap", "measure", "reset", "barrier") or flips_target(name, params) is not None
+
+
+def simulate(programs: Sequence[Sequence[Instruction]], layout: GlobalLayout, shots: int) -> Dict[str, int]:
+    """
+    Run a classical global program and return its counts.
+
+    Args:
+        programs: Segments of the global program, in order, as
+            returned by :func:`~netqmpi.runtime.adapters.monolithic.monolithic_layout.splice`.
+        layout: Global layout, used to size the registers and format the
+            counts keys.
+        shots: Number of shots.
+
+    Returns:
+        The counts, keyed as by
+        :meth:`~netqmpi.runtime.adapters.monolithic.monolithic_layout.GlobalLayout.counts_key`.
+
+    Raises:
+        ValueError: If an instruction is not classical.
+    """
+    if shots <= 0:
+        return {}
+    bits = bytearray(layout.num_qubits)
+    clbits = [0] * layout.num_clbits
+    for name, params, qubits, targets in chain.from_iterable(programs):
+        if name == "measure":
+            clbits[targets[0]] = bits[qubits[0]]
+        elif name == "reset":
+            bits[qubits[0]] = 0
+        elif name == "swap":
+            p, q = qubits
+            bits[p], bits[q] = bits[q], bits[p]
+        elif name != "barrier":
+            flips = flips_target(name, params)
+            if flips is None:
+                raise ValueError(f"{describe(name, params)} is not a classical gate.")
+            if flips and all(bits[c] for c in qubits[:-1]):
+                bits[qubits[-1]] ^= 1
+    return {layout.counts_key(clbits): shots}
+
+
+def describe(name: str, params: tuple = ()) -> str:
+    """Return an instruction as ``name(params)`` for error messages."""
+    return f"{name}({', '.join(map(str, params))})" if params else name
@@ -2,17 +2,58 @@
 
 This package exposes the CUNQA-specific runtime adapter classes used by
 NetQMPI.
+
+Classes are loaded on first access, so importing the package neither
+imports ``cunqa`` nor touches ``sys.path``.
 """
-from netqmpi.runtime.adapters.cunqa.cunqa_circuit import CunqaCircuitAdapter
-from netqmpi.runtime.adapters.cunqa.cunqa_executor import (
-    CunqaExecutorAdapter, 
-    CunqaRunConfig
-)
-from netqmpi.runtime.adapters.cunqa.cunqa_communicator import CunqaCommunicator
+import importlib
+import os
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from netqmpi.runtime.adapters.cunqa.cunqa_circuit import CunqaCircuitAdapter
+    from netqmpi.runtime.adapters.cunqa.cunqa_executor import (
+        CunqaExecutorAdapter,
+        CunqaRunConfig
+    )
+    from netqmpi.runtime.adapters.cunqa.cunqa_communicator import CunqaCommunicator
+
+# Public name -> submodule defining it.
+_LAZY = {
+    'CunqaCircuitAdapter': 'netqmpi.runtime.adapters.cunqa.cunqa_circuit',
+    'CunqaExecutorAdapter': 'netqmpi.runtime.adapters.cunqa.cunqa_executor',
+    'CunqaCommunicator': 'netqmpi.runtime.adapters.cunqa.cunqa_communicator',
+    'CunqaRunConfig': 'netqmpi.runtime.adapters.cunqa.cunqa_executor',
+}
 
 __all__ = [
     'CunqaCircuitAdapter',
     'CunqaExecutorAdapter',
     'CunqaCommunicator',
     'CunqaRunConfig'
-]
\ No newline at end of file
+]
+
+
+def _add_cunqa_path() -> None:
+    """
+    Make a CUNQA installation under ``$HOME`` importable.
+
+    Called by the adapter submodules right before they import ``cunqa``;
+    appends ``$HOME`` to ``sys.path`` at most once.
+    """
+    home = os.getenv("HOME")
+    if home and home not in sys.path:
+        sys.path.append(home)
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
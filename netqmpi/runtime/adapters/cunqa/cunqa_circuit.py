@@ -3,20 +3,23 @@ Adapter for the CUNQA backend circuit.
 
 This module implements the ``Circuit`` interface for CUNQA circuits.
 """
-import os, sys
-sys.path.append(os.getenv("HOME"))
-
 from typing import Any
 
+from netqmpi.runtime.adapters.cunqa import _add_cunqa_path
+_add_cunqa_path()
+
 from cunqa.circuit.core import CunqaCircuit
 
 from netqmpi.sdk.circuit import Circuit
+from netqmpi.sdk.collectives import lower_broadcast, lower_collective, lower_reduce
 from netqmpi.sdk.operations import (
     Operation,
     Gate, ControlledGate, ClassicalControlledGate,
     Measure, Reset, Barrier,
     OperationContainer,
-    QSend, QRecv, QScatter, QGather, Expose, Unexpose,
+    QSend, QRecv, QISend, QIRecv, QWait,
+    QScatter, QGather, QBcast, QUnbcast, QReduce, QAllreduce,
+    Expose, Unexpose,
 )
 from netqmpi.runtime.adapters.cunqa.cunqa_communicator import CunqaCommunicator
 
@@ -85,7 +88,10 @@ class CunqaCircuitAdapter(Circuit):
         Args:
             op: Controlled gate operation to translate.
         """
-        
+        # ControlledGate has no name of its own: it is named after its target.
+        target = op.targets[0]
+        name = "C" + target.name
+
         gate_2q = {
             # 2 qubits
             "CX":   lambda: self._cunqa_circuit.cx(*op.qubits),
@@ -93,11 +99,11 @@ class CunqaCircuitAdapter(Circuit):
             "SWAP": lambda: self._cunqa_circuit.swap(*op.qubits),
             
             # 2 qubits
-            "CRZ": lambda: self._cunqa_circuit.crz(op.params[0], *op.qubits),
+            "CRZ": lambda: self._cunqa_circuit.crz(target.params[0], *op.qubits),
         }
 
-        if op.name in gate_2q:
-            gate_2q[op.name]()
+        if name in gate_2q:
+            gate_2q[name]()
             
 
     def _translate_classical_controlled_gate(self, op: ClassicalControlledGate):
@@ -160,7 +166,12 @@ class CunqaCircuitAdapter(Circuit):
         Args:
             op: Quantum send operation to translate.
         """
-        self._cunqa_circuit.qsend(op.qubits[0], f"rank_{op.dest_rank}")
+        for q in op.qubits:
+            self._cunqa_circuit.qsend(q, f"rank_{op.dest_rank}")
+        # CUNQA moves the qubits itself; count the links a routed
+        # transfer would use.
+        comm = self._comm
+        comm.network_stats.record_transfer(comm.topology, comm.rank, op.dest_rank, len(op.qubits))
 
     def _translate_qrecv(self, op: QRecv):
         """
@@ -169,31 +180,75 @@ class CunqaCircuitAdapter(Circuit):
         Args:
             op: Quantum receive operation to translate.
         """
-        self._cunqa_circuit.qrecv(op.qubits[0], f"rank_{op.src_rank}")
+        for q in op.qubits:
+            self._cunqa_circuit.qrecv(q, f"rank_{op.src_rank}")
 
     def _translate_qscatter(self, op: QScatter):
         """
-        Translate a quantum scatter operation into CUNQA instructions.
+        Translate a quantum scatter into the qsend/qrecv of its schedule.
 
         Args:
             op: Quantum scatter operation to translate.
-
-        Raises:
-            NotImplementedError: Always, because this operation is not yet supported.
         """
-        raise NotImplementedError("QScatter is not yet implemented for the CUNQA backend.")
+        comm = self._comm
+        for child in lower_collective(op, comm.rank, comm.size, self._num_qubits, comm.topology):
+            self.translate(child)
 
     def _translate_qgather(self, op: QGather):
         """
-        Translate a quantum gather operation into CUNQA instructions.
+        Translate a quantum gather into the qsend/qrecv of its schedule.
 
         Args:
             op: Quantum gather operation to translate.
+        """
+        comm = self._comm
+        for child in lower_collective(op, comm.rank, comm.size, self._num_qubits, comm.topology):
+            self.translate(child)
 
-        Raises:
-            NotImplementedError: Always, because this operation is not yet supported.
+    def _translate_qbcast(self, op: QBcast):
+        """
+        Translate a quantum broadcast into teleportations along its tree.
+
+        Args:
+            op: Quantum broadcast operation to translate.
         """
-        raise NotImplementedError("QGather is not yet implemented for the CUNQA backend.")
+        comm = self._comm
+        for child in lower_broadcast(
+            op, comm.rank, comm.size, self._num_qubits, topology=comm.topology
+        ):
+            self.translate(child)
+
+    def _translate_qunbcast(self, op: QUnbcast):
+        """
+        Translate the end of a quantum broadcast into teleportations along its tree.
+
+        Args:
+            op: Quantum unbroadcast operation to translate.
+        """
+        comm = self._comm
+        for child in lower_broadcast(
+            op, comm.rank, comm.size, self._num_qubits, topology=comm.topology
+        ):
+            self.translate(child)
+
+    def _translate_qreduce(self, op: QReduce):
+        """
+        Translate a quantum reduce into local gates around a broadcast of its target.
+
+        Args:
+            op: Quantum reduce operation to translate.
+        """
+        comm = self._comm
+        for child in lower_reduce(op, comm.rank):
+            if isinstance(child, (QBcast, QUnbcast)):
+                # The broadcast's ancilla must not be the data qubit.
+                for g in lower_broadcast(
+                    child, comm.rank, comm.size, self._num_qubits,
+                    reserved=[op.qubit], topology=comm.topology,
+                ):
+                    self.translate(g)
+            else:
+                self.translate(child)
 
     def _translate_expose(self, op: Expose):
         """
@@ -245,8 +300,15 @@ class CunqaCircuitAdapter(Circuit):
             OperationContainer:      self._translate_operation_container,
             QSend:                   self._translate_qsend,
             QRecv:                   self._translate_qrecv,
+            QISend:                  self._translate_qisend,
+            QIRecv:                  self._translate_qirecv,
+            QWait:                   self._translate_qwait,
             QScatter:                self._translate_qscatter,
             QGather:                 self._translate_qgather,
+            QBcast:                  self._translate_qbcast,
+            QUnbcast:                self._translate_qunbcast,
+            QReduce:                 self._translate_qreduce,
+            QAllreduce:              self._translate_qreduce,
             Expose:                  self._translate_expose,
             Unexpose:                self._translate_unexpose,
         }
@@ -8,7 +8,11 @@ backend-agnostic :class:`QMPICommunicator` interface.
 from __future__ import annotations
 
 from netqmpi.sdk import QMPICommunicator
+from netqmpi.sdk.topology import Topology
+from netqmpi.runtime import profiling
 from netqmpi.runtime.run_config import RunConfig
+from netqmpi.runtime.adapters.cunqa import _add_cunqa_path
+_add_cunqa_path()
 
 from cunqa.qpu import QPU
 from cunqa.qpu import run
@@ -37,7 +41,7 @@ class CunqaCommunicator(QMPICommunicator):
             rank: Numeric index of the current rank.
             size: Total number of ranks in the communicator.
         """
-        super().__init__(rank, size)
+        super().__init__(rank, size, Topology.parse(config.topology, size))
         CunqaCommunicator.qpus.append(qpu)
         self._config = config
 
@@ -48,6 +52,7 @@ class CunqaCommunicator(QMPICommunicator):
         Returns:
             None.
         """
+        profiling.begin("build", self.rank)
         return None
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
@@ -62,16 +67,20 @@ class CunqaCommunicator(QMPICommunicator):
         Returns:
             None.
         """
-        for circuit in self.circuits:
-            CunqaCommunicator.cunqa_circuits.append(circuit.translate(circuit.ops))
+        profiling.end("build", self.rank)
+        with profiling.phase("translate", self.rank):
+            for circuit in self.circuits:
+                CunqaCommunicator.cunqa_circuits.append(circuit.translate(circuit.ops))
             
         if len(CunqaCommunicator.cunqa_circuits) == self.size:
-            qjobs = run(
-                [circuit for circuit in CunqaCommunicator.cunqa_circuits], 
-                CunqaCommunicator.qpus, 
-                shots = self._config.shots
-            )
-            cunqa_results = gather(qjobs)
+            with profiling.phase("submit"):
+                qjobs = run(
+                    [circuit for circuit in CunqaCommunicator.cunqa_circuits], 
+                    CunqaCommunicator.qpus, 
+                    shots = self._config.shots
+                )
+            with profiling.phase("simulate"):
+                cunqa_results = gather(qjobs)
             self.results = cunqa_results[0].counts
         
         return None
\ No newline at end of file
@@ -4,12 +4,12 @@ Executor adapter for the CUNQA backend.
 This module provides an implementation of the ``Executor`` interface for
 running applications with the CUNQA backend.
 """
-import os, sys
-sys.path.append(os.getenv("HOME"))
-
 from typing import Dict, Any
 from dataclasses import dataclass
 
+from netqmpi.runtime.adapters.cunqa import _add_cunqa_path
+_add_cunqa_path()
+
 from cunqa.qpu import qraise, get_QPUs, qdrop
 
 from netqmpi.runtime.executor import Executor
@@ -45,6 +45,8 @@ class CunqaExecutorAdapter(Executor):
     This adapter enables execution through CUNQA while conforming to the
     common interface defined by :class:`Executor`.
     """
+
+    config_class = CunqaRunConfig
     
     def __init__(self, size: int, config: CunqaRunConfig = None):
         """
@@ -89,6 +91,7 @@ class CunqaExecutorAdapter(Executor):
             A collection of wrapped application callables, one per rank.
         """
         main_func = load_main(file)
+        self.results = {}
 
         try:
             self._family = qraise(size, "00:10:00", simulator="Aer", co_located=True, quantum_comm=True)
@@ -99,7 +102,7 @@ class CunqaExecutorAdapter(Executor):
         apps = []
         for rank, qpu in enumerate(qpus):
             env = Environment(CunqaCommunicator(rank, size, qpu, self._config), self)
-            wrapped_main = lambda env=env: main_func(env=env)
+            wrapped_main = lambda env=env: self._run_main(main_func, env)
             apps.append(wrapped_main)
         
         return apps
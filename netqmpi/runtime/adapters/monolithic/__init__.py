@@ -0,0 +1,49 @@
+"""Shared layer of the monolithic-program runtime adapters.
+
+Backends that simulate every rank as part of one global program (Aer,
+the NumPy simulators) share the layout planning, the translation of SDK
+operations into global-index instructions, the rank barrier protocol
+and the thread runner defined here.  A backend only subclasses
+:class:`MonolithicExecutor` and implements how the global program is
+simulated.
+
+Classes are loaded on first access, so importing the package is cheap.
+"""
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from netqmpi.runtime.adapters.monolithic.monolithic_circuit import MonolithicCircuitAdapter
+    from netqmpi.runtime.adapters.monolithic.monolithic_communicator import MonolithicCommunicator
+    from netqmpi.runtime.adapters.monolithic.monolithic_executor import MonolithicExecutor
+    from netqmpi.runtime.adapters.monolithic.monolithic_layout import GlobalLayout
+    from netqmpi.runtime.adapters.monolithic.monolithic_run_config import MonolithicRunConfig
+
+# Public name -> submodule defining it.
+_LAZY = {
+    "MonolithicCircuitAdapter": "netqmpi.runtime.adapters.monolithic.monolithic_circuit",
+    "MonolithicCommunicator": "netqmpi.runtime.adapters.monolithic.monolithic_communicator",
+    "MonolithicExecutor": "netqmpi.runtime.adapters.monolithic.monolithic_executor",
+    "GlobalLayout": "netqmpi.runtime.adapters.monolithic.monolithic_layout",
+    "MonolithicRunConfig": "netqmpi.runtime.adapters.monolithic.monolithic_run_config",
+}
+
+__all__ = [
+    "MonolithicCircuitAdapter",
+    "MonolithicCommunicator",
+    "MonolithicExecutor",
+    "GlobalLayout",
+    "MonolithicRunConfig",
+]
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,588 @@
+"""
+Circuit adapter shared by the monolithic-program backends.
+
+Translates SDK operations into a private list of instructions on global
+qubit/clbit indices.  Every local index is shifted by the rank's offset
+in the planned
+:class:`~netqmpi.runtime.adapters.monolithic.monolithic_layout.GlobalLayout`;
+the executor splices the lists of all ranks into one global program for
+its simulator.
+"""
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, TYPE_CHECKING
+
+from netqmpi.sdk.circuit import Circuit
+from netqmpi.sdk.collectives import broadcast_links, chunk_bounds
+from netqmpi.sdk.operations import (
+    Operation,
+    Gate, ControlledGate, ClassicalControlledGate,
+    Measure, Reset, Barrier,
+    OperationContainer,
+    QSend, QRecv, QISend, QIRecv, QWait,
+    QScatter, QGather, QBcast, QUnbcast, QReduce, QAllreduce,
+    Expose, Unexpose,
+)
+from netqmpi.runtime.adapters.monolithic.monolithic_layout import SYNC
+
+if TYPE_CHECKING:
+    from netqmpi.sdk.communicator import QMPICommunicator
+    from netqmpi.runtime.adapters.monolithic.monolithic_layout import GlobalLayout, Instruction
+
+
+class MonolithicCircuitAdapter(Circuit):
+    """
+    Circuit adapter that translates operations into global-index instructions.
+
+    Once bound to a layout, each rank owns a contiguous slice
+    ``[qubit_offset, qubit_offset + num_qubits)`` of its circuit group's
+    qubit register and the analogous slice of the classical register.
+    All translate methods map local indices to global indices before
+    emitting instructions, so ranks can translate independently.
+
+    Instructions that act on other ranks' qubits are emitted at sync
+    points (see :meth:`_sync`), so they run after the earlier instructions
+    of every rank taking part although ranks are spliced in rank order.
+
+    For qsend, the destination offset within the same circuit group is
+    computed as ``group_base + dest_rank * group_width``, which remains
+    valid regardless of how many circuit groups exist.  Like qsend,
+    expose, qbcast and qreduce pair qubits by local index: qubit ``q``
+    of the exposer or root is copied into, or reduced from, qubit ``q``
+    of every other rank.
+
+    The global program ignores the communicator's topology, but the
+    links and routes a distributed run would use are counted in
+    :attr:`~netqmpi.sdk.communicator.QMPICommunicator.network_stats`.
+
+    Instruction names are lower-case Qiskit names: ``h``, ``x``, ``y``,
+    ``z``, ``s``, ``sdg``, ``t``, ``tdg``, ``rx``, ``ry``, ``rz``,
+    ``swap``, ``cx``, ``ccx``, ``cz``, ``crz``, ``measure``, ``reset``
+    and ``barrier``.
+    """
+
+    # Backend name used in error messages.
+    _BACKEND = "monolithic"
+
+    def __init__(
+        self,
+        num_qubits: int,
+        num_clbits: int,
+        comm: "QMPICommunicator",
+    ) -> None:
+        """
+        Initialize the circuit adapter.
+
+        Args:
+            num_qubits: Number of qubits for this rank's circuit slice.
+            num_clbits: Number of classical bits for this rank's circuit slice.
+            comm: Communicator owning this rank.
+        """
+        super().__init__(num_qubits, num_clbits, comm)
+        self._config = comm._config
+        self._offset = 0
+        self._clbit_offset = 0
+        self._group_base = 0
+        self._group_width = num_qubits
+        self._instructions: List["Instruction"] = []
+        # Exposer rank -> stack of the qubit lists of its open expose windows.
+        self._exposed: Dict[int, List[List[int]]] = {}
+
+    def bind(self, layout: "GlobalLayout", group: int) -> None:
+        """
+        Fix this circuit's global offsets and clear earlier instructions.
+
+        Args:
+            layout: Planned global layout.
+            group: Circuit group this circuit belongs to.
+        """
+        rank = self._comm.rank
+        self._offset = layout.qubit_offset(group, rank)
+        self._clbit_offset = layout.clbit_offset(group, rank)
+        self._group_base = layout.qubit_bases[group]
+        self._group_width = layout.qubit_widths[group]
+        self._instructions = []
+        self._exposed = {}
+
+    def _emit(self, name: str, qubits: tuple, clbits: tuple = (), params: tuple = ()) -> None:
+        """
+        Append one global-index instruction.
+
+        Args:
+            name: Lower-case Qiskit instruction name.
+            qubits: Global qubit indices.
+            clbits: Global clbit indices.
+            params: Instruction parameters.
+        """
+        self._instructions.append((name, params, qubits, clbits))
+
+    @contextmanager
+    def _sync(self, ranks: Iterable[int]) -> Iterator[None]:
+        """
+        Emit the instructions of a ``with`` block at a sync point of ``ranks``.
+
+        The block's instructions are wrapped in one sync marker, which
+        :func:`~netqmpi.runtime.adapters.monolithic.monolithic_layout.splice`
+        emits once every rank in ``ranks`` has reached its own marker for
+        the same ranks.  Every rank taking part must open a sync point,
+        even one that emits nothing.
+
+        Args:
+            ranks: Ranks taking part, this one included.
+        """
+        program = self._instructions
+        self._instructions = []
+        try:
+            yield
+        finally:
+            instructions, self._instructions = self._instructions, program
+        ranks = tuple(sorted(set(ranks) | {self._comm.rank}))
+        program.append((SYNC, tuple(instructions), ranks, ()))
+
+    def _check_transfer_mode(self) -> None:
+        """
+        Check that inter-rank operations can be emitted.
+
+        The CLI only offers ``"swap"``; this catches other modes set on
+        the config directly.
+
+        Raises:
+            NotImplementedError: When ``transfer_mode`` is ``"teleport"``.
+        """
+        if self._config.transfer_mode != "swap":
+            raise NotImplementedError(
+                "teleport mode is not yet implemented; use transfer_mode='swap'"
+            )
+
+    def _copy_exposed(self, qubits: List[int], rank: int) -> None:
+        """
+        Entangle local qubits with the same qubits of an exposer rank.
+
+        Emits ``cx(exposer qubit q, local qubit q)``.  Applied to a local
+        qubit in ``|0>`` this creates the cat state of the cat-entangler;
+        applied again it is the cat-disentangler.
+
+        Args:
+            qubits: Local qubit indices, paired by index with the exposer's.
+            rank: Exposer rank.
+
+        Raises:
+            NotImplementedError: When ``transfer_mode`` is ``"teleport"``.
+        """
+        self._check_transfer_mode()
+        source_offset = self._group_base + rank * self._group_width
+        for q in qubits:
+            self._emit("cx", (q + source_offset, q + self._offset))
+
+    def _transfer(self, qubits: List[int], dest_rank: int, dest_qubits: List[int]) -> None:
+        """
+        Move local qubits into a destination rank's slice of the group.
+
+        Callers emit the SWAPs inside a sync point of the ranks taking
+        part in the transfer.
+
+        Args:
+            qubits: Local qubit indices on this rank.
+            dest_rank: Rank receiving the qubits.
+            dest_qubits: Local qubit indices on ``dest_rank``, one per
+                entry of ``qubits``.
+
+        Raises:
+            IndexError: If a destination index is outside the group width.
+            NotImplementedError: When ``transfer_mode`` is ``"teleport"``.
+        """
+        self._check_transfer_mode()
+        dest_offset = self._group_base + dest_rank * self._group_width
+        for q, d in zip(qubits, dest_qubits):
+            if d >= self._group_width:
+                raise IndexError(
+                    f"Qubit {d} of rank {dest_rank} is outside its circuit "
+                    f"(width {self._group_width})."
+                )
+            self._emit("swap", (q + self._offset, d + dest_offset))
+        comm = self._comm
+        comm.network_stats.record_transfer(comm.topology, comm.rank, dest_rank, len(qubits))
+
+    def _record_fanout(self, root: int) -> None:
+        """
+        Count the EPR pair of this rank's link in a broadcast tree.
+
+        Args:
+            root: Root of the broadcast.
+        """
+        comm = self._comm
+        parent, _ = broadcast_links(comm.rank, comm.size, root, comm.topology)
+        if parent is not None:
+            comm.network_stats.record_pairs(parent, comm.rank)
+
+    # ------------------------------------------------------------------
+    # Translation methods
+    # ------------------------------------------------------------------
+
+    # SDK gate name -> Qiskit instruction name.
+    _GATE_NAMES = {
+        "H": "h", "X": "x", "Y": "y", "Z": "z",
+        "S": "s", "SDG": "sdg", "T": "t", "TDG": "tdg",
+        "RX": "rx", "RY": "ry", "RZ": "rz",
+        "SWAP": "swap",
+    }
+
+    def _translate_gate(self, op: Gate) -> None:
+        """
+        Translate a single-qubit (or two-qubit SWAP) gate.
+
+        Args:
+            op: Gate operation to translate.
+        """
+        name = self._GATE_NAMES.get(op.name)
+        if name is not None:
+            self._emit(name, tuple(q + self._offset for q in op.qubits), params=tuple(op.params))
+
+    def _translate_controlled_gate(self, op: ControlledGate) -> None:
+        """
+        Translate a controlled gate (CX, CZ, CRZ, CCX).
+
+        Args:
+            op: Controlled gate operation to translate.
+        """
+        target_name = op.targets[0].name
+        ctrl = tuple(c + self._offset for c in op.controls)
+        tgt = tuple(q + self._offset for q in op.targets[0].qubits)
+
+        if target_name == "X":
+            if len(ctrl) == 1:
+                self._emit("cx", ctrl + tgt)
+            elif len(ctrl) == 2:
+                self._emit("ccx", ctrl + tgt)
+        elif target_name == "Z" and len(ctrl) == 1:
+            self._emit("cz", ctrl + tgt)
+        elif target_name == "RZ" and len(ctrl) == 1:
+            self._emit("crz", ctrl + tgt, params=(op.targets[0].params[0],))
+
+    def _translate_classical_controlled_gate(self, op: ClassicalControlledGate) -> None:
+        """
+        Translate a classically controlled gate.
+
+        Args:
+            op: Classically controlled gate operation.
+
+        Raises:
+            NotImplementedError: Always; not yet supported for this backend.
+        """
+        raise NotImplementedError(
+            f"ClassicalControlledGate is not yet implemented for the {self._BACKEND} backend."
+        )
+
+    def _translate_measure(self, op: Measure) -> None:
+        """
+        Translate a measurement into a global-index instruction.
+
+        Args:
+            op: Measurement operation to translate.
+        """
+        self._emit("measure", (op.qubits[0] + self._offset,), (op.cbit + self._clbit_offset,))
+
+    def _translate_reset(self, op: Reset) -> None:
+        """
+        Translate a reset into a global-index instruction.
+
+        Args:
+            op: Reset operation to translate.
+        """
+        self._emit("reset", (op.qubits[0] + self._offset,))
+
+    def _translate_barrier(self, op: Barrier) -> None:
+        """
+        Translate a barrier across all global qubits owned by this rank.
+
+        Args:
+            op: Barrier operation to translate.
+        """
+        if op.qubits:
+            global_qubits = tuple(q + self._offset for q in op.qubits)
+        else:
+            global_qubits = tuple(range(self._offset, self._offset + self._num_qubits))
+        self._emit("barrier", global_qubits, params=(len(global_qubits),))
+
+    def _translate_operation_container(self, op: OperationContainer) -> None:
+        """
+        Translate an operation container by translating each leaf operation.
+
+        Args:
+            op: Operation container to translate.
+        """
+        for child in op.flatten():
+            self.translate(child)
+
+    def _translate_qsend(self, op: QSend) -> None:
+        """
+        Translate a quantum send into global-index instructions.
+
+        In ``swap`` mode, emits a SWAP gate between the source qubit slot
+        and the matching slot on the destination rank within the same circuit
+        group, at a sync point of the two ranks.  The destination offset is
+        ``group_base + dest_rank * group_width``, which remains correct
+        across multiple circuit groups.
+
+        Args:
+            op: Quantum send operation to translate.
+
+        Raises:
+            NotImplementedError: When ``transfer_mode`` is ``"teleport"``.
+        """
+        with self._sync((self._comm.rank, op.dest_rank)):
+            self._transfer(op.qubits, op.dest_rank, op.qubits)
+
+    def _translate_qrecv(self, op: QRecv) -> None:
+        """
+        Translate a quantum receive into the sender's sync point.
+
+        After a ``qsend`` SWAP the transferred state is already in the
+        destination slot, so the receiver only opens the sync point at
+        which the sender's SWAPs run.
+
+        Args:
+            op: Quantum receive operation to translate.
+        """
+        with self._sync((op.src_rank, self._comm.rank)):
+            pass
+
+    def _translate_qscatter(self, op: QScatter) -> None:
+        """
+        Translate a quantum scatter into global-index instructions.
+
+        The sender splits its qubit list into ``size`` contiguous chunks,
+        the first ``len(qubits) % size`` of them one qubit longer, and
+        keeps chunk ``sender_rank``.  The ``j``-th qubit of chunk ``r``
+        lands on local qubit ``j`` of rank ``r``.  The transfers run at
+        a sync point of all ranks, where receivers emit nothing.
+
+        Swap-mode transfers are relabelings resolved when the program is
+        compiled, so every chunk moves straight to its rank whatever the
+        op's ``algorithm``: the tree schedules of
+        :mod:`netqmpi.sdk.collectives` would only add SWAPs.
+
+        Args:
+            op: Quantum scatter operation to translate.
+
+        Raises:
+            IndexError: If a chunk is wider than the circuit group.
+            NotImplementedError: When ``transfer_mode`` is ``"teleport"``.
+        """
+        rank, size = self._comm.rank, self._comm.size
+        with self._sync(range(size)):
+            if rank != op.sender_rank:
+                return
+            for dest, (start, stop) in enumerate(chunk_bounds(len(op.qubits), size)):
+                if dest != rank:
+                    qubits = op.qubits[start:stop]
+                    self._transfer(qubits, dest, list(range(len(qubits))))
+
+    def _translate_qgather(self, op: QGather) -> None:
+        """
+        Translate a quantum gather into global-index instructions.
+
+        Every rank but ``recv_rank`` contributes ``k = len(qubits)``
+        qubits; the ``j``-th qubit of rank ``r`` lands on local qubit
+        ``r * k + j`` of the receiver, whose own qubits stay in place.
+        The transfers run at a sync point of all ranks, where the receiver
+        emits nothing, and the op's ``algorithm`` is ignored as for
+        :meth:`_translate_qscatter`.
+
+        Args:
+            op: Quantum gather operation to translate.
+
+        Raises:
+            IndexError: If the receiver's circuit group is too narrow.
+            NotImplementedError: When ``transfer_mode`` is ``"teleport"``.
+        """
+        rank = self._comm.rank
+        with self._sync(range(self._comm.size)):
+            if rank == op.recv_rank:
+                return
+            k = len(op.qubits)
+            self._transfer(op.qubits, op.recv_rank, list(range(rank * k, (rank + 1) * k)))
+
+    def _translate_qbcast(self, op: QBcast) -> None:
+        """
+        Translate a quantum broadcast into global-index instructions.
+
+        Every rank but the root copies the root's qubit into its own
+        qubit of the same local index with a CX, as
+        :meth:`_translate_expose` does for one qubit.  In one global
+        program the copies need no tree: each CX reads the root's qubit
+        directly, at a sync point of all ranks so that it sees the root's
+        earlier gates.
+
+        Args:
+            op: Quantum broadcast operation to translate.
+
+        Raises:
+            NotImplementedError: When ``transfer_mode`` is ``"teleport"``.
+        """
+        with self._sync(range(self._comm.size)):
+            if self._comm.rank != op.root:
+                self._copy_exposed(op.qubits, op.root)
+                self._record_fanout(op.root)
+
+    def _translate_qunbcast(self, op: QUnbcast) -> None:
+        """
+        Translate the end of a quantum broadcast into global-index instructions.
+
+        Ranks other than the root repeat the CX of :meth:`_translate_qbcast`
+        at a sync point of all ranks, which returns their copies to ``|0>``.
+
+        Args:
+            op: Quantum unbroadcast operation to translate.
+
+        Raises:
+            NotImplementedError: When ``transfer_mode`` is ``"teleport"``.
+        """
+        with self._sync(range(self._comm.size)):
+            if self._comm.rank != op.root:
+                self._copy_exposed(op.qubits, op.root)
+
+    def _translate_qreduce(self, op: QReduce) -> None:
+        """
+        Translate a quantum reduce or allreduce into global-index instructions.
+
+        In one global program the data qubits act on the root's target
+        directly: ``cx(data, target)`` for ``"xor"``, and
+        ``crz(theta)`` from the target with ``rz(theta / 2)`` on it, a
+        controlled phase, for ``"phase"``.  Every rank adds its data
+        qubit at a sync point of all ranks, so the contributions follow
+        the earlier gates of every rank, the root's included, and precede
+        their later ones.
+
+        For an allreduce every rank but the root then copies the root's
+        target as :meth:`_translate_qbcast` does, at a second sync point
+        that follows every contribution.
+
+        Args:
+            op: Quantum reduce operation to translate.
+
+        Raises:
+            NotImplementedError: When ``transfer_mode`` is ``"teleport"``.
+        """
+        self._check_transfer_mode()
+        rank, size = self._comm.rank, self._comm.size
+        qubit = op.qubit + self._offset
+        target = op.target + self._group_base + op.root * self._group_width
+        allreduce = isinstance(op, QAllreduce)
+
+        with self._sync(range(size)):
+            if op.operation == "xor":
+                self._emit("cx", (qubit, target))
+            else:
+                self._emit("crz", (target, qubit), params=(op.theta,))
+                self._emit("rz", (target,), params=(op.theta / 2,))
+        if allreduce:
+            with self._sync(range(size)):
+                if rank != op.root:
+                    self._copy_exposed([op.target], op.root)
+        for _ in range(2 if allreduce else 1):
+            self._record_fanout(op.root)
+
+    def _translate_expose(self, op: Expose) -> None:
+        """
+        Translate an expose operation into global-index instructions.
+
+        Every rank but the exposer copies the exposed qubits into its own
+        qubits of the same local index with a CX, which is the
+        cat-entangler without its EPR pair and feed-forward.  Inside the
+        window, those qubits share a cat state with the exposer's and can
+        be used as controls for remote operations.  They must be ``|0>``
+        when the window opens.  The copies run at a sync point of all
+        ranks, after the exposer's earlier gates.
+
+        Args:
+            op: Expose operation to translate.
+
+        Raises:
+            NotImplementedError: When ``transfer_mode`` is ``"teleport"``.
+        """
+        self._exposed.setdefault(op.rank, []).append(op.qubits)
+        with self._sync(range(self._comm.size)):
+            if self._comm.rank != op.rank:
+                self._copy_exposed(op.qubits, op.rank)
+
+    def _translate_unexpose(self, op: Unexpose) -> None:
+        """
+        Translate an unexpose operation into global-index instructions.
+
+        Closes the innermost open window of ``op.rank``.  Ranks other than
+        the exposer repeat the CX of :meth:`_translate_expose` at a sync
+        point of all ranks, which disentangles their copies (the cat-disentangler) and returns them
+        to ``|0>`` as long as they were only used as controls.
+
+        Args:
+            op: Unexpose operation to translate.
+
+        Raises:
+            ValueError: If ``op.rank`` has no open expose window.
+            NotImplementedError: When ``transfer_mode`` is ``"teleport"``.
+        """
+        windows = self._exposed.get(op.rank)
+        if not windows:
+            raise ValueError(f"Unexpose without a matching Expose for rank {op.rank}.")
+        qubits = windows.pop()
+        with self._sync(range(self._comm.size)):
+            if self._comm.rank != op.rank:
+                self._copy_exposed(qubits, op.rank)
+
+    # ------------------------------------------------------------------
+    # Dispatch table (mirrors the pattern in CunqaCircuitAdapter)
+    # ------------------------------------------------------------------
+
+    _DISPATCH: dict = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._DISPATCH = {}
+
+    def _build_dispatch(self):
+        """
+        Build the dispatch table mapping operation types to translation methods.
+
+        Returns:
+            A dict from operation type to the corresponding translate method.
+        """
+        return {
+            ClassicalControlledGate: self._translate_classical_controlled_gate,
+            ControlledGate:          self._translate_controlled_gate,
+            Gate:                    self._translate_gate,
+            Measure:                 self._translate_measure,
+            Reset:                   self._translate_reset,
+            Barrier:                 self._translate_barrier,
+            OperationContainer:      self._translate_operation_container,
+            QSend:                   self._translate_qsend,
+            QRecv:                   self._translate_qrecv,
+            QISend:                  self._translate_qisend,
+            QIRecv:                  self._translate_qirecv,
+            QWait:                   self._translate_qwait,
+            QScatter:                self._translate_qscatter,
+            QGather:                 self._translate_qgather,
+            QBcast:                  self._translate_qbcast,
+            QUnbcast:                self._translate_qunbcast,
+            QReduce:                 self._translate_qreduce,
+            QAllreduce:              self._translate_qreduce,
+            Expose:                  self._translate_expose,
+            Unexpose:                self._translate_unexpose,
+        }
+
+    def translate(self, op: Operation) -> Any:
+        """
+        Dispatch an operation and return this circuit's instructions.
+
+        Args:
+            op: Operation to translate.
+
+        Returns:
+            The list of global-index instructions emitted since :meth:`bind`.
+
+        Raises:
+            TypeError: If the operation type is unknown.
+        """
+        super().translate(op)
+        return self._instructions
@@ -0,0 +1,182 @@
+"""
+Communicator shared by the monolithic-program backends.
+
+Manages the context lifecycle for a single rank.  The global program is
+owned by the :class:`~netqmpi.runtime.adapters.monolithic.monolithic_executor.MonolithicExecutor`;
+this class coordinates the barrier synchronization that ensures all
+ranks have finished building their circuits before the layout is
+planned, that every rank has translated its circuits before the
+simulation runs, and that all ranks receive results before any of them
+continue past the ``with env.comm:`` block.
+"""
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, List, Optional
+
+from netqmpi.sdk.communicator import QMPICommunicator
+from netqmpi.sdk.topology import Topology
+from netqmpi.runtime import profiling, tracing
+from netqmpi.runtime.adapters.monolithic.monolithic_layout import Instruction, splice, translate_rank
+from netqmpi.runtime.adapters.monolithic.monolithic_run_config import MonolithicRunConfig
+
+if TYPE_CHECKING:
+    from netqmpi.runtime.adapters.monolithic.monolithic_executor import MonolithicExecutor
+
+
+class MonolithicCommunicator(QMPICommunicator):
+    """
+    Communicator for a single rank of a monolithic-program backend.
+
+    All N ranks run concurrently in separate threads.  ``__exit__`` uses
+    a :class:`threading.Barrier` to synchronise them:
+
+    1. Every rank finishes building its circuit ops and reaches the
+       barrier; one designated thread plans the global layout.
+    2. Every rank translates its own circuits into global-index
+       instructions, concurrently (interleaved, since translation holds
+       the GIL).
+    3. One designated thread splices the instructions into the global
+       program, ranks in rank order between sync points (so gate ordering
+       is deterministic), and the executor runs the simulation.
+    4. All threads are released with results available and continue past
+       the ``with env.comm:`` block simultaneously.
+
+    If any phase raises, the barrier is aborted so the other ranks fail
+    with :class:`threading.BrokenBarrierError` instead of waiting forever.
+
+    The barrier and class-level communicator list are reset after the last
+    rank exits so the adapter is reusable within the same process.  Every
+    subclass gets its own list and barrier.
+
+    Args:
+        rank: Numeric index of the current rank.
+        size: Total number of ranks.
+        config: Backend-specific configuration.
+        executor: Executor that owns the global program.
+    """
+
+    # All communicator instances of this class for the current run (rank-ordered).
+    communicators: List["MonolithicCommunicator"] = []
+    # Set by MonolithicExecutor.build_apps after all communicators are created.
+    _barrier: Optional[threading.Barrier] = None
+    # Category of the barrier spans in traces.
+    _TRACE_CATEGORY = "monolithic"
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.communicators = []
+        cls._barrier = None
+
+    def __init__(
+        self,
+        rank: int,
+        size: int,
+        config: MonolithicRunConfig,
+        executor: "MonolithicExecutor",
+    ) -> None:
+        """
+        Initialize the communicator.
+
+        Args:
+            rank: Numeric index of the current rank.
+            size: Total number of ranks in the communicator.
+            config: Backend-specific configuration.
+            executor: Executor that owns the global program.
+        """
+        super().__init__(rank, size, Topology.parse(config.topology, size))
+        self._config = config
+        self._executor = executor
+        # Global-index instructions of this rank's circuits (phase 2).
+        self._program: List[Instruction] = []
+        type(self).communicators.append(self)
+
+    def __enter__(self) -> "MonolithicCommunicator":
+        """
+        Enter the communicator context.
+
+        Returns:
+            The communicator instance.
+        """
+        profiling.begin("build", self.rank)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """
+        Synchronise all ranks, run the simulation, and broadcast results.
+
+        Four-phase barrier protocol:
+
+        * **Phase 1** – all ranks wait until every rank has finished
+          appending operations to its circuits; one designated thread
+          (party 0) plans the global layout from their shapes.
+        * **Phase 2** – every rank translates its own circuits against
+          the fixed layout, concurrently but under the GIL.
+        * **Phase 3** – party 0 splices all instructions into the global
+          program and runs the simulation.  All other threads
+          block here.
+        * **Phase 4** – all threads are released once results are
+          available; the designated thread resets class-level state for
+          the next run.
+
+        After this method returns, ``env.comm.results`` is populated for
+        every rank.
+
+        Args:
+            exc_type: Exception type, if one was raised.
+            exc_val: Exception instance, if one was raised.
+            exc_tb: Traceback, if one was raised.
+        """
+        profiling.end("build", self.rank)
+        cls = type(self)
+        barrier = cls._barrier
+        communicators = cls.communicators
+        try:
+            # Phase 1: wait for every rank to finish building its circuits.
+            # Rank order is deterministic because build_apps creates
+            # communicators 0..size-1 in sequence.
+            if self._wait(barrier, 1) == 0:
+                self._executor._plan_layout([
+                    [(circuit.num_qubits, circuit.num_clbits) for circuit in comm.circuits]
+                    for comm in communicators
+                ])
+            self._wait(barrier, 2)
+
+            # Phase 2: every rank translates its own circuits.
+            with profiling.phase("translate", self.rank):
+                self._program = translate_rank(self.circuits, self._executor._layout)
+
+            # Phase 3: one thread runs the global program.
+            party_id = self._wait(barrier, 3)
+            if party_id == 0:
+                counts = self._executor._simulate(splice([comm._program for comm in communicators]))
+                with profiling.phase("distribute"):
+                    for comm in communicators:
+                        comm.results = counts
+
+            # Phase 4: all threads block until the simulation is done.
+            self._wait(barrier, 4)
+        except BaseException:
+            barrier.abort()
+            raise
+
+        if party_id == 0:
+            self._executor._reset()
+            cls.communicators = []
+            cls._barrier = None
+
+        return None
+
+    def _wait(self, barrier: threading.Barrier, index: int) -> int:
+        """
+        Wait at ``barrier``, traced as a ``barrier`` span of this rank.
+
+        Args:
+            barrier: Barrier shared by all ranks.
+            index: Number of the wait in the protocol (1-4), for the trace.
+
+        Returns:
+            The party id returned by :meth:`threading.Barrier.wait`.
+        """
+        with tracing.span("barrier", self._TRACE_CATEGORY, rank=self.rank, wait=index):
+            return barrier.wait()
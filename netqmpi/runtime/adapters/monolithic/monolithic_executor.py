@@ -0,0 +1,223 @@
+"""
+Executor base shared by the monolithic-program backends.
+
+This module provides :class:`MonolithicExecutor`, a partial
+:class:`~netqmpi.runtime.executor.Executor` for backends that simulate
+all ranks as one global program: ranks run in threads, a
+:class:`~netqmpi.runtime.adapters.monolithic.monolithic_layout.GlobalLayout`
+is planned from their circuit shapes, every rank translates its circuits
+into global-index instructions, and subclasses only implement
+:meth:`MonolithicExecutor._run_simulation`.
+"""
+from __future__ import annotations
+
+import threading
+from abc import abstractmethod
+from typing import Any, List, Optional, Tuple
+
+from netqmpi.runtime import profiling
+from netqmpi.runtime.executor import Executor
+from netqmpi.sdk.environment import Environment
+from netqmpi.runtime.adapters.monolithic.monolithic_circuit import MonolithicCircuitAdapter
+from netqmpi.runtime.adapters.monolithic.monolithic_communicator import MonolithicCommunicator
+from netqmpi.runtime.adapters.monolithic.monolithic_layout import GlobalLayout, Instruction
+from netqmpi.runtime.adapters.monolithic.monolithic_run_config import MonolithicRunConfig
+from netqmpi.helpers import load_main
+
+
+class MonolithicExecutor(Executor):
+    """
+    Executor base that runs NetQMPI apps as one global program.
+
+    Circuits are only recorded while ranks run.  Once every rank has left
+    its ``with env.comm:`` block, the executor plans a global layout from
+    the circuit shapes: circuit ``g`` of every rank lands in *circuit
+    group* ``g``, one slice per rank, so any number of circuits can be
+    created per rank while the SWAP-based qsend offsets remain
+    consistent.  Each rank then translates its own circuits concurrently,
+    and the executor runs the instruction lists spliced in rank order
+    between sync points.
+
+    :meth:`run` launches every rank in a separate thread.
+    :meth:`build_apps` installs a :class:`threading.Barrier` on
+    :attr:`communicator_class` so that ``__exit__`` can synchronise all
+    threads between these phases.
+
+    Subclasses set the class attributes below and implement
+    :meth:`_run_simulation`.
+
+    Attributes:
+        circuit_class: Circuit adapter created by :meth:`create_circuit`.
+        communicator_class: Communicator created per rank.
+        layout_class: Layout planned by :meth:`_plan_layout`.
+    """
+
+    config_class = MonolithicRunConfig
+    circuit_class = MonolithicCircuitAdapter
+    communicator_class = MonolithicCommunicator
+    layout_class = GlobalLayout
+
+    def __init__(self, size: int, config: MonolithicRunConfig = None) -> None:
+        """
+        Initialize the executor.
+
+        Args:
+            size: Number of parallel ranks to simulate.
+            config: Backend-specific configuration.  Defaults to
+                :attr:`config_class` with its built-in defaults.
+        """
+        _config = config or self.config_class()
+        super().__init__(size, _config)
+        self._layout: Optional[GlobalLayout] = None
+
+    def create_circuit(
+        self,
+        num_qubits: int,
+        num_clbits: int,
+        comm: MonolithicCommunicator,
+    ) -> MonolithicCircuitAdapter:
+        """
+        Create a circuit adapter for one rank.
+
+        The circuit is placed in the global layout only after every rank
+        has finished building, so this method needs no locking.
+
+        Args:
+            num_qubits: Number of qubits for this rank's circuit slice.
+            num_clbits: Number of classical bits for this rank's circuit slice.
+            comm: Communicator associated with this rank.
+
+        Returns:
+            An unbound :attr:`circuit_class` instance.
+        """
+        return self.circuit_class(num_qubits, num_clbits, comm)
+
+    def build_apps(self, file: str, size: int) -> List[Any]:
+        """
+        Build one callable wrapper per rank and install the sync barrier.
+
+        Creates all communicators and then installs a
+        :class:`threading.Barrier` on :attr:`communicator_class` so that
+        every rank's ``__exit__`` can synchronise before the simulation
+        runs.
+
+        Args:
+            file: Path to the NetQMPI Python script defining ``main()``.
+            size: Number of ranks to instantiate.
+
+        Returns:
+            A list of zero-argument callables, one per rank.
+        """
+        self.results = {}
+        main_func = load_main(file)
+        communicator_class = self.communicator_class
+        # Drop communicators left behind by a run that failed mid-protocol.
+        communicator_class.communicators = []
+        apps = []
+        for rank in range(size):
+            comm = communicator_class(rank, size, self._config, self)
+            env = Environment(comm, self)
+            wrapped_main = lambda env=env: self._run_main(main_func, env)
+            apps.append(wrapped_main)
+        # Install the barrier after all communicators exist so __exit__ can use it.
+        communicator_class._barrier = threading.Barrier(size)
+        return apps
+
+    def run(self, apps: List[Any]) -> None:
+        """
+        Launch every rank in a separate thread and wait for all to finish.
+
+        Running ranks concurrently is required so that the
+        :class:`threading.Barrier` in the communicator's ``__exit__`` can
+        synchronise them: all N threads must reach the barrier for any of
+        them to proceed past it.  The threads are not a speed-up: script
+        code, circuit building and translation are pure Python and hold
+        the GIL, so only I/O-bound or GIL-releasing work in ``main()``
+        overlaps across ranks.
+
+        Args:
+            apps: List of callables returned by :meth:`build_apps`.
+
+        Raises:
+            RuntimeError: If a rank raised; chained to its exception.
+        """
+        errors: List[Tuple[int, BaseException]] = []
+
+        def run_app(rank: int, app: Any) -> None:
+            try:
+                app()
+            except BaseException as exc:
+                errors.append((rank, exc))
+
+        threads = [
+            threading.Thread(target=run_app, args=(rank, app), name=f"rank_{rank}")
+            for rank, app in enumerate(apps)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        if errors:
+            # Report the root cause, not the ranks it left at a broken barrier.
+            errors.sort(key=lambda item: isinstance(item[1], threading.BrokenBarrierError))
+            rank, exc = errors[0]
+            raise RuntimeError(f"rank_{rank} failed: {exc!r}") from exc
+
+    # ------------------------------------------------------------------
+    # Internal helpers called by the rank runners
+    # ------------------------------------------------------------------
+
+    def _plan_layout(self, shapes: List[List[Tuple[int, int]]]) -> GlobalLayout:
+        """
+        Plan the global layout for the current round.
+
+        Args:
+            shapes: Per rank, the ``(num_qubits, num_clbits)`` of each of
+                its circuits in creation order.
+
+        Returns:
+            The planned layout, also kept for :meth:`_run_simulation`.
+        """
+        with profiling.phase("layout"):
+            self._layout = self.layout_class.plan(shapes)
+        return self._layout
+
+    def _simulate(self, programs: List[List[Instruction]]) -> dict:
+        """
+        Run the global program on behalf of the rank threads.
+
+        Called by the designated rank thread.  Subclasses may override
+        this to move the simulation to another thread.
+
+        Args:
+            programs: Segments of the global program, in order.
+
+        Returns:
+            The measurement counts.
+        """
+        return self._run_simulation(programs)
+
+    @abstractmethod
+    def _run_simulation(self, programs: List[List[Instruction]]) -> dict:
+        """
+        Simulate the global program against the planned layout.
+
+        Args:
+            programs: Segments of the global program, in order, as
+                returned by :func:`~netqmpi.runtime.adapters.monolithic.monolithic_layout.splice`.
+
+        Returns:
+            The counts to broadcast to every rank, keyed as described in
+            :meth:`GlobalLayout.counts_key
+            <netqmpi.runtime.adapters.monolithic.monolithic_layout.GlobalLayout.counts_key>`.
+        """
+
+    def _reset(self) -> None:
+        """
+        Reset executor state for the next run.
+
+        Called by the designated thread inside the communicator's
+        ``__exit__`` after all ranks have received their results.
+        """
+        self._layout = None
@@ -0,0 +1,260 @@
+"""
+Global qubit/clbit layout of a monolithic NetQMPI program.
+
+The layout is planned once every rank has finished building its circuits,
+before anything is translated.  With the offsets fixed up front, each rank
+can translate its own circuits independently (in its own thread or worker
+process) into a private list of global-index instructions; the executor
+then splices the lists of all ranks into one program for its simulator.
+
+Ranks are spliced in rank order between *synchronisation points*.  An
+instruction that acts on another rank's qubits, such as a broadcast copy,
+is emitted inside a sync marker rather than in the rank's own list: it
+runs once every rank taking part has reached the marker, after all of
+their earlier instructions and before any of their later ones, wherever
+the ranks fall in rank order.
+
+Circuit ``g`` of every rank belongs to *circuit group* ``g``.  A group
+reserves ``size * width`` consecutive qubits, where ``width`` is the
+widest circuit any rank created for that group, so rank ``r`` owns the
+slice starting at ``base + r * width`` and qsend destinations are known
+without looking at the destination rank's circuit.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, List, Sequence, Tuple
+
+if TYPE_CHECKING:
+    from netqmpi.runtime.adapters.monolithic.monolithic_circuit import MonolithicCircuitAdapter
+
+# (name, params, qubits, clbits) with global indices.
+Instruction = Tuple[str, tuple, tuple, tuple]
+
+# Name of the sync marker ``(SYNC, instructions, ranks, ())``: the
+# ``instructions`` run once every rank in ``ranks`` (sorted, the emitting
+# rank included) reached a marker naming the same ranks.
+SYNC = "sync"
+
+
+@dataclass
+class GlobalLayout:
+    """
+    Placement of every circuit group in the global program.
+
+    Attributes:
+        size: Number of ranks.
+        qubit_widths: Per-rank qubit slice width of each group.
+        clbit_widths: Per-rank clbit slice width of each group.
+        qubit_bases: Global index of the first qubit of each group.
+        clbit_bases: Global index of the first clbit of each group.
+    """
+
+    size: int
+    qubit_widths: List[int]
+    clbit_widths: List[int]
+    qubit_bases: List[int]
+    clbit_bases: List[int]
+
+    @classmethod
+    def plan(cls, shapes: Sequence[Sequence[Tuple[int, int]]]) -> "GlobalLayout":
+        """
+        Plan the layout from the circuit shapes of every rank.
+
+        Args:
+            shapes: Per rank, the ``(num_qubits, num_clbits)`` of each of
+                its circuits in creation order.
+
+        Returns:
+            The planned layout.
+        """
+        size = len(shapes)
+        num_groups = max((len(circuits) for circuits in shapes), default=0)
+        layout = cls(size, [], [], [], [])
+        qubit_count = clbit_count = 0
+        for group in range(num_groups):
+            members = [circuits[group] for circuits in shapes if group < len(circuits)]
+            qubit_width = max(num_qubits for num_qubits, _ in members)
+            clbit_width = max(num_clbits for _, num_clbits in members)
+            layout.qubit_widths.append(qubit_width)
+            layout.clbit_widths.append(clbit_width)
+            layout.qubit_bases.append(qubit_count)
+            layout.clbit_bases.append(clbit_count)
+            qubit_count += size * qubit_width
+            clbit_count += size * clbit_width
+        return layout
+
+    @property
+    def num_qubits(self) -> int:
+        """
+        Return the width of the global program.
+
+        Returns:
+            Total number of global qubits.
+        """
+        if not self.qubit_bases:
+            return 0
+        return self.qubit_bases[-1] + self.size * self.qubit_widths[-1]
+
+    @property
+    def num_clbits(self) -> int:
+        """
+        Return the number of global classical bits.
+
+        Returns:
+            Total number of global clbits.
+        """
+        if not self.clbit_bases:
+            return 0
+        return self.clbit_bases[-1] + self.size * self.clbit_widths[-1]
+
+    def qubit_offset(self, group: int, rank: int) -> int:
+        """
+        Return the first global qubit of a rank's slice in a group.
+
+        Args:
+            group: Circuit group index.
+            rank: Rank index.
+
+        Returns:
+            Global qubit index.
+        """
+        return self.qubit_bases[group] + rank * self.qubit_widths[group]
+
+    def clbit_offset(self, group: int, rank: int) -> int:
+        """
+        Return the first global clbit of a rank's slice in a group.
+
+        Args:
+            group: Circuit group index.
+            rank: Rank index.
+
+        Returns:
+            Global clbit index.
+        """
+        return self.clbit_bases[group] + rank * self.clbit_widths[group]
+
+    def rank_of_qubit(self, qubit: int) -> int:
+        """
+        Return the rank owning a global qubit index.
+
+        Args:
+            qubit: Global qubit index.
+
+        Returns:
+            The rank whose slice contains ``qubit``.
+
+        Raises:
+            IndexError: If ``qubit`` is outside every circuit group.
+        """
+        for base, width in zip(self.qubit_bases, self.qubit_widths):
+            if base <= qubit < base + self.size * width:
+                return (qubit - base) // width
+        raise IndexError(f"Qubit {qubit} is outside every circuit group.")
+
+    def counts_key(self, bits: Sequence[int]) -> str:
+        """
+        Format the global clbit values of one shot as a counts key.
+
+        Keys follow Qiskit's ``get_counts`` convention, so every monolithic
+        backend reports the same keys: one register ``cr<g>`` per circuit
+        group, last group first and separated by spaces, each written
+        most significant (highest index) clbit first.
+
+        Args:
+            bits: Value of every global clbit, indexed by global clbit.
+
+        Returns:
+            The counts key.
+        """
+        registers = []
+        for base, width in zip(reversed(self.clbit_bases), reversed(self.clbit_widths)):
+            registers.append("".join(
+                "1" if bits[c] else "0" for c in range(base + self.size * width - 1, base - 1, -1)
+            ))
+        return " ".join(registers)
+
+
+def translate_rank(
+    circuits: Sequence["MonolithicCircuitAdapter"],
+    layout: GlobalLayout,
+) -> List[Instruction]:
+    """
+    Translate all circuits of one rank into global-index instructions.
+
+    Args:
+        circuits: The rank's circuits in creation order.
+        layout: Planned global layout.
+
+    Returns:
+        The rank's instructions, circuit by circuit, including the sync
+        markers resolved by :func:`splice`.
+    """
+    program: List[Instruction] = []
+    for group, circuit in enumerate(circuits):
+        circuit.bind(layout, group)
+        program.extend(circuit.translate(circuit.ops))
+    return program
+
+
+def splice(programs: Sequence[Sequence[Instruction]]) -> List[List[Instruction]]:
+    """
+    Order the instructions of every rank into one global program.
+
+    Each rank runs up to its next sync marker, in rank order.  A marker
+    fires once every rank it names waits on a marker naming the same
+    ranks, and emits the instructions of all of their markers in rank
+    order; those ranks then run on.  When no marker can fire, because a
+    rank never reaches its partner's marker, the waiting rank with the
+    lowest index fires its marker alone, which places its instructions
+    where a plain rank-order splice would.
+
+    Args:
+        programs: Per rank, in rank order, the instructions returned by
+            :func:`translate_rank`.
+
+    Returns:
+        The segments of the global program, in order, without sync
+        markers.
+    """
+    # Per rank, the positions of its sync markers and the next one to reach.
+    marks = [
+        [i for i, instruction in enumerate(program) if instruction[0] == SYNC] + [len(program)]
+        for program in programs
+    ]
+    reached = [0] * len(programs)
+    # Rank -> the sync marker it waits on; ranks named by a marker -> how
+    # many of them wait on it.
+    waiting: Dict[int, Instruction] = {}
+    arrived: Dict[tuple, int] = {}
+    segments: List[List[Instruction]] = []
+    running = range(len(programs))
+    while True:
+        fired: List[int] = []
+        for rank in running:
+            program = programs[rank]
+            start = marks[rank][reached[rank] - 1] + 1 if reached[rank] else 0
+            stop = marks[rank][reached[rank]]
+            if stop > start:
+                segments.append(list(program[start:stop]))
+            if stop == len(program):
+                continue
+            reached[rank] += 1
+            marker = waiting[rank] = program[stop]
+            ranks = marker[2]
+            arrived[ranks] = arrived.get(ranks, 0) + 1
+            if arrived[ranks] == len(ranks):
+                del arrived[ranks]
+                fired.extend(ranks)
+        if not fired:
+            if not waiting:
+                return segments
+            rank = min(waiting)
+            ranks = waiting[rank][2]
+            arrived[ranks] -= 1
+            fired.append(rank)
+        for rank in fired:
+            instructions = waiting.pop(rank)[1]
+            if instructions:
+                segments.append(list(instructions))
+        running = sorted(fired)
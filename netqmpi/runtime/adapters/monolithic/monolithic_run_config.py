@@ -0,0 +1,29 @@
+"""
+Configuration shared by the monolithic-program backends.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from netqmpi.runtime.run_config import RunConfig
+
+
+@dataclass
+class MonolithicRunConfig(RunConfig):
+    """
+    Extension of :class:`~netqmpi.runtime.run_config.RunConfig` with the
+    fields read by the shared monolithic translation layer.
+
+    Field ``metadata["choices"]`` lists the accepted values of string
+    fields; the CLI turns it into ``choices`` for the matching option.
+
+    Attributes:
+        transfer_mode: Qubit transfer protocol for qsend/qrecv.
+            ``"swap"`` (default) inserts an unphysical SWAP gate between
+            the source and destination qubit slots — produces shallower
+            circuits and is easier to debug, but does not model a real
+            quantum-network transfer.  It is the only mode the monolithic
+            backends implement; teleportation is not modelled yet.
+    """
+
+    transfer_mode: str = field(default="swap", metadata={"choices": ("swap",)})
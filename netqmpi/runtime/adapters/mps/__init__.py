@@ -0,0 +1,44 @@
+"""Matrix-product-state runtime adapter for NetQMPI.
+
+This package exposes the runtime adapter classes used by NetQMPI to
+simulate distributed quantum programs as one matrix product state whose
+sites follow the rank order, which keeps long chains of ranks with
+little entanglement in linear memory.
+
+Classes are loaded on first access, so importing the package is cheap.
+"""
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from netqmpi.runtime.adapters.mps.mps_circuit import MPSCircuitAdapter
+    from netqmpi.runtime.adapters.mps.mps_executor import MPSExecutorAdapter
+    from netqmpi.runtime.adapters.mps.mps_communicator import MPSCommunicator
+    from netqmpi.runtime.adapters.mps.mps_run_config import MPSConfig
+
+# Public name -> submodule defining it.
+_LAZY = {
+    "MPSCircuitAdapter": "netqmpi.runtime.adapters.mps.mps_circuit",
+    "MPSExecutorAdapter": "netqmpi.runtime.adapters.mps.mps_executor",
+    "MPSCommunicator": "netqmpi.runtime.adapters.mps.mps_communicator",
+    "MPSConfig": "netqmpi.runtime.adapters.mps.mps_run_config",
+}
+
+__all__ = [
+    "MPSCircuitAdapter",
+    "MPSExecutorAdapter",
+    "MPSCommunicator",
+    "MPSConfig",
+]
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
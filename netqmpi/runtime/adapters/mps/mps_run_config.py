@@ -0,0 +1,33 @@
+"""
+Backend-specific configuration for matrix-product-state runs.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
+
+from netqmpi.runtime.adapters.monolithic.monolithic_run_config import MonolithicRunConfig
+
+
+@dataclass
+class MPSConfig(MonolithicRunConfig):
+    """
+    Extension of
+    :class:`~netqmpi.runtime.adapters.monolithic.monolithic_run_config.MonolithicRunConfig`
+    with matrix-product-state-specific fields.
+
+    Attributes:
+        shots: Number of simulation shots.
+        seed: Optional RNG seed for reproducible simulations.
+        max_bond_dimension: Largest bond dimension kept when a gate is
+            applied.  Memory and time grow with its square; states that
+            need more entanglement are truncated and the run reports it.
+        cutoff: Singular values whose share of the state's weight is
+            below this are dropped after every two-qubit gate.  ``0``
+            keeps every non-zero singular value.
+    """
+
+    shots: int = 1024
+    seed: Optional[int] = None
+    max_bond_dimension: int = 64
+    cutoff: float = 1e-12
@@ -0,0 +1,398 @@
+"""
+Matrix-product-state simulation of a monolithic NetQMPI program.
+
+The global-index instructions of every rank are compiled as for the
+NumPy statevector backend (see
+:func:`~netqmpi.runtime.adapters.numpy.numpy_statevector.compile_program`:
+unused qubits are never allocated, single-qubit gates are fused,
+operations outside the light cone of the measurements are dropped).
+The surviving qubits become the *sites* of a chain, ordered by rank,
+then circuit group, then local qubit of the global qubit they stand
+for, so the chain follows the rank order of ring and line programs.
+
+The state is a list of ``(left, 2, right)`` tensors kept in mixed
+canonical form around an orthogonality centre:
+
+* a single-qubit gate is contracted into its site;
+* a multi-qubit gate first moves its sites next to each other with
+  adjacent SWAPs (they stay there afterwards, so the chain follows
+  where qubits are used), then is contracted into the merged tensor,
+  which is split back into sites with truncated SVDs;
+* each SVD keeps at most ``max_bond`` singular values and drops those
+  whose share of the weight is below ``cutoff``; the dropped weight is
+  summed into the truncation error.
+
+qsend, qscatter and qgather are swap-mode transfers, compiled as moves:
+the transferred site is reordered into the destination rank's part of
+the chain with adjacent SWAPs, so a qubit passed along a line of ranks
+always stays next to the qubits it meets.  Memory is
+``O(n * max_bond**2)``, linear in the number of qubits.
+
+Terminal measurements are sampled for all shots at once by sweeping the
+chain from the left; mid-circuit measurements and resets branch the
+simulation as in the statevector backend.
+"""
+from __future__ import annotations
+
+import math
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from netqmpi.runtime.adapters.monolithic.monolithic_layout import GlobalLayout
+from netqmpi.runtime.adapters.numpy.numpy_statevector import GATE, MEASURE, MOVE, RESET, StatevectorProgram
+
+# Two-site SWAP on a (left, a, b, right) tensor.
+_SWAP_AXES = (0, 2, 1, 3)
+
+
+@dataclass
+class TruncationReport:
+    """
+    Accuracy of an MPS run.
+
+    Attributes:
+        error: Largest, over the simulation branches, total weight
+            discarded by SVD truncation.  ``0`` means the run was exact;
+            the fidelity with the exact state is at least ``1 - error``.
+        max_bond: Largest bond dimension reached.
+        bond_limited: Whether ``max_bond`` capped any SVD, i.e. whether
+            the state needed more entanglement than allowed.
+    """
+
+    error: float = 0.0
+    max_bond: int = 1
+    bond_limited: bool = False
+
+
+def chain_key(layout: GlobalLayout, qubit: int) -> int:
+    """
+    Return the place of a global qubit along the chain.
+
+    Args:
+        layout: Global layout.
+        qubit: Global qubit index.
+
+    Returns:
+        A key that orders qubits by rank, circuit group and local qubit.
+    """
+    group = bisect_right(layout.qubit_bases, qubit) - 1
+    rank, local = divmod(qubit - layout.qubit_bases[group], layout.qubit_widths[group])
+    return rank * sum(layout.qubit_widths) + sum(layout.qubit_widths[:group]) + local
+
+
+class MatrixProductState:
+    """
+    Chain of site tensors in mixed canonical form.
+
+    Args:
+        keys: Chain key (see :func:`chain_key`) of every axis, which
+            start in ``|0>`` sorted by key.
+        max_bond: Largest bond dimension kept by an SVD.
+        cutoff: Singular values whose squared share of the weight is
+            below this are dropped.
+    """
+
+    def __init__(self, keys: Sequence[int], max_bond: int, cutoff: float) -> None:
+        site = np.zeros((1, 2, 1), dtype=np.complex128)
+        site[0, 0, 0] = 1
+        self.tensors = [site] * len(keys)
+        self.keys = list(keys)
+        self.axis_at = sorted(range(len(keys)), key=self.keys.__getitem__)
+        self.position = {a: p for p, a in enumerate(self.axis_at)}
+        self.center = 0
+        self.max_bond = max_bond
+        self.cutoff = cutoff
+        self.report = TruncationReport()
+
+    def copy(self) -> "MatrixProductState":
+        """
+        Return an independent copy.
+
+        Tensors are never modified in place, so they are shared.
+
+        Returns:
+            The copy.
+        """
+        other = object.__new__(MatrixProductState)
+        other.__dict__.update(self.__dict__)
+        other.tensors = list(self.tensors)
+        other.keys = list(self.keys)
+        other.axis_at = list(self.axis_at)
+        other.position = dict(self.position)
+        other.report = TruncationReport(**vars(self.report))
+        return other
+
+    # ------------------------------------------------------------------
+    # Canonical form
+    # ------------------------------------------------------------------
+
+    def _move_center(self, p: int) -> None:
+        """Move the orthogonality centre to site ``p`` with QR sweeps."""
+        tensors = self.tensors
+        while self.center < p:
+            c = self.center
+            left, _, right = tensors[c].shape
+            q, r = np.linalg.qr(tensors[c].reshape(2 * left, right))
+            tensors[c] = q.reshape(left, 2, -1)
+            tensors[c + 1] = np.tensordot(r, tensors[c + 1], axes=(1, 0))
+            self.center += 1
+        while self.center > p:
+            c = self.center
+            left, _, right = tensors[c].shape
+            q, r = np.linalg.qr(tensors[c].reshape(left, 2 * right).T)
+            tensors[c] = q.T.reshape(-1, 2, right)
+            tensors[c - 1] = np.tensordot(tensors[c - 1], r.T, axes=(2, 0))
+            self.center -= 1
+
+    def _split(self, theta: np.ndarray, p: int) -> None:
+        """
+        Split a merged ``(left, 2, ..., 2, right)`` tensor into sites from ``p``.
+
+        The orthogonality centre must be inside the merged sites; it ends
+        on the last of them.
+        """
+        width = theta.ndim - 2
+        report = self.report
+        for i in range(width - 1):
+            left = theta.shape[0]
+            matrix = theta.reshape(2 * left, -1)
+            u, s, vh = np.linalg.svd(matrix, full_matrices=False)
+            weights = s ** 2
+            total = weights.sum()
+            keep = max(1, int(np.count_nonzero(weights > self.cutoff * total)))
+            if keep > self.max_bond:
+                keep = self.max_bond
+                report.bond_limited = True
+            if keep < s.size:
+                report.error += float(weights[keep:].sum() / total)
+                s = s[:keep] / math.sqrt(weights[:keep].sum() / total)
+            report.max_bond = max(report.max_bond, keep)
+            self.tensors[p + i] = u[:, :keep].reshape(left, 2, keep)
+            theta = (s[:keep, np.newaxis] * vh[:keep]).reshape((keep,) + theta.shape[2:])
+        self.tensors[p + width - 1] = theta
+        self.center = p + width - 1
+
+    def _swap_sites(self, p: int) -> None:
+        """Exchange the qubits of sites ``p`` and ``p + 1``."""
+        self._move_center(p)
+        theta = np.tensordot(self.tensors[p], self.tensors[p + 1], axes=(2, 0))
+        self._split(theta.transpose(_SWAP_AXES), p)
+        a, b = self.axis_at[p], self.axis_at[p + 1]
+        self.axis_at[p], self.axis_at[p + 1] = b, a
+        self.position[a], self.position[b] = p + 1, p
+
+    # ------------------------------------------------------------------
+    # Gates and measurements
+    # ------------------------------------------------------------------
+
+    def apply(self, matrix: np.ndarray, axes: Sequence[int]) -> None:
+        """
+        Apply a gate.
+
+        Args:
+            matrix: ``2**k x 2**k`` matrix; the first of ``axes`` is its
+                most significant qubit.
+            axes: The ``k`` axes acted on.
+        """
+        if len(axes) == 1:
+            p = self.position[axes[0]]
+            self.tensors[p] = np.einsum("ab,lbr->lar", matrix, self.tensors[p])
+            return
+
+        # Gather the sites next to the leftmost one.
+        by_position = sorted(axes, key=self.position.get)
+        start = self.position[by_position[0]]
+        for i, a in enumerate(by_position[1:], 1):
+            while self.position[a] > start + i:
+                self._swap_sites(self.position[a] - 1)
+
+        k = len(axes)
+        self._move_center(start)
+        theta = self.tensors[start]
+        for p in range(start + 1, start + k):
+            theta = np.tensordot(theta, self.tensors[p], axes=(theta.ndim - 1, 0))
+        # Reorder the gate's qubits to chain order, then contract.
+        perm = [axes.index(a) for a in by_position]
+        gate = matrix.reshape((2,) * (2 * k)).transpose(perm + [k + i for i in perm])
+        theta = np.tensordot(gate, theta, axes=(list(range(k, 2 * k)), list(range(1, k + 1))))
+        self._split(np.moveaxis(theta, k, 0), start)
+
+    def move(self, axis: int, key: int) -> None:
+        """
+        Move an axis to the place of its new chain key.
+
+        Args:
+            axis: Moved axis.
+            key: Chain key of the global qubit the axis now stands for.
+        """
+        keys, axis_at = self.keys, self.axis_at
+        keys[axis] = key
+        # One insertion-sort step: the rest of the chain is in key order.
+        p = self.position[axis]
+        while p > 0 and keys[axis_at[p - 1]] > key:
+            p -= 1
+            self._swap_sites(p)
+        while p < len(axis_at) - 1 and keys[axis_at[p + 1]] < key:
+            self._swap_sites(p)
+            p += 1
+
+    def probability_of_one(self, axis: int) -> float:
+        """
+        Return the probability of measuring ``1`` on an axis.
+
+        Args:
+            axis: Measured axis.
+
+        Returns:
+            The probability.
+        """
+        p = self.position[axis]
+        self._move_center(p)
+        site = self.tensors[p]
+        weights = np.sum(site.real ** 2 + site.imag ** 2, axis=(0, 2))
+        return float(weights[1] / weights.sum())
+
+    def collapse(self, axis: int, outcome: int, probability: float, reset: bool) -> None:
+        """
+        Project an axis onto a measurement outcome and renormalise.
+
+        Must follow :meth:`probability_of_one` on the same axis.
+
+        Args:
+            axis: Measured axis.
+            outcome: Measured value.
+            probability: Probability of ``outcome``.
+            reset: Also flip the axis back to ``0``.
+        """
+        p = self.position[axis]
+        site = np.zeros_like(self.tensors[p])
+        site[:, 0 if reset else outcome] = self.tensors[p][:, outcome] / math.sqrt(probability)
+        self.tensors[p] = site
+
+    def sample(self, axes: Sequence[int], shots: int, rng: np.random.Generator) -> np.ndarray:
+        """
+        Sample the joint outcome of some axes.
+
+        Sweeps the chain from the left up to the last measured site,
+        drawing every site's value conditioned on the ones before it.
+
+        Args:
+            axes: Measured axes, without duplicates.
+            shots: Number of samples.
+            rng: Random generator.
+
+        Returns:
+            A ``(shots, len(axes))`` array of measured values.
+        """
+        self._move_center(0)
+        columns = {self.position[a]: i for i, a in enumerate(axes)}
+        bits = np.zeros((shots, len(axes)), dtype=np.uint8)
+        index = np.arange(shots)
+        environment = np.ones((shots, 1), dtype=np.complex128)
+        for p in range(max(columns, default=-1) + 1):
+            left, _, right = self.tensors[p].shape
+            branches = (environment @ self.tensors[p].reshape(left, 2 * right)).reshape(shots, 2, right)
+            weights = np.sum(branches.real ** 2 + branches.imag ** 2, axis=2)
+            values = rng.random(shots) * weights.sum(axis=1) < weights[:, 1]
+            if p in columns:
+                bits[:, columns[p]] = values
+            environment = branches[index, values.astype(np.intp)]
+            environment /= np.sqrt(weights[index, values.astype(np.intp)])[:, np.newaxis]
+        return bits
+
+
+def _full_matrix(matrix: np.ndarray, controls: Tuple[int, ...]) -> np.ndarray:
+    """Return the matrix of a controlled gate on ``controls + (target,)``."""
+    if not controls:
+        return matrix
+    full = np.eye(2 << len(controls), dtype=np.complex128)
+    full[-2:, -2:] = matrix
+    return full
+
+
+def simulate(
+    program: StatevectorProgram,
+    layout: GlobalLayout,
+    shots: int,
+    rng: np.random.Generator,
+    max_bond: int,
+    cutoff: float,
+) -> Tuple[Dict[str, int], TruncationReport]:
+    """
+    Run a compiled program on a matrix product state.
+
+    Args:
+        program: Program compiled by
+            :func:`~netqmpi.runtime.adapters.numpy.numpy_statevector.compile_program`,
+            preferably with ``moves=True``.
+        layout: Global layout, used to order sites and format the counts keys.
+        shots: Number of shots.
+        rng: Random generator.
+        max_bond: Largest bond dimension kept by an SVD.
+        cutoff: Relative weight below which singular values are dropped.
+
+    Returns:
+        The counts, keyed as by
+        :meth:`~netqmpi.runtime.adapters.monolithic.monolithic_layout.GlobalLayout.counts_key`,
+        and the truncation report.
+    """
+    counts: Dict[str, int] = {}
+    report = TruncationReport()
+    if shots <= 0:
+        return counts, report
+
+    final_axes = sorted({a for a, _ in program.final})
+    column = {a: i for i, a in enumerate(final_axes)}
+    ops = program.ops
+    keys = [chain_key(layout, qubit) for qubit in program.qubits]
+    state = MatrixProductState(keys, max_bond, cutoff)
+    # (state, next op, shots, clbits recorded mid-circuit)
+    branches: List[Tuple[MatrixProductState, int, int, Dict[int, int]]] = [(state, 0, shots, {})]
+    while branches:
+        state, pc, branch_shots, recorded = branches.pop()
+        while pc < len(ops):
+            op = ops[pc]
+            pc += 1
+            if op[0] == GATE:
+                state.apply(_full_matrix(op[1], op[3]), op[3] + (op[2],))
+                continue
+            if op[0] == MOVE:
+                state.move(op[1], chain_key(layout, op[2]))
+                continue
+            a = op[1]
+            p1 = state.probability_of_one(a)
+            ones = int(rng.binomial(branch_shots, p1))
+            if 0 < ones < branch_shots:
+                branch = state.copy()
+                branch.collapse(a, 1, p1, op[0] == RESET)
+                bits = dict(recorded)
+                if op[0] == MEASURE and op[2] is not None:
+                    bits[op[2]] = 1
+                branches.append((branch, pc, ones, bits))
+                branch_shots -= ones
+                outcome = 0
+            else:
+                outcome = 1 if ones else 0
+            state.collapse(a, outcome, p1 if outcome else 1 - p1, op[0] == RESET)
+            if op[0] == MEASURE and op[2] is not None:
+                recorded = dict(recorded)
+                recorded[op[2]] = outcome
+
+        report.error = max(report.error, state.report.error)
+        report.max_bond = max(report.max_bond, state.report.max_bond)
+        report.bond_limited = report.bond_limited or state.report.bond_limited
+
+        bits = [0] * program.num_clbits
+        for clbit, value in recorded.items():
+            bits[clbit] = value
+        samples = state.sample(final_axes, branch_shots, rng)
+        outcomes, multiplicity = np.unique(samples, axis=0, return_counts=True)
+        for outcome, count in zip(outcomes.tolist(), multiplicity.tolist()):
+            for a, clbit in program.final:
+                bits[clbit] = outcome[column[a]]
+            key = layout.counts_key(bits)
+            counts[key] = counts.get(key, 0) + count
+    return counts, report
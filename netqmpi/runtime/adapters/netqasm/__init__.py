@@ -3,17 +3,44 @@
 This package exposes the NetQASM-specific runtime adapter classes used by
 NetQMPI, including the communicator, circuit adapter, executor adapter,
 and run configuration.
+
+Classes are loaded on first access, so importing the package does not
+import ``netqasm``.
 """
-from netqmpi.runtime.adapters.netqasm.netqasm_communicator import NetQASMCommunicator
-from netqmpi.runtime.adapters.netqasm.netqasm_circuit import NetQASMCircuitAdapter
-from netqmpi.runtime.adapters.netqasm.netqasm_executor import (
-    NetQASMExecutorAdapter,
-    NetQASMRunConfig,
-)
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from netqmpi.runtime.adapters.netqasm.netqasm_communicator import NetQASMCommunicator
+    from netqmpi.runtime.adapters.netqasm.netqasm_circuit import NetQASMCircuitAdapter
+    from netqmpi.runtime.adapters.netqasm.netqasm_executor import (
+        NetQASMExecutorAdapter,
+        NetQASMRunConfig,
+    )
+
+# Public name -> submodule defining it.
+_LAZY = {
+    'NetQASMCommunicator': 'netqmpi.runtime.adapters.netqasm.netqasm_communicator',
+    'NetQASMCircuitAdapter': 'netqmpi.runtime.adapters.netqasm.netqasm_circuit',
+    'NetQASMExecutorAdapter': 'netqmpi.runtime.adapters.netqasm.netqasm_executor',
+    'NetQASMRunConfig': 'netqmpi.runtime.adapters.netqasm.netqasm_executor',
+}
 
 __all__ = [
     'NetQASMCommunicator',
     'NetQASMCircuitAdapter',
     'NetQASMExecutorAdapter',
     'NetQASMRunConfig'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
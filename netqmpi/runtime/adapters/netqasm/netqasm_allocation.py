@@ -0,0 +1,169 @@
+"""
+Qubit allocation planning for the NetQASM circuit adapter.
+
+NetQASM qubits live in the limited memory of a quantum node, and a
+measured or teleported qubit frees its position.  Instead of allocating
+every slot of a circuit up front, :func:`plan_allocation` walks the
+circuit's leaf operations once and decides, per operation:
+
+* which slots get a fresh qubit just before it (a slot is allocated on
+  its first use, and again if it is used after its qubit was sent);
+* which slots release their qubit just before it (a slot overwritten by
+  a received qubit);
+* whether a measurement keeps its qubit (``inplace``) because the slot
+  is used again, or frees it for later allocations.
+
+Slots filled by :class:`~netqmpi.sdk.operations.QRecv`, or by the copy
+of a :class:`~netqmpi.sdk.operations.QBcast` on a rank other than the
+root, take the received EPR qubit and are not allocated at all when
+``adopt_received`` is set.  The plan also counts the most qubits the
+rank holds at once, including the EPR qubits of a transfer or fan-out in
+flight; those of a non-blocking receive stay in flight until its
+:class:`~netqmpi.sdk.operations.QWait`.
+
+This module does not import NetQASM, so plans can be inspected without
+the simulator installed.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from netqmpi.sdk.collectives import broadcast_links
+from netqmpi.sdk.operations import (
+    Operation, Measure, QSend, QRecv, QIRecv, QWait, QBcast, QUnbcast, Expose, Unexpose, Barrier,
+)
+from netqmpi.sdk.topology import Topology
+
+
+@dataclass
+class AllocationPlan:
+    """
+    When the qubits of one circuit are allocated and released.
+
+    Operations are numbered by their position in the flattened circuit.
+
+    Attributes:
+        allocations: Operation index -> slots allocated just before it.
+        releases: Operation index -> slots whose qubit is freed just
+            before it.
+        inplace: Indices of measurements that keep their qubit.
+        peak: Largest number of qubits the rank holds at once.
+    """
+
+    allocations: Dict[int, Tuple[int, ...]] = field(default_factory=dict)
+    releases: Dict[int, Tuple[int, ...]] = field(default_factory=dict)
+    inplace: Set[int] = field(default_factory=set)
+    peak: int = 0
+
+
+def plan_allocation(
+    ops: Sequence[Operation],
+    adopt_received: bool = True,
+    rank: int = 0,
+    size: int = 1,
+    topology: Optional[Topology] = None,
+) -> AllocationPlan:
+    """
+    Plan the qubit allocations of a circuit.
+
+    Args:
+        ops: Leaf operations of the circuit, in order, with collectives
+            lowered (see :func:`~netqmpi.sdk.collectives.expand_collectives`).
+        adopt_received: Whether a received EPR qubit becomes the slot's
+            qubit.  Otherwise a fresh qubit is allocated for the slot and
+            the EPR qubit is swapped into it and freed, which holds one
+            more qubit per received qubit during the transfer.
+        rank: Rank running the circuit, which decides its part in a
+            broadcast.
+        size: Number of ranks.
+        topology: Links of the ranks, which shape the broadcast tree.
+
+    Returns:
+        The allocation plan.
+    """
+    plan = AllocationPlan()
+    live: Set[int] = set()
+    # Request -> EPR qubits of a non-blocking receive not swapped in yet.
+    inflight: Dict[int, int] = {}
+
+    # Index of the next operation using each slot, filled backwards, to
+    # tell measurements whose slot is used again.
+    next_use: List[Dict[int, int]] = [{} for _ in ops]
+    upcoming: Dict[int, int] = {}
+    for index in range(len(ops) - 1, -1, -1):
+        next_use[index] = dict(upcoming)
+        for q in _touched(ops[index]):
+            upcoming[q] = index
+
+    for index, op in enumerate(ops):
+        pending = sum(inflight.values())
+        if isinstance(op, QRecv):
+            release = tuple(q for q in op.qubits if q in live)
+            if release:
+                plan.releases[index] = release
+                live.difference_update(release)
+            if adopt_received:
+                # Each EPR qubit arrives and stays.
+                live.update(op.qubits)
+                plan.peak = max(plan.peak, len(live) + pending)
+            else:
+                plan.allocations[index] = tuple(op.qubits)
+                live.update(op.qubits)
+                if isinstance(op, QIRecv):
+                    # Its EPR qubits are swapped in at its wait.
+                    inflight[op.request] = len(op.qubits)
+                # All EPR qubits arrive before the first one is swapped in.
+                plan.peak = max(plan.peak, len(live) + len(op.qubits) + pending)
+            continue
+
+        if isinstance(op, QWait):
+            for request in op.requests:
+                inflight.pop(request, None)
+            continue
+
+        if isinstance(op, QBcast) and op.root != rank:
+            # The copy arrives like a received qubit, while one EPR
+            # qubit per child link is held for the fan-out.
+            _, children = broadcast_links(rank, size, op.root, topology)
+            if op.qubit in live:
+                plan.releases[index] = (op.qubit,)
+                live.discard(op.qubit)
+            held = len(children)
+            if not adopt_received:
+                plan.allocations[index] = (op.qubit,)
+                held += 1
+            live.add(op.qubit)
+            plan.peak = max(plan.peak, len(live) + held + pending)
+            continue
+
+        needed = tuple(q for q in _touched(op) if q not in live)
+        if needed:
+            plan.allocations[index] = needed
+            live.update(needed)
+        plan.peak = max(plan.peak, len(live) + pending)
+
+        if isinstance(op, QSend):
+            # All EPR pairs are created before the first qubit is teleported.
+            plan.peak = max(plan.peak, len(live) + len(op.qubits) + pending)
+            live.difference_update(op.qubits)
+        elif isinstance(op, QBcast):
+            _, children = broadcast_links(rank, size, op.root, topology)
+            plan.peak = max(plan.peak, len(live) + len(children) + pending)
+        elif isinstance(op, QUnbcast) and op.root != rank:
+            # The copy is measured out.
+            live.discard(op.qubit)
+        elif isinstance(op, Measure):
+            later = next_use[index].get(op.qubit)
+            if later is not None and not isinstance(ops[later], QRecv):
+                plan.inplace.add(index)
+            else:
+                live.discard(op.qubit)
+    return plan
+
+
+def _touched(op: Operation) -> Tuple[int, ...]:
+    """Return the local slots an operation acts on."""
+    if isinstance(op, (Expose, Unexpose, Barrier)):
+        return ()
+    return tuple(op.qubits)
@@ -5,24 +5,39 @@ NetQASM does not provide a circuit object: each instruction is dispatched
 to the simulator as soon as it is invoked on a
 :class:`netqasm.sdk.qubit.Qubit`. Therefore, this adapter:
 
-1. Allocates a :class:`Qubit` array in ``__init__`` using the active
-   connection exposed by ``self._comm``.
+1. Plans the qubit allocations of a circuit once, on its first
+   ``translate()`` call (see
+   :mod:`~netqmpi.runtime.adapters.netqasm.netqasm_allocation`), and
+   allocates each slot on the active connection exposed by ``self._comm``
+   only when it is first used, so measured and sent qubits free node
+   memory for later ones.
 2. Overrides the gate methods of the base :class:`Circuit` so that each
    method first delegates to ``super()`` to record the operation in the
    :class:`OperationContainer`, and then executes the corresponding
    NetQASM SDK call immediately.
 3. Overrides the inter-rank communication primitives (``qsend``,
-   ``qrecv``, ``qscatter``, ``qgather``, ``expose``, and ``unexpose``)
-   with the concrete teleportation and collective protocols implemented
-   through the NetQASM SDK.
+   ``qrecv``, ``qbcast``, ``qunbcast``, ``expose``, and ``unexpose``)
+   with the concrete teleportation and cat-state protocols implemented
+   through the NetQASM SDK, and
+   lowers ``qscatter`` and ``qgather`` onto ``qsend``/``qrecv`` with the
+   schedules of :mod:`netqmpi.sdk.collectives`.
 4. Keeps ``translate()`` as a no-op, since execution has already taken
    place eagerly.
 5. Flushes the connection in ``build()`` and returns the qubit array
    together with the classical measurement results.
+
+With ``epr_pool_depth`` set, direct ``qsend``/``qrecv`` take their EPR
+pairs from a pool requested ahead of time (see
+:mod:`~netqmpi.runtime.adapters.netqasm.netqasm_pool`).
+
+On a topology other than a full mesh, a ``qsend`` between ranks that are
+not linked teleports over end-to-end pairs that every rank on its route
+builds, by entanglement swapping, in a prologue run before the circuit
+(see :mod:`~netqmpi.runtime.adapters.netqasm.netqasm_routing`).
 """
 from __future__ import annotations
-import numpy as np
-from typing import TYPE_CHECKING, Any, List, Optional
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from netqasm.sdk import EPRSocket, Qubit
 from netqasm.sdk.external import Socket
@@ -30,13 +45,20 @@ from netqasm.sdk.toolbox import create_ghz
 from netqasm.sdk.classical_communication.message import StructuredMessage
 
 from netqmpi.sdk.circuit import Circuit
+from netqmpi.sdk.collectives import broadcast_links, expand_collectives, lower_collective, lower_reduce
+from netqmpi.runtime import tracing
+from netqmpi.runtime.adapters.netqasm.netqasm_allocation import AllocationPlan, plan_allocation
+from netqmpi.runtime.adapters.netqasm.netqasm_pool import PoolKey
+from netqmpi.runtime.adapters.netqasm.netqasm_requests import PendingRequest
+from netqmpi.runtime.adapters.netqasm.netqasm_routing import RoutePlan
 
 from netqmpi.sdk.operations import (
     Operation,
     Gate, ControlledGate, ClassicalControlledGate,
     Measure, Reset, Barrier,
     OperationContainer,
-    QSend, QRecv, QScatter, QGather, Expose, Unexpose,
+    QSend, QRecv, QISend, QIRecv, QWait,
+    QScatter, QGather, QBcast, QUnbcast, QReduce, Expose, Unexpose,
 )
 
 
@@ -53,8 +75,18 @@ class NetQASMCircuitAdapter(Circuit):
     interface.
 
     Attributes:
-        _qubits: Live NetQASM qubits allocated at construction time.
+        _qubits: Live NetQASM qubit of each slot, ``None`` while the slot
+            holds no qubit.
         _results: Classical measurement results indexed by classical bit.
+        peak_qubits: Most qubits the rank holds at once while running
+            this circuit, known once it is translated.
+        _routes: Routed transfers of this circuit on every rank.
+        _routed: Routed transfer key -> this rank's halves of its
+            end-to-end pairs, once built.
+        _frames: Routed transfer key -> ``(z, x)`` per pair: the Pauli
+            frame the swaps left on the receiver's halves.
+        _pool_demand: Directed link -> qubits teleported over it by
+            direct transfers; empty when the EPR pool is disabled.
     """
 
     if TYPE_CHECKING:
@@ -76,9 +108,26 @@ class NetQASMCircuitAdapter(Circuit):
         """
         super().__init__(num_qubits, num_clbits, comm)
         
-        self._qubits: List[Qubit] = []
-        
+        self._qubits: List[Optional[Qubit]] = [None] * num_qubits
+        self._plan: Optional[AllocationPlan] = None
+        # Index of the leaf operation being translated, in flattened order.
+        self._position = -1
+        self.peak_qubits: Optional[int] = None
+
+        self._routes = RoutePlan()
+        self._routed: Dict[Tuple[int, int, int], List[Qubit]] = {}
+        self._frames: Dict[Tuple[int, int, int], List[Tuple[int, int]]] = {}
+        # (src, dest) -> routed transfers between them translated so far.
+        self._route_index: Dict[Tuple[int, int], int] = {}
+        self._pool_demand: Dict[PoolKey, int] = {}
+        # Link -> non-blocking transfers over it translated so far.
+        self._request_index: Dict[PoolKey, int] = {}
+        # Request index -> started transfer, until its wait.
+        self._requests: Dict[int, PendingRequest] = {}
+
         self._translated_ops: List[Any] = []
+        # Number of translated ops already wrapped in tracing spans.
+        self._num_traced = 0
         self._results: List[Any] = [None] * num_clbits
 
         # -- Expose / GHZ bookkeeping (used by the circuit adapter) ---------
@@ -131,7 +180,9 @@ class NetQASMCircuitAdapter(Circuit):
         Args:
             op: Controlled gate operation to translate.
         """
-        
+        # ControlledGate has no name of its own: it is named after its target.
+        name = "C" + op.targets[0].name
+
         gate_2q = {
             # 2 qubits
             "CX": lambda: self._qubits[op.qubits[0]].cnot(self._qubits[op.qubits[1]]),
@@ -142,8 +193,8 @@ class NetQASMCircuitAdapter(Circuit):
             "CRZ": self._gate_not_implemented("CRZ"),
         }
 
-        if op.name in gate_2q:
-            self._translated_ops.append(gate_2q[op.name])
+        if name in gate_2q:
+            self._translated_ops.append(gate_2q[name])
             
 
     def _translate_classical_controlled_gate(self, op: ClassicalControlledGate):
@@ -165,8 +216,12 @@ class NetQASMCircuitAdapter(Circuit):
         Args:
             op: Measurement operation to translate.
         """
+        inplace = self._position in self._plan.inplace
+
         def netqasm_measure():
-            result = self._qubits[op.qubits[0]].measure()
+            result = self._qubits[op.qubits[0]].measure(inplace=inplace)
+            if not inplace:
+                self._qubits[op.qubits[0]] = None
             return result
         
         self._translated_ops.append(netqasm_measure)
@@ -201,113 +256,527 @@ class NetQASMCircuitAdapter(Circuit):
         """
         
         for child in op.flatten():
-            self.translate(child)
+            self._translate_leaf(child)
 
     def _translate_qsend(self, op: QSend):
         """
-        Translate a quantum send operation into a CUNQA instruction.
+        Translate a quantum send operation into a teleportation.
 
         Args:
             op: Quantum send operation to translate.
         """
-        
+        key, pooled, link = self._plan_transfer(self._comm.rank, op.dest_rank, len(op.qubits))
+
         def netqasm_qsend():
-            epr_socket = self._comm.get_epr_socket(self._comm.rank, op.dest_rank)
-            socket = self._comm.get_socket(self._comm.rank, op.dest_rank)
-
-            for q_idx in op.qubits:
-                qubit = self._qubits[q_idx]
-                # Create EPR pair
-                epr = epr_socket.create_keep()[0]
-                # Teleport
-                qubit.cnot(epr)
-                qubit.H()
-                m1 = qubit.measure()
-                m2 = epr.measure()
-                socket.send_structured(StructuredMessage("Corrections", (m1, m2))) 
+            eprs, missing = self._send_pairs(key, pooled, link, len(op.qubits))
+            outcomes = self._teleport(op.qubits, eprs)
+            # The corrections are the only values this transfer needs
+            # back, so all qubits share one subroutine and one message.
+            self._flush_transfer(missing)
+            self._send_corrections(op.dest_rank, "Corrections", outcomes)
+            if pooled:
+                self._comm.refill_pool(link)
         
         self._translated_ops.append(netqasm_qsend)
 
     def _translate_qrecv(self, op: QRecv):
         """
-        Translate a quantum receive operation into a CUNQA instruction.
+        Translate a quantum receive operation into the end of a teleportation.
 
         Args:
             op: Quantum receive operation to translate.
         """
-        def netqasm_qrecv():
-            epr_socket = self._comm.get_epr_socket(self._comm.rank, op.src_rank)
-            socket = self._comm.get_socket(self._comm.rank, op.src_rank)
+        adopt = self._adopt_received()
+        key, pooled, link = self._plan_transfer(op.src_rank, self._comm.rank, len(op.qubits))
 
-            for q_idx in op.qubits:
-                epr = epr_socket.recv_keep()[0]
-                self._comm.flush()
-
-                # Receive corrections
-                m1, m2 = socket.recv_structured().payload
-                if m2 == 1:
-                    epr.X()
-                if m1 == 1:
-                    epr.Z()
-                self._comm.flush()
-                
-                # SWAP the corrected EPR qubit into the local slot
-                new_q = self._comm.create_qubit()
-                epr.cnot(new_q)
-                new_q.cnot(epr)
-                epr.cnot(new_q)
-
-                self._qubits[q_idx] = new_q
-                self._comm.flush()
+        def netqasm_qrecv():
+            eprs, frames, missing = self._recv_pairs(key, pooled, link, len(op.qubits))
+            # The sender's flush waits for our EPR requests: submit them
+            # before blocking on its message.
+            self._flush_transfer(missing, needed=False)
+
+            # Receive corrections; they are applied, with the swaps, in
+            # the subroutine of the next flush.
+            corrections = self._comm.recv_message(op.src_rank, "Corrections")
+            self._correct(op.qubits, eprs, corrections, frames, adopt)
+            if pooled:
+                self._comm.refill_pool(link)
         
         self._translated_ops.append(netqasm_qrecv)
 
-    def _translate_qscatter(self, op: QScatter):
+    def _translate_qisend(self, op: QISend):
         """
-        Translate a quantum scatter operation into CUNQA instructions.
+        Start a non-blocking send: request its pairs and teleport, without flushing.
+
+        The outcomes are read, and sent as corrections, at the wait, so
+        the teleportation joins the subroutine of the following gates
+        (see :mod:`~netqmpi.runtime.adapters.netqasm.netqasm_requests`).
 
         Args:
-            op: Quantum scatter operation to translate.
+            op: Non-blocking send operation to translate.
+        """
+        key, pooled, link = self._plan_transfer(self._comm.rank, op.dest_rank, len(op.qubits))
+        tag = self._request_tag(link)
 
-        Raises:
-            NotImplementedError: Always, because this operation is not yet supported.
+        def netqasm_qisend():
+            eprs, missing = self._send_pairs(key, pooled, link, len(op.qubits))
+            outcomes = self._teleport(op.qubits, eprs)
+            if pooled:
+                self._comm.refill_pool(link)
+            self._requests[op.request] = PendingRequest(
+                True, tag, op.dest_rank, op.qubits, eprs, missing,
+                outcomes=outcomes, started_op=self._comm.ops_run,
+            )
+
+        self._translated_ops.append(netqasm_qisend)
+
+    def _translate_qirecv(self, op: QIRecv):
         """
-        def netqasm_qscatter():
-            rank = self._comm.rank
-            size = self._comm.size
+        Start a non-blocking receive: request its pairs, without flushing.
+
+        Args:
+            op: Non-blocking receive operation to translate.
+        """
+        key, pooled, link = self._plan_transfer(op.src_rank, self._comm.rank, len(op.qubits))
+        tag = self._request_tag(link)
+
+        def netqasm_qirecv():
+            eprs, frames, missing = self._recv_pairs(key, pooled, link, len(op.qubits))
+            if pooled:
+                self._comm.refill_pool(link)
+            self._requests[op.request] = PendingRequest(
+                False, tag, op.src_rank, op.qubits, eprs, missing,
+                frames=frames, started_op=self._comm.ops_run,
+            )
+
+        self._translated_ops.append(netqasm_qirecv)
+
+    def _translate_qwait(self, op: QWait):
+        """
+        Complete non-blocking transfers: exchange and apply their corrections.
+
+        Args:
+            op: Wait operation to translate.
+        """
+        adopt = self._adopt_received()
+
+        def netqasm_qwait():
+            stats = self._comm.request_stats
+            start = time.perf_counter()
+            for index in op.requests:
+                request = self._requests.pop(index)
+                stats.requests += 1
+                stats.overlapped_ops += self._comm.ops_run - request.started_op
+                stats.inflight_seconds += start - request.started
+                if request.send:
+                    self._flush_transfer(request.missing)
+                    self._send_corrections(request.peer, request.tag, request.outcomes)
+                else:
+                    self._flush_transfer(request.missing, needed=False)
+                    corrections = self._comm.recv_message(request.peer, request.tag)
+                    self._correct(request.qubits, request.eprs, corrections, request.frames, adopt)
+            stats.wait_seconds += time.perf_counter() - start
+
+        self._translated_ops.append(netqasm_qwait)
+
+    def _plan_transfer(
+        self, src: int, dest: int, qubits: int
+    ) -> Tuple[Optional[Tuple[int, int, int]], bool, PoolKey]:
+        """
+        Decide where the EPR pairs of a transfer come from.
+
+        The sender also counts the transfer in the network stats.
+
+        Args:
+            src: Sending rank.
+            dest: Receiving rank.
+            qubits: Qubits teleported.
+
+        Returns:
+            The routed transfer key, or ``None`` for a direct transfer;
+            whether the pairs come from the EPR pool; and the link.
+        """
+        if src == self._comm.rank:
+            self._comm.network_stats.record_route(src, dest, qubits)
+        key = self._route_key(src, dest)
+        return key, key is None and bool(self._pool_demand), (src, dest)
+
+    def _request_tag(self, link: PoolKey) -> str:
+        """Return the header of the corrections of the next request over a link."""
+        index = self._request_index.get(link, 0)
+        self._request_index[link] = index + 1
+        return f"Request {index}"
+
+    def _send_pairs(
+        self, key: Optional[Tuple[int, int, int]], pooled: bool, link: PoolKey, number: int
+    ) -> Tuple[List[Qubit], int]:
+        """
+        Return the sender's EPR halves of a transfer.
+
+        Args:
+            key: Routed transfer key, or ``None``.
+            pooled: Whether the pairs come from the EPR pool.
+            link: Directed link ``(sender, receiver)``.
+            number: Qubits teleported.
+
+        Returns:
+            The halves, and how many were requested on demand.
+        """
+        if key is not None:
+            # End-to-end pairs built in the prologue.
+            return self._routed.pop(key), 0
+        if pooled:
+            return self._pool_pairs(link, number)
+        # One request for every EPR pair of the transfer.
+        return self._comm.create_epr(link[1], number), number
+
+    def _recv_pairs(
+        self, key: Optional[Tuple[int, int, int]], pooled: bool, link: PoolKey, number: int
+    ) -> Tuple[List[Qubit], List[Tuple[int, int]], int]:
+        """
+        Return the receiver's EPR halves of a transfer.
+
+        Args:
+            key: Routed transfer key, or ``None``.
+            pooled: Whether the pairs come from the EPR pool.
+            link: Directed link ``(sender, receiver)``.
+            number: Qubits teleported.
+
+        Returns:
+            The halves, the ``(z, x)`` frame left on each by the swaps
+            of a route, and how many were requested on demand.
+        """
+        if key is not None:
+            return self._routed.pop(key), self._frames.pop(key), 0
+        frames = [(0, 0)] * number
+        if pooled:
+            eprs, missing = self._pool_pairs(link, number)
+            return eprs, frames, missing
+        return self._comm.recv_epr(link[0], number), frames, number
+
+    def _teleport(self, qubits: List[int], eprs: List[Qubit]) -> List[Tuple[Any, Any]]:
+        """
+        Bell-measure qubits with their EPR halves, freeing their slots.
+
+        Returns:
+            The outcomes per qubit, resolved at the next flush.
+        """
+        outcomes = []
+        for q_idx, epr in zip(qubits, eprs):
+            qubit = self._qubits[q_idx]
+            qubit.cnot(epr)
+            qubit.H()
+            outcomes.append((qubit.measure(), epr.measure()))
+            self._qubits[q_idx] = None
+        return outcomes
+
+    def _send_corrections(self, dest: int, header: str, outcomes: List[Tuple[Any, Any]]) -> None:
+        """Send the teleportation outcomes of a transfer, once flushed, in one message."""
+        self._comm.get_socket(self._comm.rank, dest).send_structured(StructuredMessage(
+            header, [(int(m1), int(m2)) for m1, m2 in outcomes]
+        ))
+
+    def _correct(
+        self,
+        qubits: List[int],
+        eprs: List[Qubit],
+        corrections: List[Tuple[int, int]],
+        frames: List[Tuple[int, int]],
+        adopt: bool,
+    ) -> None:
+        """
+        Apply the corrections of a transfer and store the received qubits.
+
+        Args:
+            qubits: Slots receiving the states.
+            eprs: Received EPR halves.
+            corrections: Sender's outcomes per qubit.
+            frames: ``(z, x)`` frame per half left by a route's swaps.
+            adopt: Whether the halves become the slots' qubits.
+        """
+        for q_idx, epr, (m1, m2), (z, x) in zip(qubits, eprs, corrections, frames):
+            if m2 ^ x:
+                epr.X()
+            if m1 ^ z:
+                epr.Z()
+            self._store_received(q_idx, epr, adopt)
+
+    def _direct_demand(self, leaves: List[Operation]) -> Dict[PoolKey, int]:
+        """
+        Count the qubits teleported over each link by direct transfers.
+
+        Args:
+            leaves: Leaf operations of the circuit, with collectives lowered.
 
-            if rank == op.sender_rank:
-                chunks = self._list_split(op.qubits, size)
-                for i in range(size):
-                    if i != op.sender_rank:
-                        self.qsend(chunks[i], i)
+        Returns:
+            Directed link ``(sender, receiver)`` -> qubits.
+        """
+        rank = self._comm.rank
+        topology = self._comm.topology
+        demand: Dict[PoolKey, int] = {}
+        for op in leaves:
+            if isinstance(op, QSend):
+                link = (rank, op.dest_rank)
+            elif isinstance(op, QRecv):
+                link = (op.src_rank, rank)
             else:
-                self.qrecv(op.qubits, op.sender_rank)
-        
-        self._translated_ops.append(netqasm_qscatter)
+                continue
+            if topology.adjacent(*link):
+                demand[link] = demand.get(link, 0) + len(op.qubits)
+        return demand
+
+    def _pool_pairs(self, link: PoolKey, number: int) -> Tuple[List[Qubit], int]:
+        """
+        Take the EPR pairs of a direct transfer from the pool, on either end.
+
+        With ``epr_max_age`` set, the sender first frees the pairs past
+        it and tells the receiver how many, so that it frees its halves
+        too.  The pairs the pool lacks are requested on demand.
+
+        Args:
+            link: Directed link ``(sender, receiver)`` of the transfer.
+            number: Qubits teleported.
+
+        Returns:
+            This rank's halves, and how many of them were requested on
+            demand.
+        """
+        pool = self._comm.epr_pool
+        src, dest = link
+        sender = src == self._comm.rank
+        if pool.max_age is not None:
+            if sender:
+                expired = pool.expire(link)
+                self._comm.get_socket(src, dest).send_structured(StructuredMessage("Expired", len(expired)))
+            else:
+                self._comm.submit_epr()
+                expired = pool.drop(link, self._comm.recv_message(src, "Expired"))
+            for half in expired:
+                half.free()
+        eprs = pool.take(link, number)
+        missing = number - len(eprs)
+        if missing:
+            if sender:
+                eprs += self._comm.create_epr(dest, missing)
+            else:
+                eprs += self._comm.recv_epr(src, missing)
+        return eprs, missing
+
+    def _flush_transfer(self, missing: int, needed: bool = True) -> None:
+        """
+        Flush for a transfer, counting the wait as a pool stall.
+
+        Args:
+            missing: Pairs of the transfer requested on demand, whose
+                generation this flush waits for.
+            needed: Whether this rank needs the flush, as the sender
+                does for its outcomes.  Otherwise it only flushes if EPR
+                requests are queued, which the other end may wait for.
+        """
+        start = time.perf_counter()
+        if needed:
+            self._comm.flush()
+        else:
+            self._comm.submit_epr()
+        if missing and self._comm.epr_pool is not None:
+            self._comm.pool_stats.stall_seconds += time.perf_counter() - start
+
+    def _route_key(self, src: int, dest: int) -> Optional[Tuple[int, int, int]]:
+        """
+        Return the key of the routed transfer a qsend/qrecv belongs to.
+
+        Args:
+            src: Sending rank.
+            dest: Receiving rank.
+
+        Returns:
+            ``(src, dest, index)``, or ``None`` if the ranks are linked.
+        """
+        if src == dest or self._comm.topology.adjacent(src, dest):
+            return None
+        index = self._route_index.get((src, dest), 0)
+        self._route_index[(src, dest)] = index + 1
+        return (src, dest, index)
+
+    def _build_routes(self) -> None:
+        """
+        Build this rank's part of the end-to-end pairs of every routed transfer.
+
+        The ends keep their halves for the transfer.  A rank in between
+        Bell-measures the halves it shares with its two neighbours on the
+        route and sends the outcomes to the receiver, which reads them,
+        in route order, once all pairs are built.
+        """
+        rank = self._comm.rank
+        swaps: List[Tuple[Any, int]] = []
+        for transfer, hop in self._routes.steps(rank):
+            path = transfer.path
+            if hop == 0:
+                self._routed[transfer.key] = self._comm.create_epr(path[1], transfer.qubits)
+            elif hop == len(path) - 1:
+                self._routed[transfer.key] = self._comm.recv_epr(path[-2], transfer.qubits)
+            else:
+                prev = self._comm.recv_epr(path[hop - 1], transfer.qubits)
+                nxt = self._comm.create_epr(path[hop + 1], transfer.qubits)
+                outcomes = []
+                for left, right in zip(prev, nxt):
+                    left.cnot(right)
+                    left.H()
+                    outcomes.append((left.measure(), right.measure()))
+                self._comm.flush()
+                self._comm.get_socket(rank, transfer.dest).send_structured(StructuredMessage(
+                    "Swap", [(int(m1), int(m2)) for m1, m2 in outcomes]
+                ))
+                continue
+            # Neighbours on the route wait for this rank's requests.
+            self._comm.flush()
+            if hop == len(path) - 1:
+                swaps.append((transfer, hop))
+
+        for transfer, _ in swaps:
+            frames = [(0, 0)] * transfer.qubits
+            for middle in transfer.path[1:-1]:
+                payload = self._comm.recv_message(middle, "Swap")
+                frames = [(z ^ m1, x ^ m2) for (z, x), (m1, m2) in zip(frames, payload)]
+            self._frames[transfer.key] = frames
+
+    def _store_received(self, q_idx: int, epr: Qubit, adopt: bool) -> None:
+        """
+        Make a received EPR qubit the qubit of a slot.
+
+        Args:
+            q_idx: Slot receiving the state.
+            epr: Received (and corrected) EPR qubit.
+            adopt: Whether the EPR qubit becomes the slot's qubit.
+                Otherwise it is swapped into the qubit the plan allocated
+                for the slot, and freed.
+        """
+        if adopt:
+            self._qubits[q_idx] = epr
+            return
+        new_q = self._qubits[q_idx]
+        epr.cnot(new_q)
+        new_q.cnot(epr)
+        epr.cnot(new_q)
+        epr.free()
+
+    def _translate_qscatter(self, op: QScatter):
+        """
+        Translate a quantum scatter into the qsend/qrecv of its schedule.
+
+        Args:
+            op: Quantum scatter operation to translate.
+        """
+        for child in lower_collective(
+            op, self._comm.rank, self._comm.size, self._num_qubits, self._comm.topology
+        ):
+            self._translate_leaf(child)
 
     def _translate_qgather(self, op: QGather):
         """
-        Translate a quantum gather operation into CUNQA instructions.
+        Translate a quantum gather into the qsend/qrecv of its schedule.
 
         Args:
             op: Quantum gather operation to translate.
+        """
+        for child in lower_collective(
+            op, self._comm.rank, self._comm.size, self._num_qubits, self._comm.topology
+        ):
+            self._translate_leaf(child)
 
-        Raises:
-            NotImplementedError: Always, because this operation is not yet supported.
+    def _translate_qbcast(self, op: QBcast):
         """
-        def netqasm_qgather():
+        Translate a quantum broadcast into a cat-entangler fan-out.
+
+        Every rank requests the EPR pairs of all its links in the
+        broadcast tree (see :func:`~netqmpi.sdk.collectives.broadcast_links`)
+        at once, CNOTs its copy onto the halves shared with its children
+        and measures them, in a single subroutine, so all links are
+        entangled in parallel.  Only one correction bit per link then
+        travels down the tree: a child flips its half when its parent's
+        outcome differs from the parent's own correction.
+
+        Args:
+            op: Quantum broadcast operation to translate.
+        """
+        parent, children = broadcast_links(
+            self._comm.rank, self._comm.size, op.root, self._comm.topology
+        )
+        adopt = self._adopt_received()
+
+        def netqasm_qbcast():
             rank = self._comm.rank
-            size = self._comm.size
+            if parent is None:
+                copy = self._qubits[op.qubit]
+            else:
+                copy = self._comm.recv_epr(parent)[0]
+            links = [self._comm.create_epr(c)[0] for c in children]
+            outcomes = []
+            for link in links:
+                copy.cnot(link)
+                outcomes.append(link.measure())
+            # The parent's flush waits for our pair: submit it before
+            # blocking on the parent's correction.
+            self._comm.flush()
+
+            flip = 0
+            if parent is not None:
+                flip = self._comm.recv_message(parent, "Cat")
+                if flip:
+                    copy.X()
+                self._store_received(op.qubit, copy, adopt)
+            for child, m in zip(children, outcomes):
+                self._comm.get_socket(rank, child).send_structured(
+                    StructuredMessage("Cat", int(m) ^ flip)
+                )
+
+        self._translated_ops.append(netqasm_qbcast)
+
+    def _translate_qunbcast(self, op: QUnbcast):
+        """
+        Translate the end of a quantum broadcast into a cat-disentangler.
+
+        Every copy is measured in the X basis and the outcomes are XORed
+        up the broadcast tree; the root applies Z when the parity is odd.
+
+        Args:
+            op: Quantum unbroadcast operation to translate.
+        """
+        parent, children = broadcast_links(
+            self._comm.rank, self._comm.size, op.root, self._comm.topology
+        )
 
-            if rank == op.recv_rank:
-                for i in range(size):
-                    if i != op.recv_rank:
-                        self.qrecv(op.qubits, i)
+        def netqasm_qunbcast():
+            rank = self._comm.rank
+            parity = 0
+            if parent is not None:
+                copy = self._qubits[op.qubit]
+                copy.H()
+                outcome = copy.measure()
+                self._qubits[op.qubit] = None
+                self._comm.flush()
+                parity = int(outcome)
             else:
-                self.qsend(op.qubits, op.recv_rank)
-        
-        self._translated_ops.append(netqasm_qgather)
+                # Children may wait for pairs this rank requested.
+                self._comm.submit_epr()
+            for child in children:
+                parity ^= self._comm.recv_message(child, "Parity")
+            if parent is not None:
+                self._comm.get_socket(rank, parent).send_structured(StructuredMessage("Parity", parity))
+            elif parity:
+                self._qubits[op.qubit].Z()
+
+        self._translated_ops.append(netqasm_qunbcast)
+
+    def _translate_qreduce(self, op: QReduce):
+        """
+        Translate a quantum reduce into local gates around a broadcast of its target.
+
+        Args:
+            op: Quantum reduce operation to translate.
+        """
+        for child in lower_reduce(op, self._comm.rank):
+            self._translate_leaf(child)
 
     def _translate_expose(self, op: Expose):
         """
@@ -346,11 +815,104 @@ class NetQASMCircuitAdapter(Circuit):
         Raises:
             TypeError: If the operation type is unknown.
         """
-        self._qubits = [
-            self._comm.create_qubit() for _ in range(self.num_qubits)
-        ]
-        super().translate(op)
+        if self._plan is None:
+            leaves = list(op.flatten()) if isinstance(op, OperationContainer) else [op]
+            # Collectives are planned as the qsend/qrecv they are lowered to.
+            leaves = list(expand_collectives(
+                leaves, self._comm.rank, self._comm.size, self._num_qubits, self._comm.topology
+            ))
+            self._plan = plan_allocation(
+                leaves, self._adopt_received(), self._comm.rank, self._comm.size, self._comm.topology
+            )
+            self._routes = self._comm.route_plan(self._comm.circuits.index(self))
+            rank = self._comm.rank
+            depth = self._comm._config.epr_pool_depth
+            if depth > 0:
+                self._pool_demand = self._direct_demand(leaves)
+            # Routed and pooled halves are held from the prologue to
+            # their transfer.
+            pooled = sum(min(depth, n) for n in self._pool_demand.values())
+            self.peak_qubits = max(
+                self._routes.peak(rank), self._plan.peak + self._routes.held(rank) + pooled
+            )
+            tracer = tracing.active()
+            if tracer is not None:
+                tracer.instant("allocation", "netqasm", rank=rank, peak_qubits=self.peak_qubits)
+            prologue = []
+            if self._routes.steps(rank):
+                prologue.append(("Routes", self._build_routes))
+            if depth > 0:
+                demand = dict(self._pool_demand)
+                prologue.append(("Pool", lambda: self._comm.open_pool(demand)))
+            for name, func in prologue:
+                if tracer is not None:
+                    func = tracer.wrap(func, name, "op", rank=rank)
+                self._translated_ops.append(func)
+            self._num_traced = len(self._translated_ops)
+        if isinstance(op, OperationContainer):
+            super().translate(op)
+        else:
+            self._translate_leaf(op)
         return self._translated_ops
+
+    def _translate_leaf(self, op: Operation) -> None:
+        """
+        Translate one leaf operation, preceded by its planned allocations.
+
+        Args:
+            op: Leaf operation to translate.
+        """
+        if isinstance(op, (QScatter, QGather, QReduce)):
+            # Its lowered operations are translated, and counted, one by one.
+            super().translate(op)
+            return
+        self._position += 1
+        release = self._plan.releases.get(self._position, ())
+        allocate = self._plan.allocations.get(self._position, ())
+        if release or allocate:
+            def netqasm_allocate():
+                for q in release:
+                    self._qubits[q].free()
+                for q in allocate:
+                    self._qubits[q] = self._comm.create_qubit()
+
+            self._translated_ops.append(netqasm_allocate)
+        super().translate(op)
+        tracer = tracing.active()
+        if tracer is not None:
+            self._trace_ops(tracer, op)
+
+    def _adopt_received(self) -> bool:
+        """
+        Return whether received EPR qubits become slot qubits directly.
+
+        Only on ``"generic"`` hardware, where any position can hold a
+        qubit; elsewhere the EPR qubit is swapped into a memory qubit
+        and its communication qubit freed for the next pair.
+        """
+        return self._comm._config.hardware == "generic"
+
+    # Operation attributes naming the other rank of a communication op.
+    _PEER_ATTRS = ("dest_rank", "src_rank", "sender_rank", "recv_rank", "root")
+
+    def _trace_ops(self, tracer: tracing.Tracer, op: Operation) -> None:
+        """
+        Wrap the closures translated from ``op`` in tracing spans.
+
+        Closures of nested operations are wrapped by their own
+        :meth:`translate` call, so each one is wrapped exactly once.
+
+        Args:
+            tracer: Active tracer.
+            op: Operation that was just translated.
+        """
+        peer = next((getattr(op, attr) for attr in self._PEER_ATTRS if hasattr(op, attr)), None)
+        for index in range(self._num_traced, len(self._translated_ops)):
+            self._translated_ops[index] = tracer.wrap(
+                self._translated_ops[index], type(op).__name__, "op",
+                rank=self._comm.rank, peer=peer, gate=getattr(op, "name", None),
+            )
+        self._num_traced = len(self._translated_ops)
     
     # ------------------------------------------------------------------
     # Collective helpers
@@ -11,7 +11,7 @@ from __future__ import annotations
 
 import os
 import importlib
-from typing import Any, List, Dict, TYPE_CHECKING
+from typing import Any, List, Dict, Optional, TYPE_CHECKING
 
 from netqasm.sdk import EPRSocket, Qubit
 from netqasm.sdk.external import NetQASMConnection, Socket
@@ -27,6 +27,13 @@ if TYPE_CHECKING:
     from netqmpi.runtime.adapters.netqasm.netqasm_executor import NetQASMRunConfig
     
 from netqmpi.sdk import QMPICommunicator
+from netqmpi.sdk.topology import Topology
+from netqmpi.runtime import profiling, tracing
+from netqmpi.sdk.collectives import expand_collectives
+from netqmpi.runtime.adapters.netqasm.netqasm_pool import EPRPool, PoolKey, PoolStats
+from netqmpi.runtime.adapters.netqasm.netqasm_requests import RequestStats
+from netqmpi.runtime.adapters.netqasm.netqasm_routing import RoutePlan, plan_routes
+from netqmpi.runtime.adapters.netqasm.netqasm_scheduler import FlushScheduler, FlushStats
 
 class NetQASMCommunicator(QMPICommunicator):
     """
@@ -36,13 +43,38 @@ class NetQASMCommunicator(QMPICommunicator):
     by the NetQASM runtime adapter, including the NetQASM connection,
     EPR sockets, and lazily created classical sockets.
 
+    EPR sockets only join ranks linked in the communicator's topology;
+    classical sockets join any two ranks.  Transfers between ranks that
+    are not linked are routed (see
+    :mod:`~netqmpi.runtime.adapters.netqasm.netqasm_routing`).
+
     Args:
         rank: Numeric index of the current rank.
         size: Total number of ranks in the communicator.
         _config: NetQASM application configuration associated with this rank.
+
+    Attributes:
+        peak_qubits: Most qubits this rank held at once over its
+            translated circuits (see
+            :attr:`NetQASMCircuitAdapter.peak_qubits
+            <netqmpi.runtime.adapters.netqasm.netqasm_circuit.NetQASMCircuitAdapter.peak_qubits>`).
+        flush_stats: Round trips to the quantum node made by this rank
+            and their time (see
+            :mod:`~netqmpi.runtime.adapters.netqasm.netqasm_scheduler`).
+        epr_pairs: Peer rank -> EPR pairs this rank shared with it,
+            created or received, over its translated circuits.
+        epr_pool: Pre-shared EPR pairs of the running circuit, ``None``
+            without ``epr_pool_depth`` (see
+            :mod:`~netqmpi.runtime.adapters.netqasm.netqasm_pool`).
+        pool_stats: Hits, misses and stalls of this rank's EPR pools.
+        request_stats: Overlap of this rank's non-blocking transfers (see
+            :mod:`~netqmpi.runtime.adapters.netqasm.netqasm_requests`).
+        ops_run: Translated operations run so far by this rank.
     """
     
     netqasm_circuits = []
+    # Rank -> its circuits, for planning the routes that cross it.
+    rank_circuits: Dict[int, List[Any]] = {}
 
     def __init__(self, rank: int, size: int, config: NetQASMRunConfig) -> None:
         """
@@ -53,7 +85,7 @@ class NetQASMCommunicator(QMPICommunicator):
             size: Total number of ranks in the communicator.
             _config: NetQASM application configuration associated with this rank.
         """
-        super().__init__(rank, size)
+        super().__init__(rank, size, Topology.parse(config.topology, size))
 
         # -- EPR sockets ---------------------------------------------------
         self._epr_sockets: Dict[str, Dict[str, EPRSocket]] = {}
@@ -62,7 +94,7 @@ class NetQASMCommunicator(QMPICommunicator):
             self._epr_sockets[self.get_rank_name(i)] = {}
 
         for i in range(self.size):
-            if i != self.rank:
+            if i != self.rank and self.topology.adjacent(self.rank, i):
                 self._epr_sockets[self.get_rank_name(self.rank)][
                     self.get_rank_name(i)
                 ] = EPRSocket(self.get_rank_name(i))
@@ -79,6 +111,18 @@ class NetQASMCommunicator(QMPICommunicator):
         self._connection = None
         
         self._config = config
+        self.peak_qubits = 0
+        self.flush_stats = FlushStats()
+        self.epr_pairs: Dict[int, int] = {}
+        self.epr_pool: Optional[EPRPool] = None
+        self.pool_stats = PoolStats()
+        self.request_stats = RequestStats()
+        self.ops_run = 0
+        # Peer rank -> messages received before they were asked for.
+        self._mailbox: Dict[int, List[Any]] = {}
+        # Whether EPR requests were queued since the last round trip.
+        self._epr_queued = False
+        self._scheduler: Optional[FlushScheduler] = None
 
     # ------------------------------------------------------------------
     # Context manager
@@ -111,6 +155,7 @@ class NetQASMCommunicator(QMPICommunicator):
         Returns:
             The current communicator instance.
         """
+        profiling.begin("build", self.rank)
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> Any:
@@ -125,24 +170,31 @@ class NetQASMCommunicator(QMPICommunicator):
         Returns:
             The result of the underlying connection ``__exit__`` method.
         """
-        
+        profiling.end("build", self.rank)
         argv_per_rank: dict = {}
+        NetQASMCommunicator.rank_circuits[self.rank] = list(self.circuits)
         
         for circuit in self.circuits:
             def entry(app_config=None):
-                self._connection = NetQASMConnection(
-                    app_name=app_config.app_name,
-                    log_config=app_config.log_config, # TODO: Change none
-                    epr_sockets=self._epr_sockets_list,
-                )
-                self._connection.__enter__()
-                for op in circuit.translate(circuit.ops):
-                    result = op()
-                    if result is not None:
-                        self.flush()
-                        str_result = str(result)
-                        self.results[str_result] = self.results.get(str_result, 0) + 1
-                self._connection.__exit__(exc_type, exc_val, exc_tb)
+                with tracing.span("program", "netqasm", rank=self.rank):
+                    self._connection = NetQASMConnection(
+                        app_name=app_config.app_name,
+                        log_config=app_config.log_config, # TODO: Change none
+                        epr_sockets=self._epr_sockets_list,
+                    )
+                    self._connection.__enter__()
+                    with profiling.phase("translate", self.rank):
+                        translated_ops = circuit.translate(circuit.ops)
+                    self.peak_qubits = max(self.peak_qubits, circuit.peak_qubits)
+                    self._scheduler = FlushScheduler(self._round_trip, self.flush_stats)
+                    for op in translated_ops:
+                        self._scheduler.queue()
+                        result = op()
+                        self.ops_run += 1
+                        if result is not None:
+                            self._scheduler.defer(result, self._record_result)
+                    self._scheduler.flush()
+                    self._connection.__exit__(exc_type, exc_val, exc_tb)
 
             print(f"rank_{self.rank}")
             NetQASMCommunicator.netqasm_circuits.append(
@@ -150,41 +202,43 @@ class NetQASMCommunicator(QMPICommunicator):
             )
 
         if len(NetQASMCommunicator.netqasm_circuits) == self.size:
-            roles = netqasm_env.load_roles_config(self._config.roles)
-            if roles is None:
-                roles = {prog.party: prog.party for prog in NetQASMCommunicator.netqasm_circuits}
-
-            app_instance = ApplicationInstance(
-                app=Application(programs=NetQASMCommunicator.netqasm_circuits, metadata=None),
-                program_inputs=argv_per_rank,
-                network=None,
-                party_alloc=roles,
-                logging_cfg=None,
-            )
-            
-            simulator = os.environ.get("NETQASM_SIMULATOR", Simulator.NETSQUID.value)
-            set_simulator(simulator)
-
-            simulate_application = importlib.import_module("netqasm.sdk.external").simulate_application
-
-            formalism = getattr(self._config, "formalism", Formalism.KET)
-            log_cfg = self._config.log_cfg
-            network_config = self._config.network_config
-
-            if network_config is not None:
-                network_config = network_cfg_from_path(".", network_config)
-
-            simulate_application(
-                app_instance=app_instance,
-                num_rounds=1,
-                network_cfg=network_config,
-                formalism=formalism,
-                post_function=self._config.post_function,
-                log_cfg=log_cfg,
-                use_app_config=True,
-                enable_logging=self._config.enable_logging,
-                hardware=self._config.hardware,
-            )
+            with profiling.phase("submit"):
+                roles = netqasm_env.load_roles_config(self._config.roles)
+                if roles is None:
+                    roles = {prog.party: prog.party for prog in NetQASMCommunicator.netqasm_circuits}
+
+                app_instance = ApplicationInstance(
+                    app=Application(programs=NetQASMCommunicator.netqasm_circuits, metadata=None),
+                    program_inputs=argv_per_rank,
+                    network=None,
+                    party_alloc=roles,
+                    logging_cfg=None,
+                )
+
+                simulator = os.environ.get("NETQASM_SIMULATOR", Simulator.NETSQUID.value)
+                set_simulator(simulator)
+
+                simulate_application = importlib.import_module("netqasm.sdk.external").simulate_application
+
+                formalism = getattr(self._config, "formalism", Formalism.KET)
+                log_cfg = self._config.log_cfg
+                network_config = self._config.network_config
+
+                if network_config is not None:
+                    network_config = network_cfg_from_path(".", network_config)
+
+            with profiling.phase("simulate"):
+                simulate_application(
+                    app_instance=app_instance,
+                    num_rounds=1,
+                    network_cfg=network_config,
+                    formalism=formalism,
+                    post_function=self._config.post_function,
+                    log_cfg=log_cfg,
+                    use_app_config=True,
+                    enable_logging=self._config.enable_logging,
+                    hardware=self._config.hardware,
+                )
 
             if self._config.enable_logging and log_cfg is not None:
                 create_app_instr_logs(log_cfg.log_subroutines_dir)
@@ -214,6 +268,33 @@ class NetQASMCommunicator(QMPICommunicator):
 
         return my_sockets[other_name]
 
+    def recv_message(self, peer: int, header: str) -> Any:
+        """
+        Receive the next message with a given header from a peer.
+
+        Messages with other headers that arrive first are kept for the
+        calls asking for them, so transfers completed out of order still
+        get their own messages.  Flush before calling if the peer may be
+        waiting for EPR pairs this rank requested.
+
+        Args:
+            peer: Sending rank.
+            header: Header of the message.
+
+        Returns:
+            The message's payload.
+        """
+        kept = self._mailbox.setdefault(peer, [])
+        for index, message in enumerate(kept):
+            if message.header == header:
+                return kept.pop(index).payload
+        socket = self.get_socket(self.rank, peer)
+        while True:
+            message = socket.recv_structured()
+            if message.header == header:
+                return message.payload
+            kept.append(message)
+
     def get_epr_socket(self, my_rank: int, other_rank: int) -> EPRSocket:
         """
         Return the EPR socket between two ranks.
@@ -239,11 +320,131 @@ class NetQASMCommunicator(QMPICommunicator):
 
         return my_eprs[other_name]
 
+    def create_epr(self, peer: int, number: int = 1) -> List[Qubit]:
+        """
+        Request EPR pairs with a linked peer, as the creating side.
+
+        The pairs are counted in :attr:`network_stats`.
+
+        Args:
+            peer: Rank sharing the pairs.
+            number: Number of pairs.
+
+        Returns:
+            This rank's halves of the pairs.
+        """
+        self.epr_pairs[peer] = self.epr_pairs.get(peer, 0) + number
+        self.network_stats.record_pairs(self.rank, peer, number)
+        self._scheduler.queue()
+        self._epr_queued = True
+        return self.get_epr_socket(self.rank, peer).create_keep(number=number)
+
+    def recv_epr(self, peer: int, number: int = 1) -> List[Qubit]:
+        """
+        Accept EPR pairs created by a linked peer.
+
+        Args:
+            peer: Rank sharing the pairs.
+            number: Number of pairs.
+
+        Returns:
+            This rank's halves of the pairs.
+        """
+        self.epr_pairs[peer] = self.epr_pairs.get(peer, 0) + number
+        self._scheduler.queue()
+        self._epr_queued = True
+        return self.get_epr_socket(self.rank, peer).recv_keep(number=number)
+
+    def route_plan(self, index: int) -> RoutePlan:
+        """
+        Plan the routed transfers of the *index*-th circuit of every rank.
+
+        Args:
+            index: Position of the circuit among its rank's circuits.
+
+        Returns:
+            The plan; empty on a full mesh.
+        """
+        if self.topology.is_full:
+            return RoutePlan()
+        leaves = []
+        for rank in range(self.size):
+            circuit = NetQASMCommunicator.rank_circuits[rank][index]
+            leaves.append(list(expand_collectives(
+                circuit.ops.flatten(), rank, self.size, circuit.num_qubits, self.topology,
+            )))
+        return plan_routes(leaves, self.topology)
+
+    def open_pool(self, demand: Dict[PoolKey, int]) -> None:
+        """
+        Start the EPR pool of a circuit and request its first pairs.
+
+        The requests are not flushed: the pairs are generated along with
+        the first subroutine of the circuit.
+
+        Args:
+            demand: Directed link -> qubits its transfers teleport over
+                the circuit.
+        """
+        self.epr_pool = EPRPool(
+            self._config.epr_pool_depth, self._config.epr_max_age, demand, self.pool_stats
+        )
+        for key in self.epr_pool.links():
+            self.refill_pool(key)
+
+    def refill_pool(self, key: PoolKey) -> None:
+        """
+        Request the pairs a link's pool is missing, without flushing.
+
+        Args:
+            key: Directed link ``(sender, receiver)``; this rank creates
+                the pairs when it is the sender.
+        """
+        number = self.epr_pool.wanted(key)
+        if not number:
+            return
+        src, dest = key
+        if src == self.rank:
+            halves = self.create_epr(dest, number)
+        else:
+            halves = self.recv_epr(src, number)
+        self.epr_pool.add(key, halves)
+
     def flush(self) -> None:
         """
-        Flush the underlying NetQASM connection.
+        Flush the underlying NetQASM connection if anything is queued.
+
+        Called where the program needs a value from the node; pending
+        measurement results are resolved as well.
+        """
+        self._scheduler.flush()
+
+    def submit_epr(self) -> None:
+        """
+        Flush if EPR requests were queued since the last flush.
+
+        Called before blocking on a message from a peer that may be
+        waiting for those pairs, e.g. requested by a pool or a
+        non-blocking transfer.
+        """
+        if self._epr_queued:
+            self.flush()
+
+    def _round_trip(self) -> None:
+        """
+        Flush the connection unconditionally.
+
+        Each flush is a round trip to the simulator, traced as a
+        ``flush`` span of this rank.
         """
-        self._connection.flush()
+        with tracing.span("flush", "netqasm", rank=self.rank):
+            self._connection.flush()
+        self._epr_queued = False
+
+    def _record_result(self, result: Any) -> None:
+        """Count a resolved measurement result."""
+        str_result = str(result)
+        self.results[str_result] = self.results.get(str_result, 0) + 1
         
     def create_qubit(self):
         """
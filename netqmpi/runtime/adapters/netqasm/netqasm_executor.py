@@ -20,7 +20,8 @@ from netqasm.runtime.settings import Formalism
 
 from netqmpi.runtime.executor import Executor
 from netqmpi.runtime.run_config import RunConfig
-from netqmpi.runtime.adapters.netqasm import NetQASMCommunicator, NetQASMCircuitAdapter
+from netqmpi.runtime.adapters.netqasm.netqasm_communicator import NetQASMCommunicator
+from netqmpi.runtime.adapters.netqasm.netqasm_circuit import NetQASMCircuitAdapter
 from netqmpi.sdk.circuit import Circuit
 from netqmpi.sdk.environment import Environment
 from netqmpi.helpers import load_main
@@ -41,6 +42,12 @@ class NetQASMRunConfig(RunConfig):
             topology. If ``None``, the default topology is used.
         log_cfg: NetQASM log configuration controlling per-rank
             instruction logging.
+        epr_pool_depth: Pre-shared EPR pairs kept per directed link for
+            ``qsend``/``qrecv`` (see
+            :mod:`~netqmpi.runtime.adapters.netqasm.netqasm_pool`).
+            ``0`` requests every pair on demand.
+        epr_max_age: Seconds after which an unused pre-shared pair is
+            freed; ``None`` keeps pairs until used.
     """
 
     formalism: Formalism = field(default_factory=lambda: Formalism.KET)
@@ -51,6 +58,8 @@ class NetQASMRunConfig(RunConfig):
     log_cfg: Optional[Any] = None
     argv = None
     roles: str = "roles.yaml"
+    epr_pool_depth: int = 0
+    epr_max_age: Optional[float] = None
 
 # ---------------------------------------------------------------------------
 # Concrete Executor
@@ -64,6 +73,8 @@ class NetQASMExecutorAdapter(Executor):
     simulation execution for the NetQASM runtime.
     """
 
+    config_class = NetQASMRunConfig
+
     def __init__(self, size: int, config: NetQASMRunConfig = None) -> None:
         """
         Initialize the NetQASM executor adapter.
@@ -122,7 +133,7 @@ class NetQASMExecutorAdapter(Executor):
         """
         def wrapped_main():
             env = Environment(NetQASMCommunicator(rank, size, self._config), self)
-            main_func(env=env)
+            self._run_main(main_func, env)
             
         return wrapped_main
 
@@ -156,6 +167,7 @@ class NetQASMExecutorAdapter(Executor):
 
         argv: dict = load_yaml(self._config.argv) if self._config.argv is not None else {}
         main_func = load_main(file)
+        self.results = {}
 
         apps = []
         for rank in range(size):
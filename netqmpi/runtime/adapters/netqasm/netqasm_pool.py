@@ -0,0 +1,165 @@
+"""
+Pre-shared EPR pairs for the NetQASM adapter.
+
+Without a pool, every ``qsend``/``qrecv`` requests its EPR pairs when it
+runs and waits for them in the same round trip that returns the
+teleportation outcomes, so pair generation sits on the critical path.
+With a pool (``epr_pool_depth`` > 0), each rank keeps up to that many
+pre-shared halves per directed link, ``(sender, receiver)``:
+
+* the first pairs are requested before the circuit runs, and a transfer
+  asks for replacements as soon as it consumed its pairs.  Neither
+  flushes: the requests ride in the next subroutine the rank sends
+  anyway, so the pairs are generated while the rank runs its local
+  gates;
+* a transfer takes its pairs from the pool (hits) and only requests the
+  missing ones (misses), whose generation it then waits for (stall);
+* a pool never holds more pairs than the transfers of its link still
+  need, so both ends agree on every request and none is left unmatched.
+
+Both ends of a link replay the same requests and takes, so their pools
+hold the two halves of the same pairs.  The sender created them and
+alone knows their age: with ``epr_max_age`` set, it frees the pairs
+older than that before a transfer and tells the receiver how many, so
+that it frees its halves too.
+
+This module does not import NetQASM.
+"""
+from __future__ import annotations
+
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, List, Mapping, Optional, Tuple
+
+# A directed link, as ``(sender, receiver)``.
+PoolKey = Tuple[int, int]
+
+
+@dataclass
+class PoolStats:
+    """
+    Use of the EPR pools of one rank, as a sender or a receiver.
+
+    Attributes:
+        hits: Teleported qubits whose pair came from the pool.
+        misses: Teleported qubits whose pair was requested on demand.
+        expired: Pairs freed unused for exceeding ``epr_max_age``.
+        refills: Pairs requested to fill the pools.
+        stall_seconds: Wall-clock time spent waiting for on-demand pairs.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    expired: int = 0
+    refills: int = 0
+    stall_seconds: float = 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of teleported qubits served by the pool."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class EPRPool:
+    """
+    Pre-shared EPR halves of one rank over one circuit.
+
+    Args:
+        depth: Most pairs held per directed link.
+        max_age: Seconds after which the sender frees an unused pair;
+            ``None`` keeps pairs until used.
+        demand: Directed link -> qubits its transfers teleport over
+            the circuit.  Links without demand get no pool.
+        stats: Counters to update; shared across the circuits of a rank.
+    """
+
+    def __init__(
+        self,
+        depth: int,
+        max_age: Optional[float],
+        demand: Mapping[PoolKey, int],
+        stats: PoolStats,
+    ) -> None:
+        self.depth = depth
+        self.max_age = max_age
+        self.stats = stats
+        self._remaining: Dict[PoolKey, int] = {k: n for k, n in demand.items() if n}
+        self._halves: Dict[PoolKey, Deque[Tuple[Any, float]]] = {
+            key: deque() for key in self._remaining
+        }
+
+    def links(self) -> List[PoolKey]:
+        """
+        Return the links with a pool, in the order their pairs are requested.
+
+        Links are sorted by their lower and then higher rank, and the
+        lower rank sends first, so the requests of all ranks follow one
+        global order and cannot wait on each other in a cycle.
+        """
+        return sorted(self._remaining, key=lambda k: (min(k), max(k), k[0] > k[1]))
+
+    def wanted(self, key: PoolKey) -> int:
+        """Return how many pairs a link's pool should request now."""
+        if key not in self._remaining:
+            return 0
+        return max(0, min(self.depth, self._remaining[key]) - len(self._halves[key]))
+
+    def add(self, key: PoolKey, halves: List[Any]) -> None:
+        """Add newly requested halves to a link's pool."""
+        now = time.perf_counter()
+        self._halves[key].extend((half, now) for half in halves)
+        self.stats.refills += len(halves)
+
+    def expire(self, key: PoolKey) -> List[Any]:
+        """
+        Remove the pairs past ``max_age`` from a link's pool, on the sender.
+
+        Returns:
+            The halves removed, oldest first, to be freed.
+        """
+        halves = self._halves.get(key)
+        if self.max_age is None or not halves:
+            return []
+        limit = time.perf_counter() - self.max_age
+        expired = []
+        while halves and halves[0][1] < limit:
+            expired.append(halves.popleft()[0])
+        self.stats.expired += len(expired)
+        return expired
+
+    def drop(self, key: PoolKey, count: int) -> List[Any]:
+        """
+        Remove the pairs the sender expired from a link's pool, on the receiver.
+
+        Returns:
+            The halves removed, to be freed.
+        """
+        halves = self._halves[key]
+        self.stats.expired += count
+        return [halves.popleft()[0] for _ in range(count)]
+
+    def take(self, key: PoolKey, qubits: int) -> List[Any]:
+        """
+        Take the pairs of a transfer from a link's pool.
+
+        Args:
+            key: Link of the transfer.
+            qubits: Qubits teleported.
+
+        Returns:
+            Up to ``qubits`` halves, oldest first; the transfer requests
+            the others on demand.
+        """
+        halves = self._halves.get(key, deque())
+        taken = [halves.popleft()[0] for _ in range(min(qubits, len(halves)))]
+        if key in self._remaining:
+            self._remaining[key] -= qubits
+        self.stats.hits += len(taken)
+        self.stats.misses += qubits - len(taken)
+        return taken
+
+    def held(self) -> int:
+        """Return the most halves the pools hold at once."""
+        return sum(min(self.depth, n) for n in self._remaining.values())
@@ -0,0 +1,82 @@
+"""
+Non-blocking transfers for the NetQASM adapter.
+
+A blocking ``qsend`` flushes as soon as it has teleported, to send the
+corrections, and a blocking ``qrecv`` flushes to submit its EPR requests
+before it waits for them: each costs a round trip of its own.  A
+``qisend``/``qirecv`` queues the EPR requests and, on the sender, the
+teleportation itself without flushing, so they join the subroutine of
+the rank's next local gates and the pairs are generated while those
+run.  Only the wait flushes, and sends or receives the corrections.
+
+The corrections of a request travel under the header ``"Request k"``,
+``k`` counting the requests between the two ranks, so the receiver
+matches them however its waits interleave with other messages.
+
+Both ends still match EPR requests in program order: the transfers
+between two ranks, blocking or not, must start in the same order on
+both.
+
+This module does not import NetQASM.
+"""
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import Any, List, Tuple
+
+
+@dataclass
+class RequestStats:
+    """
+    Non-blocking transfers of one rank and how much they overlapped.
+
+    Attributes:
+        requests: Transfers completed.
+        overlapped_ops: Operations run between the start and the wait
+            of a transfer, summed over transfers.
+        inflight_seconds: Wall-clock time from the start to the wait of
+            each transfer, summed over transfers.
+        wait_seconds: Wall-clock time spent blocked in waits.
+    """
+
+    requests: int = 0
+    overlapped_ops: int = 0
+    inflight_seconds: float = 0.0
+    wait_seconds: float = 0.0
+
+    @property
+    def overlap(self) -> float:
+        """Fraction of the transfers' time not spent blocked in a wait."""
+        total = self.inflight_seconds + self.wait_seconds
+        return self.inflight_seconds / total if total else 0.0
+
+
+@dataclass
+class PendingRequest:
+    """
+    A started transfer, until its wait.
+
+    Attributes:
+        send: Whether this rank is the sender.
+        tag: Header of its corrections message.
+        peer: Rank on the other end.
+        qubits: Local qubits sent or receiving.
+        eprs: This rank's EPR halves.
+        missing: Halves requested on demand rather than taken from a pool.
+        outcomes: Teleportation outcomes, on the sender.
+        frames: ``(z, x)`` Pauli frame per half, on the receiver.
+        started_op: Operations run by the rank when the transfer started.
+        started: Wall-clock start time.
+    """
+
+    send: bool
+    tag: str
+    peer: int
+    qubits: List[int]
+    eprs: List[Any]
+    missing: int = 0
+    outcomes: List[Tuple[Any, Any]] = field(default_factory=list)
+    frames: List[Tuple[int, int]] = field(default_factory=list)
+    started_op: int = 0
+    started: float = field(default_factory=time.perf_counter)
@@ -0,0 +1,129 @@
+"""
+Entanglement-swapping routes for the NetQASM adapter.
+
+On a topology other than a full mesh (see
+:class:`~netqmpi.sdk.topology.Topology`), a rank only has EPR sockets to
+the ranks it is linked to.  A ``qsend`` between ranks that are not
+linked teleports over end-to-end EPR pairs built along
+:meth:`Topology.route <netqmpi.sdk.topology.Topology.route>` by
+entanglement swapping: every rank between the ends holds one pair with
+the previous rank and one with the next, Bell-measures its two halves
+and sends the outcomes to the receiver, which folds them into the
+teleportation corrections.
+
+The ranks between the ends do not take part in the transfer in their
+own programs, so every rank builds the pairs of all routed transfers,
+in one global order, before it runs its circuit.  A pair only waits for
+the ranks of its route, which follow the same order, so this prologue
+cannot deadlock; and the pairs do not depend on the data they later
+carry.  The receiver reads the swap outcomes at the end of its prologue,
+before any other message from those ranks.
+
+:func:`plan_routes` finds the routed transfers in the circuits of all
+ranks.  This module does not import NetQASM.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Sequence, Tuple
+
+from netqmpi.sdk.operations import Operation, QSend
+from netqmpi.sdk.topology import Topology
+
+
+@dataclass(frozen=True)
+class RoutedTransfer:
+    """
+    A ``qsend`` between ranks that are not linked.
+
+    Attributes:
+        src: Sending rank.
+        dest: Receiving rank.
+        index: Number of routed transfers from ``src`` to ``dest``
+            before this one; the receiver's ``index``-th routed
+            ``qrecv`` from ``src`` matches it.
+        qubits: Qubits sent, one end-to-end pair each.
+        path: Ranks of the route, from ``src`` to ``dest``.
+    """
+
+    src: int
+    dest: int
+    index: int
+    qubits: int
+    path: Tuple[int, ...]
+
+    @property
+    def key(self) -> Tuple[int, int, int]:
+        """``(src, dest, index)``, which both ends can compute."""
+        return (self.src, self.dest, self.index)
+
+
+@dataclass
+class RoutePlan:
+    """
+    The routed transfers of one circuit of every rank.
+
+    Attributes:
+        transfers: Routed transfers, in the order the pairs are built.
+    """
+
+    transfers: List[RoutedTransfer] = field(default_factory=list)
+
+    def steps(self, rank: int) -> List[Tuple[RoutedTransfer, int]]:
+        """
+        Return the part of a rank in building the pairs.
+
+        Args:
+            rank: Rank whose part is returned.
+
+        Returns:
+            ``(transfer, hop)`` for every transfer whose route contains
+            ``rank``, at position ``hop`` of its path, in build order.
+        """
+        return [(t, t.path.index(rank)) for t in self.transfers if rank in t.path]
+
+    def held(self, rank: int) -> int:
+        """Return how many end-to-end halves a rank holds after its prologue."""
+        return sum(t.qubits for t, hop in self.steps(rank) if hop in (0, len(t.path) - 1))
+
+    def peak(self, rank: int) -> int:
+        """Return the most qubits a rank holds at once during its prologue."""
+        held = peak = 0
+        for t, hop in self.steps(rank):
+            if hop in (0, len(t.path) - 1):
+                held += t.qubits
+                peak = max(peak, held)
+            else:
+                # One half with each neighbour on the route.
+                peak = max(peak, held + 2 * t.qubits)
+        return peak
+
+
+def plan_routes(leaves: Sequence[Sequence[Operation]], topology: Topology) -> RoutePlan:
+    """
+    Find the transfers that need a route.
+
+    Args:
+        leaves: Per rank, the leaf operations of its circuit, with
+            collectives lowered (see
+            :func:`~netqmpi.sdk.collectives.expand_collectives`).
+        topology: Links of the ranks.
+
+    Returns:
+        The plan, ordered by sending rank and then by program order.
+    """
+    plan = RoutePlan()
+    for src, ops in enumerate(leaves):
+        counts: Dict[int, int] = {}
+        for op in ops:
+            if not isinstance(op, QSend):
+                continue
+            dest = op.dest_rank
+            if dest == src or topology.adjacent(src, dest):
+                continue
+            index = counts.get(dest, 0)
+            counts[dest] = index + 1
+            plan.transfers.append(RoutedTransfer(
+                src, dest, index, len(op.qubits), tuple(topology.route(src, dest)),
+            ))
+    return plan
@@ -0,0 +1,93 @@
+"""
+Flush scheduling for the NetQASM adapter.
+
+Every flush of a NetQASM connection sends the instructions queued so far
+to the quantum node as one subroutine and waits for it to run: a full
+round trip.  A rank only needs one where it needs something back from
+the node:
+
+* before it blocks on a classical message from a rank that is waiting
+  for an EPR pair this rank requested (``qrecv``);
+* before it sends measurement outcomes to another rank (``qsend``);
+* at the end, to read the recorded measurement results.
+
+:class:`FlushScheduler` sits between the adapter and the connection.
+Measurement results are kept as futures and resolved at the next flush
+instead of flushing after every measurement, and a flush requested when
+nothing was queued since the last one is skipped, so everything between
+two real dependencies runs as a single subroutine.
+
+This module does not import NetQASM.
+"""
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, List, Tuple
+
+
+@dataclass
+class FlushStats:
+    """
+    Flushes of one rank.
+
+    Attributes:
+        flushes: Round trips to the quantum node.
+        skipped: Flushes requested with nothing queued, which were not
+            sent.
+        seconds: Wall-clock time spent in round trips.
+    """
+
+    flushes: int = 0
+    skipped: int = 0
+    seconds: float = 0.0
+
+
+class FlushScheduler:
+    """
+    Flush a connection only where a value from the node is needed.
+
+    Args:
+        flush: Performs one round trip to the node.
+        stats: Counters to update; shared across the circuits of a rank.
+    """
+
+    def __init__(self, flush: Callable[[], None], stats: FlushStats) -> None:
+        self._flush = flush
+        self.stats = stats
+        self._pending = False
+        self._deferred: List[Tuple[Any, Callable[[Any], None]]] = []
+
+    def queue(self) -> None:
+        """Note that instructions may have been queued since the last flush."""
+        self._pending = True
+
+    def defer(self, future: Any, resolve: Callable[[Any], None]) -> None:
+        """
+        Hand a future to ``resolve`` once its value is known.
+
+        Args:
+            future: Value produced by the node, e.g. a measurement result.
+            resolve: Called with ``future`` after the next flush.
+        """
+        self._deferred.append((future, resolve))
+
+    def flush(self) -> bool:
+        """
+        Flush if anything was queued since the last flush.
+
+        Returns:
+            Whether a round trip took place.
+        """
+        if not self._pending:
+            self.stats.skipped += 1
+            return False
+        start = time.perf_counter()
+        self._flush()
+        self.stats.seconds += time.perf_counter() - start
+        self.stats.flushes += 1
+        self._pending = False
+        deferred, self._deferred = self._deferred, []
+        for future, resolve in deferred:
+            resolve(future)
+        return True
@@ -0,0 +1,43 @@
+"""NumPy statevector runtime adapter for NetQMPI.
+
+This package exposes the runtime adapter classes used by NetQMPI to
+simulate distributed quantum programs as one global NumPy statevector,
+without any external simulator.
+
+Classes are loaded on first access, so importing the package is cheap.
+"""
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from netqmpi.runtime.adapters.numpy.numpy_circuit import NumpyCircuitAdapter
+    from netqmpi.runtime.adapters.numpy.numpy_executor import NumpyExecutorAdapter
+    from netqmpi.runtime.adapters.numpy.numpy_communicator import NumpyCommunicator
+    from netqmpi.runtime.adapters.numpy.numpy_run_config import NumpyStatevectorConfig
+
+# Public name -> submodule defining it.
+_LAZY = {
+    "NumpyCircuitAdapter": "netqmpi.runtime.adapters.numpy.numpy_circuit",
+    "NumpyExecutorAdapter": "netqmpi.runtime.adapters.numpy.numpy_executor",
+    "NumpyCommunicator": "netqmpi.runtime.adapters.numpy.numpy_communicator",
+    "NumpyStatevectorConfig": "netqmpi.runtime.adapters.numpy.numpy_run_config",
+}
+
+__all__ = [
+    "NumpyCircuitAdapter",
+    "NumpyExecutorAdapter",
+    "NumpyCommunicator",
+    "NumpyStatevectorConfig",
+]
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
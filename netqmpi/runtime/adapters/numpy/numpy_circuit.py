@@ -0,0 +1,20 @@
+"""
+Circuit adapter for the NumPy statevector backend.
+
+Translation into global-index instructions is shared with the other
+monolithic backends (see
+:class:`~netqmpi.runtime.adapters.monolithic.monolithic_circuit.MonolithicCircuitAdapter`);
+the executor compiles the instructions of all ranks into one
+statevector program.
+"""
+from __future__ import annotations
+
+from netqmpi.runtime.adapters.monolithic.monolithic_circuit import MonolithicCircuitAdapter
+
+
+class NumpyCircuitAdapter(MonolithicCircuitAdapter):
+    """
+    Circuit adapter that translates operations into global-index instructions.
+    """
+
+    _BACKEND = "NumPy"
@@ -0,0 +1,91 @@
+"""
+Executor adapter for the NumPy statevector backend.
+
+This module provides the :class:`NumpyExecutorAdapter` implementation of
+the :class:`~netqmpi.runtime.executor.Executor` interface.  It simulates
+the global program with a NumPy statevector and needs no external
+simulator, which makes it a fast backend for development and CI and a
+reference for comparing the other backends.
+"""
+from __future__ import annotations
+
+from typing import List
+
+from netqmpi.runtime import profiling
+from netqmpi.runtime.adapters.monolithic.monolithic_executor import MonolithicExecutor
+from netqmpi.runtime.adapters.monolithic.monolithic_layout import Instruction
+from netqmpi.runtime.adapters.numpy.numpy_circuit import NumpyCircuitAdapter
+from netqmpi.runtime.adapters.numpy.numpy_communicator import NumpyCommunicator
+from netqmpi.runtime.adapters.numpy.numpy_run_config import NumpyStatevectorConfig
+
+
+class NumpyExecutorAdapter(MonolithicExecutor):
+    """
+    Executor adapter that runs NetQMPI apps on a NumPy statevector.
+
+    Ranks run in threads and are translated against a global layout as
+    described in
+    :class:`~netqmpi.runtime.adapters.monolithic.monolithic_executor.MonolithicExecutor`.
+    The instructions of all ranks are then compiled and simulated by
+    :mod:`~netqmpi.runtime.adapters.numpy.numpy_statevector`.
+
+    Attributes:
+        program: The compiled
+            :class:`~netqmpi.runtime.adapters.numpy.numpy_statevector.StatevectorProgram`
+            of the last run, e.g. to inspect how many qubits it needed.
+    """
+
+    config_class = NumpyStatevectorConfig
+    circuit_class = NumpyCircuitAdapter
+    communicator_class = NumpyCommunicator
+
+    def __init__(self, size: int, config: NumpyStatevectorConfig = None) -> None:
+        """
+        Initialize the NumPy statevector executor adapter.
+
+        Args:
+            size: Number of parallel ranks to simulate.
+            config: NumPy statevector configuration.  Defaults to
+                :class:`NumpyStatevectorConfig` with its built-in defaults.
+        """
+        super().__init__(size, config)
+        # Re-narrow the type so the checker knows we have NumpyStatevectorConfig.
+        self._config: NumpyStatevectorConfig = self._config
+        self.program = None
+
+    def _run_simulation(self, programs: List[List[Instruction]]) -> dict:
+        """
+        Compile the global program and simulate it.
+
+        Args:
+            programs: Segments of the global program, in order, as
+                returned by :func:`~netqmpi.runtime.adapters.monolithic.monolithic_layout.splice`.
+
+        Returns:
+            The counts to broadcast to every rank.
+
+        Raises:
+            ValueError: If ``precision`` is unknown.
+            RuntimeError: If the program needs more than ``max_qubits``
+                qubits.
+        """
+        import numpy as np
+        from netqmpi.runtime.adapters.numpy.numpy_statevector import compile_program, simulate
+
+        dtypes = {"single": np.complex64, "double": np.complex128}
+        if self._config.precision not in dtypes:
+            raise ValueError(
+                f"Unknown precision {self._config.precision!r}; use 'single' or 'double'."
+            )
+
+        with profiling.phase("submit"):
+            self.program = compile_program(programs, self._layout, dtypes[self._config.precision])
+        if self.program.num_axes > self._config.max_qubits:
+            raise RuntimeError(
+                f"The program needs {self.program.num_axes} qubits "
+                f"(max_qubits={self._config.max_qubits})."
+            )
+
+        with profiling.phase("simulate"):
+            rng = np.random.default_rng(self._config.seed)
+            return simulate(self.program, self._layout, self._config.shots, rng)
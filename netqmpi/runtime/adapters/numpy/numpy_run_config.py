@@ -0,0 +1,37 @@
+"""
+Backend-specific configuration for NumPy statevector runs.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Optional
+
+from netqmpi.runtime.adapters.monolithic.monolithic_run_config import MonolithicRunConfig
+
+
+@dataclass
+class NumpyStatevectorConfig(MonolithicRunConfig):
+    """
+    Extension of
+    :class:`~netqmpi.runtime.adapters.monolithic.monolithic_run_config.MonolithicRunConfig`
+    with NumPy statevector-specific fields.
+
+    Field ``metadata["choices"]`` lists the accepted values of string
+    fields; the CLI turns it into ``choices`` for the matching option.
+
+    Attributes:
+        shots: Number of simulation shots.
+        seed: Optional RNG seed for reproducible simulations.
+        precision: ``"double"`` (default) simulates with ``complex128``
+            amplitudes, ``"single"`` with ``complex64``, which halves
+            memory and bandwidth at the cost of accuracy.
+        max_qubits: Refuse to simulate more qubits than this.  Only
+            qubits the program actually uses count, not the padding of
+            the global layout.  The state takes ``16 * 2**n`` bytes in
+            double precision, so the default of 26 allows up to 1 GiB.
+    """
+
+    shots: int = 1024
+    seed: Optional[int] = None
+    precision: str = field(default="double", metadata={"choices": ("single", "double")})
+    max_qubits: int = 26
@@ -0,0 +1,483 @@
+"""
+NumPy statevector simulation of a monolithic NetQMPI program.
+
+The global-index instructions of every rank are first compiled into a
+:class:`StatevectorProgram` on tensor *axes* rather than global qubits:
+
+* a qubit gets an axis on its first use, so slots of the layout that no
+  instruction touches are never allocated;
+* SWAP (and therefore every swap-mode qsend, qscatter and qgather) is a
+  relabelling of which axis holds which qubit and costs nothing at run
+  time;
+* runs of single-qubit gates on the same axis are fused into one matrix;
+* operations outside the backward light cone of the recorded
+  measurements are dropped, and the remaining axes are renumbered;
+* a measurement whose qubit is not acted on afterwards is *terminal* and
+  moved to the end of the program, as is done on hardware.
+
+The state is an ``(2,) * n`` tensor.  Gates are applied as contractions
+of the tensor reshaped around the target axis, controlled gates on the
+sub-tensor where every control axis is ``1``, and diagonal gates as an
+in-place scaling.  When every measurement is terminal, all shots are
+sampled from the single final state.  Otherwise the simulation branches
+at each mid-circuit measurement or reset and splits the remaining shots
+between the two outcomes binomially, so the state is copied once per
+distinct branch instead of being re-simulated once per shot.
+"""
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import chain
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from netqmpi.runtime.adapters.monolithic.monolithic_layout import GlobalLayout, Instruction
+
+# Compiled operation kinds.
+GATE, MEASURE, RESET, MOVE = 0, 1, 2, 3
+
+# Target of each controlled instruction.
+_CONTROLLED = {"cx": "x", "ccx": "x", "cz": "z", "crz": "rz"}
+
+# Above this many trailing amplitudes a gate is applied as a batched 2x2
+# product; below it, as one matrix product against kron(gate, identity).
+_KRON_LIMIT = 16
+
+
+@lru_cache(maxsize=None)
+def gate_matrix(name: str, params: tuple = ()) -> np.ndarray:
+    """
+    Return the 2x2 matrix of a single-qubit gate.
+
+    Conventions follow Qiskit, so results match the Aer backend.
+
+    Args:
+        name: Lower-case instruction name.
+        params: Instruction parameters (one angle for rotations).
+
+    Returns:
+        A read-only ``complex128`` matrix.
+
+    Raises:
+        ValueError: If the gate is unknown.
+    """
+    if name in ("rx", "ry", "rz"):
+        theta = params[0] / 2
+        c, s = math.cos(theta), math.sin(theta)
+        if name == "rx":
+            matrix = [[c, -1j * s], [-1j * s, c]]
+        elif name == "ry":
+            matrix = [[c, -s], [s, c]]
+        else:
+            matrix = [[complex(c, -s), 0], [0, complex(c, s)]]
+    else:
+        r = 1 / math.sqrt(2)
+        t = complex(r, r)
+        matrices = {
+            "h": [[r, r], [r, -r]],
+            "x": [[0, 1], [1, 0]],
+            "y": [[0, -1j], [1j, 0]],
+            "z": [[1, 0], [0, -1]],
+            "s": [[1, 0], [0, 1j]],
+            "sdg": [[1, 0], [0, -1j]],
+            "t": [[1, 0], [0, t]],
+            "tdg": [[1, 0], [0, t.conjugate()]],
+        }
+        if name not in matrices:
+            raise ValueError(f"Unknown gate {name!r}.")
+        matrix = matrices[name]
+    matrix = np.array(matrix, dtype=np.complex128)
+    matrix.flags.writeable = False
+    return matrix
+
+
+@dataclass
+class StatevectorProgram:
+    """
+    Global program compiled onto statevector axes.
+
+    Attributes:
+        num_axes: Number of qubits actually simulated.
+        ops: Compiled operations: ``(GATE, matrix, axis, controls,
+            diagonal)``, ``(MEASURE, axis, clbit)`` with ``clbit`` set to
+            ``None`` when a later measurement overwrites it,
+            ``(RESET, axis)`` and, only if requested from
+            :func:`compile_program`, ``(MOVE, axis, qubit)``.
+        final: ``(axis, clbit)`` of the terminal measurements.
+        num_clbits: Number of global clbits.
+        dtype: Complex dtype of the simulated state.
+        qubits: Global qubit each axis was allocated on, i.e. where its
+            qubit started before any SWAP moved it.
+    """
+
+    num_axes: int
+    ops: List[tuple]
+    final: List[Tuple[int, int]]
+    num_clbits: int
+    dtype: type = np.complex128
+    qubits: List[int] = field(default_factory=list)
+
+    @property
+    def is_terminal(self) -> bool:
+        """
+        Return whether all shots can be sampled from one final state.
+
+        Returns:
+            ``True`` if no measurement or reset happens mid-circuit.
+        """
+        return all(op[0] not in (MEASURE, RESET) for op in self.ops)
+
+
+def compile_program(
+    programs: Sequence[Sequence[Instruction]],
+    layout: GlobalLayout,
+    dtype: type = np.complex128,
+    moves: bool = False,
+) -> StatevectorProgram:
+    """
+    Compile the instructions of every rank into a statevector program.
+
+    Args:
+        programs: Segments of the global program, in order.
+        layout: Layout the instructions were translated against.
+        dtype: Complex dtype of the simulated state.
+        moves: Record every SWAP that relabels an axis as a
+            ``(MOVE, axis, qubit)`` operation, ``qubit`` being the global
+            qubit the axis now stands for.  The statevector ignores where
+            a qubit lives; simulators whose cost depends on it do not.
+
+    Returns:
+        The compiled program.
+
+    Raises:
+        ValueError: If an instruction is not supported.
+    """
+    axis_of: Dict[int, int] = {}
+    home: List[int] = []
+    pending: Dict[int, np.ndarray] = {}
+    ops: List[list] = []
+    num_axes = 0
+
+    def axis(qubit: int) -> int:
+        nonlocal num_axes
+        a = axis_of.get(qubit)
+        if a is None:
+            a = axis_of[qubit] = num_axes
+            num_axes += 1
+            home.append(qubit)
+        return a
+
+    def flush(a: int) -> None:
+        matrix = pending.pop(a, None)
+        if matrix is not None:
+            ops.append([GATE, matrix, a, ()])
+
+    for name, params, qubits, clbits in chain.from_iterable(programs):
+        if name == "barrier":
+            continue
+        if name == "swap":
+            p, q = qubits
+            a, b = axis_of.pop(p, None), axis_of.pop(q, None)
+            if a is not None:
+                axis_of[q] = a
+            if b is not None:
+                axis_of[p] = b
+            if moves:
+                ops.extend([MOVE, c, t] for c, t in ((a, q), (b, p)) if c is not None)
+        elif name == "measure":
+            # A qubit that was never allocated is still |0>.
+            a = axis_of.get(qubits[0])
+            if a is not None:
+                flush(a)
+            ops.append([MEASURE, a, clbits[0]])
+        elif name == "reset":
+            a = axis_of.get(qubits[0])
+            if a is not None:
+                flush(a)
+                ops.append([RESET, a])
+        elif name in _CONTROLLED:
+            axes = [axis(q) for q in qubits]
+            for a in axes:
+                flush(a)
+            ops.append([GATE, gate_matrix(_CONTROLLED[name], params), axes[-1], tuple(axes[:-1])])
+        else:
+            a = axis(qubits[0])
+            matrix = gate_matrix(name, params)
+            previous = pending.get(a)
+            pending[a] = matrix if previous is None else matrix @ previous
+    for a in list(pending):
+        flush(a)
+
+    return _prune(ops, layout.num_clbits, dtype, home)
+
+
+def _prune(ops: List[list], num_clbits: int, dtype: type, home: List[int]) -> StatevectorProgram:
+    """
+    Drop operations that cannot affect the counts and renumber axes.
+
+    Walks the program backwards.  An axis is *live* if a later kept
+    operation or recorded measurement involves it, and *touched* if a
+    later kept reset or non-diagonal gate targets it; operations on axes
+    that are not live are dropped, and measurements on untouched axes
+    are terminal.  Controls, diagonal gates and moves commute with a
+    measurement, so they do not keep it mid-circuit.
+
+    Args:
+        ops: Operations from :func:`compile_program`.
+        num_clbits: Number of global clbits.
+        dtype: Complex dtype of the simulated state.
+        home: Global qubit each axis of ``ops`` was allocated on.
+
+    Returns:
+        The compiled program.
+    """
+    live, touched, written = set(), set(), set()
+    kept: List[list] = []
+    final: List[Tuple[int, int]] = []
+    for op in reversed(ops):
+        if op[0] == MEASURE:
+            _, a, clbit = op
+            record = clbit not in written
+            written.add(clbit)
+            if a is None:
+                continue
+            if a not in touched:
+                if record:
+                    final.append((a, clbit))
+                    live.add(a)
+            else:
+                kept.append([MEASURE, a, clbit if record else None])
+            continue
+        if op[0] == RESET:
+            if op[1] in live:
+                touched.add(op[1])
+                kept.append(op)
+            continue
+        if op[0] == MOVE:
+            if op[1] in live:
+                kept.append(op)
+            continue
+        _, matrix, a, controls = op
+        if live.isdisjoint((a,) + controls):
+            continue
+        live.add(a)
+        live.update(controls)
+        if matrix[0, 1] != 0 or matrix[1, 0] != 0:
+            touched.add(a)
+        kept.append(op)
+    kept.reverse()
+    final.reverse()
+
+    # Renumber the surviving axes in order of first use.
+    renumber: Dict[int, int] = {}
+    number = lambda a: renumber.setdefault(a, len(renumber))
+    compiled = []
+    for op in kept:
+        if op[0] == GATE:
+            _, matrix, a, controls = op
+            diagonal = matrix[0, 1] == 0 and matrix[1, 0] == 0
+            compiled.append((
+                GATE, matrix.astype(dtype), number(a), tuple(number(c) for c in controls), diagonal,
+            ))
+        elif op[0] == MEASURE:
+            compiled.append((MEASURE, number(op[1]), op[2]))
+        elif op[0] == MOVE:
+            compiled.append((MOVE, number(op[1]), op[2]))
+        else:
+            compiled.append((RESET, number(op[1])))
+    final = [(number(a), clbit) for a, clbit in final]
+    qubits = [home[a] for a in sorted(renumber, key=renumber.get)]
+    return StatevectorProgram(len(renumber), compiled, final, num_clbits, dtype, qubits)
+
+
+# ----------------------------------------------------------------------
+# Simulation
+# ----------------------------------------------------------------------
+
+def apply_gate(
+    state: np.ndarray,
+    matrix: np.ndarray,
+    axis: int,
+    controls: Tuple[int, ...] = (),
+    diagonal: bool = False,
+) -> np.ndarray:
+    """
+    Apply a (controlled) single-qubit gate to a state tensor.
+
+    Args:
+        state: C-contiguous ``(2,) * n`` state tensor.
+        matrix: 2x2 gate matrix of the state's dtype.
+        axis: Target axis.
+        controls: Control axes.
+        diagonal: Whether ``matrix`` is diagonal.
+
+    Returns:
+        The new state tensor, which may be ``state`` updated in place.
+    """
+    if controls or diagonal:
+        index = [slice(None)] * state.ndim
+        for c in controls:
+            index[c] = 1
+        view = state[tuple(index)]
+        target = axis - sum(c < axis for c in controls)
+        if diagonal:
+            for bit in (0, 1):
+                if matrix[bit, bit] != 1:
+                    sub = [slice(None)] * view.ndim
+                    sub[target] = bit
+                    view[tuple(sub)] *= matrix[bit, bit]
+        else:
+            result = np.tensordot(matrix, view, axes=(1, target))
+            view[...] = np.moveaxis(result, 0, target)
+        return state
+
+    left = 1 << axis
+    right = state.size >> (axis + 1)
+    if right <= _KRON_LIMIT:
+        kron = np.kron(matrix, np.eye(right, dtype=state.dtype)).T
+        return (state.reshape(left, 2 * right) @ kron).reshape(state.shape)
+    return np.matmul(matrix, state.reshape(left, 2, right)).reshape(state.shape)
+
+
+def _probability_of_one(state: np.ndarray, axis: int) -> float:
+    """
+    Return the probability of measuring ``1`` on an axis.
+
+    Args:
+        state: Normalised state tensor.
+        axis: Measured axis.
+
+    Returns:
+        The probability, clipped to ``[0, 1]``.
+    """
+    ones = state.reshape(1 << axis, 2, -1)[:, 1, :]
+    p = float(np.sum(ones.real ** 2 + ones.imag ** 2))
+    return min(max(p, 0.0), 1.0)
+
+
+def _collapse(state: np.ndarray, axis: int, outcome: int, probability: float, reset: bool) -> None:
+    """
+    Project a state tensor in place onto a measurement outcome.
+
+    Args:
+        state: State tensor.
+        axis: Measured axis.
+        outcome: Measured bit.
+        probability: Probability of ``outcome``.
+        reset: Whether to return the qubit to ``|0>`` afterwards.
+    """
+    view = state.reshape(1 << axis, 2, -1)
+    view[:, 1 - outcome, :] = 0
+    view[:, outcome, :] *= 1 / math.sqrt(probability)
+    if reset and outcome == 1:
+        view[:, 0, :] = view[:, 1, :]
+        view[:, 1, :] = 0
+
+
+def _sample(
+    state: np.ndarray,
+    axes: Sequence[int],
+    shots: int,
+    rng: np.random.Generator,
+) -> Dict[int, int]:
+    """
+    Sample the joint outcome of some axes of the final state.
+
+    Args:
+        state: Final state tensor.
+        axes: Measured axes, sorted.
+        shots: Number of samples.
+        rng: Random generator.
+
+    Returns:
+        ``outcome -> count``, where bit ``len(axes) - 1 - i`` of an
+        outcome is the value of ``axes[i]``.
+    """
+    probabilities = state.real ** 2 + state.imag ** 2
+    others = tuple(a for a in range(state.ndim) if a not in axes)
+    if others:
+        probabilities = probabilities.sum(axis=others)
+    probabilities = probabilities.reshape(-1).astype(np.float64)
+    probabilities /= probabilities.sum()
+
+    if probabilities.size <= shots:
+        counts = rng.multinomial(shots, probabilities)
+        outcomes = np.flatnonzero(counts)
+        return dict(zip(outcomes.tolist(), counts[outcomes].tolist()))
+    cdf = np.cumsum(probabilities)
+    samples = np.searchsorted(cdf, rng.random(shots) * cdf[-1], side="right")
+    outcomes, counts = np.unique(np.minimum(samples, cdf.size - 1), return_counts=True)
+    return dict(zip(outcomes.tolist(), counts.tolist()))
+
+
+def simulate(
+    program: StatevectorProgram,
+    layout: GlobalLayout,
+    shots: int,
+    rng: np.random.Generator,
+) -> Dict[str, int]:
+    """
+    Run a compiled program and return its counts.
+
+    Args:
+        program: Compiled program.
+        layout: Global layout, used to format the counts keys.
+        shots: Number of shots.
+        rng: Random generator.
+
+    Returns:
+        The counts, keyed as by
+        :meth:`~netqmpi.runtime.adapters.monolithic.monolithic_layout.GlobalLayout.counts_key`.
+    """
+    counts: Dict[str, int] = {}
+    if shots <= 0:
+        return counts
+
+    final_axes = sorted({a for a, _ in program.final})
+    position = {a: len(final_axes) - 1 - i for i, a in enumerate(final_axes)}
+    ops = program.ops
+
+    state = np.zeros((2,) * program.num_axes, dtype=program.dtype)
+    state[(0,) * program.num_axes] = 1
+    # (state, next op, shots, clbits recorded mid-circuit)
+    branches: List[Tuple[np.ndarray, int, int, Dict[int, int]]] = [(state, 0, shots, {})]
+    while branches:
+        state, pc, branch_shots, recorded = branches.pop()
+        while pc < len(ops):
+            op = ops[pc]
+            pc += 1
+            if op[0] == GATE:
+                state = apply_gate(state, op[1], op[2], op[3], op[4])
+                continue
+            a = op[1]
+            p1 = _probability_of_one(state, a)
+            ones = int(rng.binomial(branch_shots, p1))
+            if 0 < ones < branch_shots:
+                branch = state.copy()
+                _collapse(branch, a, 1, p1, op[0] == RESET)
+                bits = dict(recorded)
+                if op[0] == MEASURE and op[2] is not None:
+                    bits[op[2]] = 1
+                branches.append((branch, pc, ones, bits))
+                branch_shots -= ones
+                outcome = 0
+            else:
+                outcome = 1 if ones else 0
+            _collapse(state, a, outcome, p1 if outcome else 1 - p1, op[0] == RESET)
+            if op[0] == MEASURE and op[2] is not None:
+                recorded = dict(recorded)
+                recorded[op[2]] = outcome
+
+        bits = [0] * program.num_clbits
+        for clbit, value in recorded.items():
+            bits[clbit] = value
+        sampled = _sample(state, final_axes, branch_shots, rng) if final_axes else {0: branch_shots}
+        for outcome, count in sampled.items():
+            for a, clbit in program.final:
+                bits[clbit] = (outcome >> position[a]) & 1
+            key = layout.counts_key(bits)
+            counts[key] = counts.get(key, 0) + count
+    return counts
@@ -0,0 +1,44 @@
+"""Sharded statevector runtime adapter for NetQMPI.
+
+This package exposes the runtime adapter classes used by NetQMPI to
+simulate distributed quantum programs as one statevector split across
+local worker processes over shared memory, so programs of 30 or more
+qubits use every core and the memory of the whole machine.
+
+Classes are loaded on first access, so importing the package is cheap.
+"""
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from netqmpi.runtime.adapters.sharded.sharded_circuit import ShardedCircuitAdapter
+    from netqmpi.runtime.adapters.sharded.sharded_executor import ShardedExecutorAdapter
+    from netqmpi.runtime.adapters.sharded.sharded_communicator import ShardedCommunicator
+    from netqmpi.runtime.adapters.sharded.sharded_run_config import ShardedStatevectorConfig
+
+# Public name -> submodule defining it.
+_LAZY = {
+    "ShardedCircuitAdapter": "netqmpi.runtime.adapters.sharded.sharded_circuit",
+    "ShardedExecutorAdapter": "netqmpi.runtime.adapters.sharded.sharded_executor",
+    "ShardedCommunicator": "netqmpi.runtime.adapters.sharded.sharded_communicator",
+    "ShardedStatevectorConfig": "netqmpi.runtime.adapters.sharded.sharded_run_config",
+}
+
+__all__ = [
+    "ShardedCircuitAdapter",
+    "ShardedExecutorAdapter",
+    "ShardedCommunicator",
+    "ShardedStatevectorConfig",
+]
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
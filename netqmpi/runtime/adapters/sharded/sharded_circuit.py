@@ -0,0 +1,20 @@
+"""
+Circuit adapter for the sharded statevector backend.
+
+Translation into global-index instructions is shared with the other
+monolithic backends (see
+:class:`~netqmpi.runtime.adapters.monolithic.monolithic_circuit.MonolithicCircuitAdapter`);
+the executor compiles the instructions of all ranks into one program
+and runs it on the worker processes.
+"""
+from __future__ import annotations
+
+from netqmpi.runtime.adapters.monolithic.monolithic_circuit import MonolithicCircuitAdapter
+
+
+class ShardedCircuitAdapter(MonolithicCircuitAdapter):
+    """
+    Circuit adapter that translates operations into global-index instructions.
+    """
+
+    _BACKEND = "sharded"
@@ -0,0 +1,127 @@
+"""
+Executor adapter for the sharded statevector backend.
+
+This module provides the :class:`ShardedExecutorAdapter` implementation
+of the :class:`~netqmpi.runtime.executor.Executor` interface.  It
+simulates the global program with a statevector split across local
+worker processes over shared memory, so every core works on the gates
+and programs larger than one process handles comfortably still run.
+"""
+from __future__ import annotations
+
+import multiprocessing
+import os
+from typing import List
+
+from netqmpi.runtime import profiling
+from netqmpi.runtime.adapters.monolithic.monolithic_executor import MonolithicExecutor
+from netqmpi.runtime.adapters.monolithic.monolithic_layout import Instruction
+from netqmpi.runtime.adapters.sharded.sharded_circuit import ShardedCircuitAdapter
+from netqmpi.runtime.adapters.sharded.sharded_communicator import ShardedCommunicator
+from netqmpi.runtime.adapters.sharded.sharded_run_config import ShardedStatevectorConfig
+
+
+class ShardedExecutorAdapter(MonolithicExecutor):
+    """
+    Executor adapter that runs NetQMPI apps on a sharded statevector.
+
+    Ranks run in threads and are translated against a global layout as
+    described in
+    :class:`~netqmpi.runtime.adapters.monolithic.monolithic_executor.MonolithicExecutor`.
+    The instructions of all ranks are then compiled as for the ``numpy``
+    backend and simulated by
+    :mod:`~netqmpi.runtime.adapters.sharded.sharded_statevector`.
+
+    Attributes:
+        program: The compiled
+            :class:`~netqmpi.runtime.adapters.numpy.numpy_statevector.StatevectorProgram`
+            of the last run.
+        shards: Number of shards the state of the last run was split
+            into; ``1`` when it was simulated in the current process.
+    """
+
+    config_class = ShardedStatevectorConfig
+    circuit_class = ShardedCircuitAdapter
+    communicator_class = ShardedCommunicator
+
+    def __init__(self, size: int, config: ShardedStatevectorConfig = None) -> None:
+        """
+        Initialize the sharded statevector executor adapter.
+
+        Args:
+            size: Number of parallel ranks to simulate.
+            config: Sharded statevector configuration.  Defaults to
+                :class:`ShardedStatevectorConfig` with its built-in defaults.
+        """
+        super().__init__(size, config)
+        # Re-narrow the type so the checker knows we have ShardedStatevectorConfig.
+        self._config: ShardedStatevectorConfig = self._config
+        self.program = None
+        self.shards = None
+
+    def _global_axes(self, num_axes: int) -> int:
+        """Return how many axes select the shard for a state of ``num_axes``."""
+        workers = self._config.workers
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers < 1:
+            raise ValueError(f"workers must be positive, got {workers}.")
+        # Every shard keeps at least one local axis.
+        return min(workers.bit_length() - 1, max(num_axes - 1, 0))
+
+    def _run_simulation(self, programs: List[List[Instruction]]) -> dict:
+        """
+        Compile the global program and simulate it.
+
+        Args:
+            programs: Segments of the global program, in order, as
+                returned by :func:`~netqmpi.runtime.adapters.monolithic.monolithic_layout.splice`.
+
+        Returns:
+            The counts to broadcast to every rank.
+
+        Raises:
+            ValueError: If ``precision`` is unknown or ``workers`` is not
+                positive.
+            RuntimeError: If the program needs more than ``max_qubits``
+                qubits, or a worker process failed.
+        """
+        import numpy as np
+        from netqmpi.runtime.adapters.numpy import numpy_statevector
+        from netqmpi.runtime.adapters.sharded import sharded_statevector
+
+        dtypes = {"single": np.complex64, "double": np.complex128}
+        if self._config.precision not in dtypes:
+            raise ValueError(
+                f"Unknown precision {self._config.precision!r}; use 'single' or 'double'."
+            )
+
+        with profiling.phase("submit"):
+            self.program = numpy_statevector.compile_program(
+                programs, self._layout, dtypes[self._config.precision]
+            )
+        num_axes = self.program.num_axes
+        if num_axes > self._config.max_qubits:
+            raise RuntimeError(
+                f"The program needs {num_axes} qubits "
+                f"(max_qubits={self._config.max_qubits})."
+            )
+
+        global_axes = self._global_axes(num_axes)
+        rng = np.random.default_rng(self._config.seed)
+        if num_axes < self._config.min_sharded_qubits or global_axes == 0:
+            self.shards = 1
+            with profiling.phase("simulate"):
+                return numpy_statevector.simulate(self.program, self._layout, self._config.shots, rng)
+
+        self.shards = 1 << global_axes
+        start_method = self._config.start_method
+        if start_method is None and "forkserver" in multiprocessing.get_all_start_methods():
+            start_method = "forkserver"
+        with profiling.phase("simulate"):
+            with sharded_statevector.ShardPool(
+                num_axes, global_axes, self.program.dtype, start_method
+            ) as pool:
+                return sharded_statevector.simulate(
+                    self.program, self._layout, self._config.shots, rng, pool
+                )
@@ -0,0 +1,50 @@
+"""
+Backend-specific configuration for sharded statevector runs.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Optional
+
+from netqmpi.runtime.adapters.monolithic.monolithic_run_config import MonolithicRunConfig
+
+
+@dataclass
+class ShardedStatevectorConfig(MonolithicRunConfig):
+    """
+    Extension of
+    :class:`~netqmpi.runtime.adapters.monolithic.monolithic_run_config.MonolithicRunConfig`
+    with sharded-statevector-specific fields.
+
+    Field ``metadata["choices"]`` lists the accepted values of string
+    fields; the CLI turns it into ``choices`` for the matching option.
+
+    Attributes:
+        shots: Number of simulation shots.
+        seed: Optional RNG seed for reproducible simulations.
+        precision: ``"double"`` (default) simulates with ``complex128``
+            amplitudes, ``"single"`` with ``complex64``, which halves
+            memory and bandwidth at the cost of accuracy.
+        max_qubits: Refuse to simulate more qubits than this.  Only
+            qubits the program actually uses count.  The state takes
+            ``16 * 2**n`` bytes of shared memory in double precision, so
+            the default of 32 allows up to 64 GiB.
+        workers: Worker processes holding a shard each.  Rounded down to
+            a power of two; ``None`` uses one per CPU.
+        min_sharded_qubits: Programs with fewer qubits are simulated in
+            the current process, as by the ``numpy`` backend, because
+            starting the workers would cost more than it saves.
+        start_method: :mod:`multiprocessing` start method used for the
+            workers.  ``None`` uses ``"forkserver"`` where available and
+            the platform default elsewhere.
+    """
+
+    shots: int = 1024
+    seed: Optional[int] = None
+    precision: str = field(default="double", metadata={"choices": ("single", "double")})
+    max_qubits: int = 32
+    workers: Optional[int] = None
+    min_sharded_qubits: int = 20
+    start_method: Optional[str] = field(
+        default=None, metadata={"choices": ("fork", "spawn", "forkserver")}
+    )
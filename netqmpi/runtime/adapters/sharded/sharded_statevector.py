@@ -0,0 +1,445 @@
+"""
+Statevector sharded across local worker processes.
+
+The global program is compiled as for the NumPy statevector backend
+(see :func:`~netqmpi.runtime.adapters.numpy.numpy_statevector.compile_program`).
+Its ``2**n`` amplitudes live in one
+:class:`multiprocessing.shared_memory.SharedMemory` block, split into
+``2**k`` contiguous shards, one per worker process.  Axis ``0`` is the
+most significant bit of an amplitude's index, so axes ``0..k-1`` are
+*global* (they select the shard, bit ``k - 1 - axis`` of the worker
+index) and the others are *local* to every shard.
+
+* A gate on a local axis runs on every shard in parallel, with no
+  communication.
+* A diagonal gate on a global axis only scales whole shards.
+* Any other gate on a global axis pairs the shards that differ in that
+  axis.  Both halves of a pair are in shared memory, so the pair updates
+  them in place, each worker taking half of the amplitudes of both
+  shards; workers meet at a barrier before and after the exchange.
+* Controls on a global axis switch off the shards where they are ``0``.
+
+The coordinator (the simulating rank thread) drives the workers over
+pipes: runs of gates are sent as one batch, measurements and resets
+reduce per-shard probabilities on the coordinator, and terminal
+measurements are sampled by splitting the shots between the shards by
+their weight and letting every shard sample its share.
+
+A mid-circuit measurement or reset whose outcome varies between shots
+splits the shots between its two outcomes as in the statevector
+backend.  A copy of a state this size may not fit in memory, so the
+state is not copied: every further branch is recomputed from ``|0>``
+with the outcomes of its earlier measurements forced.
+"""
+from __future__ import annotations
+
+import multiprocessing
+import traceback
+from multiprocessing import shared_memory
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from netqmpi.runtime import tracing
+from netqmpi.runtime.adapters.monolithic.monolithic_layout import GlobalLayout
+from netqmpi.runtime.adapters.numpy.numpy_statevector import (
+    GATE, MEASURE, StatevectorProgram, _sample, apply_gate,
+)
+
+if TYPE_CHECKING:
+    from multiprocessing.connection import Connection
+    from multiprocessing.synchronize import Barrier
+
+
+# ----------------------------------------------------------------------
+# Worker side
+# ----------------------------------------------------------------------
+
+class _Shard:
+    """
+    One worker's view of the sharded state.
+
+    Args:
+        index: Shard (worker) index.
+        global_axes: Number ``k`` of global axes.
+        num_axes: Number ``n`` of axes of the whole state.
+        state: The whole state, flat, in shared memory.
+        barrier: Barrier shared by all workers.
+    """
+
+    def __init__(self, index: int, global_axes: int, num_axes: int, state: np.ndarray, barrier: "Barrier") -> None:
+        self.index = index
+        self.k = global_axes
+        self.local_axes = num_axes - global_axes
+        self.length = state.size >> global_axes
+        self.state = state
+        self.own = state[index * self.length:(index + 1) * self.length]
+        self.barrier = barrier
+
+    def bit(self, axis: int) -> int:
+        """Return the value of global ``axis`` on this shard."""
+        return (self.index >> (self.k - 1 - axis)) & 1
+
+    def partner(self, axis: int) -> np.ndarray:
+        """Return the shard that differs from this one in global ``axis``."""
+        index = self.index ^ (1 << (self.k - 1 - axis))
+        return self.state[index * self.length:(index + 1) * self.length]
+
+    def tensor(self, flat: np.ndarray) -> np.ndarray:
+        """Return a flat shard as a ``(2,) * local_axes`` tensor."""
+        return flat.reshape((2,) * self.local_axes)
+
+    def apply(self, matrix: np.ndarray, axis: int, controls: Tuple[int, ...], diagonal: bool) -> None:
+        """Apply one compiled gate to this shard."""
+        k = self.k
+        active = all(self.bit(c) for c in controls if c < k)
+        local_controls = tuple(c - k for c in controls if c >= k)
+        if axis >= k:
+            if active:
+                tensor = self.tensor(self.own)
+                result = apply_gate(tensor, matrix, axis - k, local_controls, diagonal)
+                if result is not tensor:
+                    tensor[...] = result
+            return
+        if diagonal:
+            factor = matrix[self.bit(axis), self.bit(axis)]
+            if active and factor != 1:
+                index = [slice(None)] * self.local_axes
+                for c in local_controls:
+                    index[c] = 1
+                self.tensor(self.own)[tuple(index)] *= factor
+            return
+
+        # Pairwise exchange: every worker of a pair updates one half of
+        # the amplitudes of both shards.
+        self.barrier.wait()
+        if active:
+            bit = self.bit(axis)
+            zero, one = (self.own, self.partner(axis)) if bit == 0 else (self.partner(axis), self.own)
+            half = self.length >> 1
+            start = half if bit else 0
+            shape = (1,) + (2,) * (self.local_axes - 1)
+            zero = zero[start:start + half].reshape(shape)
+            one = one[start:start + half].reshape(shape)
+            # Local axis 0 is fixed to ``bit`` within each half.
+            if 0 not in local_controls or bit:
+                index = [slice(None)] * len(shape)
+                for c in local_controls:
+                    if c:
+                        index[c] = 1
+                x0, x1 = zero[tuple(index)], one[tuple(index)]
+                new0 = matrix[0, 0] * x0 + matrix[0, 1] * x1
+                x1[...] = matrix[1, 0] * x0 + matrix[1, 1] * x1
+                x0[...] = new0
+        self.barrier.wait()
+
+    def probability_of_one(self, axis: int) -> float:
+        """Return this shard's weight with ``axis`` equal to ``1``."""
+        if axis < self.k:
+            values = self.own if self.bit(axis) else self.own[:0]
+        else:
+            values = np.take(self.tensor(self.own), 1, axis=axis - self.k)
+        return float(np.vdot(values, values).real)
+
+    def collapse(self, axis: int, outcome: int, probability: float, reset: bool) -> None:
+        """Project ``axis`` onto ``outcome``, renormalise, and flip it to ``0`` on reset."""
+        scale = 1 / np.sqrt(probability)
+        if axis >= self.k:
+            tensor = self.tensor(self.own)
+            # Slices rather than integers keep views even with one local axis.
+            index = [slice(None)] * self.local_axes
+            index[axis - self.k] = slice(outcome, outcome + 1)
+            kept = tensor[tuple(index)]
+            kept *= scale
+            index[axis - self.k] = slice(1 - outcome, 2 - outcome)
+            tensor[tuple(index)] = 0
+            if reset and outcome:
+                index[axis - self.k] = slice(0, 1)
+                tensor[tuple(index)] = kept
+                kept[...] = 0
+            return
+        bit = self.bit(axis)
+        if bit == outcome:
+            self.own *= scale
+        if reset and outcome:
+            # The |1> shards move into their |0> partners.
+            self.barrier.wait()
+            if bit == 0:
+                self.own[...] = self.partner(axis)
+            self.barrier.wait()
+            if bit == 1:
+                self.own[...] = 0
+        elif bit != outcome:
+            self.own[...] = 0
+
+    def norm(self) -> float:
+        """Return this shard's weight."""
+        return float(np.vdot(self.own, self.own).real)
+
+    def sample(self, axes: List[int], shots: int, seed: int) -> Dict[int, int]:
+        """
+        Sample ``shots`` outcomes of ``axes`` (sorted) within this shard.
+
+        Bit ``len(axes) - 1 - i`` of an outcome is the value of ``axes[i]``.
+        """
+        if shots <= 0:
+            return {}
+        global_axes = [a for a in axes if a < self.k]
+        local_axes = [a - self.k for a in axes if a >= self.k]
+        prefix = 0
+        for a in global_axes:
+            prefix = (prefix << 1) | self.bit(a)
+        prefix <<= len(local_axes)
+        if not local_axes:
+            return {prefix: shots}
+        sampled = _sample(self.tensor(self.own), local_axes, shots, np.random.default_rng(seed))
+        return {prefix | outcome: count for outcome, count in sampled.items()}
+
+    def clear(self) -> None:
+        """Set the state to ``|0...0>`` (each shard clears its own part)."""
+        self.own[...] = 0
+        if self.index == 0:
+            self.own[0] = 1
+
+
+def serve_shard(
+    index: int,
+    global_axes: int,
+    num_axes: int,
+    name: str,
+    dtype: str,
+    barrier: "Barrier",
+    conn: "Connection",
+) -> None:
+    """
+    Worker entry point: own one shard and answer the coordinator.
+
+    Module-level so it can be used with the ``spawn`` start method.
+    Every request is a ``(kind, *args)`` tuple; every answer is
+    ``("ok", value)`` or ``("error", traceback)``.
+
+    Args:
+        index: Shard owned by this worker.
+        global_axes: Number of global axes.
+        num_axes: Number of axes of the whole state.
+        name: Name of the shared memory block holding the state.
+        dtype: Complex dtype of the state.
+        barrier: Barrier shared by all workers.
+        conn: Worker end of the pipe to the coordinator.
+    """
+    memory = shared_memory.SharedMemory(name=name)
+    try:
+        state = np.ndarray((1 << num_axes,), dtype=dtype, buffer=memory.buf)
+        shard = _Shard(index, global_axes, num_axes, state, barrier)
+        while True:
+            request = conn.recv()
+            kind = request[0]
+            if kind == "close":
+                break
+            try:
+                if kind == "run":
+                    for _, matrix, axis, controls, diagonal in request[1]:
+                        shard.apply(matrix, axis, controls, diagonal)
+                    value = None
+                else:
+                    value = getattr(shard, kind)(*request[1:])
+            except BaseException:
+                barrier.abort()
+                conn.send(("error", traceback.format_exc()))
+            else:
+                conn.send(("ok", value))
+        del state, shard
+    finally:
+        memory.close()
+        conn.close()
+
+
+# ----------------------------------------------------------------------
+# Coordinator side
+# ----------------------------------------------------------------------
+
+class ShardPool:
+    """
+    Worker processes sharing one sharded state.
+
+    Use as a context manager; leaving it stops the workers and frees the
+    shared memory.
+
+    Args:
+        num_axes: Number of axes of the state.
+        global_axes: Number of global axes; ``2**global_axes`` workers
+            are started.
+        dtype: Complex dtype of the state.
+        start_method: :mod:`multiprocessing` start method, or ``None``
+            for the platform default.
+    """
+
+    def __init__(self, num_axes: int, global_axes: int, dtype: type, start_method: Optional[str]) -> None:
+        self.num_axes = num_axes
+        self.global_axes = global_axes
+        self._dtype = np.dtype(dtype)
+        self._context = multiprocessing.get_context(start_method)
+        self._memory: Optional[shared_memory.SharedMemory] = None
+        self._conns: List["Connection"] = []
+        self._procs: List[Any] = []
+        self._barrier: Optional["Barrier"] = None
+
+    def __enter__(self) -> "ShardPool":
+        self._memory = shared_memory.SharedMemory(
+            create=True, size=(1 << self.num_axes) * self._dtype.itemsize
+        )
+        size = 1 << self.global_axes
+        try:
+            # Kept alive until the workers exit: its semaphores are
+            # rebuilt by name when a spawned worker unpickles it.
+            self._barrier = self._context.Barrier(size)
+            for index in range(size):
+                parent_conn, child_conn = self._context.Pipe()
+                self._conns.append(parent_conn)
+                proc = self._context.Process(
+                    target=serve_shard,
+                    args=(index, self.global_axes, self.num_axes, self._memory.name,
+                          self._dtype.str, self._barrier, child_conn),
+                    name=f"shard_{index}",
+                    daemon=True,
+                )
+                proc.start()
+                child_conn.close()
+                self._procs.append(proc)
+        except BaseException:
+            self.__exit__(None, None, None)
+            raise
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        for conn in self._conns:
+            try:
+                conn.send(("close",))
+            except OSError:
+                pass
+        for proc in self._procs:
+            proc.join(timeout=5)
+            if proc.is_alive():
+                proc.terminate()
+        for conn in self._conns:
+            conn.close()
+        if self._memory is not None:
+            self._memory.close()
+            self._memory.unlink()
+
+    def request(self, *requests: tuple) -> List[Any]:
+        """
+        Send one request to every worker and collect the answers.
+
+        Args:
+            *requests: Either one request for all workers, or one per
+                worker in shard order.
+
+        Returns:
+            The answers in shard order.
+
+        Raises:
+            RuntimeError: If a worker failed.
+        """
+        if len(requests) == 1:
+            requests = requests * len(self._conns)
+        for conn, request in zip(self._conns, requests):
+            conn.send(request)
+        answers = []
+        with tracing.span(requests[0][0], "sharded", shards=len(self._conns)):
+            for conn in self._conns:
+                answers.append(conn.recv())
+        for index, (status, body) in enumerate(answers):
+            if status == "error":
+                raise RuntimeError(f"shard_{index} failed in its worker process:\n{body}")
+        return [body for _, body in answers]
+
+
+def simulate(
+    program: StatevectorProgram,
+    layout: GlobalLayout,
+    shots: int,
+    rng: np.random.Generator,
+    pool: ShardPool,
+) -> Dict[str, int]:
+    """
+    Run a compiled program on a sharded state and return its counts.
+
+    Args:
+        program: Compiled program.
+        layout: Global layout, used to format the counts keys.
+        shots: Number of shots.
+        rng: Random generator.
+        pool: Running workers holding a state of ``program.num_axes`` axes.
+
+    Returns:
+        The counts, keyed as by
+        :meth:`~netqmpi.runtime.adapters.monolithic.monolithic_layout.GlobalLayout.counts_key`.
+    """
+    counts: Dict[str, int] = {}
+    if shots <= 0:
+        return counts
+
+    final_axes = sorted({a for a, _ in program.final})
+    position = {a: len(final_axes) - 1 - i for i, a in enumerate(final_axes)}
+    ops = program.ops
+
+    # (forced outcomes of the mid-circuit measurements, shots, clbits recorded mid-circuit)
+    branches: List[Tuple[List[int], int, Dict[int, int]]] = [([], shots, {})]
+    while branches:
+        forced, branch_shots, recorded = branches.pop()
+        pool.request(("clear",))
+        batch: List[tuple] = []
+        point = 0
+        for op in ops:
+            if op[0] == GATE:
+                batch.append(op)
+                continue
+            if batch:
+                pool.request(("run", batch))
+                batch = []
+            a = op[1]
+            p1 = min(max(sum(pool.request(("probability_of_one", a))), 0.0), 1.0)
+            if point < len(forced):
+                outcome = forced[point]
+            else:
+                ones = int(rng.binomial(branch_shots, p1))
+                if 0 < ones < branch_shots:
+                    bits = dict(recorded)
+                    if op[0] == MEASURE and op[2] is not None:
+                        bits[op[2]] = 1
+                    branches.append((forced + [1], ones, bits))
+                    branch_shots -= ones
+                    outcome = 0
+                else:
+                    outcome = 1 if ones else 0
+                forced = forced + [outcome]
+            point += 1
+            pool.request(("collapse", a, outcome, p1 if outcome else 1 - p1, op[0] != MEASURE))
+            if op[0] == MEASURE and op[2] is not None:
+                recorded = dict(recorded)
+                recorded[op[2]] = outcome
+        if batch:
+            pool.request(("run", batch))
+
+        bits = [0] * program.num_clbits
+        for clbit, value in recorded.items():
+            bits[clbit] = value
+        if final_axes:
+            norms = np.asarray(pool.request(("norm",)), dtype=np.float64)
+            split = rng.multinomial(branch_shots, norms / norms.sum())
+            seeds = rng.integers(0, 2**63, size=split.size)
+            sampled: Dict[int, int] = {}
+            for part in pool.request(*[
+                ("sample", final_axes, int(n), int(seed)) for n, seed in zip(split, seeds)
+            ]):
+                for outcome, count in part.items():
+                    sampled[outcome] = sampled.get(outcome, 0) + count
+        else:
+            sampled = {0: branch_shots}
+        for outcome, count in sampled.items():
+            for a, clbit in program.final:
+                bits[clbit] = (outcome >> position[a]) & 1
+            key = layout.counts_key(bits)
+            counts[key] = counts.get(key, 0) + count
+    return counts
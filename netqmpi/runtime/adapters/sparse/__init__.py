@@ -0,0 +1,44 @@
+"""Sparse statevector runtime adapter for NetQMPI.
+
+This package exposes the runtime adapter classes used by NetQMPI to
+simulate distributed quantum programs on a statevector that stores only
+its non-zero amplitudes, which keeps GHZ states, teleportation chains
+and permutation-heavy programs cheap however many qubits they span.
+
+Classes are loaded on first access, so importing the package is cheap.
+"""
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from netqmpi.runtime.adapters.sparse.sparse_circuit import SparseCircuitAdapter
+    from netqmpi.runtime.adapters.sparse.sparse_executor import SparseExecutorAdapter
+    from netqmpi.runtime.adapters.sparse.sparse_communicator import SparseCommunicator
+    from netqmpi.runtime.adapters.sparse.sparse_run_config import SparseStatevectorConfig
+
+# Public name -> submodule defining it.
+_LAZY = {
+    "SparseCircuitAdapter": "netqmpi.runtime.adapters.sparse.sparse_circuit",
+    "SparseExecutorAdapter": "netqmpi.runtime.adapters.sparse.sparse_executor",
+    "SparseCommunicator": "netqmpi.runtime.adapters.sparse.sparse_communicator",
+    "SparseStatevectorConfig": "netqmpi.runtime.adapters.sparse.sparse_run_config",
+}
+
+__all__ = [
+    "SparseCircuitAdapter",
+    "SparseExecutorAdapter",
+    "SparseCommunicator",
+    "SparseStatevectorConfig",
+]
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
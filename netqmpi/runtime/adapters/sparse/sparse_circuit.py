@@ -0,0 +1,20 @@
+"""
+Circuit adapter for the sparse statevector backend.
+
+Translation into global-index instructions is shared with the other
+monolithic backends (see
+:class:`~netqmpi.runtime.adapters.monolithic.monolithic_circuit.MonolithicCircuitAdapter`);
+the executor compiles the instructions of all ranks into one program
+and simulates it on the support of the state.
+"""
+from __future__ import annotations
+
+from netqmpi.runtime.adapters.monolithic.monolithic_circuit import MonolithicCircuitAdapter
+
+
+class SparseCircuitAdapter(MonolithicCircuitAdapter):
+    """
+    Circuit adapter that translates operations into global-index instructions.
+    """
+
+    _BACKEND = "sparse"
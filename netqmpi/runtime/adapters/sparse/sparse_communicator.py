@@ -0,0 +1,24 @@
+"""
+Communicator adapter for the sparse statevector backend.
+
+Manages the context lifecycle for a single rank through the barrier
+protocol of
+:class:`~netqmpi.runtime.adapters.monolithic.monolithic_communicator.MonolithicCommunicator`.
+"""
+from __future__ import annotations
+
+from netqmpi.runtime.adapters.monolithic.monolithic_communicator import MonolithicCommunicator
+
+
+class SparseCommunicator(MonolithicCommunicator):
+    """
+    Sparse-statevector-backed communicator for a single rank.
+
+    Args:
+        rank: Numeric index of the current rank.
+        size: Total number of ranks.
+        config: Sparse statevector configuration.
+        executor: Executor that simulates the global program.
+    """
+
+    _TRACE_CATEGORY = "sparse"
@@ -0,0 +1,97 @@
+"""
+Executor adapter for the sparse statevector backend.
+
+This module provides the :class:`SparseExecutorAdapter` implementation
+of the :class:`~netqmpi.runtime.executor.Executor` interface.  It
+simulates the global program on a statevector that stores only its
+non-zero amplitudes, so protocols that keep a small support (GHZ,
+teleportation chains, permutation-heavy arithmetic) run in time and
+memory proportional to that support instead of ``2**n``.
+"""
+from __future__ import annotations
+
+from typing import List
+
+from netqmpi.runtime import profiling
+from netqmpi.runtime.adapters.monolithic.monolithic_executor import MonolithicExecutor
+from netqmpi.runtime.adapters.monolithic.monolithic_layout import Instruction
+from netqmpi.runtime.adapters.sparse.sparse_circuit import SparseCircuitAdapter
+from netqmpi.runtime.adapters.sparse.sparse_communicator import SparseCommunicator
+from netqmpi.runtime.adapters.sparse.sparse_run_config import SparseStatevectorConfig
+
+
+class SparseExecutorAdapter(MonolithicExecutor):
+    """
+    Executor adapter that runs NetQMPI apps on a sparse statevector.
+
+    Ranks run in threads and are translated against a global layout as
+    described in
+    :class:`~netqmpi.runtime.adapters.monolithic.monolithic_executor.MonolithicExecutor`.
+    The instructions of all ranks are then compiled as for the ``numpy``
+    backend and simulated by
+    :mod:`~netqmpi.runtime.adapters.sparse.sparse_statevector`.
+
+    Attributes:
+        program: The compiled
+            :class:`~netqmpi.runtime.adapters.numpy.numpy_statevector.StatevectorProgram`
+            of the last run.
+        report: The
+            :class:`~netqmpi.runtime.adapters.sparse.sparse_statevector.SparseReport`
+            of the last run: peak support, pruned probability and whether
+            the state turned dense.
+    """
+
+    config_class = SparseStatevectorConfig
+    circuit_class = SparseCircuitAdapter
+    communicator_class = SparseCommunicator
+
+    def __init__(self, size: int, config: SparseStatevectorConfig = None) -> None:
+        """
+        Initialize the sparse statevector executor adapter.
+
+        Args:
+            size: Number of parallel ranks to simulate.
+            config: Sparse statevector configuration.  Defaults to
+                :class:`SparseStatevectorConfig` with its built-in defaults.
+        """
+        super().__init__(size, config)
+        # Re-narrow the type so the checker knows we have SparseStatevectorConfig.
+        self._config: SparseStatevectorConfig = self._config
+        self.program = None
+        self.report = None
+
+    def _run_simulation(self, programs: List[List[Instruction]]) -> dict:
+        """
+        Compile the global program and simulate it.
+
+        Args:
+            programs: Segments of the global program, in order, as
+                returned by :func:`~netqmpi.runtime.adapters.monolithic.monolithic_layout.splice`.
+
+        Returns:
+            The counts to broadcast to every rank.
+
+        Raises:
+            ValueError: If ``precision`` is unknown.
+        """
+        import numpy as np
+        from netqmpi.runtime.adapters.numpy.numpy_statevector import compile_program
+        from netqmpi.runtime.adapters.sparse.sparse_statevector import simulate
+
+        dtypes = {"single": np.complex64, "double": np.complex128}
+        if self._config.precision not in dtypes:
+            raise ValueError(
+                f"Unknown precision {self._config.precision!r}; use 'single' or 'double'."
+            )
+
+        with profiling.phase("submit"):
+            self.program = compile_program(programs, self._layout, dtypes[self._config.precision])
+
+        with profiling.phase("simulate"):
+            rng = np.random.default_rng(self._config.seed)
+            counts, self.report = simulate(
+                self.program, self._layout, self._config.shots, rng,
+                self._config.prune_threshold, self._config.max_support,
+                self._config.max_dense_qubits,
+            )
+        return counts
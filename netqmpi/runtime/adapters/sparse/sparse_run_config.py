@@ -0,0 +1,41 @@
+"""
+Backend-specific configuration for sparse statevector runs.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Optional
+
+from netqmpi.runtime.adapters.monolithic.monolithic_run_config import MonolithicRunConfig
+
+
+@dataclass
+class SparseStatevectorConfig(MonolithicRunConfig):
+    """
+    Extension of
+    :class:`~netqmpi.runtime.adapters.monolithic.monolithic_run_config.MonolithicRunConfig`
+    with sparse-statevector-specific fields.
+
+    Field ``metadata["choices"]`` lists the accepted values of string
+    fields; the CLI turns it into ``choices`` for the matching option.
+
+    Attributes:
+        shots: Number of simulation shots.
+        seed: Optional RNG seed for reproducible simulations.
+        precision: ``"double"`` (default) simulates with ``complex128``
+            amplitudes, ``"single"`` with ``complex64``.
+        prune_threshold: Amplitudes whose probability falls below this
+            after a gate are dropped.  ``0`` only drops exact zeros.
+        max_support: Number of stored amplitudes above which the state
+            is converted to a dense statevector.
+        max_dense_qubits: Widest state that may be converted to a dense
+            statevector (``16 * 2**n`` bytes in double precision).
+            Wider states stay sparse whatever their support.
+    """
+
+    shots: int = 1024
+    seed: Optional[int] = None
+    precision: str = field(default="double", metadata={"choices": ("single", "double")})
+    prune_threshold: float = 1e-16
+    max_support: int = 1 << 16
+    max_dense_qubits: int = 26
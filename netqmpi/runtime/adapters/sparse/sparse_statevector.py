@@ -0,0 +1,327 @@
+"""
+Sparse statevector simulation of a monolithic NetQMPI program.
+
+The global-index instructions of every rank are compiled as for the
+NumPy statevector backend (see
+:func:`~netqmpi.runtime.adapters.numpy.numpy_statevector.compile_program`),
+so swap-mode transfers cost nothing and single-qubit gates are fused.
+The state then only stores its *support*: two arrays holding the basis
+indices with a non-zero amplitude and those amplitudes.  Axis ``0`` is
+the most significant bit of an index, as in the dense tensor.
+
+Gates are applied by index arithmetic on the entries whose control bits
+are all set:
+
+* a diagonal gate scales the amplitudes;
+* a gate with a zero diagonal (X, Y, the target of CX and CCX) flips the
+  target bit of the indices and scales the amplitudes, so the support
+  keeps its size;
+* any other gate sends every entry to both values of the target bit,
+  merges the entries that meet and drops those whose probability falls
+  below ``threshold``.
+
+GHZ states, teleportation chains and permutation-heavy arithmetic keep
+a handful of entries however many qubits they span.  When the support
+grows past ``max_support`` the state is copied into a dense tensor, if
+it has few enough axes, and the rest of the program runs on the NumPy
+statevector.  Indices are ``int64`` up to 62 axes and Python integers
+beyond that, so wide programs with a small support still run.
+
+Terminal measurements are sampled for all shots at once from the
+support; mid-circuit measurements and resets branch the simulation as
+in the statevector backend.
+"""
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Dict, List, Sequence, Tuple, Union
+
+import numpy as np
+
+from netqmpi.runtime.adapters.monolithic.monolithic_layout import GlobalLayout
+from netqmpi.runtime.adapters.numpy.numpy_statevector import (
+    GATE, MEASURE, RESET, StatevectorProgram,
+    _collapse, _probability_of_one, _sample, apply_gate,
+)
+
+# Widest state whose indices fit in int64 with room for a flipped bit.
+_INT64_AXES = 62
+
+
+@dataclass
+class SparseReport:
+    """
+    Cost and accuracy of a sparse run.
+
+    Attributes:
+        peak_support: Largest number of stored amplitudes, over the
+            simulation branches, before any switch to a dense state.
+        pruned: Largest, over the simulation branches, total probability
+            dropped by pruning.  ``0`` means the run was exact.
+        dense: Whether some branch outgrew ``max_support`` and finished
+            on a dense statevector.
+    """
+
+    peak_support: int = 1
+    pruned: float = 0.0
+    dense: bool = False
+
+
+class SparseState:
+    """
+    A statevector stored as its support.
+
+    Args:
+        num_axes: Number of axes (qubits).
+        dtype: Complex dtype of the amplitudes.
+        threshold: Probability below which a merged amplitude is dropped.
+    """
+
+    def __init__(self, num_axes: int, dtype: type, threshold: float) -> None:
+        self.num_axes = num_axes
+        self.threshold = threshold
+        index_dtype = np.int64 if num_axes <= _INT64_AXES else object
+        self.indices = np.zeros(1, dtype=index_dtype)
+        self.amplitudes = np.ones(1, dtype=dtype)
+        self.report = SparseReport()
+
+    @property
+    def support(self) -> int:
+        """Number of stored amplitudes."""
+        return self.amplitudes.size
+
+    def copy(self) -> "SparseState":
+        """Return an independent copy of the state."""
+        other = SparseState.__new__(SparseState)
+        other.num_axes = self.num_axes
+        other.threshold = self.threshold
+        other.indices = self.indices.copy()
+        other.amplitudes = self.amplitudes.copy()
+        other.report = SparseReport(**vars(self.report))
+        return other
+
+    def _bit(self, axis: int) -> int:
+        """Return the index bit of an axis."""
+        return 1 << (self.num_axes - 1 - axis)
+
+    def _ones(self, indices: np.ndarray, axis: int) -> np.ndarray:
+        """Return which of ``indices`` have ``axis`` set."""
+        return (indices & self._bit(axis)) != 0
+
+    def apply(self, matrix: np.ndarray, axis: int, controls: Tuple[int, ...], diagonal: bool) -> None:
+        """
+        Apply a (controlled) single-qubit gate.
+
+        Args:
+            matrix: 2x2 gate matrix.
+            axis: Target axis.
+            controls: Control axes.
+            diagonal: Whether ``matrix`` is diagonal.
+        """
+        if controls:
+            mask = sum(self._bit(c) for c in controls)
+            active = (self.indices & mask) == mask
+            if not active.any():
+                return
+        else:
+            active = slice(None)
+        bit = self._bit(axis)
+        indices = self.indices[active]
+        amplitudes = self.amplitudes[active]
+        ones = (indices & bit) != 0
+
+        if diagonal:
+            self.amplitudes[active] = amplitudes * np.where(ones, matrix[1, 1], matrix[0, 0])
+            return
+        if matrix[0, 0] == 0 and matrix[1, 1] == 0:
+            self.indices[active] = indices ^ bit
+            self.amplitudes[active] = amplitudes * np.where(ones, matrix[0, 1], matrix[1, 0])
+            return
+
+        column = ones.astype(np.intp)
+        zero = indices & ~bit
+        merged, inverse = np.unique(np.concatenate([zero, zero | bit]), return_inverse=True)
+        contributions = np.concatenate([matrix[0, column] * amplitudes, matrix[1, column] * amplitudes])
+        values = (
+            np.bincount(inverse, weights=contributions.real, minlength=merged.size)
+            + 1j * np.bincount(inverse, weights=contributions.imag, minlength=merged.size)
+        ).astype(self.amplitudes.dtype)
+        probabilities = values.real ** 2 + values.imag ** 2
+        keep = probabilities >= self.threshold
+        if not keep.all():
+            self.report.pruned += float(probabilities[~keep].sum())
+            merged, values = merged[keep], values[keep]
+
+        if controls:
+            # Entries with a control at 0 are untouched and never meet the others.
+            self.indices = np.concatenate([self.indices[~active], merged])
+            self.amplitudes = np.concatenate([self.amplitudes[~active], values])
+        else:
+            self.indices, self.amplitudes = merged, values
+        self.report.peak_support = max(self.report.peak_support, self.support)
+
+    def probability_of_one(self, axis: int) -> float:
+        """Return the probability of measuring ``1`` on an axis, clipped to ``[0, 1]``."""
+        ones = self.amplitudes[self._ones(self.indices, axis)]
+        p = float(np.sum(ones.real ** 2 + ones.imag ** 2))
+        return min(max(p, 0.0), 1.0)
+
+    def collapse(self, axis: int, outcome: int, probability: float, reset: bool) -> None:
+        """
+        Project the state onto a measurement outcome.
+
+        Args:
+            axis: Measured axis.
+            outcome: Measured bit.
+            probability: Probability of ``outcome``.
+            reset: Whether to return the qubit to ``|0>`` afterwards.
+        """
+        keep = self._ones(self.indices, axis) == bool(outcome)
+        self.indices = self.indices[keep]
+        self.amplitudes = self.amplitudes[keep] * (1 / math.sqrt(probability))
+        if reset and outcome == 1:
+            self.indices ^= self._bit(axis)
+
+    def sample(self, axes: Sequence[int], shots: int, rng: np.random.Generator) -> Dict[int, int]:
+        """
+        Sample the joint outcome of some axes.
+
+        Args:
+            axes: Measured axes, sorted.
+            shots: Number of samples.
+            rng: Random generator.
+
+        Returns:
+            ``outcome -> count``, where bit ``len(axes) - 1 - i`` of an
+            outcome is the value of ``axes[i]``.
+        """
+        outcomes = np.zeros(self.support, dtype=self.indices.dtype)
+        for a in axes:
+            outcomes = (outcomes << 1) | self._ones(self.indices, a).astype(self.indices.dtype)
+        probabilities = (self.amplitudes.real ** 2 + self.amplitudes.imag ** 2).astype(np.float64)
+        outcomes, inverse = np.unique(outcomes, return_inverse=True)
+        probabilities = np.bincount(inverse, weights=probabilities, minlength=outcomes.size)
+        counts = rng.multinomial(shots, probabilities / probabilities.sum())
+        hit = np.flatnonzero(counts)
+        return {int(o): int(c) for o, c in zip(outcomes[hit], counts[hit])}
+
+    def to_dense(self) -> np.ndarray:
+        """Return the state as a dense ``(2,) * num_axes`` tensor."""
+        state = np.zeros(1 << self.num_axes, dtype=self.amplitudes.dtype)
+        state[self.indices.astype(np.int64)] = self.amplitudes
+        return state.reshape((2,) * self.num_axes)
+
+
+def simulate(
+    program: StatevectorProgram,
+    layout: GlobalLayout,
+    shots: int,
+    rng: np.random.Generator,
+    threshold: float,
+    max_support: int,
+    max_dense_qubits: int,
+) -> Tuple[Dict[str, int], SparseReport]:
+    """
+    Run a compiled program on a sparse statevector.
+
+    Args:
+        program: Program compiled by
+            :func:`~netqmpi.runtime.adapters.numpy.numpy_statevector.compile_program`.
+        layout: Global layout, used to format the counts keys.
+        shots: Number of shots.
+        rng: Random generator.
+        threshold: Probability below which an amplitude is dropped.
+        max_support: Support above which the state turns dense.
+        max_dense_qubits: Widest state that may turn dense; wider states
+            stay sparse however large their support.
+
+    Returns:
+        The counts, keyed as by
+        :meth:`~netqmpi.runtime.adapters.monolithic.monolithic_layout.GlobalLayout.counts_key`,
+        and the run report.
+    """
+    counts: Dict[str, int] = {}
+    report = SparseReport()
+    if shots <= 0:
+        return counts, report
+
+    final_axes = sorted({a for a, _ in program.final})
+    position = {a: len(final_axes) - 1 - i for i, a in enumerate(final_axes)}
+    ops = program.ops
+    may_densify = program.num_axes <= max_dense_qubits
+
+    state: Union[SparseState, np.ndarray] = SparseState(program.num_axes, program.dtype, threshold)
+    # (state, next op, shots, clbits recorded mid-circuit)
+    branches: List[Tuple[Union[SparseState, np.ndarray], int, int, Dict[int, int]]] = [
+        (state, 0, shots, {})
+    ]
+    while branches:
+        state, pc, branch_shots, recorded = branches.pop()
+        while pc < len(ops):
+            op = ops[pc]
+            pc += 1
+            sparse = isinstance(state, SparseState)
+            if op[0] == GATE:
+                if not sparse:
+                    state = apply_gate(state, op[1], op[2], op[3], op[4])
+                    continue
+                state.apply(op[1], op[2], op[3], op[4])
+                if may_densify and state.support > max_support:
+                    _merge(report, state.report)
+                    report.dense = True
+                    state = state.to_dense()
+                continue
+            a = op[1]
+            p1 = state.probability_of_one(a) if sparse else _probability_of_one(state, a)
+            ones = int(rng.binomial(branch_shots, p1))
+            if 0 < ones < branch_shots:
+                branch = state.copy()
+                _collapse_any(branch, a, 1, p1, op[0] == RESET)
+                bits = dict(recorded)
+                if op[0] == MEASURE and op[2] is not None:
+                    bits[op[2]] = 1
+                branches.append((branch, pc, ones, bits))
+                branch_shots -= ones
+                outcome = 0
+            else:
+                outcome = 1 if ones else 0
+            _collapse_any(state, a, outcome, p1 if outcome else 1 - p1, op[0] == RESET)
+            if op[0] == MEASURE and op[2] is not None:
+                recorded = dict(recorded)
+                recorded[op[2]] = outcome
+
+        if isinstance(state, SparseState):
+            _merge(report, state.report)
+
+        bits = [0] * program.num_clbits
+        for clbit, value in recorded.items():
+            bits[clbit] = value
+        if not final_axes:
+            sampled = {0: branch_shots}
+        elif isinstance(state, SparseState):
+            sampled = state.sample(final_axes, branch_shots, rng)
+        else:
+            sampled = _sample(state, final_axes, branch_shots, rng)
+        for outcome, count in sampled.items():
+            for a, clbit in program.final:
+                bits[clbit] = (outcome >> position[a]) & 1
+            key = layout.counts_key(bits)
+            counts[key] = counts.get(key, 0) + count
+    return counts, report
+
+
+def _merge(report: SparseReport, branch: SparseReport) -> None:
+    """Fold the report of one branch into the report of the run."""
+    report.peak_support = max(report.peak_support, branch.peak_support)
+    report.pruned = max(report.pruned, branch.pruned)
+
+
+def _collapse_any(
+    state: Union[SparseState, np.ndarray], axis: int, outcome: int, probability: float, reset: bool
+) -> None:
+    """Collapse a sparse or dense state in place."""
+    if isinstance(state, SparseState):
+        state.collapse(axis, outcome, probability, reset)
+    else:
+        _collapse(state, axis, outcome, probability, reset)
@@ -0,0 +1,43 @@
+"""Stabilizer-tableau runtime adapter for NetQMPI.
+
+This package exposes the runtime adapter classes used by NetQMPI to
+simulate distributed Clifford programs as one global stabilizer
+tableau, which scales to hundreds or thousands of ranks.
+
+Classes are loaded on first access, so importing the package is cheap.
+"""
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from netqmpi.runtime.adapters.stabilizer.stabilizer_circuit import StabilizerCircuitAdapter
+    from netqmpi.runtime.adapters.stabilizer.stabilizer_executor import StabilizerExecutorAdapter
+    from netqmpi.runtime.adapters.stabilizer.stabilizer_communicator import StabilizerCommunicator
+    from netqmpi.runtime.adapters.stabilizer.stabilizer_run_config import StabilizerConfig
+
+# Public name -> submodule defining it.
+_LAZY = {
+    "StabilizerCircuitAdapter": "netqmpi.runtime.adapters.stabilizer.stabilizer_circuit",
+    "StabilizerExecutorAdapter": "netqmpi.runtime.adapters.stabilizer.stabilizer_executor",
+    "StabilizerCommunicator": "netqmpi.runtime.adapters.stabilizer.stabilizer_communicator",
+    "StabilizerConfig": "netqmpi.runtime.adapters.stabilizer.stabilizer_run_config",
+}
+
+__all__ = [
+    "StabilizerCircuitAdapter",
+    "StabilizerExecutorAdapter",
+    "StabilizerCommunicator",
+    "StabilizerConfig",
+]
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
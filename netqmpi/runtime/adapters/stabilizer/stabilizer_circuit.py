@@ -0,0 +1,47 @@
+"""
+Circuit adapter for the stabilizer-tableau backend.
+
+Translation into global-index instructions is shared with the other
+monolithic backends (see
+:class:`~netqmpi.runtime.adapters.monolithic.monolithic_circuit.MonolithicCircuitAdapter`);
+this adapter additionally rejects non-Clifford instructions as soon as
+a rank translates them, so the error names the rank that used them.
+"""
+from __future__ import annotations
+
+from netqmpi.runtime.adapters.monolithic.monolithic_circuit import MonolithicCircuitAdapter
+from netqmpi.runtime.adapters.stabilizer.stabilizer_tableau import is_clifford
+
+
+class StabilizerCircuitAdapter(MonolithicCircuitAdapter):
+    """
+    Circuit adapter that translates Clifford operations into global-index instructions.
+
+    Supported are H, X, Y, Z, S, SDG, SWAP, CX, CZ, measurements, resets,
+    RX/RY/RZ by multiples of ``pi / 2`` and CRZ by multiples of ``pi``,
+    plus every QMPI operation.
+    """
+
+    _BACKEND = "stabilizer"
+
+    def _emit(self, name: str, qubits: tuple, clbits: tuple = (), params: tuple = ()) -> None:
+        """
+        Append one global-index instruction if it is a Clifford operation.
+
+        Args:
+            name: Lower-case Qiskit instruction name.
+            qubits: Global qubit indices.
+            clbits: Global clbit indices.
+            params: Instruction parameters.
+
+        Raises:
+            ValueError: If the instruction is not a Clifford operation.
+        """
+        if not is_clifford(name, params):
+            gate = f"{name}({', '.join(map(str, params))})" if params else name
+            raise ValueError(
+                f"rank {self._comm.rank}: {gate} is not a Clifford gate; the "
+                f"{self._BACKEND} backend only simulates Clifford programs "
+                "(use the numpy or aer backend instead)."
+            )
+        super()._emit(name, qubits, clbits, params)
@@ -0,0 +1,26 @@
+"""
+Backend-specific configuration for stabilizer-tableau runs.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
+
+from netqmpi.runtime.adapters.monolithic.monolithic_run_config import MonolithicRunConfig
+
+
+@dataclass
+class StabilizerConfig(MonolithicRunConfig):
+    """
+    Extension of
+    :class:`~netqmpi.runtime.adapters.monolithic.monolithic_run_config.MonolithicRunConfig`
+    with stabilizer-tableau-specific fields.
+
+    Attributes:
+        shots: Number of simulation shots.  Shots only cost sampling,
+            the tableau is evolved once per run.
+        seed: Optional RNG seed for reproducible simulations.
+    """
+
+    shots: int = 1024
+    seed: Optional[int] = None
@@ -0,0 +1,436 @@
+"""
+Stabilizer-tableau simulation of a monolithic Clifford NetQMPI program.
+
+A Clifford program on ``n`` qubits is simulated with the tableau of
+Aaronson and Gottesman (CHP): ``n`` destabilizer and ``n`` stabilizer
+rows, each a Pauli string stored as bit-packed ``x`` and ``z`` rows plus
+a sign.  Gates update two columns in ``O(n)``; a measurement updates
+whole rows in ``O(n^2)`` bit operations, eight qubits per byte.  The
+memory is ``O(n^2 / 4)`` bytes, so thousands of ranks fit easily.
+
+The global-index instructions of every rank are first compiled into a
+:class:`StabilizerProgram` on *wires*:
+
+* a qubit gets a wire on its first use, so slots of the layout that no
+  instruction touches are never allocated;
+* SWAP (and therefore every swap-mode qsend, qscatter and qgather) is a
+  relabelling of which wire holds which qubit;
+* rotations by multiples of ``pi / 2`` (``crz`` by multiples of ``pi``)
+  are rewritten with ``s``, ``sdg``, ``z``, ``h`` and ``cz``, and every
+  other non-Clifford instruction is rejected.
+
+The ``x`` and ``z`` parts of the tableau never depend on measurement
+outcomes, only the signs do.  Signs are therefore kept *symbolic*: an
+affine function over GF(2) of one random bit per random measurement.
+A single pass over the program yields every clbit as such a function,
+and all shots are then sampled at once by drawing the random bits,
+instead of simulating the program once per shot or per branch.
+"""
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from itertools import chain
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from netqmpi.runtime.adapters.monolithic.monolithic_layout import GlobalLayout, Instruction
+
+# Compiled operation kinds.
+GATE, MEASURE, RESET = 0, 1, 2
+
+# Operand positions of the gates the tableau applies directly.
+_ONE, _TWO = (0,), (0, 1)
+_NATIVE = {
+    "h": _ONE, "x": _ONE, "y": _ONE, "z": _ONE, "s": _ONE, "sdg": _ONE,
+    "cx": _TWO, "cz": _TWO,
+}
+
+# rz by k quarter turns, up to a global phase.
+_RZ = {
+    0: (),
+    1: (("s", _ONE),),
+    2: (("z", _ONE),),
+    3: (("sdg", _ONE),),
+}
+
+# crz by k half turns, up to a global phase.
+_CRZ = {
+    0: (),
+    1: (("sdg", _ONE), ("cz", _TWO)),
+    2: (("z", _ONE),),
+    3: (("s", _ONE), ("cz", _TWO)),
+}
+
+# Tolerance on rotation angles, in radians.
+_ANGLE_TOLERANCE = 1e-9
+
+if hasattr(np, "bitwise_count"):
+    _popcount = np.bitwise_count
+else:
+    _POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+    def _popcount(a: np.ndarray) -> np.ndarray:
+        return _POPCOUNT[a]
+
+
+def _turns(angle: float, unit: float) -> Optional[int]:
+    """
+    Return ``angle / unit`` modulo 4 if it is a whole number.
+
+    Args:
+        angle: Rotation angle in radians.
+        unit: Angle of one turn step.
+
+    Returns:
+        The number of steps in ``0..3``, or ``None``.
+    """
+    k = round(float(angle) / unit)
+    if abs(float(angle) - k * unit) > _ANGLE_TOLERANCE:
+        return None
+    return k % 4
+
+
+def clifford_decomposition(name: str, params: tuple = ()) -> Optional[tuple]:
+    """
+    Rewrite an instruction as gates the tableau applies directly.
+
+    Args:
+        name: Lower-case instruction name.
+        params: Instruction parameters (one angle for rotations).
+
+    Returns:
+        A tuple of ``(gate, operand positions)`` in time order, or
+        ``None`` if the instruction is not a Clifford gate.  ``swap``,
+        ``measure``, ``reset`` and ``barrier`` are handled by the
+        compiler and also return ``None``.
+    """
+    operands = _NATIVE.get(name)
+    if operands is not None:
+        return ((name, operands),)
+    if name in ("rz", "rx", "ry"):
+        k = _turns(params[0], math.pi / 2)
+        if k is None:
+            return None
+        if name == "rz":
+            return _RZ[k]
+        rx = (("h", _ONE),) + _RZ[k] + (("h", _ONE),)
+        return rx if name == "rx" else (("sdg", _ONE),) + rx + (("s", _ONE),)
+    if name == "crz":
+        k = _turns(params[0], math.pi)
+        return None if k is None else _CRZ[k]
+    return None
+
+
+def is_clifford(name: str, params: tuple = ()) -> bool:
+    """
+    Return whether an instruction can be simulated on a tableau.
+
+    Args:
+        name: Lower-case instruction name.
+        params: Instruction parameters.
+
+    Returns:
+        ``True`` for Clifford gates, SWAP, measurements, resets and barriers.
+    """
+    return (
+        name in ("swap", "measure", "reset", "barrier")
+        or clifford_decomposition(name, params) is not None
+    )
+
+
+@dataclass
+class StabilizerProgram:
+    """
+    Global program compiled onto tableau wires.
+
+    Attributes:
+        num_wires: Number of qubits actually simulated.
+        ops: Compiled operations: ``(GATE, name, wires)``,
+            ``(MEASURE, wire, clbit)`` with ``wire`` set to ``None`` for
+            a qubit that was never used, and ``(RESET, wire)``.
+        num_clbits: Number of global clbits.
+        num_measurements: Number of measurements and resets on wires,
+            an upper bound on the random bits of the run.
+    """
+
+    num_wires: int
+    ops: List[tuple]
+    num_clbits: int
+    num_measurements: int
+
+
+def compile_program(
+    programs: Sequence[Sequence[Instruction]],
+    layout: GlobalLayout,
+) -> StabilizerProgram:
+    """
+    Compile the instructions of every rank into a stabilizer program.
+
+    Args:
+        programs: Segments of the global program, in order.
+        layout: Layout the instructions were translated against.
+
+    Returns:
+        The compiled program.
+
+    Raises:
+        ValueError: If an instruction is not a Clifford operation.
+    """
+    wire_of: Dict[int, int] = {}
+    ops: List[tuple] = []
+    num_measurements = 0
+
+    def wire(qubit: int) -> int:
+        w = wire_of.get(qubit)
+        if w is None:
+            w = wire_of[qubit] = len(wire_of)
+        return w
+
+    for name, params, qubits, clbits in chain.from_iterable(programs):
+        if name == "barrier":
+            continue
+        if name == "swap":
+            p, q = qubits
+            a, b = wire_of.pop(p, None), wire_of.pop(q, None)
+            if a is not None:
+                wire_of[q] = a
+            if b is not None:
+                wire_of[p] = b
+        elif name == "measure":
+            # A qubit that was never used is still |0>.
+            w = wire_of.get(qubits[0])
+            num_measurements += w is not None
+            ops.append((MEASURE, w, clbits[0]))
+        elif name == "reset":
+            w = wire_of.get(qubits[0])
+            if w is not None:
+                num_measurements += 1
+                ops.append((RESET, w))
+        else:
+            steps = clifford_decomposition(name, params)
+            if steps is None:
+                raise ValueError(
+                    f"{name}{tuple(params) if params else ''} is not a Clifford gate; "
+                    "the stabilizer backend only simulates Clifford programs."
+                )
+            for gate, operands in steps:
+                ops.append((GATE, gate, tuple(wire(qubits[i]) for i in operands)))
+
+    return StabilizerProgram(len(wire_of), ops, layout.num_clbits, num_measurements)
+
+
+class Tableau:
+    """
+    Bit-packed stabilizer tableau with symbolic signs.
+
+    Rows ``0..n-1`` are the destabilizers and rows ``n..2n-1`` the
+    stabilizers.  Bit ``q & 7`` of byte ``q >> 3`` of a row of
+    :attr:`xbits` or :attr:`zbits` is the X or Z component on qubit ``q``; both set is Y.
+    Row ``i`` of :attr:`signs` is the sign of row ``i`` as packed GF(2)
+    coefficients: bit 0 is the constant and bit ``k + 1`` the ``k``-th
+    random bit, so the sign is ``-1`` exactly when their dot product
+    with ``(1, b_0, b_1, ...)`` is odd.
+
+    Args:
+        num_qubits: Number of qubits, all starting in ``|0>``.
+        num_random: Maximum number of random bits (random measurements).
+    """
+
+    def __init__(self, num_qubits: int, num_random: int) -> None:
+        n = num_qubits
+        self.num_qubits = n
+        self.num_random = 0
+        qubit_bytes = (n + 7) >> 3
+        self.xbits = np.zeros((2 * n, qubit_bytes), dtype=np.uint8)
+        self.zbits = np.zeros((2 * n, qubit_bytes), dtype=np.uint8)
+        self.signs = np.zeros((2 * n, (num_random + 8) >> 3), dtype=np.uint8)
+        rows = np.arange(n)
+        self.xbits[rows, rows >> 3] = 1 << (rows & 7)
+        self.zbits[rows + n, rows >> 3] = 1 << (rows & 7)
+
+    # ------------------------------------------------------------------
+    # Column helpers
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _column(m: np.ndarray, q: int) -> np.ndarray:
+        """Return the bits of qubit ``q`` in every row of ``m``."""
+        return (m[:, q >> 3] >> (q & 7)) & 1
+
+    @staticmethod
+    def _flip(m: np.ndarray, q: int, bits: np.ndarray) -> None:
+        """Toggle the bits of qubit ``q`` in the rows of ``m`` where ``bits`` is set."""
+        m[:, q >> 3] ^= bits << (q & 7)
+
+    def _negate(self, bits: np.ndarray) -> None:
+        """Toggle the constant sign of the rows where ``bits`` is set."""
+        self.signs[:, 0] ^= bits
+
+    # ------------------------------------------------------------------
+    # Gates
+    # ------------------------------------------------------------------
+
+    def h(self, a: int) -> None:
+        xa, za = self._column(self.xbits, a), self._column(self.zbits, a)
+        self._negate(xa & za)
+        self._flip(self.xbits, a, xa ^ za)
+        self._flip(self.zbits, a, xa ^ za)
+
+    def s(self, a: int) -> None:
+        xa, za = self._column(self.xbits, a), self._column(self.zbits, a)
+        self._negate(xa & za)
+        self._flip(self.zbits, a, xa)
+
+    def sdg(self, a: int) -> None:
+        xa, za = self._column(self.xbits, a), self._column(self.zbits, a)
+        self._negate(xa & (za ^ 1))
+        self._flip(self.zbits, a, xa)
+
+    def x(self, a: int) -> None:
+        self._negate(self._column(self.zbits, a))
+
+    def y(self, a: int) -> None:
+        self._negate(self._column(self.xbits, a) ^ self._column(self.zbits, a))
+
+    def z(self, a: int) -> None:
+        self._negate(self._column(self.xbits, a))
+
+    def cx(self, a: int, b: int) -> None:
+        xa, za = self._column(self.xbits, a), self._column(self.zbits, a)
+        xb, zb = self._column(self.xbits, b), self._column(self.zbits, b)
+        self._negate(xa & zb & (xb ^ za ^ 1))
+        self._flip(self.xbits, b, xa)
+        self._flip(self.zbits, a, zb)
+
+    def cz(self, a: int, b: int) -> None:
+        xa, za = self._column(self.xbits, a), self._column(self.zbits, a)
+        xb, zb = self._column(self.xbits, b), self._column(self.zbits, b)
+        self._negate(xa & xb & (za ^ zb))
+        self._flip(self.zbits, a, xb)
+        self._flip(self.zbits, b, xa)
+
+    # ------------------------------------------------------------------
+    # Measurement
+    # ------------------------------------------------------------------
+
+    def measure(self, a: int) -> np.ndarray:
+        """
+        Measure qubit ``a`` in the Z basis.
+
+        Args:
+            a: Qubit to measure.
+
+        Returns:
+            The outcome as a packed sign row (see :attr:`signs`): a fresh
+            random bit if the outcome is random, otherwise an affine
+            function of the earlier random bits.
+        """
+        n = self.num_qubits
+        x, z, r = self.xbits, self.zbits, self.signs
+        xa = self._column(x, a)
+        anticommuting = np.flatnonzero(xa[n:])
+
+        if anticommuting.size == 0:
+            # Deterministic: Z_a is the product of the stabilizers whose
+            # destabilizer anticommutes with it.
+            rows = n + np.flatnonzero(xa[:n])
+            outcome = np.bitwise_xor.reduce(r[rows], axis=0) if rows.size else np.zeros_like(r[0])
+            if rows.size:
+                xs, zs = x[rows], z[rows]
+                # Y = i XZ contributes a factor i per qubit; reordering the
+                # product to X...X Z...Z contributes -1 per Z moved past an X.
+                preceding = np.zeros_like(zs)
+                preceding[1:] = np.bitwise_xor.accumulate(zs[:-1], axis=0)
+                exponent = int(_popcount(xs & zs).sum()) + 2 * int(_popcount(xs & preceding).sum())
+                outcome[0] ^= (exponent % 4) >> 1
+            return outcome
+
+        # Random: multiply every other anticommuting row by stabilizer p.
+        p = n + int(anticommuting[0])
+        rows = np.flatnonzero(xa)
+        rows = rows[(rows != p) & (rows != p - n)]
+        if rows.size:
+            x1, z1 = x[p], z[p]
+            x2, z2 = x[rows], z[rows]
+            y1, xo1, zo1 = x1 & z1, x1 & ~z1, z1 & ~x1
+            y2, xo2, zo2 = x2 & z2, x2 & ~z2, z2 & ~x2
+            # Exponent of i in P_p * P_h, summed over qubits.
+            plus = (y1 & zo2) | (xo1 & y2) | (zo1 & xo2)
+            minus = (y1 & xo2) | (xo1 & zo2) | (zo1 & y2)
+            g = _popcount(plus).sum(axis=1, dtype=np.int64) - _popcount(minus).sum(axis=1, dtype=np.int64)
+            x[rows] ^= x1
+            z[rows] ^= z1
+            r[rows] ^= r[p]
+            r[rows, 0] ^= ((g % 4) >> 1).astype(np.uint8)
+
+        x[p - n], z[p - n], r[p - n] = x[p], z[p], r[p]
+        x[p] = 0
+        z[p] = 0
+        z[p, a >> 3] = 1 << (a & 7)
+        r[p] = 0
+        self.num_random += 1
+        k = self.num_random
+        r[p, k >> 3] = 1 << (k & 7)
+        return r[p].copy()
+
+    def reset(self, a: int) -> None:
+        """
+        Reset qubit ``a`` to ``|0>``: measure it and flip it back if it was ``1``.
+
+        Args:
+            a: Qubit to reset.
+        """
+        outcome = self.measure(a)
+        rows = np.flatnonzero(self._column(self.zbits, a))
+        self.signs[rows] ^= outcome
+
+
+def simulate(
+    program: StabilizerProgram,
+    layout: GlobalLayout,
+    shots: int,
+    rng: np.random.Generator,
+) -> Dict[str, int]:
+    """
+    Run a compiled program and return its counts.
+
+    Args:
+        program: Compiled program.
+        layout: Global layout, used to format the counts keys.
+        shots: Number of shots.
+        rng: Random generator.
+
+    Returns:
+        The counts, keyed as by
+        :meth:`~netqmpi.runtime.adapters.monolithic.monolithic_layout.GlobalLayout.counts_key`.
+    """
+    if shots <= 0:
+        return {}
+
+    tableau = Tableau(program.num_wires, program.num_measurements)
+    gates = {name: getattr(tableau, name) for name in _NATIVE}
+    # Packed affine function of the random bits last written to each clbit.
+    clbits = np.zeros((program.num_clbits, tableau.signs.shape[1]), dtype=np.uint8)
+    for op in program.ops:
+        if op[0] == GATE:
+            gates[op[1]](*op[2])
+        elif op[0] == MEASURE:
+            clbits[op[2]] = 0 if op[1] is None else tableau.measure(op[1])
+        else:
+            tableau.reset(op[1])
+
+    # Sample the random bits of every shot at once and evaluate each clbit.
+    terms = np.unpackbits(clbits, axis=1, bitorder="little")[:, :tableau.num_random + 1]
+    constant, coefficients = terms[:, 0], terms[:, 1:]
+    used = np.flatnonzero(coefficients.any(axis=0))
+    if used.size:
+        bits = rng.integers(0, 2, size=(shots, used.size), dtype=np.uint8).astype(np.float32)
+        values = (bits @ coefficients[:, used].T.astype(np.float32)).astype(np.int64) & 1
+        values = values.astype(np.uint8) ^ constant
+        outcomes, counts = np.unique(values, axis=0, return_counts=True)
+    else:
+        outcomes, counts = constant[np.newaxis], np.array([shots])
+
+    return {layout.counts_key(row.tolist()): int(count) for row, count in zip(outcomes, counts)}
@@ -4,21 +4,28 @@ NetQMPI command-line entry point.
 This module is intentionally free of backend-specific imports from the
 core runtime logic. All simulator-specific behavior is delegated to an
 :class:`~netqmpi.runtime.executor.Executor` implementation provided by
-the corresponding adapter package.
+the corresponding adapter package, which is imported only once it has
+been selected so that start-up stays cheap.
 """
 
-import time, argparse
-from typing import Optional
+import time
+from typing import TYPE_CHECKING, Optional
 
 from netqmpi.runtime import Executor
 from netqmpi.runtime.run_config import RunConfig
 
+if TYPE_CHECKING:
+    from netqmpi.runtime.profiling import Profiler
+    from netqmpi.runtime.tracing import Tracer
+
 def simulate(
     script: str,
     num_procs: int = 1,
     executor: Optional[Executor] = None,
     config: Optional[RunConfig] = None,
     timer: bool = False,
+    profiler: Optional["Profiler"] = None,
+    tracer: Optional["Tracer"] = None,
 ) -> None:
     """
     Build and run a NetQMPI script using the given backend executor.
@@ -26,34 +33,300 @@ def simulate(
     Args:
         script: Path to the NetQMPI Python script.
         num_procs: Number of parallel quantum nodes.
-        executor: Backend executor to use. If ``None``, a
-            :class:`~netqmpi.runtime.adapters.netqasm.NetQASMExecutorAdapter`
-            is used by default.
-        config: Simulation parameters. If ``None``, a default
-            :class:`RunConfig` instance is used.
+        executor: Backend executor to use. If ``None``, the executor of
+            :data:`~netqmpi.runtime.registry.DEFAULT_BACKEND` is created.
+        config: Configuration for the default executor when
+            ``executor`` is ``None``. If ``None``, its defaults are used.
         timer: If ``True``, print the wall-clock execution time.
+        profiler: If given, active for the whole run so that every phase
+            is recorded on it.
+        tracer: If given, active for the whole run so that every span is
+            recorded on it.
     """
     if executor is None:
-        executor = NetQASMExecutorAdapter(size=num_procs)
+        from netqmpi.runtime.registry import DEFAULT_BACKEND, create_executor
+
+        executor = create_executor(DEFAULT_BACKEND, num_procs, config)
 
     if timer:
         start = time.perf_counter()
 
-    apps_instance = executor.build_apps(script, size=num_procs)
-    executor.run(apps_instance)
+    if profiler is not None:
+        profiler.start()
+    if tracer is not None:
+        tracer.start()
+    try:
+        apps_instance = executor.build_apps(script, size=num_procs)
+        executor.run(apps_instance)
+    finally:
+        if tracer is not None:
+            tracer.stop()
+        if profiler is not None:
+            profiler.stop()
 
     if timer:
         print(f"finished simulation in {round(time.perf_counter() - start, 2)} seconds")
 
+# Legacy backend flags, kept as aliases of ``--backend NAME``.
+_LEGACY_FLAGS = {
+    "netqasm": "Use NetQASM backend",
+    "cunqa": "Use CUNQA backend",
+    "aer": "Use Qiskit AerSimulator backend",
+}
+
+# CLI arguments that config fields may not shadow.
+_RESERVED = {
+    "num_procs", "script", "backend", "help",
+    "profile", "profile_json", "profile_memory", "profile_stats", "trace",
+} | set(_LEGACY_FLAGS)
+
+
+def _add_backend_arguments(parser, backends) -> None:
+    """
+    Add the backend selection flags to ``parser``.
+
+    Args:
+        parser: Parser to extend.
+        backends: Known backends, as returned by
+            :func:`~netqmpi.runtime.registry.available_backends`.
+    """
+    backend_group = parser.add_mutually_exclusive_group()
+    backend_group.add_argument(
+        "--backend",
+        choices=sorted(backends),
+        help="Backend to run on: " + ", ".join(
+            f"{name} ({spec.description})" for name, spec in sorted(backends.items())
+        ),
+    )
+    for name, text in _LEGACY_FLAGS.items():
+        backend_group.add_argument(
+            f"--{name}", dest="backend", action="store_const", const=name, help=text,
+        )
+
+
+def _add_profile_arguments(parser) -> None:
+    """
+    Add the ``--profile*`` and ``--trace`` options to ``parser``.
+
+    Args:
+        parser: Parser to extend.
+    """
+    group = parser.add_argument_group("profiling")
+    group.add_argument(
+        "--profile", action="store_true",
+        help="Print wall-clock and CPU time of every run phase",
+    )
+    group.add_argument(
+        "--profile-json", metavar="PATH",
+        help="Write the phase timings as JSON to PATH",
+    )
+    group.add_argument(
+        "--profile-memory", action="store_true",
+        help="Also record peak Python memory per phase (tracemalloc)",
+    )
+    group.add_argument(
+        "--profile-stats", metavar="PATH",
+        help="Run cProfile in every rank and write the merged stats to PATH",
+    )
+    group.add_argument(
+        "--trace", metavar="PATH",
+        help="Write a Chrome/Perfetto trace of the run's spans to PATH",
+    )
+
+
+def _parse_bool(text: str) -> bool:
+    """
+    Parse a boolean option value.
+
+    Args:
+        text: ``true``/``false`` (also ``1``/``0``, ``yes``/``no``).
+
+    Returns:
+        The parsed value.
+
+    Raises:
+        argparse.ArgumentTypeError: If ``text`` is not a boolean.
+    """
+    import argparse
+
+    value = text.lower()
+    if value in ("1", "true", "yes", "on"):
+        return True
+    if value in ("0", "false", "no", "off"):
+        return False
+    raise argparse.ArgumentTypeError(f"expected true or false, got {text!r}")
+
+
+def _attribute_help(config_class) -> dict:
+    """
+    Collect the ``Attributes:`` docstring entries of a config class.
+
+    Args:
+        config_class: Dataclass whose MRO docstrings are scanned.
+
+    Returns:
+        A dict from attribute name to its first sentence.
+    """
+    import re
+
+    docs: dict = {}
+    for klass in reversed(config_class.__mro__):
+        lines = (klass.__doc__ or "").splitlines()
+        in_attributes, name = False, None
+        for line in lines:
+            stripped = line.strip()
+            if stripped == "Attributes:":
+                in_attributes = True
+                continue
+            if not in_attributes:
+                continue
+            match = re.match(r"(\w+)\s*:\s*(.*)", stripped)
+            if match and len(line) - len(line.lstrip()) <= 8:
+                name = match.group(1)
+                docs[name] = match.group(2)
+            elif stripped and name is not None:
+                docs[name] += " " + stripped
+            elif not stripped and name is not None:
+                in_attributes = False
+    def plain(text: str) -> str:
+        text = re.sub(r":\w+:`~?([^`]+)`", r"\1", text)
+        return text.replace("``", "").split(". ")[0].rstrip(".")
+
+    return {name: plain(text) for name, text in docs.items()}
+
+
+def _config_options(config_class) -> list:
+    """
+    Describe the CLI options derived from a config dataclass.
+
+    Fields typed as ``int``, ``float``, ``str``, ``bool`` or an
+    :class:`enum.Enum` (optionally ``Optional[...]``) become options named
+    after the field, e.g. ``transfer_mode`` -> ``--transfer-mode``.  Other
+    fields can only be set programmatically.
+
+    Args:
+        config_class: :class:`RunConfig` subclass of the selected backend.
+
+    Returns:
+        A list of ``(field_name, value_type)`` pairs.
+    """
+    import dataclasses
+    import enum
+    import typing
+
+    try:
+        hints = typing.get_type_hints(config_class)
+    except Exception:
+        hints = {}
+
+    options = []
+    for f in dataclasses.fields(config_class):
+        value_type = hints.get(f.name)
+        if typing.get_origin(value_type) is typing.Union:
+            args = [arg for arg in typing.get_args(value_type) if arg is not type(None)]
+            value_type = args[0] if len(args) == 1 else None
+        supported = value_type in (int, float, str, bool) or (
+            isinstance(value_type, type) and issubclass(value_type, enum.Enum)
+        )
+        if supported and f.name not in _RESERVED:
+            options.append((f.name, value_type))
+    return options
+
+
+def _add_config_options(parser, backend: str, config_class) -> list:
+    """
+    Add one option per supported field of ``config_class``.
+
+    Args:
+        parser: Parser to extend.
+        backend: Backend name, used as the option group title.
+        config_class: :class:`RunConfig` subclass of the selected backend.
+
+    Returns:
+        The ``(field_name, value_type)`` pairs that were added.
+    """
+    import argparse
+    import dataclasses
+    import enum
+
+    options = _config_options(config_class)
+    defaults = {f.name: f.default for f in dataclasses.fields(config_class)}
+    docs = _attribute_help(config_class)
+    group = parser.add_argument_group(f"{backend} options")
+    for name, value_type in options:
+        f = next(f for f in dataclasses.fields(config_class) if f.name == name)
+        kwargs: dict = {"dest": name, "default": argparse.SUPPRESS}
+        if value_type is bool:
+            kwargs.update(type=_parse_bool, metavar="{true,false}")
+        elif issubclass(value_type, enum.Enum):
+            kwargs["choices"] = [member.name for member in value_type]
+        else:
+            kwargs["type"] = value_type
+        if "choices" in f.metadata:
+            kwargs["choices"] = list(f.metadata["choices"])
+        default = defaults[name]
+        text = docs.get(name, name.replace("_", " "))
+        if default is not dataclasses.MISSING:
+            text += f" (default: {default})"
+        group.add_argument("--" + name.replace("_", "-"), help=text, **kwargs)
+    return options
+
+
 def main():
     """
     Parse command-line arguments and execute the requested NetQMPI script.
 
-    The selected backend adapter is instantiated from the provided flags
-    and passed to :func:`simulate`.
+    ``netqmpi sweep`` and ``netqmpi run-many`` are handed over to
+    :mod:`~netqmpi.runtime.sweep`.  Otherwise the backend is chosen with
+    ``--backend NAME`` (or one of the legacy
+    ``--netqasm/--cunqa/--aer`` flags) from the backends known to
+    :mod:`~netqmpi.runtime.registry`.  Only that backend is imported; its
+    configuration dataclass contributes one option per field, and the
+    resulting executor is passed to :func:`simulate`.  ``--help`` without
+    ``--backend`` lists the backends without importing any of them, and
+    a backend whose simulator is not installed is only reported once a
+    run needs it.
+
+    Any ``--profile*`` option runs the script under a
+    :class:`~netqmpi.runtime.profiling.Profiler`; the per-phase table is
+    printed unless only file outputs were requested.  ``--trace PATH``
+    records the run's spans (see :mod:`~netqmpi.runtime.tracing`) and
+    writes them as Chrome trace-event JSON.
     """
-    
-    parser = argparse.ArgumentParser(description="Run a NetQMPI Python code.")
+    import argparse
+    import enum
+    import sys
+
+    if len(sys.argv) > 1 and sys.argv[1] in ("sweep", "run-many"):
+        from netqmpi.runtime.sweep import main as sweep_main
+
+        sys.exit(sweep_main(sys.argv[2:], prog=f"netqmpi {sys.argv[1]}"))
+
+    from netqmpi.runtime.registry import DEFAULT_BACKEND, available_backends, get_backend
+
+    backends = available_backends()
+
+    # First pass: find out which backend's options to offer.
+    selector = argparse.ArgumentParser(add_help=False)
+    _add_backend_arguments(selector, backends)
+    selected, _ = selector.parse_known_args()
+    backend = selected.backend or DEFAULT_BACKEND
+    spec = get_backend(backend)
+    help_requested = any(arg in ("-h", "--help") for arg in sys.argv[1:])
+    config_class, missing = None, None
+    if selected.backend is not None or not help_requested:
+        try:
+            config_class = spec.load_config_class()
+        except ImportError as exc:
+            missing = exc
+
+    if missing is not None:
+        epilog = f"Options of backend {backend!r} are not shown: {missing}"
+    elif config_class is None:
+        epilog = "Pass --backend NAME --help to list the options of a backend."
+    else:
+        epilog = None
+    parser = argparse.ArgumentParser(description="Run a NetQMPI Python code.", epilog=epilog)
     
     parser.add_argument(
         "-n", "--num-procs", 
@@ -64,61 +337,66 @@ def main():
     
     parser.add_argument("script", type=str, help="Path to the NetQMPI Python script to be executed")
 
-    backend_group = parser.add_mutually_exclusive_group()
-    backend_group.add_argument("--netqasm", action="store_true", help="Use NetQASM backend")
-    backend_group.add_argument("--cunqa", action="store_true", help="Use CUNQA backend")
-    backend_group.add_argument("--aer", action="store_true", help="Use Qiskit AerSimulator backend")
-
-    parser.add_argument(
-        "--transfer-mode",
-        choices=["swap", "teleport"],
-        default="swap",
-        help="Qubit transfer mode for the Aer backend: 'swap' (default) or 'teleport'",
-    )
-
-    parser.add_argument(
-        "--shots", 
-        type=int, 
-        help="Number of shots"
-    )
+    _add_backend_arguments(parser, backends)
+    _add_profile_arguments(parser)
+    options = [] if config_class is None else _add_config_options(parser, backend, config_class)
 
     # TODO: Turn ON and OFF the timer
-    # TODO: Get specific configurations
 
     args = parser.parse_args()
 
+    if missing is not None:
+        parser.error(f"backend {backend!r} is not available: {missing}")
+
     if args.num_procs < 1:
         parser.error("Number of processes must be at least 1")
-    
-    if args.netqasm:
-        from netqmpi.runtime.adapters.netqasm import NetQASMExecutorAdapter, NetQASMRunConfig
-
-        config = NetQASMRunConfig(shots=(args.shots or 1))
-        executor = NetQASMExecutorAdapter(args.num_procs, config=config)
-    elif args.cunqa:
-        from netqmpi.runtime.adapters.cunqa import CunqaExecutorAdapter, CunqaRunConfig
-
-        config = CunqaRunConfig(shots=(args.shots or 1024))
-        executor = CunqaExecutorAdapter(args.num_procs, config=config)
-    elif args.aer:
-        from netqmpi.runtime.adapters.aer import AerExecutorAdapter, AerSimulatorConfig
-
-        config = AerSimulatorConfig(
-            shots=(args.shots or 1024),
-            transfer_mode=args.transfer_mode,
-        )
-        executor = AerExecutorAdapter(args.num_procs, config=config)
-    else:
-        from netqmpi.runtime.adapters.netqasm import NetQASMExecutorAdapter, NetQASMRunConfig
 
-        print("No backend flag; using default (NetQASM)")
-        executor = NetQASMExecutorAdapter(args.num_procs)    
-    
+    if args.backend is None:
+        print(f"No backend flag; using default ({backend})")
+
+    values = {}
+    for name, value_type in options:
+        if hasattr(args, name):
+            value = getattr(args, name)
+            if isinstance(value_type, type) and issubclass(value_type, enum.Enum):
+                value = value_type[value]
+            values[name] = value
+
+    executor = spec.load()(args.num_procs, config=config_class(**values))
+
+    profiler = None
+    if args.profile or args.profile_json or args.profile_memory or args.profile_stats:
+        from netqmpi.runtime.profiling import Profiler
+
+        profiler = Profiler(memory=args.profile_memory, cprofile=args.profile_stats is not None)
+
+    tracer = None
+    if args.trace:
+        from netqmpi.runtime.tracing import Tracer
+
+        tracer = Tracer()
+
     simulate(
         script=args.script,
         num_procs=args.num_procs,
-        executor=executor
+        executor=executor,
+        profiler=profiler,
+        tracer=tracer,
     )
 
+    if tracer is not None:
+        tracer.dump(args.trace)
+
+    if profiler is not None:
+        if args.profile or not (args.profile_json or args.profile_stats):
+            print(profiler.report())
+        if args.profile_json:
+            import json
+
+            with open(args.profile_json, "w") as f:
+                json.dump(profiler.to_dict(), f, indent=2)
+        if args.profile_stats:
+            profiler.dump_stats(args.profile_stats)
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -11,8 +11,9 @@ packages such as ``netqasm`` or ``cunqa`` must not appear here.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional, Type
 
+from netqmpi.runtime import profiling
 from netqmpi.runtime.run_config import RunConfig
 from netqmpi.sdk.circuit import Circuit
 
@@ -34,8 +35,15 @@ class Executor(ABC):
     Attributes:
         size: Number of nodes or resources managed by the executor.
         config: Backend-specific configuration dictionary.
+        config_class: :class:`RunConfig` subclass accepted by this
+            executor; the CLI derives its backend options from its fields.
+        results: Outcome of every rank in the last :meth:`run`, keyed by
+            rank: ``{"results": comm.results, "return": main() value,
+            "network": comm.network_stats}``.
     """
 
+    config_class: Type[RunConfig] = RunConfig
+
     def __init__(self, size: int, config: RunConfig) -> None:
         """
         Initialize the executor.
@@ -46,6 +54,7 @@ class Executor(ABC):
         """
         self._size = size
         self._config = config
+        self.results: Dict[int, Dict[str, Any]] = {}
 
     # ------------------------------------------------------------------
     # Properties
@@ -71,6 +80,44 @@ class Executor(ABC):
         """
         return self._config
 
+    @config.setter
+    def config(self, config: RunConfig) -> None:
+        """
+        Replace the configuration used by subsequent runs.
+
+        Lets a warm executor be reused across runs with different
+        settings, e.g. by ``netqmpi sweep``.
+
+        Args:
+            config: New backend-specific configuration.
+        """
+        self._config = config
+
+    # ------------------------------------------------------------------
+    # Helpers for adapters
+    # ------------------------------------------------------------------
+
+    def _run_main(self, main_func: Any, env: Any) -> Any:
+        """
+        Call a rank's ``main()`` and record its outcome in :attr:`results`.
+
+        The call is measured as the rank's ``main`` phase when a
+        :class:`~netqmpi.runtime.profiling.Profiler` is active.
+
+        Args:
+            main_func: User entry-point function.
+            env: Environment injected into ``main_func``.
+
+        Returns:
+            The value returned by ``main_func``.
+        """
+        with profiling.phase("main", env.comm.rank), profiling.rank_profile():
+            value = main_func(env=env)
+        self.results[env.comm.rank] = {
+            "results": env.comm.results, "return": value, "network": env.comm.network_stats,
+        }
+        return value
+
     # ------------------------------------------------------------------
     # Abstract interface
     # ------------------------------------------------------------------
@@ -0,0 +1,449 @@
+"""
+Per-phase profiling of NetQMPI runs.
+
+A :class:`Profiler` measures wall-clock time, CPU time and, optionally,
+peak traced memory of the phases of a run:
+
+* ``load``: loading the script (:func:`~netqmpi.helpers.load_main`).
+* ``main``: one rank's ``main()`` call, end to end.
+* ``build``: one rank recording its circuit operations inside
+  ``with env.comm:``.
+* ``layout``: planning where every rank's circuits land in the global
+  program (monolithic backends).
+* ``translate``: one rank translating its circuits for the backend.
+* ``submit``: assembling the backend program and handing it over.
+* ``simulate``: waiting for the backend to produce results.
+* ``distribute``: handing the results back to the ranks.
+* ``total``: the whole profiled run.
+
+Phases nest (``main`` contains ``build``, for instance), so the rows do
+not add up to ``total``.  Adapters mark phases with :func:`phase` (or
+:func:`begin`/:func:`end` when a phase starts and ends in different
+methods); these are no-ops unless a profiler or a
+:class:`~netqmpi.runtime.tracing.Tracer` is active, so instrumentation
+costs two global lookups when both are off.  With a tracer, every phase
+also becomes a span of category ``phase``.  Typical use::
+
+    profiler = Profiler(memory=True, cprofile=True)
+    with profiler:
+        executor.run(executor.build_apps(script, size))
+    print(profiler.report())
+    profiler.dump_stats("run.prof")
+"""
+from __future__ import annotations
+
+import contextlib
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, ContextManager, Dict, Iterator, List, Optional, Tuple
+
+from netqmpi.runtime import tracing
+
+PHASES = (
+    "load", "main", "build", "layout", "translate", "submit", "simulate", "distribute", "total",
+)
+
+_NULL = contextlib.nullcontext()
+
+# Profiler receiving the phases of the current run, if any.
+_active: Optional["Profiler"] = None
+
+
+@dataclass
+class PhaseRecord:
+    """
+    One measured phase.
+
+    Attributes:
+        phase: Phase name, one of :data:`PHASES`.
+        rank: Rank the phase belongs to, or ``None`` for global phases.
+        wall: Wall-clock seconds.
+        cpu: CPU seconds of the calling thread for rank phases, of the
+            whole process for global phases (so simulator worker threads
+            are included).
+        peak: Peak traced Python memory in bytes while the phase ran, if
+            memory tracing is on.  Overlapping phases share one peak, so
+            this is an upper bound for each of them.
+    """
+
+    phase: str
+    rank: Optional[int]
+    wall: float
+    cpu: float
+    peak: Optional[int] = None
+
+
+class _Stats:
+    """Adapter letting :mod:`pstats` load a raw stats dict from a worker."""
+
+    def __init__(self, stats: dict) -> None:
+        self.stats = stats
+
+    def create_stats(self) -> None:
+        pass
+
+
+class Profiler:
+    """
+    Collects :class:`PhaseRecord` entries for one or more runs.
+
+    Use it as a context manager (or call :meth:`start`/:meth:`stop`)
+    around the run; only one profiler can be active at a time.
+
+    Args:
+        memory: Trace Python allocations with :mod:`tracemalloc` and
+            record peak memory per phase.  Native allocations of the
+            simulators are not seen.
+        cprofile: Run :mod:`cProfile` in every rank's ``main()`` so the
+            profiles can be merged with :meth:`dump_stats`.
+    """
+
+    def __init__(self, memory: bool = False, cprofile: bool = False) -> None:
+        self.memory = memory
+        self.cprofile = cprofile
+        self.records: List[PhaseRecord] = []
+        self._profiles: List[Any] = []
+        self._open: Dict[Tuple[str, Optional[int]], Tuple[float, float, bool]] = {}
+        self._running = 0
+        self._lock = threading.Lock()
+        self._started_tracemalloc = False
+        self._total: Optional[Tuple[float, float, bool]] = None
+
+    # ------------------------------------------------------------------
+    # Activation
+    # ------------------------------------------------------------------
+
+    def start(self) -> "Profiler":
+        """
+        Make this the active profiler and start the ``total`` phase.
+
+        Returns:
+            The profiler.
+
+        Raises:
+            RuntimeError: If another profiler is already active.
+        """
+        global _active
+        if _active is not None and _active is not self:
+            raise RuntimeError("Another profiler is already active.")
+        if self.memory:
+            import tracemalloc
+
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracemalloc = True
+        _active = self
+        # Not counted as a running phase, so per-phase peaks still reset.
+        self._total = (time.perf_counter(), time.process_time(), False)
+        return self
+
+    def stop(self) -> None:
+        """Record the ``total`` phase and deactivate the profiler."""
+        global _active
+        if self._total is not None:
+            self._record("total", None, self._total)
+            self._total = None
+            if self.memory:
+                peaks = [record.peak for record in self.records if record.peak is not None]
+                self.records[-1].peak = max(peaks, default=None)
+        if _active is self:
+            _active = None
+        if self._started_tracemalloc:
+            import tracemalloc
+
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def __enter__(self) -> "Profiler":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+    # ------------------------------------------------------------------
+    # Measurement
+    # ------------------------------------------------------------------
+
+    def _stamp(self, rank: Optional[int]) -> Tuple[float, float, bool]:
+        """Take the start stamp of a phase."""
+        cpu = time.thread_time() if rank is not None else time.process_time()
+        if self.memory:
+            with self._lock:
+                self._running += 1
+                if self._running == 1:
+                    import tracemalloc
+
+                    tracemalloc.reset_peak()
+        return time.perf_counter(), cpu, self.memory
+
+    def _record(self, name: str, rank: Optional[int], stamp: Tuple[float, float, bool]) -> None:
+        """Close a phase opened with :meth:`_stamp`."""
+        wall_start, cpu_start, traced = stamp
+        wall = time.perf_counter() - wall_start
+        cpu = (time.thread_time() if rank is not None else time.process_time()) - cpu_start
+        peak = None
+        if traced:
+            import tracemalloc
+
+            peak = tracemalloc.get_traced_memory()[1]
+            with self._lock:
+                self._running -= 1
+        self.records.append(PhaseRecord(name, rank, wall, cpu, peak))
+
+    @contextlib.contextmanager
+    def phase(self, name: str, rank: Optional[int] = None) -> Iterator[None]:
+        """
+        Measure the enclosed block as phase ``name``.
+
+        Args:
+            name: Phase name.
+            rank: Rank the phase belongs to, or ``None``.
+        """
+        stamp = self._stamp(rank)
+        try:
+            yield
+        finally:
+            self._record(name, rank, stamp)
+
+    def begin(self, name: str, rank: Optional[int] = None) -> None:
+        """
+        Open phase ``name`` of ``rank``; close it with :meth:`end`.
+
+        Args:
+            name: Phase name.
+            rank: Rank the phase belongs to, or ``None``.
+        """
+        stamp = self._stamp(rank)
+        with self._lock:
+            self._open[name, rank] = stamp
+
+    def end(self, name: str, rank: Optional[int] = None) -> None:
+        """
+        Close phase ``name`` of ``rank`` if it is open.
+
+        Args:
+            name: Phase name.
+            rank: Rank the phase belongs to, or ``None``.
+        """
+        with self._lock:
+            stamp = self._open.pop((name, rank), None)
+        if stamp is not None:
+            self._record(name, rank, stamp)
+
+    @contextlib.contextmanager
+    def rank_profile(self) -> Iterator[None]:
+        """Run :mod:`cProfile` in the calling thread for the enclosed block."""
+        if not self.cprofile:
+            yield
+            return
+        import cProfile
+
+        profile = cProfile.Profile()
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            with self._lock:
+                self._profiles.append(profile)
+
+    # ------------------------------------------------------------------
+    # Worker processes
+    # ------------------------------------------------------------------
+
+    def options(self) -> Dict[str, bool]:
+        """
+        Return the constructor arguments, for profilers in worker processes.
+
+        Returns:
+            ``{"memory": ..., "cprofile": ...}``.
+        """
+        return {"memory": self.memory, "cprofile": self.cprofile}
+
+    def export(self) -> Dict[str, Any]:
+        """
+        Return the measurements in a picklable form for :meth:`absorb`.
+
+        Returns:
+            A dict with the phase records and the raw cProfile stats.
+        """
+        stats = []
+        for profile in self._profiles:
+            profile.create_stats()
+            stats.append(profile.stats)
+        return {"records": [asdict(record) for record in self.records], "stats": stats}
+
+    def absorb(self, exported: Dict[str, Any]) -> None:
+        """
+        Add measurements exported by a profiler in another process.
+
+        The other profiler's ``total`` phase is dropped; this profiler
+        keeps its own.
+
+        Args:
+            exported: Value returned by :meth:`export`.
+        """
+        self.records.extend(
+            PhaseRecord(**record) for record in exported["records"] if record["phase"] != "total"
+        )
+        self._profiles.extend(_Stats(stats) for stats in exported["stats"])
+
+    # ------------------------------------------------------------------
+    # Reporting
+    # ------------------------------------------------------------------
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """
+        Aggregate the records per phase and rank.
+
+        Returns:
+            One row per ``(phase, rank)`` in :data:`PHASES` order, with
+            ``calls``, total and maximum ``wall``, total ``cpu`` and the
+            largest ``peak``.
+        """
+        rows: Dict[Tuple[str, Optional[int]], Dict[str, Any]] = {}
+        for record in self.records:
+            row = rows.setdefault((record.phase, record.rank), {
+                "phase": record.phase, "rank": record.rank, "calls": 0,
+                "wall": 0.0, "wall_max": 0.0, "cpu": 0.0, "peak": None,
+            })
+            row["calls"] += 1
+            row["wall"] += record.wall
+            row["wall_max"] = max(row["wall_max"], record.wall)
+            row["cpu"] += record.cpu
+            if record.peak is not None:
+                row["peak"] = max(row["peak"] or 0, record.peak)
+
+        def order(key: Tuple[str, Optional[int]]) -> Tuple[int, str, int]:
+            name, rank = key
+            index = PHASES.index(name) if name in PHASES else len(PHASES)
+            return index, name, -1 if rank is None else rank
+
+        return [rows[key] for key in sorted(rows, key=order)]
+
+    def report(self) -> str:
+        """
+        Format :meth:`summary` as a text table.
+
+        Returns:
+            The table, one line per row.
+        """
+        header = f"{'phase':<11} {'rank':>4} {'calls':>5} {'wall s':>10} {'max s':>10} {'cpu s':>10} {'peak MiB':>9}"
+        lines = [header, "-" * len(header)]
+        for row in self.summary():
+            rank = "-" if row["rank"] is None else row["rank"]
+            peak = "-" if row["peak"] is None else f"{row['peak'] / 2 ** 20:.1f}"
+            lines.append(
+                f"{row['phase']:<11} {rank:>4} {row['calls']:>5} {row['wall']:>10.4f} "
+                f"{row['wall_max']:>10.4f} {row['cpu']:>10.4f} {peak:>9}"
+            )
+        return "\n".join(lines)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Return the summary and the raw records as JSON-serialisable data.
+
+        Returns:
+            ``{"summary": [...], "records": [...]}``.
+        """
+        return {
+            "summary": self.summary(),
+            "records": [asdict(record) for record in self.records],
+        }
+
+    def dump_stats(self, path: str) -> None:
+        """
+        Merge the per-rank cProfile data into one :mod:`pstats` file.
+
+        Args:
+            path: Output file, readable with ``python -m pstats``.
+
+        Raises:
+            RuntimeError: If no rank was profiled.
+        """
+        import pstats
+
+        if not self._profiles:
+            raise RuntimeError("No cProfile data; create the profiler with cprofile=True.")
+        stats = pstats.Stats(*self._profiles)
+        stats.dump_stats(path)
+
+
+# ----------------------------------------------------------------------
+# Instrumentation hooks
+# ----------------------------------------------------------------------
+
+def active() -> Optional[Profiler]:
+    """
+    Return the active profiler.
+
+    Returns:
+        The active :class:`Profiler`, or ``None``.
+    """
+    return _active
+
+
+@contextlib.contextmanager
+def _both(first: ContextManager[None], second: ContextManager[None]) -> Iterator[None]:
+    """Enter two context managers as one."""
+    with first, second:
+        yield
+
+
+def phase(name: str, rank: Optional[int] = None) -> ContextManager[None]:
+    """
+    Measure the enclosed block on the active profiler and tracer, if any.
+
+    Args:
+        name: Phase name.
+        rank: Rank the phase belongs to, or ``None``.
+
+    Returns:
+        A context manager.
+    """
+    profiler = _active
+    tracer = tracing.active()
+    if tracer is None:
+        return _NULL if profiler is None else profiler.phase(name, rank)
+    span = tracer.span(name, "phase", rank=rank)
+    return span if profiler is None else _both(profiler.phase(name, rank), span)
+
+
+def begin(name: str, rank: Optional[int] = None) -> None:
+    """
+    Open a phase on the active profiler and tracer, if any.
+
+    Args:
+        name: Phase name.
+        rank: Rank the phase belongs to, or ``None``.
+    """
+    profiler = _active
+    if profiler is not None:
+        profiler.begin(name, rank)
+    tracing.begin(name, "phase", rank=rank)
+
+
+def end(name: str, rank: Optional[int] = None) -> None:
+    """
+    Close a phase opened with :func:`begin`, if any.
+
+    Args:
+        name: Phase name.
+        rank: Rank the phase belongs to, or ``None``.
+    """
+    profiler = _active
+    if profiler is not None:
+        profiler.end(name, rank)
+    tracing.end(name, rank)
+
+
+def rank_profile() -> ContextManager[None]:
+    """
+    Run :mod:`cProfile` for the enclosed rank code if requested.
+
+    Returns:
+        A context manager.
+    """
+    profiler = _active
+    return _NULL if profiler is None else profiler.rank_profile()
@@ -0,0 +1,208 @@
+"""
+Registry of runtime backends.
+
+Maps backend names to lazily loaded :class:`~netqmpi.runtime.executor.Executor`
+classes.  The built-in adapters are always available; third-party
+packages can add their own by declaring an entry point in the
+``netqmpi.backends`` group that points at their executor class::
+
+    entry_points={
+        'netqmpi.backends': [
+            'mybackend = my_package.executor:MyExecutor',
+        ],
+    }
+
+Nothing is imported until a backend is actually loaded, and then only
+that backend.  Each executor names its configuration dataclass through
+:attr:`Executor.config_class`.
+"""
+from __future__ import annotations
+
+import importlib
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Optional, Type
+
+if TYPE_CHECKING:
+    from netqmpi.runtime.executor import Executor
+    from netqmpi.runtime.run_config import RunConfig
+
+ENTRY_POINT_GROUP = "netqmpi.backends"
+DEFAULT_BACKEND = "netqasm"
+
+
+@dataclass(frozen=True)
+class BackendSpec:
+    """
+    Lazily loadable description of a backend.
+
+    Attributes:
+        name: Backend name used by ``--backend``.
+        target: ``"module:ExecutorClass"`` import path of the executor.
+        description: One-line description shown by the CLI.
+    """
+
+    name: str
+    target: str
+    description: str = ""
+
+    def load(self) -> Type["Executor"]:
+        """
+        Import and return the executor class.
+
+        Returns:
+            The :class:`Executor` subclass implementing this backend.
+
+        Raises:
+            TypeError: If the target is not an :class:`Executor` subclass.
+        """
+        from netqmpi.runtime.executor import Executor
+
+        module_name, _, attr = self.target.partition(":")
+        executor_class = getattr(importlib.import_module(module_name), attr)
+        if not (isinstance(executor_class, type) and issubclass(executor_class, Executor)):
+            raise TypeError(
+                f"Backend {self.name!r} target {self.target!r} is not an Executor subclass."
+            )
+        return executor_class
+
+    def load_config_class(self) -> Type["RunConfig"]:
+        """
+        Return the configuration dataclass of this backend.
+
+        Returns:
+            The executor's :attr:`~Executor.config_class`.
+        """
+        return self.load().config_class
+
+
+_BUILTINS: Dict[str, BackendSpec] = {
+    spec.name: spec
+    for spec in (
+        BackendSpec(
+            "netqasm",
+            "netqmpi.runtime.adapters.netqasm.netqasm_executor:NetQASMExecutorAdapter",
+            "NetQASM network simulator",
+        ),
+        BackendSpec(
+            "cunqa",
+            "netqmpi.runtime.adapters.cunqa.cunqa_executor:CunqaExecutorAdapter",
+            "CUNQA QPUs",
+        ),
+        BackendSpec(
+            "aer",
+            "netqmpi.runtime.adapters.aer.aer_executor:AerExecutorAdapter",
+            "Qiskit AerSimulator on one monolithic circuit",
+        ),
+        BackendSpec(
+            "numpy",
+            "netqmpi.runtime.adapters.numpy.numpy_executor:NumpyExecutorAdapter",
+            "NumPy statevector on one monolithic program (no external simulator)",
+        ),
+        BackendSpec(
+            "stabilizer",
+            "netqmpi.runtime.adapters.stabilizer.stabilizer_executor:StabilizerExecutorAdapter",
+            "Stabilizer tableau for Clifford programs (scales to thousands of ranks)",
+        ),
+        BackendSpec(
+            "mps",
+            "netqmpi.runtime.adapters.mps.mps_executor:MPSExecutorAdapter",
+            "Matrix product state ordered by rank (long chains of ranks)",
+        ),
+        BackendSpec(
+            "sharded",
+            "netqmpi.runtime.adapters.sharded.sharded_executor:ShardedExecutorAdapter",
+            "Statevector sharded across local processes (30+ qubits)",
+        ),
+        BackendSpec(
+            "sparse",
+            "netqmpi.runtime.adapters.sparse.sparse_executor:SparseExecutorAdapter",
+            "Sparse statevector for states with few non-zero amplitudes",
+        ),
+        BackendSpec(
+            "bitvector",
+            "netqmpi.runtime.adapters.bitvector.bitvector_executor:BitVectorExecutorAdapter",
+            "Bit vector for reversible classical programs (thousands of qubits)",
+        ),
+    )
+}
+
+_backends: Optional[Dict[str, BackendSpec]] = None
+
+
+def _entry_points():
+    """Return the installed entry points of :data:`ENTRY_POINT_GROUP`."""
+    from importlib import metadata
+
+    eps = metadata.entry_points()
+    if hasattr(eps, "select"):
+        return eps.select(group=ENTRY_POINT_GROUP)
+    return eps.get(ENTRY_POINT_GROUP, [])  # Python < 3.10
+
+
+def available_backends() -> Dict[str, BackendSpec]:
+    """
+    Return every known backend, built-ins first.
+
+    Entry points are scanned once per process.  A plugin may not shadow
+    a built-in name.
+
+    Returns:
+        A dict from backend name to :class:`BackendSpec`.
+    """
+    global _backends
+    if _backends is None:
+        backends = dict(_BUILTINS)
+        for ep in _entry_points():
+            if ep.name not in backends:
+                backends[ep.name] = BackendSpec(ep.name, ep.value, f"plugin ({ep.value})")
+        _backends = backends
+    return _backends
+
+
+def register_backend(name: str, target: str, description: str = "") -> None:
+    """
+    Register a backend at runtime, e.g. from a test or a notebook.
+
+    Args:
+        name: Backend name.
+        target: ``"module:ExecutorClass"`` import path of the executor.
+        description: One-line description.
+    """
+    available_backends()[name] = BackendSpec(name, target, description)
+
+
+def get_backend(name: str) -> BackendSpec:
+    """
+    Look up a backend by name.
+
+    Args:
+        name: Backend name.
+
+    Returns:
+        The matching :class:`BackendSpec`.
+
+    Raises:
+        ValueError: If no backend with that name is known.
+    """
+    backends = available_backends()
+    if name not in backends:
+        raise ValueError(
+            f"Unknown backend {name!r}; available: {', '.join(sorted(backends))}."
+        )
+    return backends[name]
+
+
+def create_executor(name: str, size: int, config: Optional["RunConfig"] = None) -> "Executor":
+    """
+    Instantiate the executor of a backend.
+
+    Args:
+        name: Backend name.
+        size: Number of ranks.
+        config: Backend configuration.  If ``None``, the backend's
+            defaults are used.
+
+    Returns:
+        The executor instance.
+    """
+    return get_backend(name).load()(size, config=config)
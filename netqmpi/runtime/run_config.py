@@ -10,7 +10,8 @@ fields required by their simulator or hardware.
 """
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
 
 @dataclass
 class RunConfig:
@@ -24,5 +25,13 @@ class RunConfig:
     Attributes:
         name: Name of the app running.
         shots: Number of times the simulation is repeated.
+        params: User parameters of the run, available to the script as
+            :attr:`Environment.params <netqmpi.sdk.environment.Environment.params>`.
+        topology: Quantum links between the ranks, as parsed by
+            :meth:`Topology.parse <netqmpi.sdk.topology.Topology.parse>`:
+            ``full``, ``line``, ``ring``, ``star``, ``grid:RxC`` or links
+            such as ``0-1,1-2:2.5``.  ``None`` is a full mesh.
     """
-    shots: int = 1024
\ No newline at end of file
+    shots: int = 1024
+    params: Dict[str, Any] = field(default_factory=dict)
+    topology: Optional[str] = None
\ No newline at end of file
@@ -0,0 +1,256 @@
+"""
+Run many NetQMPI jobs in one process.
+
+``netqmpi sweep JOBS.jsonl`` (alias ``netqmpi run-many``) reads one JSON
+object per line and runs every job without paying interpreter start-up,
+backend import and executor construction again for each of them:
+executors are kept per ``(backend, num_procs)`` and reconfigured between
+jobs, and scripts are loaded once per file version by
+:func:`~netqmpi.helpers.load_main`.  With ``--workers K`` the jobs are
+fanned out over ``K`` local worker processes, each keeping its own warm
+executors.
+
+Job keys:
+
+* ``script`` (required): path to the NetQMPI script.
+* ``num_procs`` (or ``n``, required): number of ranks.
+* ``backend``: backend name; defaults to ``--backend``.
+* ``id``: label copied to the result; defaults to the job index.
+* ``params``: dict exposed to the script as ``env.params``.
+* ``seed``: shorthand for the backend's seed field (``seed`` or
+  ``seed_simulator``).
+* any other key must be a field of the backend's config dataclass,
+  e.g. ``shots`` or ``transfer_mode``.
+
+Every job produces one JSON line, streamed as soon as the job finishes::
+
+    {"id": ..., "index": 3, "backend": "aer", "num_procs": 4,
+     "results": [<comm.results per rank>], "returns": [<main() per rank>],
+     "error": null, "elapsed": 0.012}
+
+Output written by the scripts themselves goes to stderr so that stdout
+stays valid JSONL.
+"""
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import json
+import os
+import sys
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from netqmpi.runtime.executor import Executor
+from netqmpi.runtime.run_config import RunConfig
+from netqmpi.runtime.registry import DEFAULT_BACKEND, get_backend
+
+# Job keys that are not config fields.
+_JOB_KEYS = {"id", "script", "num_procs", "n", "backend", "params", "seed"}
+
+# Warm executors of this process, keyed by (backend, num_procs).
+_EXECUTORS: Dict[Tuple[str, int], Executor] = {}
+
+
+def load_jobs(path: str) -> List[Dict[str, Any]]:
+    """
+    Read a JSONL job list.
+
+    Blank lines and lines starting with ``#`` are ignored.
+
+    Args:
+        path: Path to the job file, or ``-`` for stdin.
+
+    Returns:
+        The jobs in file order.
+
+    Raises:
+        ValueError: If a line is not a JSON object.
+    """
+    stream = sys.stdin if path == "-" else open(path)
+    jobs = []
+    with contextlib.ExitStack() as stack:
+        if stream is not sys.stdin:
+            stack.enter_context(stream)
+        for lineno, line in enumerate(stream, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            job = json.loads(line)
+            if not isinstance(job, dict):
+                raise ValueError(f"{path}:{lineno}: a job must be a JSON object")
+            jobs.append(job)
+    return jobs
+
+
+def _make_config(config_class: type, job: Dict[str, Any]) -> RunConfig:
+    """
+    Build the run configuration of a job.
+
+    Args:
+        config_class: Config dataclass of the job's backend.
+        job: Job description.
+
+    Returns:
+        The configuration instance.
+
+    Raises:
+        ValueError: If the job sets options the backend does not have.
+    """
+    fields = {f.name for f in dataclasses.fields(config_class)}
+    values = {key: value for key, value in job.items() if key not in _JOB_KEYS}
+    unknown = sorted(set(values) - fields)
+    if unknown:
+        raise ValueError(f"Unknown options for {config_class.__name__}: {', '.join(unknown)}")
+
+    if "seed" in job:
+        seed_field = next((name for name in ("seed", "seed_simulator") if name in fields), None)
+        if seed_field is None:
+            raise ValueError(f"{config_class.__name__} has no seed option")
+        values[seed_field] = job["seed"]
+    values["params"] = dict(job.get("params") or {})
+    return config_class(**values)
+
+
+def run_job(index: int, job: Dict[str, Any], backend: str = DEFAULT_BACKEND) -> Dict[str, Any]:
+    """
+    Run one job on a warm executor and describe its outcome.
+
+    Failures are reported in the record instead of being raised, so one
+    bad job does not stop a sweep.
+
+    Args:
+        index: Position of the job in the job list.
+        job: Job description.
+        backend: Backend used when the job does not name one.
+
+    Returns:
+        The JSON-serialisable result record.
+    """
+    record: Dict[str, Any] = {"id": job.get("id", index), "index": index}
+    start = time.perf_counter()
+    try:
+        backend = job.get("backend", backend)
+        num_procs = int(job["num_procs"] if "num_procs" in job else job["n"])
+        spec = get_backend(backend)
+        config = _make_config(spec.load_config_class(), job)
+        record.update(backend=backend, num_procs=num_procs)
+
+        executor = _EXECUTORS.get((backend, num_procs))
+        if executor is None:
+            executor = _EXECUTORS[backend, num_procs] = spec.load()(num_procs, config=config)
+        else:
+            executor.config = config
+
+        executor.run(executor.build_apps(job["script"], num_procs))
+
+        outcomes = [executor.results.get(rank) or {} for rank in range(num_procs)]
+        record["results"] = [outcome.get("results") for outcome in outcomes]
+        record["returns"] = [outcome.get("return") for outcome in outcomes]
+        record["error"] = None
+    except Exception as exc:
+        record["error"] = f"{type(exc).__name__}: {exc}"
+    record["elapsed"] = round(time.perf_counter() - start, 6)
+    return record
+
+
+def _init_worker() -> None:
+    """Send script output of pool workers to stderr."""
+    sys.stdout = sys.stderr
+
+
+def run_jobs(
+    jobs: Iterable[Dict[str, Any]],
+    backend: str = DEFAULT_BACKEND,
+    workers: int = 1,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Run jobs and yield their result records as they finish.
+
+    Args:
+        jobs: Job descriptions.
+        backend: Backend used by jobs that do not name one.
+        workers: Number of local worker processes.  ``1`` runs every
+            job in the current process, in order.
+
+    Yields:
+        One record per job; with several workers, in completion order.
+    """
+    if workers <= 1:
+        for index, job in enumerate(jobs):
+            yield run_job(index, job, backend)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        futures = [pool.submit(run_job, index, job, backend) for index, job in enumerate(jobs)]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def main(argv: Optional[List[str]] = None, prog: str = "netqmpi sweep") -> int:
+    """
+    Command-line entry point of ``netqmpi sweep`` / ``netqmpi run-many``.
+
+    Args:
+        argv: Arguments after the sub-command name.
+        prog: Program name shown in usage messages.
+
+    Returns:
+        ``0`` if every job succeeded, ``1`` otherwise.
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog=prog, description="Run a JSONL list of NetQMPI jobs in one process.",
+    )
+    parser.add_argument("jobs", help="JSONL job file, or '-' for stdin")
+    parser.add_argument(
+        "--backend", default=DEFAULT_BACKEND,
+        help=f"Backend for jobs that do not name one (default: {DEFAULT_BACKEND})",
+    )
+    parser.add_argument(
+        "-j", "--workers", type=int, default=1,
+        help="Local worker processes to fan jobs out over (default: 1)",
+    )
+    parser.add_argument("-o", "--output", help="Write results here instead of stdout")
+    args = parser.parse_args(argv)
+
+    jobs = load_jobs(args.jobs)
+    failed = 0
+    with contextlib.ExitStack() as stack:
+        out = stack.enter_context(open(args.output, "w") if args.output else _claim_stdout())
+        stack.enter_context(contextlib.redirect_stdout(sys.stderr))
+        for record in run_jobs(jobs, args.backend, args.workers):
+            failed += record["error"] is not None
+            out.write(json.dumps(record, default=repr) + "\n")
+            out.flush()
+    return 1 if failed else 0
+
+
+@contextlib.contextmanager
+def _claim_stdout() -> Iterator[Any]:
+    """
+    Reserve the real stdout for result records.
+
+    File descriptor 1 is pointed at stderr for the duration, so output of
+    child processes (pool workers, process rank runners) cannot end up
+    among the records either.
+
+    Yields:
+        A text stream writing to the original stdout.
+    """
+    sys.stdout.flush()
+    try:
+        saved = os.dup(1)
+    except (AttributeError, OSError, ValueError):
+        yield sys.stdout
+        return
+    os.dup2(2, 1)
+    try:
+        with os.fdopen(os.dup(saved), "w") as out:
+            yield out
+    finally:
+        os.dup2(saved, 1)
+        os.close(saved)
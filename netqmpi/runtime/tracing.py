@@ -0,0 +1,352 @@
+"""
+Structured tracing of NetQMPI runs.
+
+A :class:`Tracer` records *spans* (named intervals with a rank, the
+thread they ran on and free-form arguments such as the op type or peer
+rank) and exports them as Chrome trace-event JSON, which
+``chrome://tracing`` and https://ui.perfetto.dev show as one timeline
+per process and thread::
+
+    tracer = Tracer()
+    with tracer:
+        executor.run(executor.build_apps(script, size))
+    tracer.dump("run.trace.json")
+
+Adapters mark spans with :func:`span` (or :func:`begin`/:func:`end`);
+these do nothing unless a tracer is active.  Hot paths should fetch
+:func:`active` once and skip instrumentation entirely when it is
+``None``.  Timestamps come from the system-wide monotonic clock, so
+spans recorded in worker processes line up with the coordinator's once
+merged with :meth:`Tracer.absorb`.
+"""
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, ContextManager, Dict, List, Optional, Tuple
+
+_NULL_ARGS: Dict[str, Any] = {}
+
+# Tracer receiving the spans of the current run, if any.
+_active: Optional["Tracer"] = None
+
+
+class _NullSpan:
+    """Reusable no-op context manager returned when tracing is off."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        return None
+
+
+_NULL = _NullSpan()
+
+
+class _Span:
+    """Context manager recording one complete event on a tracer."""
+
+    __slots__ = ("_tracer", "_name", "_cat", "_args", "_start")
+
+    def __init__(self, tracer: "Tracer", name: str, cat: str, args: Dict[str, Any]) -> None:
+        self._tracer = tracer
+        self._name = name
+        self._cat = cat
+        self._args = args
+
+    def __enter__(self) -> None:
+        self._start = time.perf_counter_ns()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        args = self._args
+        if exc_type is not None:
+            args = dict(args, error=exc_type.__name__)
+        self._tracer._emit(self._name, self._cat, self._start, time.perf_counter_ns(), args)
+
+
+class Tracer:
+    """
+    Collects spans and exports them as Chrome trace-event JSON.
+
+    Only one tracer can be active at a time.  Appending an event is a
+    single list append, so spans may be recorded from any thread.
+
+    Args:
+        process_name: Label of this process in the timeline.
+    """
+
+    def __init__(self, process_name: str = "netqmpi") -> None:
+        self.events: List[Dict[str, Any]] = []
+        self._pid = os.getpid()
+        self._names: Dict[Tuple[int, int], str] = {}
+        # (pid, name) of worker processes whose events were absorbed.
+        self._processes: List[Tuple[int, str]] = []
+        self._open: Dict[Tuple[str, Any], Tuple[int, str, Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+        self.process_name = process_name
+
+    # ------------------------------------------------------------------
+    # Activation
+    # ------------------------------------------------------------------
+
+    def start(self) -> "Tracer":
+        """
+        Make this the active tracer.
+
+        Returns:
+            The tracer.
+
+        Raises:
+            RuntimeError: If another tracer is already active.
+        """
+        global _active
+        if _active is not None and _active is not self:
+            raise RuntimeError("Another tracer is already active.")
+        _active = self
+        return self
+
+    def stop(self) -> None:
+        """Deactivate the tracer, closing spans that are still open."""
+        global _active
+        with self._lock:
+            pending, self._open = self._open, {}
+        now = time.perf_counter_ns()
+        for (name, _), (start, cat, args) in pending.items():
+            self._emit(name, cat, start, now, dict(args, unfinished=True))
+        if _active is self:
+            _active = None
+
+    def __enter__(self) -> "Tracer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    def _tid(self) -> int:
+        """Return the calling thread's id, remembering its name."""
+        tid = threading.get_ident()
+        if (self._pid, tid) not in self._names:
+            self._names[self._pid, tid] = threading.current_thread().name
+        return tid
+
+    def _emit(self, name: str, cat: str, start: int, end: int, args: Dict[str, Any]) -> None:
+        """Append one complete (``"X"``) event."""
+        self.events.append({
+            "name": name, "cat": cat, "ph": "X",
+            "ts": start / 1000, "dur": (end - start) / 1000,
+            "pid": self._pid, "tid": self._tid(),
+            "args": args,
+        })
+
+    def span(self, name: str, cat: str = "netqmpi", **args: Any) -> ContextManager[None]:
+        """
+        Record the enclosed block as a span.
+
+        Args:
+            name: Span name, e.g. the op type.
+            cat: Category, used for filtering in the viewer.
+            **args: Span arguments such as ``rank`` or ``peer``;
+                ``None`` values are dropped.
+
+        Returns:
+            A context manager.
+        """
+        return _Span(self, name, cat, _clean(args))
+
+    def begin(self, name: str, cat: str = "netqmpi", **args: Any) -> None:
+        """
+        Open a span that is closed by :meth:`end` from another method.
+
+        Spans are matched by name and ``rank``.
+
+        Args:
+            name: Span name.
+            cat: Category.
+            **args: Span arguments.
+        """
+        with self._lock:
+            self._open[name, args.get("rank")] = (time.perf_counter_ns(), cat, _clean(args))
+
+    def end(self, name: str, rank: Optional[int] = None) -> None:
+        """
+        Close a span opened with :meth:`begin`, if it is open.
+
+        Args:
+            name: Span name.
+            rank: Rank the span was opened with.
+        """
+        with self._lock:
+            pending = self._open.pop((name, rank), None)
+        if pending is not None:
+            start, cat, args = pending
+            self._emit(name, cat, start, time.perf_counter_ns(), args)
+
+    def instant(self, name: str, cat: str = "netqmpi", **args: Any) -> None:
+        """
+        Record a point in time.
+
+        Args:
+            name: Event name.
+            cat: Category.
+            **args: Event arguments.
+        """
+        self.events.append({
+            "name": name, "cat": cat, "ph": "i", "s": "t",
+            "ts": time.perf_counter_ns() / 1000,
+            "pid": self._pid, "tid": self._tid(),
+            "args": _clean(args),
+        })
+
+    def wrap(self, func: Callable[[], Any], name: str, cat: str = "netqmpi", **args: Any) -> Callable[[], Any]:
+        """
+        Return ``func`` wrapped so that every call is recorded as a span.
+
+        Args:
+            func: Zero-argument callable.
+            name: Span name.
+            cat: Category.
+            **args: Span arguments.
+
+        Returns:
+            The wrapped callable.
+        """
+        args = _clean(args)
+
+        def traced() -> Any:
+            with _Span(self, name, cat, args):
+                return func()
+
+        return traced
+
+    # ------------------------------------------------------------------
+    # Worker processes
+    # ------------------------------------------------------------------
+
+    def export(self) -> Dict[str, Any]:
+        """
+        Return the recorded events in a picklable form for :meth:`absorb`.
+
+        Returns:
+            A dict with the events, thread names and process name.
+        """
+        return {
+            "events": self.events,
+            "threads": [(pid, tid, name) for (pid, tid), name in self._names.items()],
+            "processes": [(self._pid, self.process_name)],
+        }
+
+    def absorb(self, exported: Dict[str, Any]) -> None:
+        """
+        Add events recorded by a tracer in another process.
+
+        Args:
+            exported: Value returned by :meth:`export`.
+        """
+        self.events.extend(exported["events"])
+        for pid, tid, name in exported["threads"]:
+            self._names[pid, tid] = name
+        self._processes.extend(exported["processes"])
+
+    # ------------------------------------------------------------------
+    # Export
+    # ------------------------------------------------------------------
+
+    def to_chrome(self) -> Dict[str, Any]:
+        """
+        Return the trace in Chrome trace-event format.
+
+        Returns:
+            ``{"traceEvents": [...], "displayTimeUnit": "ms"}``.
+        """
+        processes = [(self._pid, self.process_name)] + self._processes
+        metadata = [
+            {"name": "process_name", "ph": "M", "pid": pid, "tid": 0, "args": {"name": name}}
+            for pid, name in processes
+        ] + [
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+            for (pid, tid), name in self._names.items()
+        ]
+        return {"traceEvents": metadata + self.events, "displayTimeUnit": "ms"}
+
+    def dump(self, path: str) -> None:
+        """
+        Write :meth:`to_chrome` to ``path``.
+
+        Args:
+            path: Output JSON file.
+        """
+        with open(path, "w") as f:
+            json.dump(self.to_chrome(), f, default=repr)
+
+
+def _clean(args: Dict[str, Any]) -> Dict[str, Any]:
+    """Drop ``None`` arguments."""
+    if not args:
+        return _NULL_ARGS
+    return {key: value for key, value in args.items() if value is not None}
+
+
+# ----------------------------------------------------------------------
+# Instrumentation hooks
+# ----------------------------------------------------------------------
+
+def active() -> Optional[Tracer]:
+    """
+    Return the active tracer.
+
+    Returns:
+        The active :class:`Tracer`, or ``None``.
+    """
+    return _active
+
+
+def span(name: str, cat: str = "netqmpi", **args: Any) -> ContextManager[None]:
+    """
+    Record the enclosed block on the active tracer, if any.
+
+    Args:
+        name: Span name.
+        cat: Category.
+        **args: Span arguments.
+
+    Returns:
+        A context manager.
+    """
+    tracer = _active
+    return _NULL if tracer is None else tracer.span(name, cat, **args)
+
+
+def begin(name: str, cat: str = "netqmpi", **args: Any) -> None:
+    """
+    Open a span on the active tracer, if any.
+
+    Args:
+        name: Span name.
+        cat: Category.
+        **args: Span arguments.
+    """
+    tracer = _active
+    if tracer is not None:
+        tracer.begin(name, cat, **args)
+
+
+def end(name: str, rank: Optional[int] = None) -> None:
+    """
+    Close a span opened with :func:`begin`, if any.
+
+    Args:
+        name: Span name.
+        rank: Rank the span was opened with.
+    """
+    tracer = _active
+    if tracer is not None:
+        tracer.end(name, rank)
@@ -7,13 +7,21 @@ interface for distributed quantum applications:
 - :class:`~netqmpi.sdk.environment.Environment` – runtime context
   injected into every ``main()`` function.
 - :class:`~netqmpi.sdk.circuit.Circuit` – abstract quantum circuit.
+- :class:`~netqmpi.sdk.topology.Topology` – quantum links between ranks.
+- :class:`~netqmpi.sdk.request.QRequest` – handle of a non-blocking
+  transfer.
 """
 from netqmpi.sdk.circuit import Circuit
 from netqmpi.sdk.communicator import QMPICommunicator
 from netqmpi.sdk.environment import Environment
+from netqmpi.sdk.request import QRequest
+from netqmpi.sdk.topology import NetworkStats, Topology
 
 __all__ = [
   'Circuit',
   'QMPICommunicator',
-  'Environment'
+  'Environment',
+  'NetworkStats',
+  'QRequest',
+  'Topology',
 ]
@@ -8,15 +8,18 @@ implementations.
 """
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Iterator, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Sequence, Union
 
 from netqmpi.sdk.operations import (
     Operation,
     Gate, ControlledGate, ClassicalControlledGate,
     Measure, Reset, Barrier,
     OperationContainer,
-    QSend, QRecv, QScatter, QGather, Expose, Unexpose,
+    QSend, QRecv, QISend, QIRecv, QWait,
+    QScatter, QGather, QBcast, QUnbcast, QReduce, QAllreduce,
+    Expose, Unexpose,
 )
+from netqmpi.sdk.request import QRequest
 
 if TYPE_CHECKING:
     from netqmpi.sdk import QMPICommunicator
@@ -113,6 +116,9 @@ class Circuit(ABC):
         self._num_clbits = num_clbits
         self._comm = comm
         self._ops = OperationContainer()
+        self._num_requests = 0
+        # Qubit -> pending request that owns it.
+        self._pending: Dict[int, QRequest] = {}
 
     # ------------------------------------------------------------------
     # Properties
@@ -249,16 +255,49 @@ class Circuit(ABC):
             op: Quantum receive operation to translate.
         """
 
+    def _translate_qisend(self, op: QISend):
+        """
+        Translate the start of a non-blocking send.
+
+        By default the whole transfer runs here, as :meth:`_translate_qsend`,
+        which completes it before any later operation.
+
+        Args:
+            op: Non-blocking send operation to translate.
+        """
+        return self._translate_qsend(op)
+
+    def _translate_qirecv(self, op: QIRecv):
+        """
+        Translate the start of a non-blocking receive.
+
+        By default the whole transfer runs here, as :meth:`_translate_qrecv`.
+
+        Args:
+            op: Non-blocking receive operation to translate.
+        """
+        return self._translate_qrecv(op)
+
+    def _translate_qwait(self, op: QWait):
+        """
+        Translate the completion of non-blocking transfers.
+
+        Nothing is left to do when the transfers ran at their start.
+
+        Args:
+            op: Wait operation to translate.
+        """
+
     @abstractmethod
     def _translate_qscatter(self, op: QScatter):
         """
         Translate a quantum scatter operation into backend instructions.
 
+        Adapters without a native protocol lower it onto their qsend and
+        qrecv with :func:`~netqmpi.sdk.collectives.lower_collective`.
+
         Args:
             op: Quantum scatter operation to translate.
-
-        Raises:
-            NotImplementedError: Always, because this operation is not yet supported.
         """
 
     @abstractmethod
@@ -266,14 +305,44 @@ class Circuit(ABC):
         """
         Translate a quantum gather operation into backend instructions.
 
+        Adapters without a native protocol lower it onto their qsend and
+        qrecv with :func:`~netqmpi.sdk.collectives.lower_collective`.
+
         Args:
             op: Quantum gather operation to translate.
-
-        Raises:
-            NotImplementedError: Always, because this operation is not yet supported.
         """
         raise NotImplementedError("QGather is not yet implemented for the backend backend.")
 
+    @abstractmethod
+    def _translate_qbcast(self, op: QBcast):
+        """
+        Translate a quantum broadcast into backend instructions.
+
+        Args:
+            op: Quantum broadcast operation to translate.
+        """
+
+    @abstractmethod
+    def _translate_qunbcast(self, op: QUnbcast):
+        """
+        Translate the end of a quantum broadcast into backend instructions.
+
+        Args:
+            op: Quantum unbroadcast operation to translate.
+        """
+
+    @abstractmethod
+    def _translate_qreduce(self, op: QReduce):
+        """
+        Translate a quantum reduce or allreduce into backend instructions.
+
+        Adapters lower it onto their broadcast with
+        :func:`~netqmpi.sdk.collectives.lower_reduce`.
+
+        Args:
+            op: Quantum reduce operation to translate.
+        """
+
     @abstractmethod
     def _translate_expose(self, op: Expose):
         """
@@ -324,8 +393,15 @@ class Circuit(ABC):
             OperationContainer:      self._translate_operation_container,
             QSend:                   self._translate_qsend,
             QRecv:                   self._translate_qrecv,
+            QISend:                  self._translate_qisend,
+            QIRecv:                  self._translate_qirecv,
+            QWait:                   self._translate_qwait,
             QScatter:                self._translate_qscatter,
             QGather:                 self._translate_qgather,
+            QBcast:                  self._translate_qbcast,
+            QUnbcast:                self._translate_qunbcast,
+            QReduce:                 self._translate_qreduce,
+            QAllreduce:              self._translate_qreduce,
             Expose:                  self._translate_expose,
             Unexpose:                self._translate_unexpose,
         }
@@ -371,10 +447,15 @@ class Circuit(ABC):
 
         Raises:
             IndexError: If the qubit index is out of range.
+            ValueError: If the qubit belongs to a non-blocking transfer
+                that has not been waited on.
         """
         if not (0 <= qubit < self._num_qubits):
             raise IndexError(
                 f"Qubit index {qubit} out of range [0, {self._num_qubits}).")
+        if qubit in self._pending:
+            raise ValueError(
+                f"Qubit {qubit} belongs to pending request {self._pending[qubit].index}; wait on it first.")
 
     def _check_cbit(self, cbit: int) -> None:
         """
@@ -746,35 +827,214 @@ class Circuit(ABC):
             self._check_qubit(q)
         return self._add(QRecv(qubits, src_rank))
 
-    def qscatter(self, qubits: List[int], sender_rank: int) -> Circuit:
+    def qisend(self, qubits: List[int], dest_rank: int) -> QRequest:
+        """
+        Start sending qubits to another rank without waiting for the transfer.
+
+        The qubits cannot be used until the request is waited on (see
+        :meth:`wait`); operations on other qubits added in between may
+        overlap with the transfer.
+
+        Args:
+            qubits: Local qubit indices to send.
+            dest_rank: Destination rank.
+
+        Returns:
+            The request of the transfer.
+        """
+        return self._start_request(QISend, "send", qubits, dest_rank)
+
+    def qirecv(self, qubits: List[int], src_rank: int) -> QRequest:
+        """
+        Start receiving qubits from another rank without waiting for the transfer.
+
+        The qubits hold the received state, and can be used, once the
+        request is waited on (see :meth:`wait`).
+
+        Args:
+            qubits: Local qubit indices that will receive the incoming qubits.
+            src_rank: Source rank.
+
+        Returns:
+            The request of the transfer.
+        """
+        return self._start_request(QIRecv, "recv", qubits, src_rank)
+
+    def wait(self, requests: Union[QRequest, Sequence[QRequest]]) -> Circuit:
+        """
+        Complete non-blocking transfers started in this circuit.
+
+        Args:
+            requests: A request or several, completed in the given order.
+
+        Returns:
+            The current circuit instance.
+
+        Raises:
+            ValueError: If a request belongs to another circuit, was
+                already waited on or is given more than once.
+        """
+        if isinstance(requests, QRequest):
+            requests = [requests]
+        seen = set()
+        for request in requests:
+            if request.circuit is not self:
+                raise ValueError(f"Request {request.index} belongs to another circuit.")
+            if request.test():
+                raise ValueError(f"Request {request.index} was already waited on.")
+            if request.index in seen:
+                raise ValueError(f"Request {request.index} is given more than once.")
+            seen.add(request.index)
+        for request in requests:
+            request._complete()
+            for q in request.qubits:
+                del self._pending[q]
+        return self._add(QWait([request.index for request in requests]))
+
+    def _start_request(self, op_class: type, kind: str, qubits: List[int], peer: int) -> QRequest:
+        """
+        Add the start of a non-blocking transfer and return its request.
+
+        Args:
+            op_class: :class:`QISend` or :class:`QIRecv`.
+            kind: ``"send"`` or ``"recv"``.
+            qubits: Local qubit indices of the transfer.
+            peer: Rank on the other end.
+
+        Returns:
+            The request, which owns ``qubits`` until waited on.
+        """
+        for q in qubits:
+            self._check_qubit(q)
+        self._add(op_class(qubits, peer, self._num_requests))
+        request = QRequest(self, self._num_requests, kind, peer, qubits)
+        self._num_requests += 1
+        for q in qubits:
+            self._pending[q] = request
+        return request
+
+    def qscatter(self, qubits: List[int], sender_rank: int, algorithm: str = "auto") -> Circuit:
         """
         Scatter qubits from one rank across all ranks.
 
         Args:
             qubits: Qubits involved in the scatter operation.
             sender_rank: Rank acting as the sender.
+            algorithm: Transfer schedule (see :mod:`netqmpi.sdk.collectives`);
+                every rank must pass the same value.
 
         Returns:
             The current circuit instance.
         """
         for q in qubits:
             self._check_qubit(q)
-        return self._add(QScatter(qubits, sender_rank))
+        return self._add(QScatter(qubits, sender_rank, algorithm))
 
-    def qgather(self, qubits: List[int], recv_rank: int) -> Circuit:
+    def qgather(self, qubits: List[int], recv_rank: int, algorithm: str = "auto") -> Circuit:
         """
         Contribute qubits to a gather operation.
 
         Args:
             qubits: Qubits contributed to the gather.
             recv_rank: Rank receiving the gathered qubits.
+            algorithm: Transfer schedule (see :mod:`netqmpi.sdk.collectives`);
+                every rank must pass the same value.
 
         Returns:
             The current circuit instance.
         """
         for q in qubits:
             self._check_qubit(q)
-        return self._add(QGather(qubits, recv_rank))
+        return self._add(QGather(qubits, recv_rank, algorithm))
+
+    def qbcast(self, qubit: int, root: int) -> Circuit:
+        """
+        Fan a qubit of the root out to every rank as a cat state.
+
+        On the root, ``qubit`` is the broadcast qubit; on every other
+        rank, it must be ``|0>`` and becomes an entangled copy.
+
+        Args:
+            qubit: Qubit index broadcast or receiving the copy.
+            root: Rank owning the broadcast qubit.
+
+        Returns:
+            The current circuit instance.
+        """
+        self._check_qubit(qubit)
+        return self._add(QBcast(qubit, root))
+
+    def qunbcast(self, qubit: int, root: int) -> Circuit:
+        """
+        Disentangle the copies made by :meth:`qbcast`.
+
+        Args:
+            qubit: Qubit index passed to the matching :meth:`qbcast`.
+            root: Rank owning the broadcast qubit.
+
+        Returns:
+            The current circuit instance.
+        """
+        self._check_qubit(qubit)
+        return self._add(QUnbcast(qubit, root))
+
+    def qreduce(
+        self,
+        qubit: int,
+        target: int,
+        root: int,
+        operation: str = "xor",
+        theta: Optional[float] = None,
+    ) -> Circuit:
+        """
+        Accumulate a qubit of every rank into a target qubit of the root.
+
+        Data qubits are not moved; see
+        :class:`~netqmpi.sdk.operations.QReduce` for the operations.
+
+        Args:
+            qubit: This rank's data qubit.
+            target: Target qubit on the root; on other ranks a ``|0>``
+                qubit of the same index, used for the cat-state copy.
+            root: Rank owning the target qubit.
+            operation: ``"xor"`` or ``"phase"``.
+            theta: Phase angle of a ``"phase"`` reduction.
+
+        Returns:
+            The current circuit instance.
+        """
+        self._check_qubit(qubit)
+        self._check_qubit(target)
+        return self._add(QReduce(qubit, target, root, operation, theta))
+
+    def qallreduce(
+        self,
+        qubit: int,
+        target: int,
+        root: int,
+        operation: str = "xor",
+        theta: Optional[float] = None,
+    ) -> Circuit:
+        """
+        Reduce into the root's target, then fan the result out to every rank.
+
+        Every rank's ``target`` ends up holding an entangled copy of the
+        result; close it with :meth:`qunbcast` on ``target``.
+
+        Args:
+            qubit: This rank's data qubit.
+            target: Target qubit on the root; on other ranks a ``|0>``
+                qubit of the same index, which receives the result.
+            root: Rank that accumulates the result.
+            operation: ``"xor"`` or ``"phase"``.
+            theta: Phase angle of a ``"phase"`` reduction.
+
+        Returns:
+            The current circuit instance.
+        """
+        self._check_qubit(qubit)
+        self._check_qubit(target)
+        return self._add(QAllreduce(qubit, target, root, operation, theta))
 
     def expose(self, qubits: List[int], rank: int = 0) -> _ExposeContext:
         """
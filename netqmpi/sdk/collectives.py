@@ -0,0 +1,715 @@
+"""
+Schedules of the quantum collective operations.
+
+A :class:`~netqmpi.sdk.operations.QScatter` or
+:class:`~netqmpi.sdk.operations.QGather` is a pattern of point-to-point
+transfers.  This module computes that pattern once for every backend and
+lowers it onto :class:`~netqmpi.sdk.operations.QSend` and
+:class:`~netqmpi.sdk.operations.QRecv`, so an adapter only needs its
+point-to-point primitives to run any schedule.
+
+The root's ``qubits`` are the full register, split into ``size``
+contiguous *blocks* by :func:`chunk_bounds`; block ``r`` belongs to rank
+``r`` and the root's own block never moves.  On every other rank,
+``qubits`` are the slots of its own block.  The schedules are:
+
+* ``"linear"``: the root exchanges one block with each rank in turn,
+  ``size - 1`` rounds.
+* ``"binomial"``: a binomial tree over the ranks counted from the root;
+  in every round each rank holding blocks hands the upper half (by
+  powers of two) of its subtree to a new rank.
+* ``"halving"``: recursive halving; every holder splits its range of
+  ranks into two halves of nearly equal size, which balances the tree
+  when ``size`` is not a power of two.
+* ``"tree"``: the shortest-path tree of the communicator's
+  :class:`~netqmpi.sdk.topology.Topology`; every holder hands each
+  child's subtree to it over their link, largest subtree first.
+
+The binomial and halving trees finish in ``ceil(log2(size))`` rounds,
+but their blocks travel through intermediate ranks.  An intermediate
+rank holds the blocks of its subtree in its first free qubits (those not
+in its ``qubits``), so its circuit must be wide enough, and the root's
+register must split evenly.
+A gather runs the scatter schedule backwards.
+
+On a topology other than a full mesh, a message between ranks that
+are not linked is routed over several links, each using its own EPR
+pairs, so the cost model weighs every pair by the cost of its link.
+``"auto"`` picks the schedule with the lowest :meth:`CollectiveCost.estimate`.
+The choice only depends on ``size``, the block width, the root and the
+topology, so every rank makes it alike.
+
+A :class:`~netqmpi.sdk.operations.QBcast` sends one qubit along every
+edge of the binomial tree whatever its size, so it always uses that tree
+on a full mesh, and the shortest-path tree on any other topology
+(:func:`broadcast_links`); every rank extends the cat state to its
+children over its own links, and the binomial fan-out takes
+``ceil(log2(size))`` rounds.
+
+A :class:`~netqmpi.sdk.operations.QReduce` (and
+:class:`~netqmpi.sdk.operations.QAllreduce`) is lowered by
+:func:`lower_reduce` onto that broadcast: the root's target is fanned
+out, every rank acts locally between its copy and its data qubit, and
+the copies are disentangled, so data qubits never leave their rank.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from netqmpi.sdk.operations import (
+    Operation, Gate, ControlledGate, Reset,
+    QSend, QRecv, QScatter, QGather, QBcast, QUnbcast, QReduce, QAllreduce,
+)
+from netqmpi.sdk.operations.qmpi import COLLECTIVE_ALGORITHMS
+from netqmpi.sdk.topology import Topology
+
+# Default weights of the cost model: one round of classical messages
+# against one teleported qubit (an EPR pair over a unit-cost link plus
+# its corrections).
+ROUND_LATENCY = 1.0
+PAIR_COST = 0.25
+
+
+@dataclass(frozen=True)
+class Transfer:
+    """
+    One point-to-point message of a collective schedule.
+
+    Attributes:
+        round: Round of the message; the messages of one round involve
+            distinct pairs of ranks and can run concurrently.
+        src: Sending rank.
+        dest: Receiving rank.
+        blocks: Ranks whose blocks the message carries, in order.
+    """
+
+    round: int
+    src: int
+    dest: int
+    blocks: Tuple[int, ...]
+
+
+@dataclass(frozen=True)
+class CollectiveCost:
+    """
+    Cost of a collective schedule.
+
+    Attributes:
+        rounds: Sequential rounds of messages.
+        messages: Point-to-point messages.
+        teleports: Qubits teleported, counting every hop of a qubit.
+        buffer: Most qubits a rank other than the root receives at once.
+        epr_pairs: EPR pairs consumed, one per teleported qubit or
+            cat-state link and per link of its route.
+        link_cost: Sum, over the EPR pairs, of the cost of their link;
+            ``epr_pairs`` on a full mesh of unit-cost links.
+    """
+
+    rounds: int
+    messages: int
+    teleports: int
+    buffer: int
+    epr_pairs: int = 0
+    link_cost: float = 0.0
+
+    def estimate(self, round_latency: float = ROUND_LATENCY, pair_cost: float = PAIR_COST) -> float:
+        """
+        Estimate the run time of the schedule.
+
+        Args:
+            round_latency: Cost of one round.
+            pair_cost: Cost of one EPR pair over a unit-cost link.
+
+        Returns:
+            ``rounds * round_latency + link_cost * pair_cost``.
+        """
+        return self.rounds * round_latency + self.link_cost * pair_cost
+
+
+# ----------------------------------------------------------------------
+# Schedules
+# ----------------------------------------------------------------------
+
+def chunk_bounds(num_qubits: int, size: int) -> List[Tuple[int, int]]:
+    """
+    Split a register into one block per rank.
+
+    The first ``num_qubits % size`` blocks are one qubit longer.
+
+    Args:
+        num_qubits: Length of the register.
+        size: Number of ranks.
+
+    Returns:
+        The ``(start, stop)`` bounds of the block of each rank.
+    """
+    chunk, extra = divmod(num_qubits, size)
+    bounds = []
+    start = 0
+    for rank in range(size):
+        stop = start + chunk + (rank < extra)
+        bounds.append((start, stop))
+        start = stop
+    return bounds
+
+
+def scatter_schedule(
+    size: int, root: int, algorithm: str, topology: Optional[Topology] = None
+) -> List[Transfer]:
+    """
+    Return the transfers of a scatter, ordered by round.
+
+    Args:
+        size: Number of ranks.
+        root: Rank holding every block at the start.
+        algorithm: ``"linear"``, ``"binomial"``, ``"halving"`` or ``"tree"``.
+        topology: Links followed by ``"tree"``; a full mesh if ``None``.
+
+    Returns:
+        The transfers, on absolute ranks.
+
+    Raises:
+        ValueError: If *algorithm* is not a schedule name.
+    """
+    if algorithm == "tree":
+        return _tree(topology if topology is not None else Topology.full(size), root)
+    if algorithm == "linear":
+        relative = [Transfer(r - 1, 0, r, (r,)) for r in range(1, size)]
+    elif algorithm == "binomial":
+        relative = _binomial(size)
+    elif algorithm == "halving":
+        relative = _halving(size)
+    else:
+        raise ValueError(f"Unknown collective schedule {algorithm!r}.")
+    return [
+        Transfer(
+            t.round, (t.src + root) % size, (t.dest + root) % size,
+            tuple((b + root) % size for b in t.blocks),
+        )
+        for t in relative
+    ]
+
+
+def gather_schedule(
+    size: int, root: int, algorithm: str, topology: Optional[Topology] = None
+) -> List[Transfer]:
+    """
+    Return the transfers of a gather: the scatter schedule reversed.
+
+    Args:
+        size: Number of ranks.
+        root: Rank holding every block at the end.
+        algorithm: ``"linear"``, ``"binomial"``, ``"halving"`` or ``"tree"``.
+        topology: Links followed by ``"tree"``; a full mesh if ``None``.
+
+    Returns:
+        The transfers, on absolute ranks, ordered by round.
+    """
+    scatter = scatter_schedule(size, root, algorithm, topology)
+    last = scatter[-1].round if scatter else 0
+    return [Transfer(last - t.round, t.dest, t.src, t.blocks) for t in reversed(scatter)]
+
+
+def _binomial(size: int) -> List[Transfer]:
+    """Binomial-tree scatter on ranks relative to a root at ``0``."""
+    transfers = []
+    # Largest power of two below size.
+    mask = (1 << (size - 1).bit_length()) >> 1
+    round_ = 0
+    while mask:
+        for r in range(0, size, 2 * mask):
+            if r + mask < size:
+                transfers.append(
+                    Transfer(round_, r, r + mask, tuple(range(r + mask, min(r + 2 * mask, size))))
+                )
+        mask >>= 1
+        round_ += 1
+    return transfers
+
+
+def _halving(size: int) -> List[Transfer]:
+    """Recursive-halving scatter on ranks relative to a root at ``0``."""
+    transfers = []
+    ranges = [(0, size)]
+    round_ = 0
+    while ranges:
+        split = []
+        for lo, hi in ranges:
+            if hi - lo < 2:
+                continue
+            # The holder keeps the larger half.
+            mid = lo + (hi - lo + 1) // 2
+            transfers.append(Transfer(round_, lo, mid, tuple(range(mid, hi))))
+            split += [(lo, mid), (mid, hi)]
+        ranges = split
+        round_ += 1
+    return transfers
+
+
+def _tree(topology: Topology, root: int) -> List[Transfer]:
+    """Scatter down the shortest-path tree of a topology, on absolute ranks."""
+    children = topology.tree(root)
+    order = [root]
+    for rank in order:
+        order.extend(children[rank])
+    subtree: Dict[int, List[int]] = {}
+    for rank in reversed(order):
+        subtree[rank] = sorted([rank] + [r for c in children[rank] for r in subtree[c]])
+
+    transfers = []
+    # Round in which each rank holds its subtree; the root starts with it.
+    ready = {root: -1}
+    for rank in order:
+        round_ = ready[rank]
+        for child in sorted(children[rank], key=lambda c: (-len(subtree[c]), c)):
+            round_ += 1
+            transfers.append(Transfer(round_, rank, child, tuple(subtree[child])))
+            ready[child] = round_
+    return sorted(transfers, key=lambda t: (t.round, t.src))
+
+
+# ----------------------------------------------------------------------
+# Cost model
+# ----------------------------------------------------------------------
+
+def collective_cost(
+    algorithm: str,
+    size: int,
+    width: int,
+    topology: Optional[Topology] = None,
+    root: int = 0,
+) -> CollectiveCost:
+    """
+    Return the cost of a schedule.
+
+    Args:
+        algorithm: ``"linear"``, ``"binomial"``, ``"halving"`` or ``"tree"``.
+        size: Number of ranks.
+        width: Qubits per block.
+        topology: Links of the ranks; a full mesh of unit-cost links if
+            ``None``.
+        root: Root of the collective, which only matters on a topology.
+
+    Returns:
+        The schedule's cost, the same for a scatter and a gather.
+    """
+    transfers = scatter_schedule(size, root, algorithm, topology)
+    pairs = 0
+    link_cost = 0.0
+    for t in transfers:
+        qubits = width * len(t.blocks)
+        if topology is None:
+            pairs += qubits
+            link_cost += qubits
+        else:
+            pairs += qubits * (len(topology.route(t.src, t.dest)) - 1)
+            link_cost += qubits * topology.distance(t.src, t.dest)
+    return CollectiveCost(
+        rounds=len({t.round for t in transfers}),
+        messages=len(transfers),
+        teleports=width * sum(len(t.blocks) for t in transfers),
+        buffer=width * max((len(t.blocks) for t in transfers), default=0),
+        epr_pairs=pairs,
+        link_cost=link_cost,
+    )
+
+
+def broadcast_cost(size: int, topology: Optional[Topology] = None, root: int = 0) -> CollectiveCost:
+    """
+    Return the cost of a :class:`~netqmpi.sdk.operations.QBcast`.
+
+    The fan-out uses one EPR pair per edge of its tree (see
+    :func:`broadcast_links`) and teleports nothing; its
+    :class:`~netqmpi.sdk.operations.QUnbcast` only sends classical
+    parities back up the tree.
+
+    Args:
+        size: Number of ranks.
+        topology: Links of the ranks; a full mesh of unit-cost links if
+            ``None``.
+        root: Root of the broadcast.
+
+    Returns:
+        The cost of the fan-out.
+    """
+    transfers = _broadcast_schedule(size, root, topology)
+    if topology is None:
+        link_cost = float(len(transfers))
+    else:
+        link_cost = sum(topology.cost(t.src, t.dest) for t in transfers)
+    return CollectiveCost(
+        rounds=len({t.round for t in transfers}),
+        messages=len(transfers),
+        teleports=0,
+        buffer=1 if size > 1 else 0,
+        epr_pairs=len(transfers),
+        link_cost=link_cost,
+    )
+
+
+def reduce_cost(
+    size: int,
+    allreduce: bool = False,
+    topology: Optional[Topology] = None,
+    root: int = 0,
+) -> CollectiveCost:
+    """
+    Return the cost of a :class:`~netqmpi.sdk.operations.QReduce`.
+
+    A reduce is a broadcast of the target and its unbroadcast, both as
+    deep as the broadcast tree; an allreduce adds a second broadcast of
+    the result.
+
+    Args:
+        size: Number of ranks.
+        allreduce: Whether to cost a
+            :class:`~netqmpi.sdk.operations.QAllreduce`.
+        topology: Links of the ranks; a full mesh of unit-cost links if
+            ``None``.
+        root: Root of the reduction.
+
+    Returns:
+        The cost of the reduction.
+    """
+    fanout = broadcast_cost(size, topology, root)
+    fanouts = 2 if allreduce else 1
+    return CollectiveCost(
+        rounds=(fanouts + 1) * fanout.rounds,
+        messages=(fanouts + 1) * fanout.messages,
+        teleports=0,
+        buffer=fanout.buffer,
+        epr_pairs=fanouts * fanout.epr_pairs,
+        link_cost=fanouts * fanout.link_cost,
+    )
+
+
+def choose_algorithm(
+    size: int,
+    width: int,
+    round_latency: float = ROUND_LATENCY,
+    pair_cost: float = PAIR_COST,
+    topology: Optional[Topology] = None,
+    root: int = 0,
+) -> str:
+    """
+    Pick the cheapest schedule for a collective.
+
+    Trees save rounds but teleport most qubits more than once, so they
+    win for many ranks and narrow blocks; on a sparse topology the
+    shortest-path tree also avoids routing.  Ties go to ``"linear"``.
+
+    Args:
+        size: Number of ranks.
+        width: Qubits per block.
+        round_latency: Cost of one round.
+        pair_cost: Cost of one EPR pair over a unit-cost link.
+        topology: Links of the ranks; a full mesh of unit-cost links if
+            ``None``.
+        root: Root of the collective.
+
+    Returns:
+        ``"linear"``, ``"binomial"``, ``"halving"`` or ``"tree"``.
+    """
+    schedules = [a for a in COLLECTIVE_ALGORITHMS if a != "auto"]
+    return min(
+        schedules,
+        key=lambda a: collective_cost(a, size, width, topology, root).estimate(round_latency, pair_cost),
+    )
+
+
+# ----------------------------------------------------------------------
+# Lowering
+# ----------------------------------------------------------------------
+
+def lower_collective(
+    op: Operation, rank: int, size: int, num_qubits: int, topology: Optional[Topology] = None
+) -> List[Operation]:
+    """
+    Lower a collective onto this rank's point-to-point operations.
+
+    Args:
+        op: :class:`~netqmpi.sdk.operations.QScatter` or
+            :class:`~netqmpi.sdk.operations.QGather`.
+        rank: Rank whose part is lowered.
+        size: Number of ranks.
+        num_qubits: Width of the rank's circuit, which bounds the slots
+            an intermediate rank can hold blocks in.
+        topology: Links of the ranks, followed by ``"tree"`` and weighed
+            by ``"auto"``; a full mesh if ``None``.
+
+    Returns:
+        The :class:`~netqmpi.sdk.operations.QSend` and
+        :class:`~netqmpi.sdk.operations.QRecv` operations of ``rank``, in
+        the order it runs them.
+
+    Raises:
+        TypeError: If *op* is not a collective.
+        ValueError: If a tree is used on a register that does not split
+            evenly.
+        IndexError: If an intermediate rank has too few free qubits.
+    """
+    if isinstance(op, QScatter):
+        root, schedule, name = op.sender_rank, scatter_schedule, "qscatter"
+    elif isinstance(op, QGather):
+        root, schedule, name = op.recv_rank, gather_schedule, "qgather"
+    else:
+        raise TypeError(f"Expected QScatter or QGather, got {type(op).__name__}.")
+
+    qubits = op.qubits
+    if rank == root:
+        width = len(qubits) // size
+    else:
+        width = len(qubits)
+    algorithm = op.algorithm
+    if algorithm == "auto":
+        algorithm = choose_algorithm(size, width, topology=topology, root=root)
+    if algorithm != "linear" and rank == root and len(qubits) % size:
+        raise ValueError(
+            f"{name} of {len(qubits)} qubits over {size} ranks does not split "
+            f"evenly, which the {algorithm} schedule needs; use algorithm='linear'."
+        )
+
+    transfers = [t for t in schedule(size, root, algorithm, topology) if rank in (t.src, t.dest)]
+    slots = _block_slots(transfers, qubits, rank, root, size, width, num_qubits, name)
+
+    ops: List[Operation] = []
+    for t in transfers:
+        local = [q for b in t.blocks for q in slots[b]]
+        if t.src == rank:
+            ops.append(QSend(local, t.dest))
+        else:
+            ops.append(QRecv(local, t.src))
+    return ops
+
+
+def expand_collectives(
+    ops: Iterable[Operation],
+    rank: int,
+    size: int,
+    num_qubits: int,
+    topology: Optional[Topology] = None,
+) -> Iterator[Operation]:
+    """
+    Replace the collectives of a sequence of leaf operations by their lowering.
+
+    Args:
+        ops: Leaf operations.
+        rank: Rank whose part is lowered.
+        size: Number of ranks.
+        num_qubits: Width of the rank's circuit.
+        topology: Links of the ranks; a full mesh if ``None``.
+
+    Yields:
+        The operations, with every scatter and gather lowered by
+        :func:`lower_collective` and every reduce by :func:`lower_reduce`.
+    """
+    for op in ops:
+        if isinstance(op, (QScatter, QGather)):
+            yield from lower_collective(op, rank, size, num_qubits, topology)
+        elif isinstance(op, QReduce):
+            yield from lower_reduce(op, rank)
+        else:
+            yield op
+
+
+def _block_slots(
+    transfers: List[Transfer],
+    qubits: List[int],
+    rank: int,
+    root: int,
+    size: int,
+    width: int,
+    num_qubits: int,
+    name: str,
+) -> Dict[int, List[int]]:
+    """Map every block a rank touches to the local slots holding it."""
+    if rank == root:
+        return {b: qubits[start:stop] for b, (start, stop) in enumerate(chunk_bounds(len(qubits), size))}
+
+    slots = {rank: qubits}
+    relayed = [b for t in transfers for b in t.blocks if b != rank]
+    relayed = list(dict.fromkeys(relayed))
+    if relayed:
+        taken = set(qubits)
+        free = [q for q in range(num_qubits) if q not in taken]
+        needed = width * len(relayed)
+        if len(free) < needed:
+            raise IndexError(
+                f"Rank {rank} relays {needed} qubits of a {name} but only has "
+                f"{len(free)} free qubits; widen its circuit or use algorithm='linear'."
+            )
+        for i, b in enumerate(relayed):
+            slots[b] = free[i * width:(i + 1) * width]
+    return slots
+
+
+# ----------------------------------------------------------------------
+# Broadcast
+# ----------------------------------------------------------------------
+
+def _broadcast_schedule(size: int, root: int, topology: Optional[Topology]) -> List[Transfer]:
+    """Return the edges of the broadcast tree as the transfers of a scatter."""
+    if topology is None or (topology.is_full and len(set(topology.links.values())) <= 1):
+        return scatter_schedule(size, root, "binomial")
+    return scatter_schedule(size, root, "tree", topology)
+
+
+def broadcast_links(
+    rank: int, size: int, root: int, topology: Optional[Topology] = None
+) -> Tuple[Optional[int], List[int]]:
+    """
+    Return a rank's neighbours in the broadcast tree.
+
+    The tree is binomial on a full mesh of equal links, and the
+    shortest-path tree of any other topology, so that every edge is a
+    link.
+
+    Args:
+        rank: Rank whose links are returned.
+        size: Number of ranks.
+        root: Root of the tree.
+        topology: Links of the ranks; a full mesh if ``None``.
+
+    Returns:
+        The parent of ``rank`` (``None`` for the root) and its children,
+        in the order the fan-out reaches them.
+    """
+    parent = None
+    children = []
+    for t in _broadcast_schedule(size, root, topology):
+        if t.dest == rank:
+            parent = t.src
+        elif t.src == rank:
+            children.append(t.dest)
+    return parent, children
+
+
+def lower_broadcast(
+    op: Operation,
+    rank: int,
+    size: int,
+    num_qubits: int,
+    reserved: Sequence[int] = (),
+    topology: Optional[Topology] = None,
+) -> List[Operation]:
+    """
+    Lower a broadcast onto teleportation, for adapters without a
+    cat-entangler.
+
+    A rank extends the cat state to a child by copying its qubit into an
+    ancilla with a CX and sending the ancilla; the unbroadcast sends the
+    copies back up the tree and uncomputes them into the ancilla.  The
+    ancilla is the rank's first qubit other than ``op.qubit`` and those
+    in *reserved*, and is reset before use, so it must not hold live
+    data on ranks with children.
+
+    Args:
+        op: :class:`~netqmpi.sdk.operations.QBcast` or
+            :class:`~netqmpi.sdk.operations.QUnbcast`.
+        rank: Rank whose part is lowered.
+        size: Number of ranks.
+        num_qubits: Width of the rank's circuit.
+        reserved: Live qubits the ancilla must not be taken from.
+        topology: Links of the ranks; a full mesh if ``None``.
+
+    Returns:
+        The operations of ``rank``, in the order it runs them.
+
+    Raises:
+        TypeError: If *op* is not a broadcast.
+        IndexError: If a rank with children has no ancilla.
+    """
+    if not isinstance(op, (QBcast, QUnbcast)):
+        raise TypeError(f"Expected QBcast or QUnbcast, got {type(op).__name__}.")
+    parent, children = broadcast_links(rank, size, op.root, topology)
+    qubit = op.qubit
+    ops: List[Operation] = []
+    ancilla = None
+    if children:
+        taken = {qubit, *reserved}
+        free = [q for q in range(num_qubits) if q not in taken]
+        if not free:
+            raise IndexError(
+                f"Rank {rank} relays a broadcast but its circuit has no ancilla qubit."
+            )
+        ancilla = free[0]
+
+    if isinstance(op, QBcast):
+        if parent is not None:
+            ops.append(QRecv([qubit], parent))
+        for child in children:
+            ops.append(Reset(ancilla))
+            ops.append(ControlledGate([qubit], [Gate("X", [ancilla])]))
+            ops.append(QSend([ancilla], child))
+    else:
+        for child in reversed(children):
+            ops.append(QRecv([ancilla], child))
+            ops.append(ControlledGate([qubit], [Gate("X", [ancilla])]))
+        if parent is not None:
+            ops.append(QSend([qubit], parent))
+    return ops
+
+
+# ----------------------------------------------------------------------
+# Reduce
+# ----------------------------------------------------------------------
+
+def lower_reduce(op: Operation, rank: int) -> List[Operation]:
+    """
+    Lower a reduce onto a broadcast of its target.
+
+    Every data qubit acts on the target through the target's cat-state
+    copy on its own rank:
+
+    * ``"xor"``: a CX from each data qubit into the target is, in the
+      Hadamard basis, a CX from the target into each data qubit, which
+      the copies apply locally.
+    * ``"phase"``: a controlled phase is diagonal, so it acts on the
+      copy as on the target; it is applied as ``RZ`` and ``CX`` gates.
+
+    Args:
+        op: :class:`~netqmpi.sdk.operations.QReduce` or
+            :class:`~netqmpi.sdk.operations.QAllreduce`.
+        rank: Rank whose part is lowered.
+
+    Returns:
+        The operations of ``rank``, in the order it runs them, with the
+        broadcasts left for the adapter.  An adapter lowering them with
+        :func:`lower_broadcast` must reserve ``op.qubit``, which stays
+        live throughout.
+
+    Raises:
+        TypeError: If *op* is not a reduce.
+    """
+    if not isinstance(op, QReduce):
+        raise TypeError(f"Expected QReduce or QAllreduce, got {type(op).__name__}.")
+    qubit, target, root = op.qubit, op.target, op.root
+    is_root = rank == root
+    ops: List[Operation] = []
+
+    if op.operation == "xor":
+        if is_root:
+            ops.append(Gate("H", [target]))
+        ops.append(Gate("H", [qubit]))
+        ops.append(QBcast(target, root))
+        ops.append(ControlledGate([target], [Gate("X", [qubit])]))
+        ops.append(QUnbcast(target, root))
+        ops.append(Gate("H", [qubit]))
+        if is_root:
+            ops.append(Gate("H", [target]))
+    else:
+        # CP(theta) = RZ(theta/2) on both qubits, then exp(i theta/4 ZZ),
+        # up to a global phase.
+        half = op.theta / 2
+        ops.append(QBcast(target, root))
+        ops.append(Gate("RZ", [target], [half]))
+        ops.append(Gate("RZ", [qubit], [half]))
+        ops.append(ControlledGate([target], [Gate("X", [qubit])]))
+        ops.append(Gate("RZ", [qubit], [-half]))
+        ops.append(ControlledGate([target], [Gate("X", [qubit])]))
+        ops.append(QUnbcast(target, root))
+
+    if isinstance(op, QAllreduce):
+        ops.append(QBcast(target, root))
+    return ops
@@ -10,10 +10,12 @@ imported here.
 """
 from __future__ import annotations
 
-from typing import Any, List, Dict
+from typing import Any, List, Dict, Optional, Sequence
 from abc import ABC, abstractmethod
 
 from netqmpi.sdk.circuit import Circuit
+from netqmpi.sdk.request import QRequest
+from netqmpi.sdk.topology import NetworkStats, Topology
 from netqmpi.runtime.run_config import RunConfig
 
 class QMPICommunicator(ABC):
@@ -26,23 +28,31 @@ class QMPICommunicator(ABC):
 
     It provides:
 
-    - ``rank`` and ``size`` properties.
+    - ``rank``, ``size`` and ``topology`` properties.
     - Context-manager support for connection lifecycle handling.
     - Utility helpers for rank naming and neighbor traversal.
+
+    Attributes:
+        network_stats: Links and routes used by this rank's circuits,
+            filled as they are translated.
     """
 
-    def __init__(self, rank: int, size: int) -> None:
+    def __init__(self, rank: int, size: int, topology: Optional[Topology] = None) -> None:
         """
         Initialize the communicator.
 
         Args:
             rank: Numeric index of the current rank.
             size: Total number of ranks in the communicator.
+            topology: Quantum links between the ranks; a full mesh if
+                ``None``.
         """
         self._rank = rank
         self._size = size
+        self._topology = topology if topology is not None else Topology.full(size)
         self.circuits: List[Circuit] = []
         self.results: Dict = {}
+        self.network_stats = NetworkStats()
 
     # ------------------------------------------------------------------
     # Properties
@@ -68,6 +78,16 @@ class QMPICommunicator(ABC):
         """
         return self._size
 
+    @property
+    def topology(self) -> Topology:
+        """
+        Return the quantum links between the ranks.
+
+        Returns:
+            The communicator's topology.
+        """
+        return self._topology
+
     # ------------------------------------------------------------------
     # Context manager (wraps the backend connection lifecycle)
     # ------------------------------------------------------------------
@@ -114,6 +134,81 @@ class QMPICommunicator(ABC):
         """
         return circuit.qrecv(qubits, src_rank)
 
+    def qisend(self, circuit, qubits: List[int], dest_rank: int) -> QRequest:
+        """
+        Start sending qubits to the destination rank without waiting.
+        """
+        return circuit.qisend(qubits, dest_rank)
+
+    def qirecv(self, circuit, qubits: List[int], src_rank: int) -> QRequest:
+        """
+        Start receiving qubits from the source rank without waiting.
+        """
+        return circuit.qirecv(qubits, src_rank)
+
+    def wait(self, request: QRequest):
+        """
+        Complete a non-blocking transfer.
+        """
+        request.wait()
+
+    def test(self, request: QRequest) -> bool:
+        """
+        Return whether a non-blocking transfer has been waited on.
+        """
+        return request.test()
+
+    def waitall(self, requests: Sequence[QRequest]):
+        """
+        Complete several non-blocking transfers, in order.
+        """
+        by_circuit: Dict[int, List[QRequest]] = {}
+        for request in requests:
+            by_circuit.setdefault(id(request.circuit), []).append(request)
+        for pending in by_circuit.values():
+            pending[0].circuit.wait(pending)
+
+    def waitany(self, requests: Sequence[QRequest]) -> Optional[int]:
+        """
+        Complete one of several non-blocking transfers and return its index.
+
+        Circuits are built before they run, so the transfer completed is
+        the pending one started first, which is also the first to finish
+        on a link; ``None`` if every request was already waited on.
+        """
+        pending = [(r.index, i) for i, r in enumerate(requests) if not r.test()]
+        if not pending:
+            return None
+        _, position = min(pending)
+        requests[position].wait()
+        return position
+
+    def qbcast(self, circuit, qubit: int, root: int):
+        """
+        Fan a qubit of the root out to every rank as a cat state.
+        """
+        circuit.qbcast(qubit, root)
+
+    def qunbcast(self, circuit, qubit: int, root: int):
+        """
+        Disentangle the copies made by :meth:`qbcast`.
+        """
+        circuit.qunbcast(qubit, root)
+
+    def qreduce(self, circuit, qubit: int, target: int, root: int,
+                operation: str = "xor", theta: Optional[float] = None):
+        """
+        Accumulate a qubit of every rank into a target qubit of the root.
+        """
+        circuit.qreduce(qubit, target, root, operation, theta)
+
+    def qallreduce(self, circuit, qubit: int, target: int, root: int,
+                   operation: str = "xor", theta: Optional[float] = None):
+        """
+        Reduce into the root's target, then fan the result out to every rank.
+        """
+        circuit.qallreduce(qubit, target, root, operation, theta)
+
     def qscatter(self, qubits: List[int], rank_sender: int) -> List[int]:
         pass
 
@@ -11,7 +11,7 @@ backend adapter.
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Dict
 
 from netqmpi.sdk.communicator import QMPICommunicator
 from netqmpi.sdk.circuit import Circuit
@@ -74,6 +74,19 @@ class Environment:
         """
         return self._comm
 
+    @property
+    def params(self) -> Dict[str, Any]:
+        """
+        Return the user parameters of this run.
+
+        Parameters come from ``RunConfig.params``, e.g. one entry of a
+        ``netqmpi sweep`` job list.
+
+        Returns:
+            The parameter dictionary (empty if none were given).
+        """
+        return getattr(self._executor.config, "params", {})
+
     def create_circuit(self, num_qubits: int, num_clbits: int) -> Circuit:
         """
         Create a backend-specific quantum circuit.
@@ -10,7 +10,9 @@ from netqmpi.sdk.operations.gate import Gate, ControlledGate, ClassicalControlle
 from netqmpi.sdk.operations.non_unitary import Measure, Reset, Barrier
 from netqmpi.sdk.operations.container import OperationContainer
 from netqmpi.sdk.operations.qmpi import (
-    QSend, QRecv, QScatter, QGather, Expose, Unexpose,
+    QSend, QRecv, QISend, QIRecv, QWait,
+    QScatter, QGather, QBcast, QUnbcast, QReduce, QAllreduce,
+    Expose, Unexpose,
 )
 
 __all__ = [
@@ -24,8 +26,15 @@ __all__ = [
     "OperationContainer",
     "QSend",
     "QRecv",
+    "QISend",
+    "QIRecv",
+    "QWait",
     "QScatter",
     "QGather",
+    "QBcast",
+    "QUnbcast",
+    "QReduce",
+    "QAllreduce",
     "Expose",
     "Unexpose",
 ]
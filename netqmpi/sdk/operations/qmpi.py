@@ -10,10 +10,32 @@ so they flow through :class:`~netqmpi.sdk.operations.OperationContainer`
 and ``flatten()`` exactly like any gate or measurement.
 """
 from __future__ import annotations
-from typing import List
+from typing import List, Optional
 
 from netqmpi.sdk.operations.operation import Operation
 
+# Schedules accepted by the collective operations (see
+# :mod:`netqmpi.sdk.collectives`).
+COLLECTIVE_ALGORITHMS = ("auto", "linear", "binomial", "halving", "tree")
+
+
+# Accumulations computed by the reduce operations.
+REDUCE_OPERATIONS = ("xor", "phase")
+
+
+def _check_algorithm(algorithm: str) -> None:
+    """
+    Validate the schedule name of a collective operation.
+
+    Raises:
+        ValueError: If *algorithm* is not one of
+            :data:`COLLECTIVE_ALGORITHMS`.
+    """
+    if algorithm not in COLLECTIVE_ALGORITHMS:
+        raise ValueError(
+            f"algorithm must be one of {', '.join(COLLECTIVE_ALGORITHMS)}; got {algorithm!r}."
+        )
+
 
 class QSend(Operation):
     """
@@ -111,51 +133,187 @@ class QRecv(Operation):
         return hash(("QRecv", tuple(self._qubits), self._src_rank))
 
 
+class QISend(QSend):
+    """
+    Start a non-blocking :class:`QSend`.
+
+    The qubits are consumed when the transfer starts; it completes at the
+    :class:`QWait` naming ``request``.  Local operations in between may
+    overlap with it.
+
+    Attributes:
+        request (int): Index of the request within its circuit.
+    """
+
+    def __init__(self, qubits: List[int], dest_rank: int, request: int) -> None:
+        """
+        Args:
+            qubits:    Local qubit indices to send.
+            dest_rank: Rank of the receiving process.
+            request:   Index of the request within its circuit.
+        """
+        super().__init__(qubits, dest_rank)
+        self._request = request
+
+    @property
+    def request(self) -> int:
+        """Index of the request within its circuit."""
+        return self._request
+
+    def __repr__(self) -> str:
+        return f"QISend(qubits={self._qubits}, dest_rank={self._dest_rank}, request={self._request})"
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, QISend)
+            and self._qubits == other._qubits
+            and self._dest_rank == other._dest_rank
+            and self._request == other._request
+        )
+
+    def __hash__(self) -> int:
+        return hash(("QISend", tuple(self._qubits), self._dest_rank, self._request))
+
+
+class QIRecv(QRecv):
+    """
+    Start a non-blocking :class:`QRecv`.
+
+    The qubits hold the received state once the :class:`QWait` naming
+    ``request`` completes the transfer, and must not be used before.
+
+    Attributes:
+        request (int): Index of the request within its circuit.
+    """
+
+    def __init__(self, qubits: List[int], src_rank: int, request: int) -> None:
+        """
+        Args:
+            qubits:   Local qubit indices to receive into.
+            src_rank: Rank of the sending process.
+            request:  Index of the request within its circuit.
+        """
+        super().__init__(qubits, src_rank)
+        self._request = request
+
+    @property
+    def request(self) -> int:
+        """Index of the request within its circuit."""
+        return self._request
+
+    def __repr__(self) -> str:
+        return f"QIRecv(qubits={self._qubits}, src_rank={self._src_rank}, request={self._request})"
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, QIRecv)
+            and self._qubits == other._qubits
+            and self._src_rank == other._src_rank
+            and self._request == other._request
+        )
+
+    def __hash__(self) -> int:
+        return hash(("QIRecv", tuple(self._qubits), self._src_rank, self._request))
+
+
+class QWait(Operation):
+    """
+    Complete non-blocking transfers started by :class:`QISend` or :class:`QIRecv`.
+
+    Attributes:
+        requests (List[int]): Indices of the requests completed, in order.
+    """
+
+    def __init__(self, requests: List[int]) -> None:
+        """
+        Args:
+            requests: Indices of the requests to complete.
+
+        Raises:
+            ValueError: If *requests* is empty.
+        """
+        if not requests:
+            raise ValueError("requests must be a non-empty list.")
+        super().__init__([])
+        self._requests = list(requests)
+
+    @property
+    def requests(self) -> List[int]:
+        """Indices of the requests completed."""
+        return list(self._requests)
+
+    def __repr__(self) -> str:
+        return f"QWait(requests={self._requests})"
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, QWait) and self._requests == other._requests
+
+    def __hash__(self) -> int:
+        return hash(("QWait", tuple(self._requests)))
+
+
 class QScatter(Operation):
     """
     Scatter qubits from *sender_rank* across all ranks.
 
     The adapter splits ``qubits`` into chunks and teleports each chunk
-    to its target rank.
+    to its target rank, following the schedule named by ``algorithm``
+    (see :mod:`netqmpi.sdk.collectives`).
 
     Attributes:
         qubits      (List[int]): Local qubit indices being scattered.
         sender_rank (int):       Rank that owns the full qubit list.
+        algorithm   (str):       Schedule of the point-to-point transfers.
     """
 
-    def __init__(self, qubits: List[int], sender_rank: int) -> None:
+    def __init__(self, qubits: List[int], sender_rank: int, algorithm: str = "auto") -> None:
         """
         Args:
             qubits:      Local qubit indices to scatter.
             sender_rank: Rank of the scattering process.
+            algorithm:   ``"linear"``, ``"binomial"``, ``"halving"``,
+                         ``"tree"`` or ``"auto"`` to let the cost model
+                         choose.  Every rank must pass the same value.
 
         Raises:
-            ValueError: If *qubits* is empty or *sender_rank* is negative.
+            ValueError: If *qubits* is empty, *sender_rank* is negative
+                or *algorithm* is unknown.
         """
         if not qubits:
             raise ValueError("qubits must be a non-empty list.")
         if sender_rank < 0:
             raise ValueError("sender_rank must be a non-negative integer.")
+        _check_algorithm(algorithm)
         super().__init__(qubits)
         self._sender_rank = sender_rank
+        self._algorithm = algorithm
 
     @property
     def sender_rank(self) -> int:
         """Rank that scatters the qubits."""
         return self._sender_rank
 
+    @property
+    def algorithm(self) -> str:
+        """Schedule of the point-to-point transfers."""
+        return self._algorithm
+
     def __repr__(self) -> str:
-        return f"QScatter(qubits={self._qubits}, sender_rank={self._sender_rank})"
+        return (
+            f"QScatter(qubits={self._qubits}, sender_rank={self._sender_rank}, "
+            f"algorithm={self._algorithm!r})"
+        )
 
     def __eq__(self, other: object) -> bool:
         return (
             isinstance(other, QScatter)
             and self._qubits == other._qubits
             and self._sender_rank == other._sender_rank
+            and self._algorithm == other._algorithm
         )
 
     def __hash__(self) -> int:
-        return hash(("QScatter", tuple(self._qubits), self._sender_rank))
+        return hash(("QScatter", tuple(self._qubits), self._sender_rank, self._algorithm))
 
 
 class QGather(Operation):
@@ -165,41 +323,278 @@ class QGather(Operation):
     Attributes:
         qubits    (List[int]): Local qubit indices being contributed.
         recv_rank (int):       Rank that will hold all gathered qubits.
+        algorithm (str):       Schedule of the point-to-point transfers.
     """
 
-    def __init__(self, qubits: List[int], recv_rank: int) -> None:
+    def __init__(self, qubits: List[int], recv_rank: int, algorithm: str = "auto") -> None:
         """
         Args:
             qubits:    Local qubit indices to contribute to the gather.
             recv_rank: Rank of the gathering process.
+            algorithm: ``"linear"``, ``"binomial"``, ``"halving"``,
+                       ``"tree"`` or ``"auto"`` to let the cost model
+                       choose.  Every rank must pass the same value.
 
         Raises:
-            ValueError: If *qubits* is empty or *recv_rank* is negative.
+            ValueError: If *qubits* is empty, *recv_rank* is negative or
+                *algorithm* is unknown.
         """
         if not qubits:
             raise ValueError("qubits must be a non-empty list.")
         if recv_rank < 0:
             raise ValueError("recv_rank must be a non-negative integer.")
+        _check_algorithm(algorithm)
         super().__init__(qubits)
         self._recv_rank = recv_rank
+        self._algorithm = algorithm
 
     @property
     def recv_rank(self) -> int:
         """Rank that gathers the qubits."""
         return self._recv_rank
 
+    @property
+    def algorithm(self) -> str:
+        """Schedule of the point-to-point transfers."""
+        return self._algorithm
+
     def __repr__(self) -> str:
-        return f"QGather(qubits={self._qubits}, recv_rank={self._recv_rank})"
+        return (
+            f"QGather(qubits={self._qubits}, recv_rank={self._recv_rank}, "
+            f"algorithm={self._algorithm!r})"
+        )
 
     def __eq__(self, other: object) -> bool:
         return (
             isinstance(other, QGather)
             and self._qubits == other._qubits
             and self._recv_rank == other._recv_rank
+            and self._algorithm == other._algorithm
+        )
+
+    def __hash__(self) -> int:
+        return hash(("QGather", tuple(self._qubits), self._recv_rank, self._algorithm))
+
+
+class QBcast(Operation):
+    """
+    Fan a qubit of *root* out to every rank as a cat state.
+
+    Qubit ``qubit`` of every other rank, which must be ``|0>``, becomes
+    an entangled copy of the root's: ``a|0> + b|1>`` turns into
+    ``a|0...0> + b|1...1>``.  Nothing is cloned, and the copies can act
+    as controls for remote operations until the matching
+    :class:`QUnbcast`.  The adapter builds the fan-out along a tree (see
+    :func:`~netqmpi.sdk.collectives.broadcast_links`).
+
+    Attributes:
+        qubit (int): Qubit index broadcast by the root and holding the
+            copy on the other ranks.
+        root  (int): Rank owning the broadcast qubit.
+    """
+
+    def __init__(self, qubit: int, root: int) -> None:
+        """
+        Args:
+            qubit: Qubit index broadcast or receiving the copy.
+            root:  Rank owning the broadcast qubit.
+
+        Raises:
+            ValueError: If *root* is negative.
+        """
+        if root < 0:
+            raise ValueError("root must be a non-negative integer.")
+        super().__init__([qubit])
+        self._root = root
+
+    @property
+    def qubit(self) -> int:
+        """Qubit index."""
+        return self._qubits[0]
+
+    @property
+    def root(self) -> int:
+        """Rank owning the broadcast qubit."""
+        return self._root
+
+    def __repr__(self) -> str:
+        return f"QBcast(qubit={self.qubit}, root={self._root})"
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, QBcast)
+            and self._qubits == other._qubits
+            and self._root == other._root
+        )
+
+    def __hash__(self) -> int:
+        return hash(("QBcast", self.qubit, self._root))
+
+
+class QUnbcast(Operation):
+    """
+    Disentangle the copies made by a :class:`QBcast`.
+
+    The root's qubit keeps its state; the copies of the other ranks are
+    consumed.  They must only have been used as controls since the
+    broadcast.
+
+    Attributes:
+        qubit (int): Qubit index passed to the matching :class:`QBcast`.
+        root  (int): Rank owning the broadcast qubit.
+    """
+
+    def __init__(self, qubit: int, root: int) -> None:
+        """
+        Args:
+            qubit: Qubit index passed to the matching :class:`QBcast`.
+            root:  Rank owning the broadcast qubit.
+
+        Raises:
+            ValueError: If *root* is negative.
+        """
+        if root < 0:
+            raise ValueError("root must be a non-negative integer.")
+        super().__init__([qubit])
+        self._root = root
+
+    @property
+    def qubit(self) -> int:
+        """Qubit index."""
+        return self._qubits[0]
+
+    @property
+    def root(self) -> int:
+        """Rank owning the broadcast qubit."""
+        return self._root
+
+    def __repr__(self) -> str:
+        return f"QUnbcast(qubit={self.qubit}, root={self._root})"
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, QUnbcast)
+            and self._qubits == other._qubits
+            and self._root == other._root
         )
 
     def __hash__(self) -> int:
-        return hash(("QGather", tuple(self._qubits), self._recv_rank))
+        return hash(("QUnbcast", self.qubit, self._root))
+
+
+class QReduce(Operation):
+    """
+    Accumulate one qubit of every rank into a target qubit of *root*.
+
+    The data qubits never move: the root's target is fanned out to
+    every rank as a cat state (see :class:`QBcast`), each rank acts
+    locally between its copy and its data qubit, and the copies are
+    disentangled again.
+
+    * ``"xor"``: the target is XORed with every data qubit, as if each
+      data qubit controlled an X on it.
+    * ``"phase"``: the target's ``|1>`` component picks up a phase
+      ``exp(i * theta * z)`` per data qubit in state ``|z>``, i.e. a
+      controlled-phase between the target and every data qubit.
+
+    Attributes:
+        qubit  (int):   This rank's data qubit.
+        target (int):   On the root, the target qubit; elsewhere a
+            qubit in ``|0>`` that holds the copy and is left in ``|0>``.
+        root   (int):   Rank owning the target qubit.
+        operation (str): ``"xor"`` or ``"phase"``.
+        theta  (float): Phase angle of a ``"phase"`` reduction.
+    """
+
+    def __init__(
+        self,
+        qubit: int,
+        target: int,
+        root: int,
+        operation: str = "xor",
+        theta: Optional[float] = None,
+    ) -> None:
+        """
+        Args:
+            qubit:     This rank's data qubit.
+            target:    Target qubit on the root, copy qubit elsewhere;
+                       every rank must pass the same index.
+            root:      Rank owning the target qubit.
+            operation: ``"xor"`` or ``"phase"``.
+            theta:     Phase angle, required by ``"phase"``.
+
+        Raises:
+            ValueError: If *qubit* equals *target*, *root* is negative,
+                *operation* is unknown or *theta* does not match it.
+        """
+        if qubit == target:
+            raise ValueError("qubit and target must be different qubits.")
+        if root < 0:
+            raise ValueError("root must be a non-negative integer.")
+        if operation not in REDUCE_OPERATIONS:
+            raise ValueError(
+                f"operation must be one of {', '.join(REDUCE_OPERATIONS)}; got {operation!r}."
+            )
+        if (theta is None) != (operation == "xor"):
+            raise ValueError("theta is required by, and only by, the 'phase' operation.")
+        super().__init__([qubit, target])
+        self._root = root
+        self._operation = operation
+        self._theta = theta
+
+    @property
+    def qubit(self) -> int:
+        """This rank's data qubit."""
+        return self._qubits[0]
+
+    @property
+    def target(self) -> int:
+        """Target (root) or copy (other ranks) qubit."""
+        return self._qubits[1]
+
+    @property
+    def root(self) -> int:
+        """Rank owning the target qubit."""
+        return self._root
+
+    @property
+    def operation(self) -> str:
+        """Accumulation: ``"xor"`` or ``"phase"``."""
+        return self._operation
+
+    @property
+    def theta(self) -> Optional[float]:
+        """Phase angle of a ``"phase"`` reduction."""
+        return self._theta
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(qubit={self.qubit}, target={self.target}, root={self._root}, "
+            f"operation={self._operation!r}, theta={self._theta})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            type(other) is type(self)
+            and self._qubits == other._qubits
+            and self._root == other._root
+            and self._operation == other._operation
+            and self._theta == other._theta
+        )
+
+    def __hash__(self) -> int:
+        return hash((type(self).__name__, tuple(self._qubits), self._root, self._operation, self._theta))
+
+
+class QAllreduce(QReduce):
+    """
+    A :class:`QReduce` whose result is then fanned out to every rank.
+
+    After the reduction, the root's target is broadcast as by
+    :class:`QBcast`, so the ``target`` of every rank (``|0>`` on entry
+    outside the root) holds an entangled copy of the result.  Close it
+    with :class:`QUnbcast` on ``target`` when done.
+    """
 
 
 class Expose(Operation):
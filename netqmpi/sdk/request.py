@@ -0,0 +1,89 @@
+"""
+Handles of non-blocking transfers.
+
+:meth:`Circuit.qisend <netqmpi.sdk.circuit.Circuit.qisend>` and
+:meth:`Circuit.qirecv <netqmpi.sdk.circuit.Circuit.qirecv>` start a
+transfer and return a :class:`QRequest`; the transfer completes where
+the circuit waits on it.  The operations added in between may overlap
+with the transfer: a backend that supports it generates the EPR pairs
+and teleports while the rank runs them.
+
+Circuits are built before they run, so a request is complete once a
+wait on it has been added to its circuit, not once the transfer has
+finished on the node.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, List
+
+if TYPE_CHECKING:
+    from netqmpi.sdk.circuit import Circuit
+
+
+class QRequest:
+    """
+    A non-blocking transfer started in a circuit.
+
+    Args:
+        circuit: Circuit that started the transfer.
+        index: Index of the request within the circuit.
+        kind: ``"send"`` or ``"recv"``.
+        peer: Rank on the other end of the transfer.
+        qubits: Local qubits sent or receiving.
+    """
+
+    def __init__(self, circuit: Circuit, index: int, kind: str, peer: int, qubits: List[int]) -> None:
+        self._circuit = circuit
+        self._index = index
+        self._kind = kind
+        self._peer = peer
+        self._qubits = list(qubits)
+        self._done = False
+
+    @property
+    def circuit(self) -> Circuit:
+        """Circuit that started the transfer."""
+        return self._circuit
+
+    @property
+    def index(self) -> int:
+        """Index of the request within its circuit."""
+        return self._index
+
+    @property
+    def kind(self) -> str:
+        """``"send"`` or ``"recv"``."""
+        return self._kind
+
+    @property
+    def peer(self) -> int:
+        """Rank on the other end of the transfer."""
+        return self._peer
+
+    @property
+    def qubits(self) -> List[int]:
+        """Local qubits sent or receiving."""
+        return list(self._qubits)
+
+    def wait(self) -> Circuit:
+        """
+        Complete the transfer.
+
+        Returns:
+            The request's circuit.
+        """
+        return self._circuit.wait(self)
+
+    def test(self) -> bool:
+        """Return whether the transfer has been completed by a wait."""
+        return self._done
+
+    def _complete(self) -> None:
+        """Mark the request as waited on."""
+        self._done = True
+
+    def __repr__(self) -> str:
+        return (
+            f"QRequest(index={self._index}, kind={self._kind!r}, peer={self._peer}, "
+            f"qubits={self._qubits}, done={self._done})"
+        )
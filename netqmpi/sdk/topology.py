@@ -0,0 +1,301 @@
+"""
+Network topology of a communicator.
+
+A :class:`Topology` lists which ranks share a quantum link, i.e. can
+create EPR pairs directly, and what each link costs.  Every backend used
+to assume a full mesh, which stays the default.  On any other topology a
+transfer between ranks that are not linked follows :meth:`Topology.route`,
+the cheapest path, and the ranks along it join their EPR pairs by
+entanglement swapping; collectives can follow the shortest-path tree of
+:meth:`Topology.tree` so that every message crosses a single link.
+
+:class:`NetworkStats` counts how much each link and each route is used,
+to size the links of real hardware.
+
+Topologies are usually given by name through the ``topology`` field of
+:class:`~netqmpi.runtime.run_config.RunConfig` (see :meth:`Topology.parse`).
+"""
+from __future__ import annotations
+
+import heapq
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+# An undirected link, as ``(lower rank, higher rank)``.
+Link = Tuple[int, int]
+
+
+def _link(a: int, b: int) -> Link:
+    """Return the canonical key of the link between two ranks."""
+    return (a, b) if a < b else (b, a)
+
+
+class Topology:
+    """
+    Ranks and the quantum links between them.
+
+    Args:
+        size: Number of ranks.
+        links: Link -> cost of one EPR pair over it, e.g. its length or
+            inverse fidelity.  Keys may be given in either order.
+
+    Raises:
+        ValueError: If a link names an unknown rank or the rank itself,
+            a cost is not positive, or the ranks are not connected.
+    """
+
+    def __init__(self, size: int, links: Mapping[Tuple[int, int], float]) -> None:
+        self._size = size
+        self._links: Dict[Link, float] = {}
+        self._neighbors: List[List[int]] = [[] for _ in range(size)]
+        for (a, b), cost in links.items():
+            if not (0 <= a < size and 0 <= b < size) or a == b:
+                raise ValueError(f"Invalid link ({a}, {b}) for {size} ranks.")
+            if cost <= 0:
+                raise ValueError(f"Link ({a}, {b}) must have a positive cost; got {cost}.")
+            self._links[_link(a, b)] = float(cost)
+        for a, b in self._links:
+            self._neighbors[a].append(b)
+            self._neighbors[b].append(a)
+        for neighbors in self._neighbors:
+            neighbors.sort()
+        # Source rank -> predecessor of every rank on its cheapest path.
+        self._parents: Dict[int, List[Optional[int]]] = {}
+        if size and any(p is None for r, p in enumerate(self._shortest(0)) if r != 0):
+            raise ValueError("The topology does not connect every rank.")
+
+    # ------------------------------------------------------------------
+    # Constructors
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def full(cls, size: int) -> Topology:
+        """Every pair of ranks linked at unit cost."""
+        return cls(size, {(a, b): 1.0 for a in range(size) for b in range(a + 1, size)})
+
+    @classmethod
+    def line(cls, size: int) -> Topology:
+        """Rank ``r`` linked to ``r + 1``."""
+        return cls(size, {(r, r + 1): 1.0 for r in range(size - 1)})
+
+    @classmethod
+    def ring(cls, size: int) -> Topology:
+        """A line whose ends are linked too."""
+        links = {(r, r + 1): 1.0 for r in range(size - 1)}
+        if size > 2:
+            links[(0, size - 1)] = 1.0
+        return cls(size, links)
+
+    @classmethod
+    def star(cls, size: int, center: int = 0) -> Topology:
+        """Every rank linked to *center* only."""
+        return cls(size, {(center, r): 1.0 for r in range(size) if r != center})
+
+    @classmethod
+    def grid(cls, rows: int, cols: int) -> Topology:
+        """Ranks on a ``rows x cols`` grid, row by row, linked to their four neighbours."""
+        links = {}
+        for r in range(rows * cols):
+            if (r + 1) % cols:
+                links[(r, r + 1)] = 1.0
+            if r + cols < rows * cols:
+                links[(r, r + cols)] = 1.0
+        return cls(rows * cols, links)
+
+    @classmethod
+    def parse(cls, spec: Optional[str], size: int) -> Topology:
+        """
+        Build a topology from its description.
+
+        Args:
+            spec: ``None`` or ``"full"``, ``"line"``, ``"ring"``,
+                ``"star"``, ``"grid:RxC"`` with ``R * C == size``, or a
+                comma-separated list of links ``"a-b"`` with an optional
+                cost, e.g. ``"0-1,1-2:2.5"``.
+            size: Number of ranks.
+
+        Returns:
+            The topology.
+
+        Raises:
+            ValueError: If *spec* cannot be parsed or does not fit *size*.
+        """
+        if spec is None or spec == "full":
+            return cls.full(size)
+        if spec in ("line", "ring", "star"):
+            return getattr(cls, spec)(size)
+        try:
+            if spec.startswith("grid:"):
+                rows, cols = (int(n) for n in spec[len("grid:"):].split("x"))
+                if rows * cols != size:
+                    raise ValueError(f"A {rows}x{cols} grid does not hold {size} ranks.")
+                return cls.grid(rows, cols)
+            links = {}
+            for item in spec.split(","):
+                pair, _, cost = item.strip().partition(":")
+                a, b = (int(n) for n in pair.split("-"))
+                links[(a, b)] = float(cost) if cost else 1.0
+        except ValueError as exc:
+            raise ValueError(f"Invalid topology {spec!r}: {exc}") from None
+        return cls(size, links)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    @property
+    def size(self) -> int:
+        """Number of ranks."""
+        return self._size
+
+    @property
+    def links(self) -> Dict[Link, float]:
+        """Link -> cost, keyed as ``(lower rank, higher rank)``."""
+        return dict(self._links)
+
+    @property
+    def is_full(self) -> bool:
+        """Whether every pair of ranks is linked."""
+        return len(self._links) == self._size * (self._size - 1) // 2
+
+    def neighbors(self, rank: int) -> List[int]:
+        """Return the ranks linked to *rank*, in increasing order."""
+        return list(self._neighbors[rank])
+
+    def adjacent(self, a: int, b: int) -> bool:
+        """Return whether two ranks share a link."""
+        return _link(a, b) in self._links
+
+    def cost(self, a: int, b: int) -> float:
+        """
+        Return the cost of the link between two ranks.
+
+        Raises:
+            KeyError: If the ranks are not linked.
+        """
+        return self._links[_link(a, b)]
+
+    def route(self, src: int, dest: int) -> List[int]:
+        """
+        Return the cheapest path between two ranks.
+
+        Ties go to the path with fewer hops, then to the one whose ranks
+        come first in order, e.g. ``[0, 1, 3]`` before ``[0, 2, 3]``, so
+        both ends of a transfer find the same path.
+
+        Args:
+            src: First rank of the path.
+            dest: Last rank of the path.
+
+        Returns:
+            The ranks of the path, from *src* to *dest* inclusive.
+        """
+        parents = self._shortest(src)
+        path = [dest]
+        while path[-1] != src:
+            path.append(parents[path[-1]])
+        return path[::-1]
+
+    def distance(self, src: int, dest: int) -> float:
+        """Return the total link cost of :meth:`route`."""
+        path = self.route(src, dest)
+        return sum(self.cost(a, b) for a, b in zip(path, path[1:]))
+
+    def tree(self, root: int) -> Dict[int, List[int]]:
+        """
+        Return the shortest-path tree of a root: the union of its routes.
+
+        Args:
+            root: Root of the tree.
+
+        Returns:
+            Rank -> its children, in increasing order.
+        """
+        children: Dict[int, List[int]] = {r: [] for r in range(self._size)}
+        for r, parent in enumerate(self._shortest(root)):
+            if parent is not None:
+                children[parent].append(r)
+        return children
+
+    def _shortest(self, src: int) -> List[Optional[int]]:
+        """Return the predecessor of every rank on its cheapest path from *src*."""
+        parents = self._parents.get(src)
+        if parents is not None:
+            return parents
+        parents = [None] * self._size
+        # Paths are compared by cost, then hops, then their ranks in order.
+        best: Dict[int, Tuple[float, int, Tuple[int, ...]]] = {src: (0.0, 0, (src,))}
+        queue = [best[src]]
+        done = set()
+        while queue:
+            cost, hops, path = heapq.heappop(queue)
+            rank = path[-1]
+            if rank in done:
+                continue
+            done.add(rank)
+            for other in self._neighbors[rank]:
+                key = (cost + self._links[_link(rank, other)], hops + 1, path + (other,))
+                if other not in best or key < best[other]:
+                    best[other] = key
+                    parents[other] = rank
+                    heapq.heappush(queue, key)
+        self._parents[src] = parents
+        return parents
+
+    def __repr__(self) -> str:
+        return f"Topology(size={self._size}, links={self._links})"
+
+
+@dataclass
+class NetworkStats:
+    """
+    Usage of the links and routes of a topology.
+
+    Each EPR pair and each transfer is counted once, by the rank that
+    creates or sends it, so the stats of all ranks add up with
+    :meth:`merge`.
+
+    Attributes:
+        links: Link -> EPR pairs created over it, keyed as
+            ``(lower rank, higher rank)``.
+        routes: ``(src, dest)`` -> qubits sent from *src* to *dest*,
+            over as many links as its route has.
+    """
+
+    links: Dict[Link, int] = field(default_factory=dict)
+    routes: Dict[Tuple[int, int], int] = field(default_factory=dict)
+
+    def record_pairs(self, a: int, b: int, pairs: int = 1) -> None:
+        """Count EPR pairs created over the link between two ranks."""
+        key = _link(a, b)
+        self.links[key] = self.links.get(key, 0) + pairs
+
+    def record_route(self, src: int, dest: int, qubits: int) -> None:
+        """Count qubits sent from *src* to *dest*."""
+        if not qubits:
+            return
+        self.routes[(src, dest)] = self.routes.get((src, dest), 0) + qubits
+
+    def record_transfer(self, topology: Topology, src: int, dest: int, qubits: int) -> None:
+        """
+        Count a transfer and one EPR pair per qubit on every link of its route.
+
+        For backends whose transport does not create the pairs itself.
+        """
+        if not qubits:
+            return
+        self.record_route(src, dest, qubits)
+        path = topology.route(src, dest)
+        for a, b in zip(path, path[1:]):
+            self.record_pairs(a, b, qubits)
+
+    @classmethod
+    def merge(cls, stats: Iterable[NetworkStats]) -> NetworkStats:
+        """Return the sum of the stats of several ranks."""
+        total = cls()
+        for s in stats:
+            for key, n in s.links.items():
+                total.links[key] = total.links.get(key, 0) + n
+            for key, n in s.routes.items():
+                total.routes[key] = total.routes.get(key, 0) + n
+        return total
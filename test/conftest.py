@@ -0,0 +1,149 @@
+"""
+Shared fixtures for the NetQMPI test suite.
+"""
+import math
+import textwrap
+
+import pytest
+
+from netqmpi.runtime.executor import Executor
+from netqmpi.runtime.registry import get_backend
+
+MONOLITHIC_BACKENDS = ["aer", "numpy", "stabilizer", "mps", "sparse", "bitvector", "sharded"]
+
+
+@pytest.fixture(params=MONOLITHIC_BACKENDS)
+def backend(request):
+    """Name of each monolithic-program backend, skipping Aer if it is missing."""
+    if request.param == "aer":
+        pytest.importorskip("qiskit_aer")
+    return request.param
+
+
+@pytest.fixture
+def run_executor(tmp_path):
+    """
+    Run a NetQMPI script on a registered backend.
+
+    The fixture is a callable ``run_executor(backend, source, size, **config)``
+    that writes ``source`` (dedented) to a temporary file, runs it on
+    ``size`` ranks with the backend's run config built from ``config``,
+    and returns the executor, e.g. to inspect the program it compiled.
+    """
+    def run(backend: str, source: str, size: int, **config) -> Executor:
+        path = tmp_path / "main.py"
+        path.write_text(textwrap.dedent(source))
+        spec = get_backend(backend)
+        executor = spec.load()(size, config=spec.load_config_class()(**config))
+        executor.run(executor.build_apps(str(path), size))
+        return executor
+
+    return run
+
+
+@pytest.fixture
+def netqasm_network(monkeypatch):
+    """
+    Run the NetQASM backend against the in-process stub of ``netqasm``.
+
+    Returns the stub's :class:`netqasm_stub.Network`, whose logs record
+    what every rank asked of its node (see :mod:`netqasm_stub`).
+    """
+    import netqasm_stub
+
+    return netqasm_stub.install(monkeypatch)
+
+
+@pytest.fixture
+def run_script(run_executor):
+    """
+    Run a NetQMPI script on a registered backend.
+
+    The fixture is a callable ``run_script(backend, source, size, **config)``
+    that runs ``source`` as :func:`run_executor` does and returns the
+    counts of rank 0.
+    """
+    def run(backend: str, source: str, size: int, **config) -> dict:
+        return run_executor(backend, source, size, **config).results[0]["results"]
+
+    return run
+
+
+# ----------------------------------------------------------------------
+# Reference distributions
+# ----------------------------------------------------------------------
+
+GATES = """
+def main(env=None):
+    num_qubits = env.params["num_qubits"]
+    with env.comm:
+        circuit = env.create_circuit(num_qubits=num_qubits, num_clbits=num_qubits)
+        for name, *args in env.params["gates"]:
+            getattr(circuit, name)(*args)
+        for qubit in range(num_qubits):
+            circuit.measure(qubit, qubit)
+"""
+
+# Small fixed circuits as ``(num_qubits, gates)``.  Every gate is a
+# ``(name, *args)`` tuple in the argument order shared by the SDK circuit
+# and :class:`qiskit.QuantumCircuit`.
+CIRCUITS = {
+    "bell": (2, [("h", 0), ("cx", 0, 1)]),
+    "rotations": (3, [
+        ("rx", 0.3, 0), ("ry", 1.1, 1), ("rz", 0.7, 1), ("h", 2), ("t", 2),
+        ("crz", 1.3, 2, 0), ("h", 0), ("cz", 1, 2), ("ry", -0.4, 2), ("cx", 0, 1),
+    ]),
+    "toffoli": (3, [
+        ("h", 0), ("ry", 0.9, 1), ("ccx", 0, 1, 2), ("s", 2), ("y", 0),
+        ("swap", 0, 2), ("tdg", 1), ("h", 1), ("sdg", 0), ("rx", 2.1, 0),
+    ]),
+}
+
+CLIFFORD_CIRCUITS = {
+    "ghz": (3, [("h", 0), ("cx", 0, 1), ("cx", 1, 2)]),
+    "clifford": (3, [
+        ("h", 0), ("s", 0), ("h", 0), ("cx", 0, 1), ("h", 2), ("cz", 2, 1),
+        ("h", 1), ("rz", math.pi / 2, 2), ("h", 2), ("sdg", 0), ("y", 1),
+        ("swap", 0, 2), ("rx", -math.pi / 2, 1), ("crz", math.pi, 0, 2),
+    ]),
+}
+
+
+@pytest.fixture(params=list(CIRCUITS))
+def circuit(request):
+    """One of :data:`CIRCUITS`, as ``(num_qubits, gates)``."""
+    return CIRCUITS[request.param]
+
+
+@pytest.fixture(params=list(CLIFFORD_CIRCUITS))
+def clifford_circuit(request):
+    """One of :data:`CLIFFORD_CIRCUITS`, as ``(num_qubits, gates)``."""
+    return CLIFFORD_CIRCUITS[request.param]
+
+
+@pytest.fixture
+def statevector_distance(run_script):
+    """
+    Compare a backend with the exact distribution of a circuit.
+
+    The fixture is a callable
+    ``statevector_distance(backend, num_qubits, gates, shots=4096, **config)``
+    that runs ``gates`` on one rank, measures every qubit, and returns
+    the total variation distance between the counts and the
+    probabilities of :class:`qiskit.quantum_info.Statevector`.
+    """
+    quantum_info = pytest.importorskip("qiskit.quantum_info")
+    from qiskit import QuantumCircuit
+
+    def distance(backend: str, num_qubits: int, gates: list, shots: int = 4096, **config) -> float:
+        config.setdefault("seed", 1234)
+        params = {"num_qubits": num_qubits, "gates": gates}
+        counts = run_script(backend, GATES, 1, shots=shots, params=params, **config)
+        reference = QuantumCircuit(num_qubits)
+        for name, *args in gates:
+            getattr(reference, name)(*args)
+        probabilities = quantum_info.Statevector(reference).probabilities_dict()
+        keys = set(counts) | set(probabilities)
+        return sum(abs(counts.get(k, 0) / shots - probabilities.get(k, 0.0)) for k in keys) / 2
+
+    return distance
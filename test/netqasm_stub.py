@@ -0,0 +1,275 @@
+"""
+In-process stand-in for the parts of NetQASM the adapter uses.
+
+:func:`install` puts stub ``netqasm.*`` modules in :data:`sys.modules`.
+The stub simulator runs every rank's program in its own thread.  Qubits
+hold no state: every measurement is a future that resolves to ``0`` at
+the next flush of its connection and refuses to be read before, so a
+missing flush fails the test instead of going unnoticed.  Everything a
+rank asks of its node is appended to its log in :class:`Network`.
+"""
+import enum
+import queue
+import sys
+import threading
+import types
+from typing import Any, Dict, List, Tuple
+
+# Adapter modules importing ``netqasm``; re-imported against the stub.
+ADAPTER_MODULES = [
+    "netqmpi.runtime.adapters.netqasm.netqasm_circuit",
+    "netqmpi.runtime.adapters.netqasm.netqasm_communicator",
+    "netqmpi.runtime.adapters.netqasm.netqasm_executor",
+]
+
+
+class Network:
+    """
+    Logs and classical channels of one stub simulation.
+
+    Attributes:
+        logs: Party name -> the calls its node received, in order, as
+            tuples such as ``("H",)``, ``("create_keep", "rank_1", 3)``
+            or ``("flush",)``.
+    """
+
+    def __init__(self) -> None:
+        self.logs: Dict[str, List[Tuple[Any, ...]]] = {}
+        self._channels: Dict[Tuple[str, str], "queue.Queue"] = {}
+        self._lock = threading.Lock()
+
+    def log(self, party: str) -> List[Tuple[Any, ...]]:
+        with self._lock:
+            return self.logs.setdefault(party, [])
+
+    def channel(self, src: str, dest: str) -> "queue.Queue":
+        with self._lock:
+            return self._channels.setdefault((src, dest), queue.Queue())
+
+    def flushes(self, party: str) -> List[int]:
+        """Return the positions of the flushes in a party's log."""
+        return [i for i, call in enumerate(self.logs[party]) if call == ("flush",)]
+
+    def calls(self, party: str, name: str) -> List[Tuple[Any, ...]]:
+        """Return the calls named ``name`` in a party's log."""
+        return [call for call in self.logs[party] if call[0] == name]
+
+
+network = Network()
+
+
+# ----------------------------------------------------------------------
+# netqasm.sdk
+# ----------------------------------------------------------------------
+
+class Future:
+    """Measurement outcome, known once its connection has flushed."""
+
+    def __init__(self, connection: "NetQASMConnection") -> None:
+        self._value = None
+        connection._futures.append(self)
+
+    def __int__(self) -> int:
+        if self._value is None:
+            raise AssertionError("measurement outcome read before a flush")
+        return self._value
+
+    def __str__(self) -> str:
+        return str(int(self))
+
+
+class NetQASMConnection:
+    def __init__(self, app_name: str, log_config: Any = None, epr_sockets: List[Any] = ()) -> None:
+        self.app_name = app_name
+        self.log = network.log(app_name)
+        self._futures: List[Future] = []
+        for socket in epr_sockets:
+            socket.connection = self
+
+    def __enter__(self) -> "NetQASMConnection":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        return None
+
+    def flush(self) -> None:
+        self.log.append(("flush",))
+        futures, self._futures = self._futures, []
+        for future in futures:
+            future._value = 0
+
+
+def _gate(name: str):
+    def apply(self, *args: Any, **kwargs: Any) -> None:
+        self._connection.log.append((name,))
+
+    return apply
+
+
+class Qubit:
+    def __init__(self, connection: NetQASMConnection, epr: bool = False) -> None:
+        self._connection = connection
+        if not epr:
+            connection.log.append(("qubit",))
+
+    H, X, Y, Z, S, T = (_gate(name) for name in ("H", "X", "Y", "Z", "S", "T"))
+    rot_X, rot_Y, rot_Z = (_gate(name) for name in ("rot_X", "rot_Y", "rot_Z"))
+    cnot, cphase, free = _gate("cnot"), _gate("cphase"), _gate("free")
+
+    def measure(self, inplace: bool = False) -> Future:
+        self._connection.log.append(("measure",))
+        return Future(self._connection)
+
+
+class EPRSocket:
+    def __init__(self, remote_app_name: str) -> None:
+        self.remote_app_name = remote_app_name
+        self.connection = None
+
+    def _halves(self, call: str, number: int) -> List[Qubit]:
+        self.connection.log.append((call, self.remote_app_name, number))
+        return [Qubit(self.connection, epr=True) for _ in range(number)]
+
+    def create_keep(self, number: int = 1) -> List[Qubit]:
+        return self._halves("create_keep", number)
+
+    def recv_keep(self, number: int = 1) -> List[Qubit]:
+        return self._halves("recv_keep", number)
+
+
+class StructuredMessage:
+    def __init__(self, header: str, payload: Any) -> None:
+        self.header = header
+        self.payload = payload
+
+
+class Socket:
+    def __init__(self, app_name: str, remote_app_name: str) -> None:
+        self._app_name = app_name
+        self._remote = remote_app_name
+
+    def send_structured(self, message: StructuredMessage) -> None:
+        network.log(self._app_name).append(("send", self._remote, message.header))
+        network.channel(self._app_name, self._remote).put(message)
+
+    def recv_structured(self) -> StructuredMessage:
+        message = network.channel(self._remote, self._app_name).get(timeout=10)
+        network.log(self._app_name).append(("recv", self._remote, message.header))
+        return message
+
+
+def create_ghz(**kwargs: Any) -> None:
+    raise NotImplementedError("create_ghz is not stubbed")
+
+
+# ----------------------------------------------------------------------
+# netqasm.runtime
+# ----------------------------------------------------------------------
+
+class Formalism(enum.Enum):
+    KET = "ket"
+
+
+class Simulator(enum.Enum):
+    NETSQUID = "netsquid"
+
+
+class _Record:
+    """Keeps its keyword arguments as attributes."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        self.__dict__.update(kwargs)
+
+
+class AppConfig(_Record):
+    pass
+
+
+class Application(_Record):
+    pass
+
+
+class ApplicationInstance(_Record):
+    pass
+
+
+class Program(_Record):
+    pass
+
+
+def simulate_application(app_instance: ApplicationInstance, **kwargs: Any) -> None:
+    """Run every program in its own thread and re-raise the first failure."""
+    errors: List[BaseException] = []
+
+    def run(program: Program) -> None:
+        try:
+            program.entry(app_config=types.SimpleNamespace(app_name=program.party, log_config=None))
+        except BaseException as exc:  # noqa: BLE001
+            errors.append(exc)
+
+    threads = [
+        threading.Thread(target=run, args=(program,), name=program.party)
+        for program in app_instance.app.programs
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise errors[0]
+
+
+def _noop(*args: Any, **kwargs: Any) -> None:
+    return None
+
+
+MODULES = {
+    "netqasm": {},
+    "netqasm.sdk": {"EPRSocket": EPRSocket, "Qubit": Qubit},
+    "netqasm.sdk.external": {
+        "NetQASMConnection": NetQASMConnection, "Socket": Socket,
+        "simulate_application": simulate_application,
+    },
+    "netqasm.sdk.toolbox": {"create_ghz": create_ghz},
+    "netqasm.sdk.classical_communication": {},
+    "netqasm.sdk.classical_communication.message": {"StructuredMessage": StructuredMessage},
+    "netqasm.runtime": {},
+    "netqasm.runtime.env": {"load_roles_config": _noop},
+    "netqasm.runtime.app_config": {"AppConfig": AppConfig},
+    "netqasm.runtime.application": {
+        "Application": Application, "ApplicationInstance": ApplicationInstance,
+        "Program": Program, "network_cfg_from_path": _noop,
+    },
+    "netqasm.runtime.process_logs": {"create_app_instr_logs": _noop, "make_last_log": _noop},
+    "netqasm.runtime.settings": {
+        "Formalism": Formalism, "Simulator": Simulator, "set_simulator": _noop,
+    },
+    "netqasm.util": {},
+    "netqasm.util.yaml": {"load_yaml": lambda path: {}},
+}
+
+
+def install(monkeypatch) -> Network:
+    """
+    Install the stub for one test and return its fresh :class:`Network`.
+
+    The adapter modules are imported again against the stub; the
+    monkeypatch restores :data:`sys.modules` afterwards.
+    """
+    global network
+    network = Network()
+    for name, attributes in MODULES.items():
+        module = types.ModuleType(name)
+        module.__dict__.update(attributes)
+        monkeypatch.setitem(sys.modules, name, module)
+    sys.modules["netqasm.runtime"].env = sys.modules["netqasm.runtime.env"]
+    for name in ADAPTER_MODULES:
+        # Set first so that undoing drops the stub-bound module again.
+        monkeypatch.setitem(sys.modules, name, None)
+        monkeypatch.delitem(sys.modules, name)
+
+    from netqmpi.runtime.adapters.netqasm.netqasm_communicator import NetQASMCommunicator
+
+    monkeypatch.setattr(NetQASMCommunicator, "netqasm_circuits", [])
+    monkeypatch.setattr(NetQASMCommunicator, "rank_circuits", {})
+    return network
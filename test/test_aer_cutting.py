@@ -0,0 +1,113 @@
+"""
+Cutting the Aer global circuit at inter-rank links and knitting it back.
+"""
+import pytest
+
+pytest.importorskip("qiskit_aer")
+
+from qiskit import QuantumCircuit  # noqa: E402
+from qiskit.quantum_info import Statevector  # noqa: E402
+
+from netqmpi.runtime.adapters.aer.aer_cutting import CircuitKnitter, plan_cuts  # noqa: E402
+
+
+def _rank_of(qubit):
+    return qubit // 2
+
+
+def _two_rank_circuit():
+    """Two ranks of two qubits; rank 0 hands qubit 0 to rank 1 halfway."""
+    circuit = QuantumCircuit(4, 4)
+    circuit.h(0)
+    circuit.ry(0.8, 1)
+    circuit.cx(0, 1)
+    circuit.measure(1, 1)
+    circuit.swap(0, 2)
+    circuit.rx(0.5, 2)
+    circuit.cx(2, 3)
+    circuit.measure(2, 2)
+    circuit.measure(3, 3)
+    return circuit
+
+
+def test_plan_cuts_at_the_inter_rank_swap():
+    plan = plan_cuts(_two_rank_circuit(), _rank_of)
+    assert plan.summary() == {
+        "num_cuts": 1,
+        "num_fragments": 2,
+        "max_fragment_width": 2,
+        "num_subexperiments": 3 + 6,
+        "sampling_overhead": 16,
+    }
+    assert sorted(fragment.clbits for fragment in plan.fragments) == [[1], [2, 3]]
+
+
+def test_knitting_recovers_the_uncut_distribution():
+    circuit = _two_rank_circuit()
+    exact = Statevector(circuit.remove_final_measurements(inplace=False)).probabilities_dict([1, 2, 3])
+    # Clbit 0 is never written.
+    exact = {key + "0": p for key, p in exact.items()}
+
+    quasi = CircuitKnitter(plan_cuts(circuit, _rank_of), shots=40000, seed=3, workers=1).run()
+    keys = set(exact) | set(quasi)
+    assert max(abs(quasi.get(k, 0.0) - exact.get(k, 0.0)) for k in keys) < 0.03
+    assert sum(quasi.values()) == pytest.approx(1.0, abs=1e-9)
+
+
+def test_clbits_written_on_both_sides_of_a_cut_are_rejected():
+    circuit = QuantumCircuit(4, 2)
+    circuit.h(0)
+    circuit.measure(0, 0)
+    circuit.swap(0, 2)
+    circuit.h(2)
+    circuit.measure(2, 0)
+    with pytest.raises(ValueError, match="Clbit 0 is written on both sides of a cut"):
+        plan_cuts(circuit, _rank_of)
+
+
+# ----------------------------------------------------------------------
+# Through the executor
+# ----------------------------------------------------------------------
+
+RELAY = """
+def main(env=None):
+    rank = env.comm.rank
+    with env.comm:
+        circuit = env.create_circuit(num_qubits=2, num_clbits=2)
+        if rank == 0:
+            circuit.h(0)
+            circuit.ry(0.8, 1)
+            circuit.cx(0, 1)
+            circuit.measure(1, 1)
+            circuit.qsend([0], 1)
+            if env.params["overwrite"]:
+                circuit.qrecv([0], 1)
+                circuit.measure(0, 1)
+        else:
+            circuit.qrecv([0], 0)
+            circuit.rx(0.5, 0)
+            circuit.cx(0, 1)
+            circuit.measure(0, 0)
+            circuit.measure(1, 1)
+            if env.params["overwrite"]:
+                circuit.qsend([0], 0)
+"""
+
+
+def test_cut_runs_match_uncut_runs(run_script, run_executor):
+    config = dict(shots=20000, seed_simulator=5, params={"overwrite": False})
+    uncut = run_script("aer", RELAY, 2, **config)
+    executor = run_executor("aer", RELAY, 2, max_qubits=3, cutting_workers=1, **config)
+    cut = executor.results[0]["results"]
+    assert executor.cut_plan.num_cuts == 1
+    keys = set(uncut) | set(cut)
+    assert sum(abs(cut.get(k, 0) - uncut.get(k, 0)) for k in keys) / 2 / 20000 < 0.05
+
+
+def test_cut_runs_reject_clbits_written_on_both_sides(run_executor):
+    with pytest.raises(RuntimeError) as info:
+        run_executor(
+            "aer", RELAY, 2, max_qubits=3, cutting_workers=1, params={"overwrite": True},
+        )
+    assert isinstance(info.value.__cause__, ValueError)
+    assert "written on both sides of a cut" in str(info.value.__cause__)
@@ -0,0 +1,61 @@
+"""
+Composing the global Aer circuit from translated rank programs.
+"""
+import pytest
+
+pytest.importorskip("qiskit")
+
+from netqmpi.runtime.adapters.aer import aer_layout  # noqa: E402
+from netqmpi.runtime.adapters.aer.aer_layout import AerLayout, splice, translate_rank  # noqa: E402
+from netqmpi.runtime.adapters.aer.aer_process import (  # noqa: E402
+    AerProcessCommunicator, _RecordingExecutor,
+)
+from netqmpi.runtime.adapters.aer.aer_run_config import AerSimulatorConfig  # noqa: E402
+from netqmpi.sdk.environment import Environment  # noqa: E402
+
+
+def _record(rank, size):
+    """Record the circuits of one rank without running the program."""
+    config = AerSimulatorConfig()
+    env = Environment(AerProcessCommunicator(rank, size, config, None), _RecordingExecutor(config))
+    circuit = env.create_circuit(3, 2)
+    circuit.h(0)
+    circuit.rx(0.25 * (rank + 1), 1)
+    circuit.crz(1.5, 0, 2)
+    circuit.ccx(0, 1, 2)
+    circuit.measure(1, 1)
+    circuit.reset(1)
+    circuit.barrier()
+    if rank == 0:
+        circuit.qsend([2], 1)
+    else:
+        circuit.qrecv([2], 0)
+    circuit.sdg(2)
+    circuit.measure(2, 0)
+    return env.comm.circuits
+
+
+def _programs(size=2):
+    layout = AerLayout.plan([[(3, 2)]] * size)
+    return layout, splice([translate_rank(_record(rank, size), layout) for rank in range(size)])
+
+
+def test_bulk_emission_is_supported_by_the_installed_qiskit():
+    assert aer_layout._bulk_emission_supported()
+
+
+def test_bulk_emission_matches_append(monkeypatch):
+    layout, programs = _programs()
+    bulk = layout.compose(programs)
+    monkeypatch.setattr(aer_layout, "_bulk_emission_supported", lambda: False)
+    appended = layout.compose(programs)
+
+    # The Aer translation emits no classically conditioned gates, so
+    # params, qubits and clbits are all there is to compare.
+    assert bulk == appended
+    assert len(bulk.data) == len(appended.data) == sum(len(p) for p in programs)
+    for fast, slow in zip(bulk.data, appended.data):
+        assert fast.operation.name == slow.operation.name
+        assert list(fast.operation.params) == list(slow.operation.params)
+        assert fast.qubits == slow.qubits
+        assert fast.clbits == slow.clbits
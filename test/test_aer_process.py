@@ -0,0 +1,41 @@
+"""
+Aer ranks run in worker processes.
+"""
+import pytest
+
+pytest.importorskip("qiskit_aer")
+
+from netqmpi.runtime.adapters.aer.aer_executor import AerExecutorAdapter  # noqa: E402
+from netqmpi.runtime.adapters.aer.aer_run_config import AerSimulatorConfig  # noqa: E402
+
+RELAY = """
+def main(env=None):
+    rank = env.comm.rank
+    with env.comm:
+        circuit = env.create_circuit(num_qubits=2, num_clbits=2)
+        if rank == 0:
+            circuit.ry(0.9, 0)
+            circuit.h(1)
+            circuit.cx(1, 0)
+            circuit.measure(1, 1)
+            circuit.qsend([0], 1)
+        else:
+            circuit.qrecv([0], 0)
+            circuit.rx(0.4, 0)
+            circuit.cx(0, 1)
+            circuit.measure(0, 0)
+            circuit.measure(1, 1)
+"""
+
+
+def test_process_runs_match_thread_runs(run_executor):
+    config = dict(shots=2000, seed_simulator=11)
+    thread = run_executor("aer", RELAY, 2, rank_runner="thread", **config)
+    process = run_executor("aer", RELAY, 2, rank_runner="process", **config)
+    assert process.results == thread.results
+
+
+def test_unknown_rank_runners_are_rejected_before_running(tmp_path):
+    executor = AerExecutorAdapter(2, AerSimulatorConfig(rank_runner="fiber"))
+    with pytest.raises(ValueError, match="Unknown rank_runner 'fiber'"):
+        executor.build_apps(str(tmp_path / "main.py"), 2)
@@ -0,0 +1,85 @@
+"""
+Bit-vector backend: classical gates, and rejection of or fallback for
+the others.
+"""
+import math
+
+import pytest
+
+from netqmpi.runtime.adapters.monolithic.monolithic_layout import GlobalLayout
+from netqmpi.runtime.adapters.bitvector.bitvector_state import flips_target, is_classical, simulate
+
+# Reversible circuits as ``(num_qubits, gates)``, in the format of the
+# Qiskit reference circuits.
+CLASSICAL_CIRCUITS = {
+    "toffoli": (3, [("x", 0), ("x", 1), ("ccx", 0, 1, 2), ("cx", 2, 0)]),
+    "permutation": (4, [
+        ("x", 0), ("swap", 0, 3), ("cx", 3, 1), ("y", 2), ("rx", math.pi, 0),
+        ("z", 1), ("s", 3), ("t", 2), ("rz", 0.4, 1), ("crz", 0.7, 3, 2), ("ccx", 1, 2, 0),
+    ]),
+}
+
+
+@pytest.mark.parametrize("name", list(CLASSICAL_CIRCUITS))
+def test_matches_the_statevector(statevector_distance, name):
+    assert statevector_distance("bitvector", *CLASSICAL_CIRCUITS[name]) < 1e-9
+
+
+@pytest.mark.parametrize("name, params, flips", [
+    ("x", (), True), ("y", (), True), ("cx", (), True), ("ccx", (), True),
+    ("rx", (math.pi,), True), ("ry", (-math.pi,), True),
+    ("z", (), False), ("t", (), False), ("rz", (0.3,), False),
+    ("cz", (), False), ("crz", (1.0,), False),
+    ("h", (), None), ("rx", (0.3,), None), ("u3", (), None),
+])
+def test_flips_target(name, params, flips):
+    assert flips_target(name, params) is flips
+    assert is_classical(name, params) is (flips is not None)
+
+
+def test_all_shots_share_one_outcome():
+    layout = GlobalLayout.plan([[(2, 2)]])
+    program = [
+        ("x", (), (0,), ()), ("measure", (), (0,), (0,)),
+        ("reset", (), (0,), ()), ("cx", (), (0, 1), ()), ("measure", (), (0,), (1,)),
+    ]
+    assert simulate([program], layout, 50) == {"01": 50}
+    assert simulate([program], layout, 0) == {}
+
+
+# ----------------------------------------------------------------------
+# Programs that are not classical
+# ----------------------------------------------------------------------
+
+def test_non_reversible_gates_are_rejected():
+    layout = GlobalLayout.plan([[(1, 1)]])
+    with pytest.raises(ValueError, match="is not a classical gate"):
+        simulate([[("h", (), (0,), ())]], layout, 10)
+
+
+SUPERPOSITION = """
+def main(env=None):
+    with env.comm:
+        circuit = env.create_circuit(num_qubits=1, num_clbits=1)
+        circuit.h(0)
+        circuit.measure(0, 0)
+"""
+
+
+def test_non_reversible_programs_fail_without_a_fallback(run_executor):
+    with pytest.raises(RuntimeError) as info:
+        run_executor("bitvector", SUPERPOSITION, 1, fallback=None)
+    assert isinstance(info.value.__cause__, ValueError)
+    assert "is not a classical gate" in str(info.value.__cause__)
+
+
+@pytest.mark.parametrize("fallback, adapter", [
+    ({}, "SparseExecutorAdapter"),
+    ({"fallback": "numpy"}, "NumpyExecutorAdapter"),
+])
+def test_non_reversible_programs_run_on_the_fallback(run_executor, fallback, adapter):
+    executor = run_executor("bitvector", SUPERPOSITION, 1, shots=1000, seed=1, **fallback)
+    counts = executor.results[0]["results"]
+    assert type(executor.delegate).__name__ == adapter
+    assert sorted(counts) == ["0", "1"]
+    assert sum(counts.values()) == 1000
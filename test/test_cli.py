@@ -0,0 +1,72 @@
+"""
+Command-line entry point: help and backend selection.
+"""
+import sys
+
+import pytest
+
+from netqmpi.runtime import cli, registry
+
+
+@pytest.fixture
+def netqmpi(monkeypatch, capsys):
+    """
+    Run ``netqmpi`` with NetQASM missing.
+
+    The fixture is a callable ``netqmpi(*args)`` that runs :func:`cli.main`
+    with those arguments and returns ``(exit_status, stdout, stderr)``.
+    """
+    monkeypatch.setitem(sys.modules, "netqasm", None)
+    for name in list(sys.modules):
+        if name.startswith("netqmpi.runtime.adapters.netqasm."):
+            monkeypatch.delitem(sys.modules, name)
+    monkeypatch.setattr(registry, "_backends", None)
+
+    def run(*args):
+        monkeypatch.setattr(sys, "argv", ["netqmpi", *args])
+        with pytest.raises(SystemExit) as info:
+            cli.main()
+        out, err = capsys.readouterr()
+        return info.value.code, out, err
+
+    return run
+
+
+def test_help_lists_backends_without_importing_them(netqmpi, monkeypatch):
+    def load(spec):
+        pytest.fail(f"{spec.name} was imported")
+
+    monkeypatch.setattr(registry.BackendSpec, "load", load)
+    status, out, _ = netqmpi("--help")
+    assert status == 0
+    assert "--backend" in out
+    assert "aer,bitvector,cunqa,mps,netqasm,numpy" in out.replace(" ", "").replace("\n", "")
+    assert "Pass --backend NAME --help" in out
+
+
+def test_help_shows_the_options_of_the_selected_backend(netqmpi):
+    status, out, _ = netqmpi("--backend", "numpy", "--help")
+    assert status == 0
+    assert "numpy options" in out
+    assert "--precision" in out
+
+
+def test_help_notes_a_missing_backend(netqmpi):
+    status, out, _ = netqmpi("--backend", "netqasm", "--help")
+    assert status == 0
+    assert "Options of backend 'netqasm' are not shown" in out
+
+
+def test_runs_report_a_missing_backend(netqmpi, tmp_path):
+    status, _, err = netqmpi("-n", "1", str(tmp_path / "main.py"))
+    assert status == 2
+    assert "backend 'netqasm' is not available" in err
+
+
+@pytest.mark.parametrize("backend", ["numpy", "aer"])
+def test_only_implemented_transfer_modes_are_offered(netqmpi, tmp_path, backend):
+    status, _, err = netqmpi(
+        "--backend", backend, "--transfer-mode", "teleport", "-n", "1", str(tmp_path / "main.py"),
+    )
+    assert status == 2
+    assert "invalid choice: 'teleport'" in err
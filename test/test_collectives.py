@@ -0,0 +1,415 @@
+"""
+Schedules, cost model and lowering of the quantum collectives.
+"""
+import math
+
+import pytest
+
+from netqmpi.sdk.collectives import (
+    broadcast_cost,
+    broadcast_links,
+    choose_algorithm,
+    chunk_bounds,
+    collective_cost,
+    CollectiveCost,
+    gather_schedule,
+    lower_broadcast,
+    lower_collective,
+    lower_reduce,
+    reduce_cost,
+    scatter_schedule,
+)
+from netqmpi.sdk.operations import (
+    ControlledGate, Gate, QAllreduce, QBcast, QGather, QRecv, QReduce, QScatter, QSend, QUnbcast,
+)
+from netqmpi.sdk.topology import Topology
+
+SCHEDULES = ["linear", "binomial", "halving", "tree"]
+SIZES = range(1, 9)
+
+
+def _roots(size):
+    return sorted({0, size // 2, size - 1})
+
+
+def _topologies(size):
+    yield None
+    yield Topology.line(size)
+    yield Topology.ring(size)
+    yield Topology.star(size, center=size - 1)
+
+
+def _exchange(rank_ops, holdings):
+    """
+    Run the QSend/QRecv of every rank as blocking rendezvous messages.
+
+    Args:
+        rank_ops: Per rank, its operations in program order.
+        holdings: Per rank, local qubit -> label; updated in place as
+            labels move with the qubits sent.
+
+    Returns:
+        The ``(src, dest, labels)`` messages in the order they ran.
+
+    Raises:
+        AssertionError: If a send has no matching receive, or the ranks
+            wait on each other.
+    """
+    queues = [[op for op in ops if isinstance(op, (QSend, QRecv))] for ops in rank_ops]
+    positions = [0] * len(queues)
+    messages = []
+    progress = True
+    while progress:
+        progress = False
+        for src, queue in enumerate(queues):
+            if positions[src] == len(queue) or not isinstance(queue[positions[src]], QSend):
+                continue
+            send = queue[positions[src]]
+            dest_queue = queues[send.dest_rank]
+            if positions[send.dest_rank] == len(dest_queue):
+                continue
+            recv = dest_queue[positions[send.dest_rank]]
+            if not isinstance(recv, QRecv) or recv.src_rank != src:
+                continue
+            assert len(recv.qubits) == len(send.qubits), (send, recv)
+            labels = [holdings[src].pop(q, None) for q in send.qubits]
+            for q, label in zip(recv.qubits, labels):
+                holdings[send.dest_rank][q] = label
+            messages.append((src, send.dest_rank, labels))
+            positions[src] += 1
+            positions[send.dest_rank] += 1
+            progress = True
+    stuck = {rank: queue[positions[rank]] for rank, queue in enumerate(queues) if positions[rank] < len(queue)}
+    assert not stuck, f"ranks wait on each other: {stuck}"
+    return messages
+
+
+# ----------------------------------------------------------------------
+# Schedules
+# ----------------------------------------------------------------------
+
+def test_chunk_bounds_gives_the_remainder_to_the_first_blocks():
+    assert chunk_bounds(7, 3) == [(0, 3), (3, 5), (5, 7)]
+    assert chunk_bounds(2, 4) == [(0, 1), (1, 2), (2, 2), (2, 2)]
+
+
+@pytest.mark.parametrize("algorithm", SCHEDULES)
+@pytest.mark.parametrize("size", SIZES)
+def test_scatter_schedule_delivers_every_block_once(algorithm, size):
+    for root in _roots(size):
+        for topology in _topologies(size):
+            transfers = scatter_schedule(size, root, algorithm, topology)
+            held = {root: set(range(size))}
+            for t in transfers:
+                assert set(t.blocks) <= held.get(t.src, set()), t
+                held[t.src] -= set(t.blocks)
+                held.setdefault(t.dest, set()).update(t.blocks)
+            assert held == {rank: {rank} for rank in range(size)}
+
+
+@pytest.mark.parametrize("algorithm", SCHEDULES)
+def test_scatter_rounds_pair_distinct_ranks(algorithm):
+    for size in SIZES:
+        for root in _roots(size):
+            rounds = {}
+            for t in scatter_schedule(size, root, algorithm):
+                busy = rounds.setdefault(t.round, set())
+                assert not busy & {t.src, t.dest}
+                busy |= {t.src, t.dest}
+
+
+def test_tree_schedules_take_logarithmic_rounds():
+    for size in SIZES:
+        depth = math.ceil(math.log2(size)) if size > 1 else 0
+        for algorithm in ("binomial", "halving"):
+            rounds = {t.round for t in scatter_schedule(size, 0, algorithm)}
+            assert len(rounds) == depth
+
+
+def test_gather_schedule_reverses_the_scatter():
+    scatter = scatter_schedule(8, 3, "binomial")
+    gather = gather_schedule(8, 3, "binomial")
+    assert [(t.src, t.dest, t.blocks) for t in gather] == [
+        (t.dest, t.src, t.blocks) for t in reversed(scatter)
+    ]
+    assert gather[0].round == 0
+
+
+def test_tree_schedule_follows_the_links():
+    topology = Topology.line(5)
+    for t in scatter_schedule(5, 2, "tree", topology):
+        assert topology.adjacent(t.src, t.dest)
+
+
+def test_unknown_schedule_is_rejected():
+    with pytest.raises(ValueError, match="Unknown collective schedule"):
+        scatter_schedule(4, 0, "ring")
+
+
+# ----------------------------------------------------------------------
+# Cost model
+# ----------------------------------------------------------------------
+
+def test_linear_cost():
+    assert collective_cost("linear", 5, 2) == CollectiveCost(
+        rounds=4, messages=4, teleports=8, buffer=2, epr_pairs=8, link_cost=8.0,
+    )
+
+
+def test_binomial_cost_counts_relayed_qubits():
+    cost = collective_cost("binomial", 8, 1)
+    assert (cost.rounds, cost.messages, cost.teleports, cost.buffer) == (3, 7, 12, 4)
+
+
+def test_cost_on_a_topology_counts_every_hop():
+    cost = collective_cost("linear", 4, 1, Topology.line(4), root=0)
+    # Blocks travel 1, 2 and 3 links.
+    assert cost.epr_pairs == 6
+    assert cost.link_cost == 6.0
+
+
+def test_estimate_weighs_rounds_against_pairs():
+    cost = CollectiveCost(rounds=3, messages=7, teleports=12, buffer=4, epr_pairs=12, link_cost=12.0)
+    assert cost.estimate() == 3 + 12 * 0.25
+    assert cost.estimate(round_latency=2.0, pair_cost=1.0) == 18.0
+
+
+def test_choose_algorithm_prefers_linear_for_few_ranks():
+    assert choose_algorithm(2, 4) == "linear"
+    assert choose_algorithm(8, 4, round_latency=0.0) == "linear"
+
+
+def test_choose_algorithm_prefers_a_tree_when_rounds_dominate():
+    algorithm = choose_algorithm(8, 1, round_latency=10.0)
+    assert algorithm in ("binomial", "halving")
+    assert collective_cost(algorithm, 8, 1).rounds == 3
+
+
+@pytest.mark.parametrize("size", [3, 6, 8])
+def test_choose_algorithm_minimises_the_estimate_on_a_topology(size):
+    for topology in _topologies(size):
+        for root in _roots(size):
+            estimates = {a: collective_cost(a, size, 1, topology, root).estimate() for a in SCHEDULES}
+            chosen = choose_algorithm(size, 1, topology=topology, root=root)
+            assert estimates[chosen] == min(estimates.values())
+
+
+# ----------------------------------------------------------------------
+# Lowering of scatter and gather
+# ----------------------------------------------------------------------
+
+@pytest.mark.parametrize("algorithm", ["auto"] + SCHEDULES)
+@pytest.mark.parametrize("size", SIZES)
+def test_lowered_scatter_and_gather_pair_up(algorithm, size):
+    width = 2
+    num_qubits = size * width
+    for root in _roots(size):
+        for topology in _topologies(size):
+            register = list(range(num_qubits))
+            own = list(range(width))
+
+            holdings = [
+                {q: (b, q - start) for b, (start, stop) in enumerate(chunk_bounds(num_qubits, size))
+                 for q in range(start, stop)}
+                if rank == root else {}
+                for rank in range(size)
+            ]
+            scatter = [
+                lower_collective(
+                    QScatter(register if rank == root else own, root, algorithm),
+                    rank, size, num_qubits, topology,
+                )
+                for rank in range(size)
+            ]
+            _exchange(scatter, holdings)
+            for rank in range(size):
+                slots = register[rank * width:(rank + 1) * width] if rank == root else own
+                assert [holdings[rank].get(q) for q in slots] == [(rank, j) for j in range(width)]
+
+            gather = [
+                lower_collective(
+                    QGather(register if rank == root else own, root, algorithm),
+                    rank, size, num_qubits, topology,
+                )
+                for rank in range(size)
+            ]
+            _exchange(gather, holdings)
+            assert [holdings[root].get(q) for q in register] == [
+                (b, j) for b in range(size) for j in range(width)
+            ]
+
+
+def test_lowered_tree_rejects_an_uneven_register():
+    with pytest.raises(ValueError, match="does not split evenly"):
+        lower_collective(QScatter([0, 1, 2], 0, "binomial"), 0, 2, 3)
+
+
+def test_lowered_tree_needs_free_qubits_to_relay():
+    with pytest.raises(IndexError, match="free qubits"):
+        lower_collective(QScatter([0], 0, "binomial"), 2, 8, 1)
+
+
+def test_lower_collective_rejects_other_operations():
+    with pytest.raises(TypeError):
+        lower_collective(QSend([0], 1), 0, 2, 1)
+
+
+# ----------------------------------------------------------------------
+# Broadcast
+# ----------------------------------------------------------------------
+
+def test_broadcast_cost():
+    cost = broadcast_cost(8)
+    assert (cost.rounds, cost.messages, cost.teleports, cost.epr_pairs) == (3, 7, 0, 7)
+    assert broadcast_cost(1).buffer == 0
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_lowered_broadcast_pairs_up(size):
+    for root in _roots(size):
+        for topology in _topologies(size):
+            holdings = [{} for _ in range(size)]
+            for op in (QBcast(0, root), QUnbcast(0, root)):
+                lowered = [lower_broadcast(op, rank, size, 2, topology=topology) for rank in range(size)]
+                messages = _exchange(lowered, holdings)
+                assert len(messages) == size - 1
+            for rank in range(size):
+                parent, children = broadcast_links(rank, size, root, topology)
+                assert (parent is None) == (rank == root)
+                if topology is not None:
+                    assert all(topology.adjacent(rank, child) for child in children)
+
+
+def test_lowered_broadcast_copies_into_an_ancilla():
+    ops = lower_broadcast(QBcast(1, 0), 0, 2, 3, reserved=[0])
+    assert ops[1] == ControlledGate([1], [Gate("X", [2])])
+    assert ops[2] == QSend([2], 1)
+
+
+def test_lowered_broadcast_needs_an_ancilla_to_relay():
+    with pytest.raises(IndexError, match="no ancilla"):
+        lower_broadcast(QBcast(0, 0), 0, 2, 1)
+
+
+def test_lower_broadcast_rejects_other_operations():
+    with pytest.raises(TypeError):
+        lower_broadcast(QSend([0], 1), 0, 2, 1)
+
+
+# ----------------------------------------------------------------------
+# Reduce
+# ----------------------------------------------------------------------
+
+def test_reduce_cost_adds_an_unbroadcast_and_a_second_fanout():
+    fanout = broadcast_cost(6)
+    reduce = reduce_cost(6)
+    allreduce = reduce_cost(6, allreduce=True)
+    assert (reduce.rounds, reduce.epr_pairs) == (2 * fanout.rounds, fanout.epr_pairs)
+    assert (allreduce.rounds, allreduce.epr_pairs) == (3 * fanout.rounds, 2 * fanout.epr_pairs)
+
+
+def test_lower_reduce_wraps_the_contribution_in_a_broadcast():
+    ops = lower_reduce(QReduce(0, 1, root=0), 1)
+    assert ops == [
+        Gate("H", [0]),
+        QBcast(1, 0),
+        ControlledGate([1], [Gate("X", [0])]),
+        QUnbcast(1, 0),
+        Gate("H", [0]),
+    ]
+    assert lower_reduce(QAllreduce(0, 1, root=0), 1)[-1] == QBcast(1, 0)
+
+
+def test_lower_reduce_rejects_other_operations():
+    with pytest.raises(TypeError):
+        lower_reduce(QBcast(0, 0), 0)
+
+
+def _run_lowered_reduce(op_for_rank, size, prepare):
+    """
+    Statevector of the lowered reduce, with broadcasts as cat-state copies.
+
+    Every rank owns two qubits, data ``0`` and target ``1``; ``prepare``
+    adds the input state to a circuit.
+    """
+    from qiskit import QuantumCircuit
+    from qiskit.quantum_info import Statevector
+
+    circuit = QuantumCircuit(2 * size)
+    prepare(circuit)
+    lowered = [lower_reduce(op_for_rank(rank), rank) for rank in range(size)]
+    positions = [0] * size
+    while True:
+        # Local gates commute across ranks; run each rank up to its next broadcast.
+        for rank in range(size):
+            while positions[rank] < len(lowered[rank]):
+                op = lowered[rank][positions[rank]]
+                if isinstance(op, (QBcast, QUnbcast)):
+                    break
+                _apply(circuit, op, 2 * rank)
+                positions[rank] += 1
+        if positions[0] == len(lowered[0]):
+            return Statevector(circuit)
+        collective = lowered[0][positions[0]]
+        root = 2 * collective.root + collective.qubit
+        for rank in range(size):
+            if rank != collective.root:
+                circuit.cx(root, 2 * rank + collective.qubit)
+            positions[rank] += 1
+
+
+def _apply(circuit, op, offset):
+    if isinstance(op, ControlledGate):
+        circuit.cx(op.controls[0] + offset, op.targets[0].qubits[0] + offset)
+    elif op.name == "H":
+        circuit.h(op.qubits[0] + offset)
+    else:
+        circuit.rz(op.params[0], op.qubits[0] + offset)
+
+
+def _prepare(size, root):
+    def prepare(circuit):
+        for rank in range(size):
+            circuit.ry(0.4 + 0.3 * rank, 2 * rank)
+        circuit.ry(1.1, 2 * root + 1)
+    return prepare
+
+
+@pytest.mark.parametrize("reduce", [QReduce, QAllreduce])
+@pytest.mark.parametrize("size, root", [(2, 0), (3, 2), (4, 1)])
+def test_lowered_xor_reduce_matches_the_direct_reduction(size, root, reduce):
+    pytest.importorskip("qiskit")
+    from qiskit import QuantumCircuit
+    from qiskit.quantum_info import Statevector
+
+    prepare = _prepare(size, root)
+    lowered = _run_lowered_reduce(lambda rank: reduce(0, 1, root=root), size, prepare)
+
+    direct = QuantumCircuit(2 * size)
+    prepare(direct)
+    for rank in range(size):
+        direct.cx(2 * rank, 2 * root + 1)
+    if reduce is QAllreduce:
+        for rank in range(size):
+            if rank != root:
+                direct.cx(2 * root + 1, 2 * rank + 1)
+    assert lowered.equiv(Statevector(direct))
+
+
+@pytest.mark.parametrize("size, root", [(2, 1), (3, 0)])
+def test_lowered_phase_reduce_matches_the_direct_reduction(size, root):
+    pytest.importorskip("qiskit")
+    from qiskit import QuantumCircuit
+    from qiskit.quantum_info import Statevector
+
+    theta = 0.7
+    prepare = _prepare(size, root)
+    lowered = _run_lowered_reduce(
+        lambda rank: QReduce(0, 1, root=root, operation="phase", theta=theta), size, prepare,
+    )
+
+    direct = QuantumCircuit(2 * size)
+    prepare(direct)
+    for rank in range(size):
+        direct.cp(theta, 2 * rank, 2 * root + 1)
+    assert lowered.equiv(Statevector(direct))
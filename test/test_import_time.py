@@ -0,0 +1,69 @@
+"""
+Import-time budget for the netqmpi CLI.
+
+Imports the CLI module and every adapter package in a fresh interpreter
+and checks that the fastest of a few runs stays under the budget and
+that no backend stack was loaded along the way.  Adapter packages load
+their classes lazily, so none of ``netqasm``, ``cunqa``, ``qiskit`` or
+``numpy`` should be imported until a backend is selected.
+"""
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+BUDGET_MS = 100.0
+REPEAT = 5
+
+MODULES = [
+    "netqmpi",
+    "netqmpi.sdk",
+    "netqmpi.runtime.cli",
+    "netqmpi.runtime.adapters.aer",
+    "netqmpi.runtime.adapters.cunqa",
+    "netqmpi.runtime.adapters.netqasm",
+    "netqmpi.runtime.adapters.numpy",
+    "netqmpi.runtime.adapters.stabilizer",
+    "netqmpi.runtime.adapters.mps",
+    "netqmpi.runtime.adapters.sharded",
+    "netqmpi.runtime.adapters.sparse",
+    "netqmpi.runtime.adapters.bitvector",
+    "netqmpi.runtime.adapters.monolithic",
+]
+
+# Top-level packages that only the selected backend may pull in.
+BACKEND_STACKS = ["cunqa", "netqasm", "numpy", "qiskit", "qiskit_aer", "squidasm"]
+
+PROBE = f"""
+import json, sys, time
+start = time.perf_counter()
+for name in {MODULES!r}:
+    __import__(name)
+elapsed = time.perf_counter() - start
+loaded = sorted({{m.split('.')[0] for m in sys.modules}} & set({BACKEND_STACKS!r}))
+print(json.dumps({{"ms": elapsed * 1000, "loaded": loaded}}))
+"""
+
+
+@pytest.fixture(scope="module")
+def reports():
+    """Reports of :data:`PROBE` from :data:`REPEAT` fresh interpreters."""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [root, os.getenv("PYTHONPATH")])))
+    return [
+        json.loads(subprocess.run(
+            [sys.executable, "-c", PROBE], env=env, check=True, capture_output=True, text=True,
+        ).stdout)
+        for _ in range(REPEAT)
+    ]
+
+
+def test_imports_stay_within_the_budget(reports):
+    best = min(report["ms"] for report in reports)
+    assert best <= BUDGET_MS, f"importing the CLI took {best:.1f} ms (budget {BUDGET_MS:.0f} ms)"
+
+
+def test_no_backend_stack_is_imported_eagerly(reports):
+    assert sorted({name for report in reports for name in report["loaded"]}) == []
@@ -0,0 +1,99 @@
+"""
+Collectives on the monolithic-program backends.
+
+Ranks are translated separately and spliced into one program, so these
+check that cross-rank instructions see the gates of every rank taking
+part, whichever rank is the root.
+"""
+import pytest
+
+BCAST = """
+def main(env=None):
+    root = env.params["root"]
+    with env.comm:
+        circuit = env.create_circuit(num_qubits=1, num_clbits=1)
+        if env.comm.rank == root:
+            circuit.x(0)
+        circuit.qbcast(0, root=root)
+        circuit.measure(0, 0)
+"""
+
+
+@pytest.mark.parametrize("root", [0, 1, 2])
+def test_qbcast_copies_see_the_root_gates(run_script, backend, root):
+    counts = run_script(backend, BCAST, 3, shots=16, params={"root": root})
+    assert counts == {"111": 16}
+
+
+UNBCAST = """
+def main(env=None):
+    root = env.params["root"]
+    with env.comm:
+        circuit = env.create_circuit(num_qubits=1, num_clbits=1)
+        if env.comm.rank == root:
+            circuit.x(0)
+        circuit.qbcast(0, root=root)
+        circuit.qunbcast(0, root=root)
+        circuit.measure(0, 0)
+"""
+
+
+@pytest.mark.parametrize("root, key", [(0, "001"), (2, "100")])
+def test_qunbcast_returns_the_copies_to_zero(run_script, backend, root, key):
+    counts = run_script(backend, UNBCAST, 3, shots=16, params={"root": root})
+    assert counts == {key: 16}
+
+
+REDUCE = """
+import math
+
+
+def main(env=None):
+    root = env.params["root"]
+    with env.comm:
+        circuit = env.create_circuit(num_qubits=2, num_clbits=1)
+        if env.params["inputs"][env.comm.rank]:
+            circuit.x(0)
+        if env.params["phase"] and env.comm.rank == root:
+            circuit.h(1)
+        reduce = circuit.qallreduce if env.params["all"] else circuit.qreduce
+        if env.params["phase"]:
+            reduce(0, 1, root=root, operation="phase", theta=math.pi)
+        else:
+            reduce(0, 1, root=root)
+        if env.params["phase"] and env.comm.rank == root:
+            circuit.h(1)
+        circuit.measure(1, 0)
+"""
+
+
+def _reduce_key(inputs, root, allreduce):
+    parity = "1" if sum(inputs) % 2 else "0"
+    bits = [parity if allreduce or rank == root else "0" for rank in range(len(inputs))]
+    return "".join(reversed(bits))
+
+
+@pytest.mark.parametrize("inputs", [(0, 0, 1), (1, 0, 0), (0, 1, 1)])
+@pytest.mark.parametrize("root", [0, 1, 2])
+def test_qreduce_sees_every_contribution(run_script, backend, root, inputs):
+    params = {"root": root, "inputs": inputs, "all": False, "phase": False}
+    counts = run_script(backend, REDUCE, 3, shots=16, params=params)
+    assert counts == {_reduce_key(inputs, root, False): 16}
+
+
+@pytest.mark.parametrize("inputs", [(0, 0, 1), (1, 1, 0), (1, 1, 1)])
+@pytest.mark.parametrize("root", [0, 2])
+def test_qallreduce_copies_the_full_result(run_script, backend, root, inputs):
+    params = {"root": root, "inputs": inputs, "all": True, "phase": False}
+    counts = run_script(backend, REDUCE, 3, shots=16, params=params)
+    assert counts == {_reduce_key(inputs, root, True): 16}
+
+
+@pytest.mark.parametrize("inputs", [(0, 0, 1), (1, 1, 0)])
+@pytest.mark.parametrize("root", [0, 2])
+def test_phase_qreduce_kicks_back_every_contribution(run_script, backend, root, inputs):
+    if backend == "bitvector":
+        pytest.skip("the bit-vector backend has no Hadamard")
+    params = {"root": root, "inputs": inputs, "all": False, "phase": True}
+    counts = run_script(backend, REDUCE, 3, shots=16, params=params)
+    assert counts == {_reduce_key(inputs, root, False): 16}
@@ -0,0 +1,129 @@
+"""
+Transfers and expose windows on the monolithic-program backends.
+
+Ranks are translated separately and spliced into one program, so a
+transfer towards a lower rank, or an expose window opened by a higher
+rank, acts on qubits whose rank is spliced earlier in the global program.
+"""
+import pytest
+
+from netqmpi.runtime.adapters.monolithic.monolithic_layout import SYNC, splice
+
+SEND = """
+def main(env=None):
+    sender, receiver = env.params["sender"], env.params["receiver"]
+    with env.comm:
+        circuit = env.create_circuit(num_qubits=1, num_clbits=1)
+        if env.comm.rank == sender:
+            circuit.x(0)
+            circuit.qsend([0], receiver)
+        elif env.comm.rank == receiver:
+            circuit.qrecv([0], sender)
+        circuit.measure(0, 0)
+"""
+
+
+@pytest.mark.parametrize("sender, receiver, key", [(0, 2, "100"), (2, 0, "001"), (1, 0, "001")])
+def test_qsend_lands_before_the_receiver_measures(run_script, backend, sender, receiver, key):
+    counts = run_script(backend, SEND, 3, shots=16, params={"sender": sender, "receiver": receiver})
+    assert counts == {key: 16}
+
+
+SCATTER_GATHER = """
+def main(env=None):
+    root = env.params["root"]
+    with env.comm:
+        circuit = env.create_circuit(num_qubits=3, num_clbits=3)
+        if env.comm.rank == root:
+            circuit.x(0)
+            circuit.x(1)
+            circuit.x(2)
+            circuit.qscatter([0, 1, 2], root)
+        else:
+            circuit.qscatter([0], root)
+        circuit.qgather([0], root)
+        for qubit in range(3):
+            circuit.measure(qubit, qubit)
+"""
+
+
+@pytest.mark.parametrize("root", [0, 2])
+def test_scatter_then_gather_round_trips(run_script, backend, root):
+    counts = run_script(backend, SCATTER_GATHER, 3, shots=16, params={"root": root})
+    bits = ["111" if rank == root else "000" for rank in range(3)]
+    assert counts == {"".join(reversed(bits)): 16}
+
+
+EXPOSE = """
+def main(env=None):
+    exposer = env.params["exposer"]
+    with env.comm:
+        circuit = env.create_circuit(num_qubits=2, num_clbits=1)
+        if env.comm.rank == exposer:
+            circuit.x(0)
+        with circuit.expose([0], rank=exposer):
+            if env.comm.rank != exposer:
+                circuit.cx(0, 1)
+        circuit.measure(1, 0)
+"""
+
+
+@pytest.mark.parametrize("exposer, key", [(0, "110"), (2, "011")])
+def test_expose_copies_see_the_exposer_gates(run_script, backend, exposer, key):
+    counts = run_script(backend, EXPOSE, 3, shots=16, params={"exposer": exposer})
+    assert counts == {key: 16}
+
+
+# ----------------------------------------------------------------------
+# splice
+# ----------------------------------------------------------------------
+
+def _sync(ranks, *instructions):
+    return (SYNC, tuple(instructions), tuple(ranks), ())
+
+
+def _gate(qubit):
+    return ("x", (), (qubit,), ())
+
+
+def _flatten(segments):
+    return [instruction for segment in segments for instruction in segment]
+
+
+def test_splice_without_sync_points_keeps_rank_order():
+    programs = [[_gate(0), _gate(1)], [_gate(2)], []]
+    assert _flatten(splice(programs)) == [_gate(0), _gate(1), _gate(2)]
+
+
+def test_splice_runs_sync_instructions_after_every_prefix():
+    programs = [
+        [_gate(0), _sync([0, 1], _gate(10)), _gate(1)],
+        [_gate(2), _sync([0, 1]), _gate(3)],
+    ]
+    assert _flatten(splice(programs)) == [_gate(0), _gate(2), _gate(10), _gate(1), _gate(3)]
+
+
+def test_splice_emits_every_rank_of_a_sync_point_in_rank_order():
+    programs = [
+        [_sync([0, 1, 2], _gate(10))],
+        [_sync([0, 1, 2], _gate(11))],
+        [_gate(2), _sync([0, 1, 2], _gate(12))],
+    ]
+    assert _flatten(splice(programs)) == [_gate(2), _gate(10), _gate(11), _gate(12)]
+
+
+def test_splice_pairs_point_to_point_sync_points():
+    programs = [
+        [_sync([0, 1], _gate(10)), _gate(0)],
+        [_sync([1, 2]), _sync([0, 1])],
+        [_gate(2), _sync([1, 2], _gate(12))],
+    ]
+    assert _flatten(splice(programs)) == [_gate(2), _gate(12), _gate(10), _gate(0)]
+
+
+def test_splice_releases_unmatched_sync_points_in_rank_order():
+    programs = [
+        [_gate(0), _sync([0, 1], _gate(10)), _gate(1)],
+        [_gate(2)],
+    ]
+    assert _flatten(splice(programs)) == [_gate(0), _gate(2), _gate(10), _gate(1)]
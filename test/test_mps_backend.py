@@ -0,0 +1,88 @@
+"""
+Matrix-product-state backend: chain order, exactness and truncation.
+"""
+import numpy as np
+import pytest
+
+from netqmpi.runtime.adapters.monolithic.monolithic_layout import GlobalLayout
+from netqmpi.runtime.adapters.mps.mps_state import chain_key, simulate
+from netqmpi.runtime.adapters.numpy.numpy_statevector import compile_program
+
+
+def test_matches_the_statevector(statevector_distance, circuit):
+    assert statevector_distance("mps", *circuit) < 0.05
+
+
+def test_chain_is_ordered_by_rank_then_group():
+    layout = GlobalLayout.plan([[(2, 0), (1, 0)], [(2, 0), (1, 0)]])
+    qubits = [
+        layout.qubit_offset(group, rank) + local
+        for rank in range(2) for group, width in enumerate((2, 1)) for local in range(width)
+    ]
+    assert [chain_key(layout, qubit) for qubit in qubits] == list(range(6))
+
+
+# ----------------------------------------------------------------------
+# Truncation
+# ----------------------------------------------------------------------
+
+def _ghz(width, shots=1000, max_bond=64, cutoff=1e-12):
+    layout = GlobalLayout.plan([[(width, width)]])
+    instructions = [("h", (), (0,), ())]
+    instructions += [("cx", (), (q, q + 1), ()) for q in range(width - 1)]
+    instructions += [("measure", (), (q,), (q,)) for q in range(width)]
+    program = compile_program([instructions], layout, moves=True)
+    return simulate(program, layout, shots, np.random.default_rng(2), max_bond, cutoff)
+
+
+def test_ghz_states_are_exact_at_bond_dimension_two():
+    counts, report = _ghz(40)
+    assert sorted(counts) == ["0" * 40, "1" * 40]
+    assert report.max_bond == 2
+    assert report.error < 1e-12
+    assert not report.bond_limited
+
+
+def test_bond_dimension_one_keeps_one_branch():
+    counts, report = _ghz(4, max_bond=1)
+    assert len(counts) == 1
+    assert report.bond_limited
+    assert report.error == pytest.approx(0.5)
+
+
+def test_cutoff_drops_small_singular_values():
+    layout = GlobalLayout.plan([[(2, 2)]])
+    program = compile_program([[
+        ("ry", (0.02,), (0,), ()), ("cx", (), (0, 1), ()),
+        ("measure", (), (0,), (0,)), ("measure", (), (1,), (1,)),
+    ]], layout, moves=True)
+    counts, report = simulate(program, layout, 100, np.random.default_rng(0), 64, 1e-3)
+    assert counts == {"00": 100}
+    assert 0 < report.error < 1e-3
+    assert not report.bond_limited
+
+
+ENTANGLED = """
+def main(env=None):
+    with env.comm:
+        circuit = env.create_circuit(num_qubits=3, num_clbits=3)
+        circuit.h(0)
+        circuit.cx(0, 1)
+        circuit.cx(1, 2)
+        for qubit in range(3):
+            circuit.measure(qubit, qubit)
+"""
+
+
+def test_truncation_is_reported_and_warned(run_executor):
+    with pytest.warns(RuntimeWarning, match="max_bond_dimension=1"):
+        executor = run_executor("mps", ENTANGLED, 1, seed=4, max_bond_dimension=1)
+    assert executor.truncation.bond_limited
+    assert len(executor.results[0]["results"]) == 1
+
+
+def test_max_bond_dimension_must_be_positive(run_executor):
+    with pytest.raises(RuntimeError) as info:
+        run_executor("mps", ENTANGLED, 1, max_bond_dimension=0)
+    assert isinstance(info.value.__cause__, ValueError)
+    assert "max_bond_dimension must be positive" in str(info.value.__cause__)
@@ -0,0 +1,98 @@
+"""
+Qubit allocation plans of the NetQASM circuit adapter.
+
+The planner does not import NetQASM, so these run without the simulator.
+"""
+import pytest
+
+from netqmpi.runtime.adapters.netqasm.netqasm_allocation import plan_allocation
+from netqmpi.sdk.operations import (
+    ControlledGate, Gate, Measure, QIRecv, QISend, QRecv, QSend, QWait,
+)
+
+
+def _h(qubit):
+    return Gate("H", [qubit])
+
+
+def _cx(control, target):
+    return ControlledGate([control], [Gate("X", [target])])
+
+
+def test_slots_are_allocated_on_first_use():
+    plan = plan_allocation([_h(0), _cx(0, 2), _h(2), Measure(0, 0), Measure(2, 1)])
+    assert plan.allocations == {0: (0,), 1: (2,)}
+    assert plan.releases == {}
+    assert plan.peak == 2
+
+
+def test_unused_slots_are_never_allocated():
+    plan = plan_allocation([_h(3), Measure(3, 0)])
+    assert plan.allocations == {0: (3,)}
+    assert plan.peak == 1
+
+
+def test_measurements_free_their_qubit_unless_the_slot_is_used_again():
+    ops = [_h(0), Measure(0, 0), _h(1), Measure(1, 1), _h(1), Measure(1, 0)]
+    plan = plan_allocation(ops)
+    assert plan.inplace == {3}
+    # Slot 0 is free again by the time slot 1 is allocated.
+    assert plan.peak == 1
+
+
+def test_a_measured_slot_refilled_by_a_receive_frees_its_qubit():
+    plan = plan_allocation([_h(0), Measure(0, 0), QRecv([0], 1), Measure(0, 0)])
+    assert plan.inplace == set()
+    assert 2 not in plan.releases
+
+
+def test_sent_slots_are_allocated_again_on_reuse():
+    plan = plan_allocation([_h(0), QSend([0], 1), _h(0), Measure(0, 0)])
+    assert plan.allocations == {0: (0,), 2: (0,)}
+    # The EPR qubit is held next to the sent qubit.
+    assert plan.peak == 2
+
+
+def test_a_send_holds_one_epr_qubit_per_sent_qubit():
+    plan = plan_allocation([_h(0), _h(1), _h(2), QSend([0, 1, 2], 1)])
+    assert plan.peak == 6
+
+
+def test_receiving_into_a_live_slot_releases_its_qubit():
+    plan = plan_allocation([_h(0), QRecv([0, 1], 1), Measure(0, 0)])
+    assert plan.releases == {1: (0,)}
+    assert 1 not in plan.allocations
+    assert plan.peak == 2
+
+
+@pytest.mark.parametrize("adopt, allocations, peak", [
+    (True, {}, 2),
+    (False, {0: (0, 1)}, 4),
+])
+def test_adopting_received_qubits_saves_one_qubit_per_transfer(adopt, allocations, peak):
+    plan = plan_allocation([QRecv([0, 1], 1), _cx(0, 1)], adopt_received=adopt)
+    assert plan.allocations == allocations
+    assert plan.peak == peak
+
+
+# ----------------------------------------------------------------------
+# Non-blocking receives
+# ----------------------------------------------------------------------
+
+@pytest.mark.parametrize("adopt, peak", [(True, 3), (False, 6)])
+def test_in_flight_epr_qubits_stay_held_until_the_wait(adopt, peak):
+    ops = [QIRecv([0, 1], 1, 0), QRecv([3], 1), QWait([0])]
+    assert plan_allocation(ops, adopt_received=adopt).peak == peak
+
+
+def test_the_wait_frees_the_in_flight_epr_qubits():
+    waited = plan_allocation([QIRecv([0], 1, 0), QWait([0]), QRecv([1], 1)], adopt_received=False)
+    pending = plan_allocation([QIRecv([0], 1, 0), QRecv([1], 1), QWait([0])], adopt_received=False)
+    assert waited.peak == 3
+    assert pending.peak == 4
+
+
+def test_a_non_blocking_send_frees_its_slot_at_the_start():
+    plan = plan_allocation([_h(0), QISend([0], 1, 0), _h(1), QWait([0]), Measure(1, 0)])
+    assert plan.allocations == {0: (0,), 2: (1,)}
+    assert plan.peak == 2
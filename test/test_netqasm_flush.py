@@ -0,0 +1,151 @@
+"""
+Flushes of the NetQASM adapter, run against the stub of ``netqasm``.
+
+A flush is a round trip to the quantum node, so a rank should only flush
+where it needs something back: before sending measurement outcomes,
+before blocking on a peer's message, and at the end to read its results.
+"""
+from types import SimpleNamespace
+
+from netqmpi.runtime.adapters.netqasm.netqasm_scheduler import FlushScheduler, FlushStats
+
+LOCAL = """
+def main(env=None):
+    with env.comm:
+        circuit = env.create_circuit(num_qubits=3, num_clbits=3)
+        circuit.h(0)
+        circuit.cx(0, 1)
+        circuit.measure(0, 0)
+        circuit.x(2)
+        circuit.measure(1, 1)
+        circuit.measure(2, 2)
+    return env.comm
+"""
+
+RELAY = """
+def main(env=None):
+    rank = env.comm.rank
+    with env.comm:
+        circuit = env.create_circuit(num_qubits=2, num_clbits=2)
+        if rank == 0:
+            circuit.h(0)
+            circuit.measure(1, 1)
+            circuit.qsend([0], 1)
+            circuit.x(1)
+            circuit.measure(1, 0)
+        else:
+            circuit.h(1)
+            circuit.qrecv([0], 0)
+            circuit.measure(0, 0)
+            circuit.measure(1, 1)
+    return env.comm
+"""
+
+
+def _flush_stats(executor, rank):
+    return executor.results[rank]["return"].flush_stats
+
+
+def test_local_programs_flush_once_at_the_end(netqasm_network, run_executor):
+    executor = run_executor("netqasm", LOCAL, 2)
+    for rank in range(2):
+        log = netqasm_network.logs[f"rank_{rank}"]
+        assert netqasm_network.flushes(f"rank_{rank}") == [len(log) - 1]
+        assert len(netqasm_network.calls(f"rank_{rank}", "measure")) == 3
+        assert _flush_stats(executor, rank).flushes == 1
+
+
+def test_the_sender_flushes_only_before_sending_its_outcomes(netqasm_network, run_executor):
+    executor = run_executor("netqasm", RELAY, 2)
+    log = netqasm_network.logs["rank_0"]
+    send = log.index(("send", "rank_1", "Corrections"))
+    # The measurement before the send rides along with the teleportation.
+    assert netqasm_network.flushes("rank_0") == [send - 1, len(log) - 1]
+    assert _flush_stats(executor, 0).flushes == 2
+
+
+def test_the_receiver_flushes_only_before_blocking_on_the_corrections(
+    netqasm_network, run_executor,
+):
+    executor = run_executor("netqasm", RELAY, 2)
+    log = netqasm_network.logs["rank_1"]
+    recv = log.index(("recv", "rank_0", "Corrections"))
+    # The EPR request is submitted before blocking, as the sender's flush
+    # waits for it; the measurements after the receive wait for the end.
+    assert log[recv - 1] == ("flush",)
+    assert log[recv - 2] == ("recv_keep", "rank_0", 1)
+    assert netqasm_network.flushes("rank_1") == [recv - 1, len(log) - 1]
+    assert _flush_stats(executor, 1).flushes == 2
+
+
+def test_a_final_flush_with_nothing_queued_is_skipped(netqasm_network, run_executor):
+    source = RELAY.replace("circuit.x(1)", "").replace("circuit.measure(1, 0)", "")
+    executor = run_executor("netqasm", source, 2)
+    # Nothing is queued on rank 0 after the transfer's own flush.
+    assert netqasm_network.logs["rank_0"][-1] == ("send", "rank_1", "Corrections")
+    assert (_flush_stats(executor, 0).flushes, _flush_stats(executor, 0).skipped) == (1, 1)
+    assert (_flush_stats(executor, 1).flushes, _flush_stats(executor, 1).skipped) == (2, 0)
+
+
+# ----------------------------------------------------------------------
+# FlushScheduler
+# ----------------------------------------------------------------------
+
+def test_the_scheduler_skips_flushes_with_nothing_queued():
+    round_trips = []
+    scheduler = FlushScheduler(lambda: round_trips.append(1), FlushStats())
+    assert not scheduler.flush()
+    scheduler.queue()
+    assert scheduler.flush()
+    assert not scheduler.flush()
+    assert len(round_trips) == 1
+    assert (scheduler.stats.flushes, scheduler.stats.skipped) == (1, 2)
+
+
+def test_deferred_results_are_resolved_after_the_next_flush():
+    node = {"outcome": None}
+    resolved = []
+    scheduler = FlushScheduler(lambda: node.update(outcome=1), FlushStats())
+    scheduler.queue()
+    scheduler.defer("outcome", lambda key: resolved.append(node[key]))
+    assert resolved == []
+    scheduler.flush()
+    assert resolved == [1]
+    scheduler.queue()
+    scheduler.flush()
+    assert resolved == [1]
+
+
+# ----------------------------------------------------------------------
+# _flush_transfer
+# ----------------------------------------------------------------------
+
+class _Comm:
+    """Records which flush a transfer asked for."""
+
+    epr_pool = None
+
+    def __init__(self):
+        self.calls = []
+
+    def flush(self):
+        self.calls.append("flush")
+
+    def submit_epr(self):
+        self.calls.append("submit_epr")
+
+
+def _flush_transfer(missing, needed):
+    from netqmpi.runtime.adapters.netqasm.netqasm_circuit import NetQASMCircuitAdapter
+
+    comm = _Comm()
+    NetQASMCircuitAdapter._flush_transfer(SimpleNamespace(_comm=comm), missing, needed=needed)
+    return comm.calls
+
+
+def test_senders_always_flush_for_their_transfer(netqasm_network):
+    assert _flush_transfer(1, needed=True) == ["flush"]
+
+
+def test_receivers_only_submit_their_epr_requests(netqasm_network):
+    assert _flush_transfer(1, needed=False) == ["submit_epr"]
@@ -0,0 +1,102 @@
+"""
+EPR pools of the NetQASM adapter.
+
+The pool bookkeeping does not import NetQASM; the runs go through the
+stub of ``netqasm``.
+"""
+import pytest
+
+from netqmpi.runtime.adapters.netqasm.netqasm_pool import EPRPool, PoolStats
+
+RELAY = """
+def main(env=None):
+    rank = env.comm.rank
+    sends = env.params["sends"]
+    with env.comm:
+        circuit = env.create_circuit(num_qubits=3, num_clbits=3)
+        for qubits in sends:
+            if rank == 0:
+                for qubit in qubits:
+                    circuit.h(qubit)
+                circuit.qsend(qubits, 1)
+            else:
+                circuit.qrecv(qubits, 0)
+                for qubit in qubits:
+                    circuit.measure(qubit, qubit)
+    return env.comm
+"""
+
+
+def _run(run_executor, sends, **config):
+    executor = run_executor("netqasm", RELAY, 2, params={"sends": sends}, **config)
+    return [executor.results[rank]["return"].pool_stats for rank in range(2)]
+
+
+def _requests(network):
+    """Return the numbers of pairs requested by the sender and by the receiver."""
+    return (
+        [number for _, _, number in network.calls("rank_0", "create_keep")],
+        [number for _, _, number in network.calls("rank_1", "recv_keep")],
+    )
+
+
+def test_pooled_pairs_serve_every_transfer(netqasm_network, run_executor):
+    stats = _run(run_executor, [[0], [1], [2]], epr_pool_depth=2)
+    for rank_stats in stats:
+        assert (rank_stats.hits, rank_stats.misses, rank_stats.refills) == (3, 0, 3)
+        assert rank_stats.hit_rate == 1.0
+    # Two pairs up front, then one refill: the last transfer needs no more.
+    assert _requests(netqasm_network) == ([2, 1], [2, 1])
+
+
+def test_missing_pairs_are_requested_on_demand(netqasm_network, run_executor):
+    stats = _run(run_executor, [[0, 1, 2]], epr_pool_depth=2)
+    for rank_stats in stats:
+        assert (rank_stats.hits, rank_stats.misses, rank_stats.refills) == (2, 1, 2)
+    assert _requests(netqasm_network) == ([2, 1], [2, 1])
+
+
+def test_stale_pairs_are_freed_on_both_ends(netqasm_network, run_executor):
+    stats = _run(run_executor, [[0, 1]], epr_pool_depth=2, epr_max_age=0.0)
+    for rank_stats in stats:
+        assert (rank_stats.expired, rank_stats.hits, rank_stats.misses) == (2, 0, 2)
+    assert netqasm_network.calls("rank_0", "send")[0] == ("send", "rank_1", "Expired")
+    assert netqasm_network.calls("rank_1", "recv")[0] == ("recv", "rank_0", "Expired")
+    # Both ends free the expired halves, then request the transfer's pairs.
+    for party in ("rank_0", "rank_1"):
+        assert len(netqasm_network.calls(party, "free")) == 2
+    assert _requests(netqasm_network) == ([2, 2], [2, 2])
+
+
+def test_pools_are_off_by_default(netqasm_network, run_executor):
+    stats = _run(run_executor, [[0, 1]])
+    assert stats == [PoolStats(), PoolStats()]
+    assert _requests(netqasm_network) == ([2], [2])
+
+
+# ----------------------------------------------------------------------
+# EPRPool
+# ----------------------------------------------------------------------
+
+def test_pools_never_want_more_than_their_link_still_needs():
+    pool = EPRPool(4, None, {(0, 1): 3, (1, 0): 0}, PoolStats())
+    assert pool.wanted((0, 1)) == 3
+    assert pool.wanted((1, 0)) == 0
+    pool.add((0, 1), ["a", "b", "c"])
+    assert pool.take((0, 1), 2) == ["a", "b"]
+    assert pool.wanted((0, 1)) == 0
+    assert pool.held() == 1
+
+
+def test_links_are_requested_in_one_global_order():
+    pool = EPRPool(1, None, {(2, 1): 1, (1, 0): 1, (0, 1): 1, (0, 2): 1}, PoolStats())
+    assert pool.links() == [(0, 1), (1, 0), (0, 2), (2, 1)]
+
+
+@pytest.mark.parametrize("max_age, expired", [(None, []), (0.0, ["a", "b"]), (3600.0, [])])
+def test_only_pairs_past_max_age_expire(max_age, expired):
+    stats = PoolStats()
+    pool = EPRPool(2, max_age, {(0, 1): 2}, stats)
+    pool.add((0, 1), ["a", "b"])
+    assert pool.expire((0, 1)) == expired
+    assert stats.expired == len(expired)
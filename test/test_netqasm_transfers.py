@@ -0,0 +1,42 @@
+"""
+EPR requests of NetQASM transfers, run against the stub of ``netqasm``.
+
+A transfer of ``n`` qubits asks its link for all ``n`` pairs in a single
+request on each end rather than one request per qubit.
+"""
+import pytest
+
+SEND = """
+def main(env=None):
+    rank = env.comm.rank
+    n = env.params["n"]
+    with env.comm:
+        circuit = env.create_circuit(num_qubits=n, num_clbits=n)
+        if rank == 0:
+            for qubit in range(n):
+                circuit.h(qubit)
+            if env.params["blocking"]:
+                circuit.qsend(list(range(n)), 1)
+            else:
+                circuit.wait(circuit.qisend(list(range(n)), 1))
+        else:
+            if env.params["blocking"]:
+                circuit.qrecv(list(range(n)), 0)
+            else:
+                circuit.wait(circuit.qirecv(list(range(n)), 0))
+            for qubit in range(n):
+                circuit.measure(qubit, qubit)
+"""
+
+
+@pytest.mark.parametrize("blocking", [True, False])
+@pytest.mark.parametrize("n", [1, 3])
+def test_a_transfer_requests_all_its_pairs_at_once(netqasm_network, run_executor, n, blocking):
+    run_executor("netqasm", SEND, 2, params={"n": n, "blocking": blocking})
+    assert netqasm_network.calls("rank_0", "create_keep") == [("create_keep", "rank_1", n)]
+    assert netqasm_network.calls("rank_1", "recv_keep") == [("recv_keep", "rank_0", n)]
+    assert netqasm_network.calls("rank_0", "recv_keep") == []
+    assert netqasm_network.calls("rank_1", "create_keep") == []
+    # All qubits share one correction message.
+    assert len(netqasm_network.calls("rank_0", "send")) == 1
+    assert len(netqasm_network.calls("rank_1", "recv")) == 1
@@ -0,0 +1,151 @@
+"""
+NumPy statevector backend: compilation, light-cone pruning and branching.
+"""
+import numpy as np
+import pytest
+
+from netqmpi.runtime.adapters.monolithic.monolithic_layout import GlobalLayout
+from netqmpi.runtime.adapters.numpy.numpy_statevector import (
+    MEASURE, compile_program, gate_matrix, simulate,
+)
+
+
+@pytest.mark.parametrize("precision", ["single", "double"])
+def test_matches_the_statevector(statevector_distance, circuit, precision):
+    assert statevector_distance("numpy", *circuit, precision=precision) < 0.05
+
+
+# ----------------------------------------------------------------------
+# Light cone of the measurements
+# ----------------------------------------------------------------------
+
+def _gate(name, *qubits, params=()):
+    return (name, tuple(params), qubits, ())
+
+
+def _measure(qubit, clbit):
+    return ("measure", (), (qubit,), (clbit,))
+
+
+def _compile(*instructions, num_qubits=3):
+    return compile_program([list(instructions)], GlobalLayout.plan([[(num_qubits, num_qubits)]]))
+
+
+def test_qubits_outside_the_light_cone_are_not_allocated():
+    program = _compile(_gate("h", 0), _gate("x", 2), _gate("cx", 0, 1), _measure(1, 1))
+    assert program.num_axes == 2
+    assert program.qubits == [0, 1]
+    assert program.final == [(1, 1)]
+
+
+def test_gates_after_the_last_measurement_of_a_qubit_are_dropped():
+    program = _compile(_gate("h", 0), _measure(0, 0), _gate("x", 0), _gate("h", 1))
+    assert program.num_axes == 1
+    assert program.is_terminal
+    assert len(program.ops) == 1
+
+
+def test_controls_and_diagonal_gates_keep_a_measurement_terminal():
+    program = _compile(
+        _gate("h", 0), _measure(0, 0), _gate("rz", 0, params=(0.5,)),
+        _gate("cx", 0, 1), _measure(1, 1),
+    )
+    assert program.is_terminal
+    assert program.final == [(0, 0), (1, 1)]
+
+
+def test_a_gate_that_moves_a_measured_qubit_keeps_it_mid_circuit():
+    program = _compile(_gate("h", 0), _measure(0, 0), _gate("h", 0), _measure(0, 1))
+    assert not program.is_terminal
+    assert [op for op in program.ops if op[0] == MEASURE] == [(MEASURE, 0, 0)]
+    assert program.final == [(0, 1)]
+
+
+def test_an_overwritten_clbit_is_not_recorded():
+    program = _compile(_gate("h", 0), _measure(0, 0), _gate("h", 0), _measure(0, 0))
+    assert [op for op in program.ops if op[0] == MEASURE] == [(MEASURE, 0, None)]
+
+
+def test_single_qubit_gates_are_fused():
+    program = _compile(_gate("h", 0), _gate("t", 0), _gate("h", 0), _measure(0, 0))
+    (gate,) = program.ops
+    np.testing.assert_allclose(gate[1], gate_matrix("h") @ gate_matrix("t") @ gate_matrix("h"))
+
+
+def test_swap_relabels_axes():
+    program = _compile(_gate("x", 0), _gate("swap", 0, 2), _measure(2, 2))
+    assert program.num_axes == 1
+    assert program.final == [(0, 2)]
+
+
+# ----------------------------------------------------------------------
+# Mid-circuit measurements and resets
+# ----------------------------------------------------------------------
+
+MID_CIRCUIT = """
+def main(env=None):
+    with env.comm:
+        circuit = env.create_circuit(num_qubits=1, num_clbits=2)
+        circuit.h(0)
+        circuit.measure(0, 0)
+        if env.params["reset"]:
+            circuit.reset(0)
+        else:
+            circuit.h(0)
+        circuit.measure(0, 1)
+"""
+
+
+def test_mid_circuit_measurement_collapses_the_state(run_executor):
+    executor = run_executor("numpy", MID_CIRCUIT, 1, shots=4000, seed=3, params={"reset": False})
+    counts = executor.results[0]["results"]
+    assert not executor.program.is_terminal
+    assert sorted(counts) == ["00", "01", "10", "11"]
+    assert all(abs(count / 4000 - 0.25) < 0.03 for count in counts.values())
+
+
+def test_mid_circuit_reset_returns_the_qubit_to_zero(run_script):
+    counts = run_script("numpy", MID_CIRCUIT, 1, shots=4000, seed=3, params={"reset": True})
+    assert sorted(counts) == ["00", "01"]
+    assert abs(counts["01"] / 4000 - 0.5) < 0.03
+
+
+@pytest.mark.parametrize("shots", [1, 7, 1000])
+def test_branches_split_the_shots(shots):
+    layout = GlobalLayout.plan([[(2, 3)]])
+    program = compile_program([[
+        _gate("h", 0), _measure(0, 0), _gate("h", 0), _gate("cx", 0, 1),
+        _measure(0, 1), _gate("h", 1), _measure(1, 2),
+    ]], layout)
+    counts = simulate(program, layout, shots, np.random.default_rng(5))
+    assert sum(counts.values()) == shots
+
+
+def test_deterministic_branches_are_not_split():
+    layout = GlobalLayout.plan([[(1, 2)]])
+    program = compile_program([[
+        _gate("x", 0), _measure(0, 0), _gate("h", 0), _gate("h", 0), _measure(0, 1),
+    ]], layout)
+    assert simulate(program, layout, 100, np.random.default_rng(0)) == {"11": 100}
+
+
+# ----------------------------------------------------------------------
+# Errors
+# ----------------------------------------------------------------------
+
+def test_unknown_gates_are_rejected():
+    with pytest.raises(ValueError, match="Unknown gate"):
+        gate_matrix("u3", (0.1, 0.2, 0.3))
+
+
+def test_unknown_precision_is_rejected(run_executor):
+    with pytest.raises(RuntimeError) as info:
+        run_executor("numpy", MID_CIRCUIT, 1, precision="half", params={"reset": False})
+    assert isinstance(info.value.__cause__, ValueError)
+    assert "Unknown precision" in str(info.value.__cause__)
+
+
+def test_programs_wider_than_max_qubits_are_rejected(run_executor):
+    with pytest.raises(RuntimeError) as info:
+        run_executor("numpy", MID_CIRCUIT, 1, max_qubits=0, params={"reset": False})
+    assert "max_qubits=0" in str(info.value.__cause__)
@@ -0,0 +1,66 @@
+"""
+Per-phase profiling of runs.
+"""
+import pytest
+
+from netqmpi.runtime import profiling
+from netqmpi.runtime.profiling import PHASES, Profiler
+
+FLIP = """
+def main(env=None):
+    with env.comm:
+        circuit = env.create_circuit(num_qubits=1, num_clbits=1)
+        circuit.x(0)
+        circuit.measure(0, 0)
+"""
+
+
+def _phases(profiler):
+    return {(row["phase"], row["rank"]): row["calls"] for row in profiler.summary()}
+
+
+def test_monolithic_runs_record_layout_apart_from_submit(run_executor, backend):
+    with Profiler() as profiler:
+        run_executor(backend, FLIP, 2, shots=10)
+    phases = _phases(profiler)
+    assert phases[("layout", None)] == 1
+    assert phases[("submit", None)] == 1
+    assert phases[("simulate", None)] == 1
+    assert phases[("total", None)] == 1
+    for rank in range(2):
+        assert phases[("main", rank)] == 1
+        assert phases[("translate", rank)] == 1
+
+
+def test_summary_follows_the_phase_order(run_executor):
+    with Profiler() as profiler:
+        run_executor("numpy", FLIP, 2)
+    names = [row["phase"] for row in profiler.summary()]
+    assert names == sorted(names, key=PHASES.index)
+    assert "layout" in profiler.report()
+
+
+def test_phases_are_no_ops_without_a_profiler():
+    assert profiling.active() is None
+    with profiling.phase("layout"):
+        pass
+
+
+def test_only_one_profiler_can_be_active():
+    with Profiler():
+        with pytest.raises(RuntimeError, match="Another profiler is already active"):
+            Profiler().start()
+    assert profiling.active() is None
+
+
+def test_absorbed_records_keep_the_local_total():
+    worker = Profiler()
+    with worker:
+        with worker.phase("translate", 0):
+            pass
+    local = Profiler()
+    with local:
+        local.absorb(worker.export())
+    assert [(record.phase, record.rank) for record in local.records] == [
+        ("translate", 0), ("total", None),
+    ]
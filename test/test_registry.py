@@ -0,0 +1,84 @@
+"""
+Backend registry: built-ins, entry-point plugins and runtime registration.
+"""
+from importlib.metadata import EntryPoint
+
+import pytest
+
+from netqmpi.runtime import registry
+from netqmpi.runtime.adapters.numpy.numpy_executor import NumpyExecutorAdapter
+from netqmpi.runtime.adapters.numpy.numpy_run_config import NumpyStatevectorConfig
+
+NUMPY_TARGET = "netqmpi.runtime.adapters.numpy.numpy_executor:NumpyExecutorAdapter"
+
+
+@pytest.fixture
+def plugins(monkeypatch):
+    """
+    Install fake ``netqmpi.backends`` entry points.
+
+    The fixture is a callable ``plugins(*(name, target))`` that makes the
+    registry scan those entry points on its next lookup.
+    """
+    def install(*entries):
+        points = [EntryPoint(name, target, registry.ENTRY_POINT_GROUP) for name, target in entries]
+        monkeypatch.setattr(registry, "_entry_points", lambda: points)
+        monkeypatch.setattr(registry, "_backends", None)
+
+    install()
+    return install
+
+
+def test_builtins_are_listed_without_importing_them(plugins):
+    backends = registry.available_backends()
+    assert {"netqasm", "cunqa", "aer", "numpy", "bitvector"} <= set(backends)
+    assert registry.DEFAULT_BACKEND in backends
+
+
+def test_entry_points_add_backends(plugins):
+    plugins(("fast", NUMPY_TARGET))
+    spec = registry.get_backend("fast")
+    assert spec.target == NUMPY_TARGET
+    assert spec.description == f"plugin ({NUMPY_TARGET})"
+    assert spec.load() is NumpyExecutorAdapter
+    assert spec.load_config_class() is NumpyStatevectorConfig
+
+
+def test_entry_points_cannot_shadow_builtins_or_each_other(plugins):
+    plugins(
+        ("numpy", "other.module:Executor"),
+        ("fast", NUMPY_TARGET),
+        ("fast", "other.module:Executor"),
+    )
+    assert registry.get_backend("numpy").target == NUMPY_TARGET
+    assert registry.get_backend("fast").target == NUMPY_TARGET
+
+
+def test_entry_points_are_scanned_once(plugins, monkeypatch):
+    plugins(("fast", NUMPY_TARGET))
+    registry.available_backends()
+    monkeypatch.setattr(registry, "_entry_points", lambda: pytest.fail("scanned twice"))
+    assert "fast" in registry.available_backends()
+
+
+def test_register_backend_replaces_an_existing_name(plugins):
+    registry.register_backend("fast", NUMPY_TARGET, "first")
+    registry.register_backend("fast", "netqmpi.runtime.run_config:RunConfig", "second")
+    spec = registry.get_backend("fast")
+    assert spec.description == "second"
+    with pytest.raises(TypeError, match="is not an Executor subclass"):
+        spec.load()
+
+
+def test_unknown_backends_are_rejected(plugins):
+    with pytest.raises(ValueError, match="Unknown backend 'missing'; available: aer, "):
+        registry.get_backend("missing")
+
+
+def test_create_executor(plugins):
+    registry.register_backend("fast", NUMPY_TARGET)
+    executor = registry.create_executor("fast", 3, NumpyStatevectorConfig(shots=7))
+    assert isinstance(executor, NumpyExecutorAdapter)
+    assert executor.size == 3
+    assert executor.config.shots == 7
+    assert registry.create_executor("fast", 1).config == NumpyStatevectorConfig()
@@ -0,0 +1,51 @@
+"""
+Non-blocking transfers: request handles and the qubits they own.
+"""
+import pytest
+
+TRANSFER = """
+def main(env=None):
+    case = env.params["case"]
+    with env.comm:
+        circuit = env.create_circuit(num_qubits=2, num_clbits=2)
+        if env.comm.rank == 0:
+            circuit.x(0)
+            request = circuit.qisend([0], 1)
+            if case == "send":
+                circuit.h(0)
+            circuit.x(1)
+            circuit.wait([request, request] if case == "duplicate" else request)
+            if case == "twice":
+                circuit.wait(request)
+            circuit.measure(1, 1)
+        else:
+            request = circuit.qirecv([0], 0)
+            if case == "recv":
+                circuit.measure(0, 0)
+            if case == "other":
+                env.create_circuit(num_qubits=1, num_clbits=1).wait(request)
+            circuit.h(1)
+            request.wait()
+            assert request.test()
+            circuit.measure(0, 0)
+"""
+
+
+def test_waited_transfers_deliver_the_qubit(run_script):
+    counts = run_script("numpy", TRANSFER, 2, shots=64, seed=0, params={"case": "ok"})
+    # Rank 1 (listed first) received the |1> of rank 0; rank 0 flipped its qubit 1.
+    assert counts == {"0110": 64}
+
+
+@pytest.mark.parametrize("case, message", [
+    ("send", "Qubit 0 belongs to pending request 0; wait on it first."),
+    ("recv", "Qubit 0 belongs to pending request 0; wait on it first."),
+    ("twice", "Request 0 was already waited on."),
+    ("duplicate", "Request 0 is given more than once."),
+    ("other", "Request 0 belongs to another circuit."),
+])
+def test_misused_requests_are_rejected(run_executor, case, message):
+    with pytest.raises(RuntimeError) as info:
+        run_executor("numpy", TRANSFER, 2, params={"case": case})
+    assert isinstance(info.value.__cause__, ValueError)
+    assert str(info.value.__cause__) == message
@@ -0,0 +1,86 @@
+"""
+Sharded statevector backend: worker processes and shared memory.
+"""
+from multiprocessing import shared_memory
+
+import numpy as np
+import pytest
+
+from netqmpi.runtime.adapters.sharded.sharded_statevector import ShardPool
+
+
+def test_matches_the_statevector(statevector_distance, circuit):
+    distance = statevector_distance("sharded", *circuit, workers=4, min_sharded_qubits=0)
+    assert distance < 0.05
+
+
+BRANCHES = """
+def main(env=None):
+    with env.comm:
+        circuit = env.create_circuit(num_qubits=2, num_clbits=3)
+        circuit.h(0)
+        circuit.cx(0, 1)
+        circuit.measure(0, 0)
+        circuit.h(0)
+        circuit.measure(0, 1)
+        circuit.measure(1, 2)
+"""
+
+
+def test_mid_circuit_branches_are_recomputed(run_executor):
+    executor = run_executor(
+        "sharded", BRANCHES, 1, shots=4000, seed=6, workers=2, min_sharded_qubits=0,
+    )
+    counts = executor.results[0]["results"]
+    assert executor.shards == 2
+    # clbit 2 repeats clbit 0; clbit 1 is uniform.
+    assert sorted(counts) == ["000", "010", "101", "111"]
+    assert all(abs(count / 4000 - 0.25) < 0.03 for count in counts.values())
+
+
+def test_small_programs_stay_in_process(run_executor):
+    executor = run_executor("sharded", BRANCHES, 1, workers=4)
+    assert executor.shards == 1
+
+
+# ----------------------------------------------------------------------
+# Shared memory
+# ----------------------------------------------------------------------
+
+def _assert_released(name, procs):
+    assert not any(proc.is_alive() for proc in procs)
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=name)
+
+
+def test_pool_frees_the_shared_memory():
+    with ShardPool(3, 1, np.complex128, None) as pool:
+        name, procs = pool._memory.name, list(pool._procs)
+        pool.request(("clear",))
+        assert sum(pool.request(("norm",))) == pytest.approx(1.0)
+    _assert_released(name, procs)
+
+
+def test_pool_frees_the_shared_memory_when_a_worker_fails():
+    with pytest.raises(RuntimeError, match="shard_0 failed in its worker process"):
+        with ShardPool(3, 1, np.complex128, None) as pool:
+            name, procs = pool._memory.name, list(pool._procs)
+            pool.request(("no_such_request",))
+    _assert_released(name, procs)
+
+
+# ----------------------------------------------------------------------
+# Errors
+# ----------------------------------------------------------------------
+
+def test_workers_must_be_positive(run_executor):
+    with pytest.raises(RuntimeError) as info:
+        run_executor("sharded", BRANCHES, 1, workers=0)
+    assert isinstance(info.value.__cause__, ValueError)
+    assert "workers must be positive" in str(info.value.__cause__)
+
+
+def test_programs_wider_than_max_qubits_are_rejected(run_executor):
+    with pytest.raises(RuntimeError) as info:
+        run_executor("sharded", BRANCHES, 1, max_qubits=1)
+    assert "max_qubits=1" in str(info.value.__cause__)
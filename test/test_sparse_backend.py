@@ -0,0 +1,104 @@
+"""
+Sparse statevector backend: support size, pruning and the dense switch.
+"""
+import numpy as np
+import pytest
+
+from netqmpi.runtime.adapters.monolithic.monolithic_layout import GlobalLayout
+from netqmpi.runtime.adapters.numpy.numpy_statevector import compile_program
+from netqmpi.runtime.adapters.sparse.sparse_statevector import SparseState, simulate
+
+
+def test_matches_the_statevector(statevector_distance, circuit):
+    assert statevector_distance("sparse", *circuit) < 0.05
+
+
+def test_matches_the_statevector_after_turning_dense(statevector_distance, circuit):
+    assert statevector_distance("sparse", *circuit, max_support=2) < 0.05
+
+
+# ----------------------------------------------------------------------
+# Support
+# ----------------------------------------------------------------------
+
+def _run(num_qubits, num_clbits, instructions, shots=1000, threshold=1e-16,
+         max_support=1 << 16, max_dense_qubits=26):
+    layout = GlobalLayout.plan([[(num_qubits, num_clbits)]])
+    program = compile_program([instructions], layout)
+    return simulate(
+        program, layout, shots, np.random.default_rng(8), threshold, max_support, max_dense_qubits,
+    )
+
+
+def _ghz(width):
+    instructions = [("h", (), (0,), ())]
+    instructions += [("cx", (), (q, q + 1), ()) for q in range(width - 1)]
+    instructions += [("measure", (), (q,), (q,)) for q in range(width)]
+    return instructions
+
+
+@pytest.mark.parametrize("width", [40, 70])
+def test_ghz_states_keep_a_support_of_two(width):
+    counts, report = _run(width, width, _ghz(width))
+    assert sorted(counts) == ["0" * width, "1" * width]
+    assert report.peak_support == 2
+    assert not report.dense
+    assert report.pruned == 0
+
+
+def test_wide_states_use_python_integer_indices():
+    assert SparseState(62, np.complex128, 0.0).indices.dtype == np.int64
+    assert SparseState(63, np.complex128, 0.0).indices.dtype == object
+
+
+def test_small_amplitudes_are_pruned():
+    instructions = [("ry", (0.02,), (0,), ()), ("measure", (), (0,), (0,))]
+    counts, report = _run(1, 1, instructions, threshold=1e-3)
+    assert counts == {"0": 1000}
+    assert 0 < report.pruned < 1e-3
+
+
+def test_large_supports_turn_dense():
+    instructions = [("h", (), (q,), ()) for q in range(4)]
+    instructions += [("measure", (), (q,), (q,)) for q in range(4)]
+    counts, report = _run(4, 4, instructions, shots=4000, max_support=4)
+    assert report.dense
+    assert report.peak_support <= 8
+    assert len(counts) == 16
+
+
+def test_wide_states_stay_sparse_past_max_support():
+    instructions = [("h", (), (q,), ()) for q in range(4)]
+    instructions += [("measure", (), (q,), (q,)) for q in range(4)]
+    _, report = _run(4, 4, instructions, max_support=4, max_dense_qubits=3)
+    assert not report.dense
+    assert report.peak_support == 16
+
+
+def test_mid_circuit_measurements_branch():
+    instructions = [
+        ("h", (), (0,), ()), ("measure", (), (0,), (0,)),
+        ("h", (), (0,), ()), ("measure", (), (0,), (1,)),
+    ]
+    counts, _ = _run(1, 2, instructions, shots=4000)
+    assert sorted(counts) == ["00", "01", "10", "11"]
+    assert all(abs(count / 4000 - 0.25) < 0.03 for count in counts.values())
+
+
+# ----------------------------------------------------------------------
+# Errors
+# ----------------------------------------------------------------------
+
+UNUSED = """
+def main(env=None):
+    with env.comm:
+        circuit = env.create_circuit(num_qubits=1, num_clbits=1)
+        circuit.measure(0, 0)
+"""
+
+
+def test_unknown_precision_is_rejected(run_executor):
+    with pytest.raises(RuntimeError) as info:
+        run_executor("sparse", UNUSED, 1, precision="half")
+    assert isinstance(info.value.__cause__, ValueError)
+    assert "Unknown precision" in str(info.value.__cause__)
@@ -0,0 +1,122 @@
+"""
+Stabilizer-tableau backend: Clifford rewriting, symbolic measurements and
+rejection of non-Clifford programs.
+"""
+import math
+
+import numpy as np
+import pytest
+
+from netqmpi.runtime.adapters.monolithic.monolithic_layout import GlobalLayout
+from netqmpi.runtime.adapters.stabilizer.stabilizer_tableau import (
+    clifford_decomposition, compile_program, is_clifford, simulate,
+)
+
+
+def test_matches_the_statevector(statevector_distance, clifford_circuit):
+    assert statevector_distance("stabilizer", *clifford_circuit) < 0.05
+
+
+# ----------------------------------------------------------------------
+# Compilation
+# ----------------------------------------------------------------------
+
+def _gate(name, *qubits, params=()):
+    return (name, tuple(params), qubits, ())
+
+
+def _measure(qubit, clbit):
+    return ("measure", (), (qubit,), (clbit,))
+
+
+def _run(num_qubits, num_clbits, *instructions, shots=1000):
+    layout = GlobalLayout.plan([[(num_qubits, num_clbits)]])
+    program = compile_program([list(instructions)], layout)
+    return simulate(program, layout, shots, np.random.default_rng(11))
+
+
+@pytest.mark.parametrize("name, params, steps", [
+    ("rz", (math.pi / 2,), ("s",)),
+    ("rz", (-math.pi / 2,), ("sdg",)),
+    ("rz", (2 * math.pi,), ()),
+    ("rx", (math.pi,), ("h", "z", "h")),
+    ("ry", (math.pi / 2,), ("sdg", "h", "s", "h", "s")),
+    ("crz", (math.pi,), ("sdg", "cz")),
+])
+def test_quarter_turns_are_rewritten_as_cliffords(name, params, steps):
+    assert tuple(gate for gate, _ in clifford_decomposition(name, params)) == steps
+
+
+@pytest.mark.parametrize("name, params", [
+    ("t", ()), ("tdg", ()), ("ccx", ()),
+    ("rz", (0.3,)), ("rx", (math.pi / 4,)), ("crz", (math.pi / 2,)),
+])
+def test_non_cliffords_have_no_decomposition(name, params):
+    assert clifford_decomposition(name, params) is None
+    assert not is_clifford(name, params)
+
+
+def test_swap_relabels_wires():
+    layout = GlobalLayout.plan([[(2, 0)]])
+    program = compile_program([[_gate("h", 0), _gate("swap", 0, 1), _gate("x", 1)]], layout)
+    assert program.num_wires == 1
+
+
+# ----------------------------------------------------------------------
+# Measurements
+# ----------------------------------------------------------------------
+
+def test_measured_bell_pairs_are_correlated():
+    counts = _run(
+        2, 2, _gate("h", 0), _gate("cx", 0, 1), _measure(0, 0), _gate("x", 1), _measure(1, 1),
+    )
+    assert sorted(counts) == ["01", "10"]
+    assert sum(counts.values()) == 1000
+
+
+def test_mid_circuit_measurement_collapses_the_state():
+    counts = _run(1, 2, _gate("h", 0), _measure(0, 0), _gate("h", 0), _measure(0, 1), shots=4000)
+    assert sorted(counts) == ["00", "01", "10", "11"]
+    assert all(abs(count / 4000 - 0.25) < 0.03 for count in counts.values())
+
+
+def test_reset_returns_the_qubit_to_zero():
+    counts = _run(1, 2, _gate("h", 0), _measure(0, 0), ("reset", (), (0,), ()), _measure(0, 1))
+    assert sorted(counts) == ["00", "01"]
+
+
+def test_unused_qubits_measure_zero():
+    assert _run(3, 2, _gate("x", 0), _measure(0, 0), _measure(2, 1)) == {"01": 1000}
+
+
+def test_wide_ghz_states_keep_two_outcomes():
+    width = 200
+    instructions = [_gate("h", 0)] + [_gate("cx", q, q + 1) for q in range(width - 1)]
+    instructions += [_measure(q, q) for q in range(width)]
+    counts = _run(width, width, *instructions)
+    assert sorted(counts) == ["0" * width, "1" * width]
+
+
+# ----------------------------------------------------------------------
+# Errors
+# ----------------------------------------------------------------------
+
+def test_non_clifford_instructions_are_rejected():
+    with pytest.raises(ValueError, match=r"t is not a Clifford gate"):
+        compile_program([[_gate("h", 0), _gate("t", 0)]], GlobalLayout.plan([[(1, 0)]]))
+
+
+NON_CLIFFORD = """
+def main(env=None):
+    with env.comm:
+        circuit = env.create_circuit(num_qubits=1, num_clbits=1)
+        circuit.rx(0.3, 0)
+        circuit.measure(0, 0)
+"""
+
+
+def test_non_clifford_programs_fail_the_run(run_executor):
+    with pytest.raises(RuntimeError) as info:
+        run_executor("stabilizer", NON_CLIFFORD, 1)
+    assert isinstance(info.value.__cause__, ValueError)
+    assert "rank 0: rx(0.3) is not a Clifford gate" in str(info.value.__cause__)
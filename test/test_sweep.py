@@ -0,0 +1,92 @@
+"""
+Running many jobs in one process: warm executors and the script cache.
+"""
+import json
+import os
+import textwrap
+
+import pytest
+
+from netqmpi import helpers
+from netqmpi.runtime import sweep
+
+SCRIPT = """
+def main(env=None):
+    with env.comm:
+        circuit = env.create_circuit(num_qubits=1, num_clbits=1)
+        if env.params["flip"]:
+            circuit.x(0)
+        circuit.measure(0, 0)
+    return env.comm.rank
+"""
+
+
+@pytest.fixture
+def script(tmp_path, monkeypatch):
+    """Path of :data:`SCRIPT`, with no warm executors or cached scripts."""
+    monkeypatch.setattr(sweep, "_EXECUTORS", {})
+    monkeypatch.setattr(helpers, "_MAIN_CACHE", {})
+    path = tmp_path / "main.py"
+    path.write_text(textwrap.dedent(SCRIPT))
+    return str(path)
+
+
+def test_jobs_with_different_configs_share_one_warm_executor(script):
+    jobs = [
+        {"id": "zero", "script": script, "n": 2, "shots": 10, "params": {"flip": False}},
+        {"id": "one", "script": script, "n": 2, "shots": 30, "params": {"flip": True}},
+    ]
+    executors = []
+    records = []
+    for record in sweep.run_jobs(jobs, backend="numpy"):
+        records.append(record)
+        executors.append(sweep._EXECUTORS[("numpy", 2)])
+
+    assert [record["error"] for record in records] == [None, None]
+    assert records[0]["results"] == [{"00": 10}] * 2
+    assert records[1]["results"] == [{"11": 30}] * 2
+    assert records[1]["returns"] == [0, 1]
+    assert executors[0] is executors[1]
+    assert list(sweep._EXECUTORS) == [("numpy", 2)]
+    assert executors[1].config.shots == 30
+
+
+def test_failed_jobs_are_reported_in_their_record(script):
+    record = sweep.run_job(0, {"script": script, "n": 1, "backend": "numpy", "colour": "red"})
+    assert record["error"] == "ValueError: Unknown options for NumpyStatevectorConfig: colour"
+
+
+def test_main_writes_one_record_per_job(script, tmp_path):
+    jobs = tmp_path / "jobs.jsonl"
+    jobs.write_text(
+        "# comment\n"
+        + json.dumps({"script": script, "n": 1, "seed": 3, "params": {"flip": True}}) + "\n\n"
+        + json.dumps({"script": script, "n": 1, "colour": "red"}) + "\n"
+    )
+    output = tmp_path / "results.jsonl"
+    assert sweep.main([str(jobs), "--backend", "numpy", "-o", str(output)]) == 1
+    records = [json.loads(line) for line in output.read_text().splitlines()]
+    assert [record["index"] for record in records] == [0, 1]
+    assert records[0]["error"] is None
+    assert records[1]["error"] is not None
+
+
+# ----------------------------------------------------------------------
+# Script cache
+# ----------------------------------------------------------------------
+
+def test_load_main_reuses_an_unchanged_script(script):
+    assert helpers.load_main(script) is helpers.load_main(script)
+
+
+def test_load_main_reloads_a_touched_script(script):
+    first = helpers.load_main(script)
+    with open(script, "w") as f:
+        f.write("def main(env=None):\n    return 'edited'\n")
+    stat = os.stat(script)
+    os.utime(script, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    second = helpers.load_main(script)
+    assert second is not first
+    assert second() == "edited"
+    assert helpers.load_main(script) is second
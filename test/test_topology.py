@@ -0,0 +1,125 @@
+"""
+Topologies of a communicator: routes, shortest-path trees and link usage.
+"""
+import pytest
+
+from netqmpi.sdk.topology import NetworkStats, Topology
+
+
+# ----------------------------------------------------------------------
+# Construction
+# ----------------------------------------------------------------------
+
+@pytest.mark.parametrize("spec, links", [
+    (None, {(0, 1), (0, 2), (0, 3), (1, 2), (1, 3), (2, 3)}),
+    ("full", {(0, 1), (0, 2), (0, 3), (1, 2), (1, 3), (2, 3)}),
+    ("line", {(0, 1), (1, 2), (2, 3)}),
+    ("ring", {(0, 1), (1, 2), (2, 3), (0, 3)}),
+    ("star", {(0, 1), (0, 2), (0, 3)}),
+    ("grid:2x2", {(0, 1), (2, 3), (0, 2), (1, 3)}),
+    ("1-0, 2-1:2.5,3-2", {(0, 1), (1, 2), (2, 3)}),
+])
+def test_parse(spec, links):
+    topology = Topology.parse(spec, 4)
+    assert set(topology.links) == links
+    assert topology.is_full == (len(links) == 6)
+
+
+def test_parse_keeps_link_costs():
+    topology = Topology.parse("0-1,1-2:2.5", 3)
+    assert topology.links == {(0, 1): 1.0, (1, 2): 2.5}
+    assert topology.cost(2, 1) == 2.5
+
+
+def test_a_grid_links_each_rank_to_its_four_neighbours():
+    topology = Topology.parse("grid:3x3", 9)
+    assert topology.neighbors(4) == [1, 3, 5, 7]
+    assert topology.neighbors(0) == [1, 3]
+    assert not topology.adjacent(2, 3)
+
+
+@pytest.mark.parametrize("spec, size, message", [
+    ("grid:2x3", 4, "does not hold 4 ranks"),
+    ("grid:2", 2, "Invalid topology"),
+    ("0-1,1-x", 3, "Invalid topology"),
+    ("mesh", 3, "Invalid topology"),
+    ("0-3", 3, r"Invalid link \(0, 3\)"),
+    ("0-0", 2, r"Invalid link \(0, 0\)"),
+    ("0-1:0", 2, "positive cost"),
+])
+def test_invalid_specs_are_rejected(spec, size, message):
+    with pytest.raises(ValueError, match=message):
+        Topology.parse(spec, size)
+
+
+def test_disconnected_topologies_are_rejected():
+    with pytest.raises(ValueError, match="does not connect every rank"):
+        Topology(4, {(0, 1): 1.0, (2, 3): 1.0})
+
+
+# ----------------------------------------------------------------------
+# Routes
+# ----------------------------------------------------------------------
+
+def test_routes_follow_the_cheapest_path():
+    topology = Topology(4, {(0, 1): 1.0, (1, 2): 1.0, (2, 3): 1.0, (0, 3): 5.0})
+    assert topology.route(0, 3) == [0, 1, 2, 3]
+    assert topology.distance(0, 3) == 3.0
+    assert topology.route(3, 0) == [3, 2, 1, 0]
+    assert topology.route(2, 2) == [2]
+
+
+def test_equal_cost_routes_prefer_fewer_hops():
+    topology = Topology(3, {(0, 1): 1.0, (1, 2): 1.0, (0, 2): 2.0})
+    assert topology.route(0, 2) == [0, 2]
+
+
+def test_equal_routes_prefer_lower_ranks():
+    # The path through rank 2 is found first, as its first link is cheaper.
+    topology = Topology(4, {(0, 2): 1.0, (2, 3): 1.5, (0, 1): 1.5, (1, 3): 1.0})
+    assert topology.route(0, 3) == [0, 1, 3]
+    assert topology.tree(0) == {0: [1, 2], 1: [3], 2: [], 3: []}
+
+
+def test_ring_routes_go_the_short_way_round():
+    topology = Topology.ring(6)
+    assert topology.route(0, 2) == [0, 1, 2]
+    assert topology.route(0, 4) == [0, 5, 4]
+    # Both ways round are three hops.
+    assert topology.route(0, 3) == [0, 1, 2, 3]
+
+
+def test_trees_are_the_union_of_the_routes_from_their_root():
+    topology = Topology.line(4)
+    assert topology.tree(1) == {0: [], 1: [0, 2], 2: [3], 3: []}
+    star = Topology.star(4, center=2)
+    assert star.tree(0) == {0: [2], 1: [], 2: [1, 3], 3: []}
+    for root in range(4):
+        tree = star.tree(root)
+        for rank in range(4):
+            if rank != root:
+                parent = star.route(root, rank)[-2]
+                assert rank in tree[parent]
+
+
+# ----------------------------------------------------------------------
+# NetworkStats
+# ----------------------------------------------------------------------
+
+def test_transfers_count_one_pair_per_qubit_and_link():
+    stats = NetworkStats()
+    stats.record_transfer(Topology.line(4), 3, 0, 2)
+    stats.record_transfer(Topology.line(4), 1, 2, 0)
+    assert stats.routes == {(3, 0): 2}
+    assert stats.links == {(2, 3): 2, (1, 2): 2, (0, 1): 2}
+
+
+def test_stats_of_several_ranks_add_up():
+    a, b = NetworkStats(), NetworkStats()
+    a.record_pairs(1, 0, 3)
+    a.record_route(0, 1, 3)
+    b.record_pairs(0, 1)
+    b.record_route(1, 0, 1)
+    b.record_route(1, 0, 0)
+    total = NetworkStats.merge([a, b])
+    assert total == NetworkStats(links={(0, 1): 4}, routes={(0, 1): 3, (1, 0): 1})
@@ -0,0 +1,81 @@
+"""
+Chrome trace-event export of runs.
+"""
+import json
+from collections import Counter
+
+import pytest
+
+from netqmpi.runtime import tracing
+from netqmpi.runtime.tracing import Tracer
+
+RELAY = """
+def main(env=None):
+    rank = env.comm.rank
+    with env.comm:
+        circuit = env.create_circuit(num_qubits=1, num_clbits=1)
+        if rank == 0:
+            circuit.x(0)
+            circuit.qsend([0], 1)
+        else:
+            circuit.qrecv([0], 0)
+            circuit.measure(0, 0)
+"""
+
+
+def _trace(run_executor, tmp_path, backend, **config):
+    path = tmp_path / "run.trace.json"
+    with Tracer() as tracer:
+        run_executor(backend, RELAY, 2, **config)
+    tracer.dump(str(path))
+    return json.loads(path.read_text())["traceEvents"]
+
+
+def _assert_well_formed(events):
+    """Check every event has a pid/tid and every B has a matching E."""
+    assert all("pid" in event and "tid" in event for event in events)
+    durations = [event for event in events if event["ph"] in ("X", "B", "E")]
+    assert durations
+    assert all(event["dur"] >= 0 for event in durations if event["ph"] == "X")
+    opened = Counter((e["pid"], e["tid"], e["name"]) for e in durations if e["ph"] == "B")
+    closed = Counter((e["pid"], e["tid"], e["name"]) for e in durations if e["ph"] == "E")
+    assert opened == closed
+
+    named = {(e["pid"], e["tid"]) for e in events if e["name"] == "thread_name"}
+    assert {(e["pid"], e["tid"]) for e in durations} <= named
+    processes = {e["pid"] for e in events if e["name"] == "process_name"}
+    assert {e["pid"] for e in durations} <= processes
+
+
+def _main_spans(events):
+    return {
+        event["args"]["rank"]: (event["pid"], event["tid"])
+        for event in events if event["ph"] == "X" and event["name"] == "main"
+    }
+
+
+def test_thread_ranks_get_one_track_each(run_executor, tmp_path):
+    events = _trace(run_executor, tmp_path, "numpy")
+    _assert_well_formed(events)
+    spans = _main_spans(events)
+    assert sorted(spans) == [0, 1]
+    assert spans[0] != spans[1]
+    assert {event["name"] for event in events} >= {"layout", "translate", "simulate"}
+
+
+def test_process_ranks_get_one_process_each(run_executor, tmp_path):
+    pytest.importorskip("qiskit_aer")
+    events = _trace(run_executor, tmp_path, "aer", rank_runner="process")
+    _assert_well_formed(events)
+    spans = _main_spans(events)
+    assert sorted(spans) == [0, 1]
+    assert spans[0][0] != spans[1][0]
+
+
+def test_unfinished_spans_are_closed_on_stop():
+    with Tracer() as tracer:
+        tracing.begin("wait", rank=3)
+    [event] = tracer.events
+    assert event["ph"] == "X"
+    assert event["args"] == {"rank": 3, "unfinished": True}
+    assert tracing.active() is None